@@ -0,0 +1,26 @@
+"""add_model_key_to_forecast_history
+
+Revision ID: 20261018120000
+Revises: 20260417130000
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018120000"
+down_revision: Union[str, None] = "20260417130000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("forecast_history", sa.Column("model_key", sa.String(length=512), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("forecast_history", "model_key")
@@ -0,0 +1,30 @@
+"""add_hash_version_to_data_snapshots
+
+Revision ID: 20261018130000
+Revises: 20261018120000
+Create Date: 2026-10-18 13:00:00.000000
+
+Existing snapshots keep hash version 1 (sorted-JSON SHA-256); new ones are
+written with version 2 (row-hash fingerprint).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018130000"
+down_revision: Union[str, None] = "20261018120000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "data_snapshots",
+        sa.Column("hash_version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("data_snapshots", "hash_version")
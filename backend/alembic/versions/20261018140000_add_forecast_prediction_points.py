@@ -0,0 +1,57 @@
+"""add_forecast_prediction_points
+
+Revision ID: 20261018140000
+Revises: 20261018130000
+Create Date: 2026-10-18 14:00:00.000000
+
+Predictions of new runs are stored one row per date in
+forecast_prediction_points; forecast_predictions.predicted_values becomes
+nullable and is only set on rows written before this revision.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018140000"
+down_revision: Union[str, None] = "20261018130000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "forecast_prediction_points",
+        sa.Column("forecast_prediction_id", sa.String(length=36), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("tenant_id", sa.String(length=36), nullable=False),
+        sa.Column("forecast_history_id", sa.String(length=36), nullable=False),
+        sa.Column("entity_id", sa.String(length=255), nullable=False),
+        sa.Column("value", sa.Float(), nullable=False),
+        sa.Column("lower_bound", sa.Float(), nullable=True),
+        sa.Column("upper_bound", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["forecast_prediction_id"], ["forecast_predictions.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["forecast_history_id"], ["forecast_history.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("forecast_prediction_id", "date"),
+    )
+    op.create_index(
+        "ix_forecast_prediction_points_run_entity_date",
+        "forecast_prediction_points",
+        ["tenant_id", "forecast_history_id", "entity_id", "date"],
+    )
+    op.create_index(
+        "ix_forecast_prediction_points_entity_date",
+        "forecast_prediction_points",
+        ["tenant_id", "entity_id", "date"],
+    )
+    op.alter_column("forecast_predictions", "predicted_values", existing_type=sa.JSON(), nullable=True)
+
+
+def downgrade() -> None:
+    # Rows stored only as points must be backfilled into predicted_values first
+    op.alter_column("forecast_predictions", "predicted_values", existing_type=sa.JSON(), nullable=False)
+    op.drop_index("ix_forecast_prediction_points_entity_date", table_name="forecast_prediction_points")
+    op.drop_index("ix_forecast_prediction_points_run_entity_date", table_name="forecast_prediction_points")
+    op.drop_table("forecast_prediction_points")
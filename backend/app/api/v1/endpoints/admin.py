@@ -20,6 +20,7 @@ from app.schemas.admin import (
     AdminUserResponse,
     AdminUserListResponse,
     PlatformStats,
+    FrameCacheStats,
 )
 
 router = APIRouter()
@@ -70,6 +71,15 @@ async def get_platform_stats(
     )
 
 
+@router.get("/stats/frame-cache", response_model=FrameCacheStats)
+async def get_frame_cache_stats(
+    current_admin: PlatformAdmin = Depends(get_current_platform_admin),
+):
+    """Get the DataFrame cache hit/miss/eviction counters of the worker serving this request"""
+    from app.db.redis_client import frame_cache_stats
+    return FrameCacheStats(**frame_cache_stats())
+
+
 # ============================================
 # Tenant Management
 # ============================================
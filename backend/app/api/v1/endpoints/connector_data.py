@@ -25,7 +25,7 @@ from app.connectors.base import validate_sql_identifier
 from app.api.v1.endpoints.connector_wizard import _validate_wizard_column
 from app.core.deps import get_current_user, get_db
 from app.core.validators import validate_uuid
-from app.db.redis_client import get_redis
+from app.db.redis_client import frame_get, frame_set, get_redis
 from app.models import (
     ConnectorDataSource,
     Connector,
@@ -40,7 +40,22 @@ from app.schemas.connector_wizard import (
     WizardEntityResponse,
     WizardImportResponse,
 )
+from app.services.connector_import import (
+    SQL_DIALECTS,
+    ImportAggregator,
+    ImportScopeError,
+    SyncState,
+    filter_import_rows,
+    import_scope,
+    import_watermark,
+    load_sync_state,
+    merge_increment,
+    plan_import_query,
+    save_sync_state,
+    supports_incremental,
+)
 from app.services.connector_service import decrypt_config
+from app.services.preprocessing_service import PreprocessingService
 from app.connectors import get_connector
 
 logger = logging.getLogger(__name__)
@@ -51,25 +66,6 @@ _REDIS_DATASET_PREFIX = "dataset:"
 _REDIS_DATASET_META_PREFIX = "dataset_meta:"
 _REDIS_DATASET_TTL = 3600 * 4
 
-# SQL dialect helpers (shared with connector_wizard.py)
-_QUOTE_OPEN = {"sqlserver": "[", "postgres": '"', "mysql": "`", "snowflake": '"', "bigquery": "`"}
-_QUOTE_CLOSE = {"sqlserver": "]", "postgres": '"', "mysql": "`", "snowflake": '"', "bigquery": "`"}
-_PARAM_STYLE = {"sqlserver": "?", "postgres": "$1", "mysql": "%s", "snowflake": "%s", "bigquery": "@param"}
-
-
-def _quote_ident(name: str, db_type: str) -> str:
-    qo = _QUOTE_OPEN.get(db_type, '"')
-    qc = _QUOTE_CLOSE.get(db_type, '"')
-    escaped = name.replace(qc, qc + qc)
-    return f"{qo}{escaped}{qc}"
-
-
-def _indexed_placeholder(db_type: str, index: int) -> str:
-    if db_type == "postgres":
-        return f"${index}"
-    return _PARAM_STYLE.get(db_type, "?")
-
-
 # ============================================================
 # Helpers
 # ============================================================
@@ -239,6 +235,10 @@ async def user_import_data(
     Import data from a configured data source, filtered by:
     - The user's RLS-allowed entities
     - The user's selected date range
+
+    With `incremental`, only rows dated on or after the watermark of the
+    previous import of the same scope are fetched and merged into that
+    import's dataset; without a previous import it runs in full.
     """
     validate_uuid(data_source_id, "data_source_id")
     tenant_id = str(current_user.tenant_id)
@@ -289,55 +289,83 @@ async def user_import_data(
     config = decrypt_config(connector.config)
     conn_instance = get_connector(db_type, config, tenant_id)
 
-    table_str = data_source.source_table.strip()
-    if "." in table_str:
-        schema_part, table_part = table_str.split(".", 1)
-    else:
-        schema_part = "dbo" if db_type == "sqlserver" else "public"
-        table_part = table_str
-
-    qs = _quote_ident(validate_sql_identifier(schema_part, "schema"), db_type)
-    qt = _quote_ident(validate_sql_identifier(table_part, "table"), db_type)
-
-    # Build SELECT with mapped columns (exclude rls_column from SELECT — it's only for WHERE)
-    select_parts = []
-    export_roles = []
+    # RLS column (store/location) filters; every other mapped role is exported
+    export_roles = [role for role in column_map if role != "rls_column"]
     for role, remote_col in column_map.items():
-        if role == "rls_column":
-            continue  # RLS column is used for filtering, not in the output
-        qcol = _quote_ident(_validate_wizard_column(remote_col, f"col_{role}"), db_type)
-        qrole = _quote_ident(role, db_type)
-        select_parts.append(f"{qcol} AS {qrole}")
-        export_roles.append(role)
-
-    # Build WHERE clause — filter by RLS column (store/location), not entity_id
-    where_clauses = []
-    rls_col = column_map.get("rls_column")
-    if rls_col and allowed:
-        qrc = _quote_ident(rls_col, db_type)
-        rls_placeholders = ", ".join(f"'{v}'" for v in allowed)
-        where_clauses.append(f"{qrc} IN ({rls_placeholders})")
-
-    date_col = column_map.get("date")
-    if date_col:
-        qdc = _quote_ident(date_col, db_type)
-        if body.date_range_start:
-            ds = body.date_range_start.strftime("%Y-%m-%d")
-            where_clauses.append(f"{qdc} >= '{ds}'")
-        if body.date_range_end:
-            de = body.date_range_end.strftime("%Y-%m-%d")
-            where_clauses.append(f"{qdc} <= '{de}'")
-
-    sql = f"SELECT {', '.join(select_parts)} FROM {qs}.{qt}"
-    if where_clauses:
-        sql += " WHERE " + " AND ".join(where_clauses)
-
-    logger.info("Import SQL for user %s: %s", current_user.email, sql)
+        _validate_wizard_column(remote_col, f"col_{role}")
+    date_start = body.date_range_start.date() if body.date_range_start else None
+    date_end = body.date_range_end.date() if body.date_range_end else None
+
+    # Incremental sync: extend the previous import of this scope while its
+    # dataset (record and frame) still exists, fetching from its watermark on
+    scope = import_scope(user_id, column_map, allowed, date_start, date_end)
+    previous: Optional[SyncState] = None
+    previous_df: Optional[pd.DataFrame] = None
+    previous_record: Optional[Dataset] = None
+    if body.incremental and supports_incremental(column_map):
+        previous = await load_sync_state(data_source_id, scope)
+    if previous:
+        previous_record = await db.scalar(
+            select(Dataset).where(
+                Dataset.id == previous.dataset_id,
+                Dataset.tenant_id == tenant_id,
+                Dataset.uploaded_by == user_id,
+            )
+        )
+        if previous_record:
+            try:
+                previous_df = await frame_get(f"{_REDIS_DATASET_PREFIX}{previous.dataset_id}")
+            except Exception as e:
+                logger.warning("Could not load dataset %s for incremental import: %s", previous.dataset_id, e)
+        if previous_df is None:
+            previous = None
+    fetch_start = date_start
+    if previous:
+        fetch_start = max(date_start, previous.watermark) if date_start else previous.watermark
+
+    # SQL sources get the RLS filter and the GROUP BY pushed down; file
+    # sources are filtered and aggregated in pandas as they stream
+    aggregator = ImportAggregator()
+    if db_type in SQL_DIALECTS:
+        table_str = data_source.source_table.strip()
+        if "." in table_str:
+            schema_part, table_part = table_str.split(".", 1)
+        else:
+            schema_part = "dbo" if db_type == "sqlserver" else "public"
+            table_part = table_str
+        plan = plan_import_query(
+            db_type,
+            validate_sql_identifier(schema_part, "schema"),
+            validate_sql_identifier(table_part, "table"),
+            column_map,
+            rls_values=allowed,
+            date_start=fetch_start,
+            date_end=date_end,
+        )
+        logger.info("Import SQL for user %s: %s", current_user.email, plan.sql)
+        chunks = conn_instance.stream_data(plan.sql, params=plan.params)
+    else:
+        # Only the mapped columns are read (Parquet skips the others entirely);
+        # identifiers stay text so codes like "007" still match the RLS values
+        chunks = conn_instance.stream_data(
+            data_source.source_table.strip(),
+            columns=list(dict.fromkeys(column_map.values())),
+            text_columns=[column_map[role] for role in ("entity_id", "rls_column") if column_map.get(role)],
+        )
     logger.info("RLS allowed values: %s", allowed)
 
-    # Fetch data
     try:
-        df = await conn_instance.fetch_data(query=sql, limit=100000)
+        async for chunk in chunks:
+            if db_type not in SQL_DIALECTS:
+                chunk = filter_import_rows(chunk, column_map, allowed, fetch_start, date_end)
+            aggregator.add(chunk)
+    except ImportScopeError as exc:
+        # Never import unfiltered rows when the RLS filter cannot be applied
+        logger.error("User import of data source %s aborted: %s", data_source_id, exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{exc}; update the data source's column mapping",
+        )
     except Exception as exc:
         logger.error("User import fetch failed for data source %s: %s", data_source_id, exc)
         raise HTTPException(
@@ -345,24 +373,18 @@ async def user_import_data(
             detail="Failed to fetch data from the connector",
         )
 
-    # Parse date column to proper datetime
-    if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-
-    # Auto-aggregate: sum volume by entity_id + date to collapse transaction rows
-    raw_count = len(df)
-    group_cols = [c for c in ["date", "entity_id", "entity_name"] if c in df.columns]
-    sum_cols = [c for c in ["volume"] if c in df.columns]
-    if group_cols and sum_cols:
-        agg_dict = {col: "sum" for col in sum_cols}
-        if "entity_name" in group_cols:
-            group_cols_no_name = [c for c in group_cols if c != "entity_name"]
-            agg_dict["entity_name"] = "first"
-            df = df.groupby(group_cols_no_name, as_index=False).agg(agg_dict)
-        else:
-            df = df.groupby(group_cols, as_index=False).agg(agg_dict)
-        df = df.sort_values(["entity_id", "date"]).reset_index(drop=True)
-        logger.info("Auto-aggregated to %d rows (%d before)", len(df), raw_count)
+    df = aggregator.result()
+    if aggregator.aggregated:
+        logger.info("Auto-aggregated to %d rows (%d received)", len(df), aggregator.raw_rows)
+
+    affected_entities: List[str] = []
+    if previous:
+        delta_rows = len(df)
+        df, affected_entities = merge_increment(previous_df, df, previous.watermark)
+        logger.info(
+            "Incremental import of data source %s: %d rows from %s merged into dataset %s (%d entities changed)",
+            data_source_id, delta_rows, previous.watermark, previous.dataset_id, len(affected_entities),
+        )
 
     row_count = len(df)
     role_columns = export_roles
@@ -371,15 +393,20 @@ async def user_import_data(
     entity_col_name = "entity_id" if "entity_id" in df.columns else None
     entity_count = int(df[entity_col_name].nunique()) if entity_col_name and entity_col_name in df.columns else 0
 
-    # Store in Redis
-    dataset_id = str(uuid.uuid4())
+    # Store in Redis (an incremental import rewrites the previous dataset)
+    dataset_id = previous.dataset_id if previous else str(uuid.uuid4())
     redis_key = f"{_REDIS_DATASET_PREFIX}{dataset_id}"
 
     try:
         redis = await get_redis()
         if redis:
-            df_clean = df.where(df.notna(), other=None)
-            await redis.set(redis_key, df_clean.to_json(orient="split", date_format="iso"), ex=_REDIS_DATASET_TTL)
+            await frame_set(redis_key, df, expire=_REDIS_DATASET_TTL)
+            if previous:
+                # Bumps the dataset version; only the changed entities lose
+                # their preprocessed series
+                await PreprocessingService(tenant_id, user_id).invalidate_entities(
+                    dataset_id, affected_entities
+                )
 
             # Metadata
             meta = {
@@ -393,7 +420,8 @@ async def user_import_data(
                 "column_count": len(role_columns),
                 "is_active": True,
                 "file_type": "connector",
-                "uploaded_by": user_id,
+                # A merge extends the dataset, it does not change its owner
+                "uploaded_by": str(previous_record.uploaded_by) if previous else user_id,
                 "uploaded_at": datetime.utcnow().isoformat(),
             }
             await redis.set(
@@ -406,22 +434,26 @@ async def user_import_data(
 
     # Persist Dataset record
     try:
-        dataset_record = Dataset(
-            id=dataset_id,
-            tenant_id=tenant_id,
-            name=data_source.name,
-            filename=f"{data_source.name}.connector",
-            file_size=0,
-            file_type="connector",
-            row_count=row_count,
-            column_count=len(role_columns),
-            columns=role_columns,
-            redis_key=redis_key,
-            uploaded_by=user_id,
-            uploaded_at=datetime.utcnow(),
-            is_processed=True,
-        )
-        db.add(dataset_record)
+        if previous:
+            previous_record.row_count = row_count
+            previous_record.uploaded_at = datetime.utcnow()
+        else:
+            dataset_record = Dataset(
+                id=dataset_id,
+                tenant_id=tenant_id,
+                name=data_source.name,
+                filename=f"{data_source.name}.connector",
+                file_size=0,
+                file_type="connector",
+                row_count=row_count,
+                column_count=len(role_columns),
+                columns=role_columns,
+                redis_key=redis_key,
+                uploaded_by=user_id,
+                uploaded_at=datetime.utcnow(),
+                is_processed=True,
+            )
+            db.add(dataset_record)
 
         # Update data source last import info
         data_source.last_imported_at = datetime.utcnow()
@@ -437,10 +469,18 @@ async def user_import_data(
             detail="Import data was fetched but could not be saved",
         )
 
+    # Watermark for the next incremental import of this scope
+    watermark = import_watermark(df) if supports_incremental(column_map) else None
+    if watermark:
+        await save_sync_state(
+            data_source_id, scope, SyncState(dataset_id, watermark), expire=_REDIS_DATASET_TTL
+        )
+
     return WizardImportResponse(
         dataset_id=dataset_id,
         data_source_id=data_source_id,
         row_count=row_count,
         entity_count=entity_count,
         status="completed",
+        sync_mode="incremental" if previous else "full",
     )
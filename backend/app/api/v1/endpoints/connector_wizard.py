@@ -22,6 +22,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.connectors import get_connector
 from app.connectors.base import validate_sql_identifier
 from app.core.deps import get_current_tenant_admin, get_db
 from app.core.validators import validate_uuid
@@ -196,7 +197,9 @@ async def _execute_wizard_query(
 ) -> List[Any]:
     """
     Execute a raw SQL query against the connector using its native driver and
-    return the result rows as a list of sequences.
+    return the result rows as a list of sequences. PostgreSQL, MySQL and SQL
+    Server queries borrow a pooled connection, so metadata clicks skip the
+    connect / TLS / auth handshake.
 
     This bypasses the high-level fetch_connector_data() path so we can run
     arbitrary metadata queries (INFORMATION_SCHEMA, sys.partitions, etc.)
@@ -214,68 +217,9 @@ async def _execute_wizard_query(
     t0 = _time.monotonic()
 
     async def _run_query() -> List[Any]:
-        if db_type == "sqlserver":
-            import aioodbc
-            host = config.get("host", "localhost")
-            port = config.get("port", 1433)
-            database = config.get("database", "")
-            username = config.get("username") or config.get("user", "")
-            password = config.get("password", "")
-            driver = config.get("driver", "ODBC Driver 18 for SQL Server")
-            encrypt = config.get("encrypt", "yes")
-            trust_cert = config.get("trust_cert", "yes")
-            dsn = (
-                f"DRIVER={{{driver}}};"
-                f"SERVER={host},{port};"
-                f"DATABASE={database};"
-                f"UID={username};"
-                f"PWD={password};"
-                f"Encrypt={encrypt};"
-                f"TrustServerCertificate={trust_cert}"
-            )
-            async with aioodbc.connect(dsn=dsn) as conn:
-                async with conn.cursor() as cur:
-                    if params:
-                        await cur.execute(sql, params)
-                    else:
-                        await cur.execute(sql)
-                    return await cur.fetchall()
-
-        elif db_type == "postgres":
-            import asyncpg
-            host = config.get("host", "localhost")
-            port = config.get("port", 5432)
-            database = config.get("database")
-            user = config.get("user") or config.get("username")
-            password = config.get("password")
-            conn_pg = await asyncpg.connect(
-                host=host, port=port, database=database, user=user, password=password
-            )
-            try:
-                rows = await conn_pg.fetch(sql, *params)
-                return [tuple(r) for r in rows]
-            finally:
-                await conn_pg.close()
-
-        elif db_type == "mysql":
-            import aiomysql
-            host = config.get("host", "localhost")
-            port = config.get("port", 3306)
-            database = config.get("database")
-            user = config.get("user") or config.get("username")
-            password = config.get("password")
-            conn_my = await aiomysql.connect(
-                host=host, port=port, db=database, user=user, password=password
-            )
-            try:
-                async with conn_my.cursor() as cur:
-                    if params:
-                        await cur.execute(sql, params)
-                    else:
-                        await cur.execute(sql)
-                    return await cur.fetchall()
-            finally:
-                conn_my.close()
+        if db_type in ("sqlserver", "postgres", "mysql"):
+            # Pooled per tenant and connector config (see app/db/connector_pool.py)
+            return await get_connector(db_type, config, connector.tenant_id).execute(sql, params)
 
         elif db_type == "snowflake":
             import snowflake.connector
@@ -29,6 +29,7 @@ from app.services.connector_service import (
     fetch_connector_data,
     list_connector_resources,
     decrypt_config,
+    invalidate_connector_pool,
 )
 from app.core.validators import validate_uuid
 from cryptography.fernet import Fernet
@@ -293,6 +294,7 @@ async def update_connector(
     if "name" in data:
         connector.name = data["name"]
     if "config" in data:
+        await invalidate_connector_pool(connector)
         connector.config = _encrypt_config(data["config"])
     if "is_active" in data:
         connector.is_active = data["is_active"]
@@ -319,6 +321,7 @@ async def delete_connector(
     if not connector:
         raise HTTPException(status_code=404, detail="Connector not found")
 
+    await invalidate_connector_pool(connector)
     await db.delete(connector)
     await db.commit()
 
@@ -12,11 +12,12 @@ import logging
 from app.core.deps import get_db, get_current_user
 from app.models.user import User
 from app.services.dataset_service import DatasetService
+from app.services.upload_ingest import UploadTooLargeError, spool_upload
 from app.schemas.datasets import (
     DatasetResponse, DatasetListResponse, DataPreviewResponse,
     DataSummaryResponse, DataStructureResponse, UploadResponse,
     SampleDataRequest, SampleDataResponse, ColumnMappingRequest,
-    ColumnMappingResponse, TemplateInfo
+    ColumnMappingResponse, TemplateInfo, UploadProgressResponse
 )
 from app.schemas import MessageResponse
 from app.config import settings
@@ -34,6 +35,9 @@ router = APIRouter()
 @router.post("/upload", response_model=UploadResponse)
 async def upload_dataset(
     file: UploadFile = File(...),
+    upload_id: Optional[str] = Query(
+        None, max_length=64, description="Client-chosen id to poll /upload/progress/{upload_id}"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -41,6 +45,10 @@ async def upload_dataset(
     Upload a CSV or Excel file for analysis.
 
     Supported formats: .csv, .xlsx, .xls
+
+    The body is spooled to disk in chunks and parsed from there, so memory use
+    does not scale with repeated copies of the raw file. Pass `upload_id` to
+    follow parse progress via GET /datasets/upload/progress/{upload_id}.
     """
     # Validate file type
     if not file.filename:
@@ -56,29 +64,51 @@ async def upload_dataset(
             detail="Invalid file type. Supported formats: CSV, XLSX, XLS"
         )
 
-    # Check file size
-    content = await file.read()
-    file_size_mb = len(content) / (1024 * 1024)
-
     # Get tenant limits
     max_size = settings.MAX_UPLOAD_SIZE_MB
     if current_user.tenant and current_user.tenant.limits:
         max_size = current_user.tenant.limits.get("max_file_size_mb", max_size)
+    max_bytes = int(max_size * 1024 * 1024)
 
-    if file_size_mb > max_size:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size: {max_size}MB"
-        )
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File too large. Maximum size: {max_size}MB"
+    )
+    if file.size is not None and file.size > max_bytes:
+        raise too_large
+
+    service = DatasetService(db, current_user.tenant_id, current_user.id)
+
+    async def progress(update: dict) -> None:
+        if upload_id:
+            await service.record_upload_progress(upload_id, update)
+
+    await progress({"stage": "receiving"})
+
+    # Spool to disk, enforcing the size limit while reading
+    suffix = "." + filename_lower.rsplit(".", 1)[-1]
+    try:
+        spooled = await spool_upload(file, max_bytes, suffix=suffix)
+    except UploadTooLargeError:
+        await progress({"stage": "failed", "detail": too_large.detail})
+        raise too_large
 
     # Process upload
     try:
-        service = DatasetService(db, current_user.tenant_id, current_user.id)
         dataset = await service.upload_file(
-            file_content=content,
+            file_path=spooled.path,
             filename=file.filename,
-            content_type=file.content_type or ""
+            content_type=file.content_type or "",
+            file_size=spooled.size,
+            progress=progress,
         )
+        await progress({
+            "stage": "completed",
+            "bytes_read": spooled.size,
+            "total_bytes": spooled.size,
+            "rows_parsed": dataset.row_count or 0,
+            "percent": 100.0,
+        })
 
         return UploadResponse(
             id=dataset.id,
@@ -93,16 +123,37 @@ async def upload_dataset(
         )
 
     except ValueError as e:
+        await progress({"stage": "failed", "detail": str(e)})
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
         logger.error(f"Error uploading file: {str(e)}")
+        await progress({"stage": "failed", "detail": "An error occurred while processing the file"})
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while processing the file"
         )
+    finally:
+        spooled.cleanup()
+
+
+@router.get("/upload/progress/{upload_id}", response_model=UploadProgressResponse)
+async def get_upload_progress(
+    upload_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the parse progress of an upload started with `upload_id`."""
+    service = DatasetService(db, current_user.tenant_id, current_user.id)
+    progress = await service.get_upload_progress(upload_id)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    return UploadProgressResponse(upload_id=upload_id, **progress)
 
 
 # ============================================
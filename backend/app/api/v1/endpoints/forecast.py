@@ -6,12 +6,18 @@ import uuid
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 
 from app.core.deps import get_db, get_current_user
 from app.db.redis_client import get_redis
 from app.models.user import User
+from app.services.forecast_events import (
+    REDIS_BATCH_EVENTS_PREFIX,
+    REDIS_FORECAST_EVENTS_PREFIX,
+    stream_events,
+)
 from app.services.forecast_service import ForecastService
 from app.schemas.forecast import (
     ForecastMethod, ForecastRequest, BatchForecastRequest,
@@ -145,7 +151,10 @@ async def run_forecast(
         # Update history with completion status
         if forecast_history_id:
             try:
-                history.status = FHStatus.COMPLETED if result.status.value == "completed" else FHStatus.FAILED
+                history.status = {
+                    "completed": FHStatus.COMPLETED,
+                    "cancelled": FHStatus.CANCELLED,
+                }.get(result.status.value, FHStatus.FAILED)
                 history.completed_at = datetime.utcnow()
                 if result.metrics:
                     history.mae = result.metrics.mae
@@ -174,16 +183,19 @@ async def run_batch_forecast(
     """
     Run forecasts for multiple entities.
 
-    Dispatches the batch job to a Celery worker and returns immediately
-    with status=PENDING.  Poll GET /forecast/status/{id} per entity
-    to track individual progress.
+    Starts the batch in the background and returns immediately with
+    status=RUNNING. Entities run concurrently, up to the tenant's
+    max_concurrent_forecasts at a time. Track progress with
+    GET /forecast/batch/{batch_id}/events (or poll GET /forecast/batch/{batch_id}).
     """
     # Validate batch size against tenant limits
     max_entities = 50  # Default
+    max_concurrency = settings.DEFAULT_MAX_CONCURRENT_FORECASTS
     if hasattr(current_user, 'tenant') and current_user.tenant:
         limits = getattr(current_user.tenant, 'limits', None)
         if limits and isinstance(limits, dict):
             max_entities = limits.get('max_entities_per_batch', max_entities)
+            max_concurrency = limits.get('max_concurrent_forecasts', max_concurrency)
 
     if len(request.entity_ids) > max_entities:
         raise HTTPException(
@@ -202,7 +214,7 @@ async def run_batch_forecast(
     # Start batch forecast in background (returns immediately)
     service = ForecastService(current_user.tenant_id, current_user.id, db=db)
     try:
-        result = await service.start_batch_forecast(request)
+        result = await service.start_batch_forecast(request, max_concurrency=max_concurrency)
         return result
     except Exception as e:
         raise HTTPException(
@@ -240,6 +252,31 @@ async def get_forecast_status(
     return result
 
 
+@router.post("/cancel/{forecast_id}")
+async def cancel_forecast(
+    forecast_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Cancel a running forecast.
+
+    The worker process fitting the model is stopped and the forecast ends
+    with status=cancelled. Only forecasts running on this API instance can
+    be cancelled.
+    """
+    validate_uuid(forecast_id, "forecast_id")
+    service = ForecastService(current_user.tenant_id, current_user.id)
+    cancelled = await service.cancel_forecast(forecast_id)
+
+    if not cancelled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Forecast not found or not running"
+        )
+
+    return {"forecast_id": forecast_id, "message": "Forecast cancellation requested"}
+
+
 @router.get("/batch/{batch_id}", response_model=BatchForecastStatusResponse)
 async def get_batch_forecast_status(
     batch_id: str,
@@ -249,7 +286,8 @@ async def get_batch_forecast_status(
     """
     Get the status and results of a batch forecast.
 
-    Poll this endpoint after starting a batch forecast to track progress.
+    Poll this endpoint after starting a batch forecast to track progress
+    (or subscribe to GET /forecast/batch/{batch_id}/events).
     Returns completed/failed counts and individual entity results as they finish.
     """
     validate_uuid(batch_id, "batch_id")
@@ -265,6 +303,84 @@ async def get_batch_forecast_status(
     return result
 
 
+# ============================================
+# Status Streams (Server-Sent Events)
+# ============================================
+
+def _event_stream_response(body) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _require_event_redis() -> None:
+    if await get_redis() is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Status streams are unavailable (Redis not connected)"
+        )
+
+
+@router.get("/events/{forecast_id}", response_class=StreamingResponse)
+async def stream_forecast_events(
+    forecast_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream the status of a forecast as Server-Sent Events.
+
+    Sends the current status first ("status"), then a "progress" event on
+    every change and a final "complete" event (completed, failed or
+    cancelled) before closing. Replaces polling GET /forecast/status/{id};
+    fetch the full result once the stream completes.
+    """
+    validate_uuid(forecast_id, "forecast_id")
+    await _require_event_redis()
+    service = ForecastService(current_user.tenant_id, current_user.id)
+    if await service.get_forecast_progress(forecast_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Forecast not found or expired. Results are stored for 1 hour."
+        )
+
+    return _event_stream_response(stream_events(
+        f"{REDIS_FORECAST_EVENTS_PREFIX}{forecast_id}",
+        lambda: service.get_forecast_progress(forecast_id),
+    ))
+
+
+@router.get("/batch/{batch_id}/events", response_class=StreamingResponse)
+async def stream_batch_forecast_events(
+    batch_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream the progress of a batch forecast as Server-Sent Events.
+
+    Sends the current counts first ("status"), then one "entity" event per
+    finished entity and a final "complete" event with the batch counts.
+    Replaces polling GET /forecast/batch/{batch_id}; entity results are
+    available from that endpoint or /results/batch/{batch_id}/download.
+    """
+    validate_uuid(batch_id, "batch_id")
+    await _require_event_redis()
+    service = ForecastService(current_user.tenant_id, current_user.id)
+
+    async def _counts():
+        batch = await service.get_batch_status(batch_id)
+        return batch.model_dump(mode='json', exclude={"results"}) if batch else None
+
+    if await _counts() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch forecast not found or expired. Results are stored for 1 hour."
+        )
+
+    return _event_stream_response(stream_events(f"{REDIS_BATCH_EVENTS_PREFIX}{batch_id}", _counts))
+
+
 # ============================================
 # Preview (Quick forecast for visualization)
 # ============================================
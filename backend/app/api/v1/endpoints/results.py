@@ -2,7 +2,8 @@
 Results API Endpoints - Retrieve, paginate, download, and export forecast results
 """
 import json
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
@@ -18,7 +19,14 @@ from app.schemas.forecast import (
     ModelSummaryResponse,
     PredictionResponse,
 )
-from app.services.results_service import ResultsService
+from app.services.prediction_store import PredictionStore
+from app.services.results_service import (
+    PREDICTION_COLUMNS,
+    PredictionReader,
+    ResultsService,
+    stream_csv,
+    stream_ndjson,
+)
 from app.core.validators import validate_uuid
 
 router = APIRouter()
@@ -54,6 +62,142 @@ async def _require_result(
     return result
 
 
+async def _require_predictions(
+    forecast_id: str,
+    service: ResultsService,
+    db: Optional[AsyncSession] = None,
+) -> PredictionReader:
+    """
+    Open a forecast's predictions for slice reads or raise 404.
+    Same two-tier lookup as _require_result, without loading the series.
+    """
+    validate_uuid(forecast_id, "forecast_id")
+    reader = await service.open_predictions(forecast_id, db=db)
+    if reader is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=(
+                f"Forecast '{forecast_id}' not found or has expired. "
+                "Results are cached for 1 hour after completion."
+            ),
+        )
+    return reader
+
+
+async def _dump_chunks(chunks: AsyncIterator[List[PredictionResponse]]) -> AsyncIterator[List[Dict[str, Any]]]:
+    async for chunk in chunks:
+        yield [p.model_dump() for p in chunk]
+
+
+def _export_response(
+    chunks: AsyncIterator[List[Dict[str, Any]]],
+    export_format: str,
+    filename: str,
+    columns: tuple,
+) -> StreamingResponse:
+    """StreamingResponse that encodes row chunks as they are read."""
+    if export_format == "ndjson":
+        body, media_type = stream_ndjson(chunks), "application/x-ndjson"
+    else:
+        body, media_type = stream_csv(chunks, columns), "text/csv"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Type": f"{media_type}; charset=utf-8",
+        },
+    )
+
+
+# ============================================
+# GET /results/predictions/range
+# ============================================
+
+@router.get(
+    "/predictions/range",
+    summary="Query stored predictions by entity and date range",
+    description=(
+        "Return stored prediction points (one row per entity, run and date) matching the filters, "
+        "ordered by entity and date. The query runs in the database over the "
+        "(tenant, entity, date) index. `latest_only` keeps only each entity's newest run."
+    ),
+)
+async def query_prediction_range(
+    entity_id: Optional[List[str]] = Query(None, description="Entity ids (repeatable)"),
+    start_date: Optional[date] = Query(None, description="First date (inclusive)"),
+    end_date: Optional[date] = Query(None, description="Last date (inclusive)"),
+    forecast_id: Optional[str] = Query(None, description="Restrict to one forecast run"),
+    latest_only: bool = Query(False, description="Only each entity's most recent run"),
+    page: int = Query(1, ge=1, description="Page number (1-based)"),
+    page_size: int = Query(1000, ge=1, le=10000, description="Rows per page"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    if forecast_id is not None:
+        validate_uuid(forecast_id, "forecast_id")
+    store = PredictionStore(current_user.tenant_id)
+    rows = await store.query_range(
+        db,
+        entity_ids=entity_id,
+        start_date=start_date,
+        end_date=end_date,
+        forecast_history_id=forecast_id,
+        latest_only=latest_only,
+        offset=(page - 1) * page_size,
+        limit=page_size + 1,
+    )
+    return {
+        "pagination": {
+            "page": page,
+            "page_size": page_size,
+            "has_next": len(rows) > page_size,
+            "has_prev": page > 1,
+        },
+        "data": rows[:page_size],
+    }
+
+
+# ============================================
+# GET /results/predictions/aggregate
+# ============================================
+
+@router.get(
+    "/predictions/aggregate",
+    summary="Aggregate stored predictions per date or per entity",
+    description=(
+        "Aggregate value, lower_bound and upper_bound of stored prediction points with "
+        "sum / avg / min / max / count, grouped by date or entity. Computed in the database. "
+        "Use `forecast_id` or `latest_only` so several runs of an entity are not counted twice."
+    ),
+)
+async def aggregate_predictions(
+    group_by: Literal["date", "entity_id"] = Query("date", description="Grouping column"),
+    agg: Literal["sum", "avg", "min", "max", "count"] = Query("sum", description="Aggregate function"),
+    entity_id: Optional[List[str]] = Query(None, description="Entity ids (repeatable)"),
+    start_date: Optional[date] = Query(None, description="First date (inclusive)"),
+    end_date: Optional[date] = Query(None, description="Last date (inclusive)"),
+    forecast_id: Optional[str] = Query(None, description="Restrict to one forecast run"),
+    latest_only: bool = Query(False, description="Only each entity's most recent run"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    if forecast_id is not None:
+        validate_uuid(forecast_id, "forecast_id")
+    store = PredictionStore(current_user.tenant_id)
+    rows = await store.aggregate(
+        db,
+        group_by=group_by,
+        agg=agg,
+        entity_ids=entity_id,
+        start_date=start_date,
+        end_date=end_date,
+        forecast_history_id=forecast_id,
+        latest_only=latest_only,
+    )
+    return {"group_by": group_by, "agg": agg, "data": rows}
+
+
 # ============================================
 # GET /results/{forecast_id}
 # ============================================
@@ -90,7 +234,8 @@ class PaginatedPredictionsResponse(dict):
     summary="Get paginated predictions",
     description=(
         "Return the forecast predictions in pages. "
-        "Use `page` and `page_size` query parameters to navigate."
+        "Use `page` and `page_size` query parameters to navigate. "
+        "Only the requested page is read from storage."
     ),
 )
 async def get_forecast_data(
@@ -101,11 +246,10 @@ async def get_forecast_data(
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
     service = _get_service(current_user)
-    result = await _require_result(forecast_id, service, db=db)
+    reader = await _require_predictions(forecast_id, service, db=db)
+    result = reader.result
 
-    items, total, total_pages, current_page = service.paginate_predictions(
-        result.predictions, page, page_size
-    )
+    items, total, total_pages, current_page = await reader.page(page, page_size)
 
     return {
         "forecast_id": forecast_id,
@@ -231,22 +375,25 @@ async def get_forecast_cv(
 
 @router.get(
     "/download/{forecast_id}",
-    summary="Download predictions as CSV",
+    summary="Download predictions as CSV or NDJSON",
     description=(
-        "Stream the forecast predictions as a CSV file download. "
+        "Stream the forecast predictions as a CSV (default) or NDJSON file download, "
+        "generated chunk by chunk as rows are read. "
         "Columns: date, value, lower_bound, upper_bound."
     ),
     response_class=StreamingResponse,
 )
 async def download_forecast_csv(
     forecast_id: str,
+    format: Literal["csv", "ndjson"] = Query("csv", description="Export format"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     service = _get_service(current_user)
-    result = await _require_result(forecast_id, service, db=db)
+    reader = await _require_predictions(forecast_id, service, db=db)
+    result = reader.result
 
-    if result.status != ForecastStatus.COMPLETED or not result.predictions:
+    if result.status != ForecastStatus.COMPLETED or not reader.total:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
@@ -255,16 +402,46 @@ async def download_forecast_csv(
             ),
         )
 
-    csv_content = service.generate_csv(result)
-    filename = service.get_csv_filename(result)
+    return _export_response(
+        _dump_chunks(reader.iter_chunks()),
+        format,
+        service.get_csv_filename(result, extension=format),
+        PREDICTION_COLUMNS,
+    )
 
-    return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "text/csv; charset=utf-8",
-        },
+
+# ============================================
+# GET /results/batch/{batch_id}/download
+# ============================================
+
+@router.get(
+    "/batch/{batch_id}/download",
+    summary="Download all predictions of a batch as CSV or NDJSON",
+    description=(
+        "Stream the predictions of every entity of a batch forecast as one CSV (default) "
+        "or NDJSON file, one entity at a time. "
+        "Columns: entity_id, date, value, lower_bound, upper_bound."
+    ),
+    response_class=StreamingResponse,
+)
+async def download_batch_predictions(
+    batch_id: str,
+    format: Literal["csv", "ndjson"] = Query("csv", description="Export format"),
+    current_user: User = Depends(get_current_user),
+):
+    validate_uuid(batch_id, "batch_id")
+    service = _get_service(current_user)
+    if not await service.batch_exists(batch_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch '{batch_id}' not found or has expired.",
+        )
+
+    return _export_response(
+        service.iter_batch_rows(batch_id),
+        format,
+        f"forecast_batch_{batch_id[:8]}.{format}",
+        ("entity_id", *PREDICTION_COLUMNS),
     )
 
 
@@ -43,10 +43,14 @@ class Settings(BaseSettings):
     # Celery
     CELERY_BROKER_URL: Optional[str] = None
     CELERY_RESULT_BACKEND: Optional[str] = None
+    CELERY_WORKER_CONCURRENCY: int = 2             # Prefork children per Celery worker
+    CELERY_WORKER_MAX_TASKS_PER_CHILD: int = 100   # Tasks before a child is replaced (0 = never)
+    CELERY_WORKER_MAX_MEMORY_MB: int = 1024        # Resident memory above which a child is replaced (0 = no limit)
 
     # File Upload
     MAX_UPLOAD_SIZE_MB: int = 100
-    UPLOAD_DIR: str = "./uploads"
+    UPLOAD_DIR: str = "./uploads"                  # Uploads are spooled here while being parsed
+    UPLOAD_PARSE_CHUNK_ROWS: int = 200_000         # CSV rows parsed per chunk
 
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
@@ -60,6 +64,51 @@ class Settings(BaseSettings):
     DEFAULT_MAX_FORECAST_HORIZON: int = 365
     DEFAULT_RATE_LIMIT_FORECASTS_PER_HOUR: int = 20
 
+    # Redis DataFrame cache encoding (dataset:, preprocessed: keys)
+    REDIS_FRAME_FORMAT: str = "parquet"            # "parquet", "arrow" or "json" (legacy)
+    REDIS_FRAME_COMPRESSION: str = "zstd"          # "zstd", "lz4" or "none"
+    FRAME_CACHE_MAX_MB: int = 512                  # Per-worker in-memory cache of decoded frames (0 = disabled)
+
+    # Forecast Execution — where fit/predict/CV run (see app/services/execution)
+    FORECAST_EXECUTION_ENGINE: str = "process"     # "inline", "thread", "process", "celery" or "warm_pool"
+    FORECAST_EXECUTION_MAX_WORKERS: int = 2        # Concurrent jobs per API process
+    FORECAST_JOB_CPU_TIME_LIMIT_SEC: int = 120     # CPU seconds a single fit may burn (0 = unlimited)
+    FORECAST_JOB_TIMEOUT_SEC: int = 300            # Wall-clock seconds before a job is abandoned (0 = unlimited)
+    FORECAST_PROGRESS_MIN_INTERVAL_SEC: float = 0.5  # Progress writes closer together than this are coalesced
+    FORECAST_EVENTS_KEEPALIVE_SEC: int = 15        # Comment sent on idle SSE status streams so proxies keep them open
+    FORECAST_EVENTS_MAX_STREAM_SEC: int = 3600     # SSE status streams end after this long; clients reconnect
+    FORECAST_RESULT_CACHE_TTL_SEC: int = 86400     # Reuse model output of identical forecasts for this long (0 = disabled)
+    FORECAST_RESULT_CACHE_MAX_ENTRIES: int = 500   # Cached results per tenant; least recently used are evicted
+
+    # Prophet jobs run on their own engine; "warm_pool" keeps pre-warmed workers
+    # with the Stan model loaded (see app/services/execution/warm_pool_engine.py)
+    PROPHET_EXECUTION_ENGINE: str = "warm_pool"    # Any FORECAST_EXECUTION_ENGINE value, or "" to use that engine
+    PROPHET_WARM_WORKERS: int = 0                  # Warm workers per API process (0 = one per CPU core)
+    PROPHET_WORKER_MAX_JOBS: int = 100             # Jobs before a warm worker is recycled
+    PROPHET_WORKER_MAX_RSS_MB: int = 1024          # Resident memory above which a warm worker is recycled (0 = no limit)
+
+    # Auto-ARIMA order search (see app/forecasting/arima_search.py)
+    ARIMA_SEARCH: str = "stepwise"                 # "stepwise" (deterministic) or "grid" (legacy, 30s budget)
+    ARIMA_SEARCH_MAX_FITS: int = 24                # Candidate fits per stepwise search
+    ARIMA_SEARCH_N_JOBS: int = 1                   # Processes fitting candidates in parallel per job
+    FORECAST_CV_N_JOBS: int = 1                    # Processes fitting cross-validation folds in parallel per job
+
+    # Connectors — connection pools (see app/db/connector_pool.py) and streamed imports
+    CONNECTOR_POOL_MAX_SIZE: int = 5               # Connections per (tenant, connector config) pool
+    CONNECTOR_POOL_IDLE_SEC: int = 300             # Pools and pooled connections unused this long are closed
+    CONNECTOR_POOL_HEALTH_CHECK_SEC: int = 30      # Pooled connections idle longer than this are pinged before reuse
+    CONNECTOR_POOL_MAX_POOLS: int = 100            # Open pools per worker; least recently used idle pools close first
+    CONNECTOR_STREAM_BATCH_ROWS: int = 50_000      # Rows per chunk when imports stream from a connector
+
+    # Prediction persistence (see app/services/prediction_store.py)
+    PREDICTION_WRITE_BATCH_SIZE: int = 200         # Batch results buffered per bulk DB write
+    PREDICTION_WRITE_INTERVAL_SEC: float = 2.0     # Buffered results are also written at least this often (0 = only on size / end)
+
+    # Data Snapshots
+    SNAPSHOT_LEGACY_HASH_LOOKUP: bool = False      # Also dedup against pre-v2 (sorted-JSON) hashes; costs a full sort per miss
+    SNAPSHOT_COMPRESSION: str = "zstd"             # Parquet codec: "zstd", "lz4", "snappy", "gzip" or "none"
+    SNAPSHOT_ROW_GROUP_ROWS: int = 100_000         # Rows per parquet row group; smaller groups prune finer, larger compress better
+
     # Data Retention
     RETENTION_CLEANUP_INTERVAL_HOURS: int = 24   # How often the cleanup runs (informational; actual schedule is crontab in celery_app.py)
     RETENTION_BATCH_SIZE: int = 100              # Number of expired snapshots processed per batch
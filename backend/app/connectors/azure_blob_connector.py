@@ -2,14 +2,17 @@
 Azure Blob Storage Connector — uses azure-storage-blob (sync), wrapped in asyncio.to_thread
 """
 import asyncio
-import io
 import logging
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 
 import pandas as pd
 from azure.core.exceptions import AzureError, ResourceNotFoundError, ClientAuthenticationError
 from azure.storage.blob import BlobServiceClient
 
+from app.config import settings
+from app.services.blob_reader import AzureBlobObject, aiter_blob_frames, read_blob_frame
+
 from .base import BaseConnector
 
 logger = logging.getLogger(__name__)
@@ -17,16 +20,6 @@ logger = logging.getLogger(__name__)
 _DATA_EXTENSIONS = (".csv", ".xlsx", ".xls", ".parquet")
 
 
-def _parse_blob(data: bytes, blob_name: str) -> pd.DataFrame:
-    """Detect format from blob name and parse into a DataFrame."""
-    lower = blob_name.lower()
-    if lower.endswith(".parquet"):
-        return pd.read_parquet(io.BytesIO(data))
-    if lower.endswith((".xlsx", ".xls")):
-        return pd.read_excel(io.BytesIO(data))
-    return pd.read_csv(io.BytesIO(data))
-
-
 class AzureBlobConnector(BaseConnector):
     """Connect to Azure Blob Storage using azure-storage-blob."""
 
@@ -45,6 +38,11 @@ class AzureBlobConnector(BaseConnector):
     def _container(self) -> str:
         return self.config.get("container", "")
 
+    def _object(self, blob_name: str) -> AzureBlobObject:
+        return AzureBlobObject(
+            self._service_client().get_blob_client(container=self._container(), blob=blob_name)
+        )
+
     # ------------------------------------------------------------------
     # Sync helpers
     # ------------------------------------------------------------------
@@ -71,19 +69,8 @@ class AzureBlobConnector(BaseConnector):
         filters: dict[str, Any] | None,
         limit: int,
     ) -> pd.DataFrame:
-        client = self._service_client()
-        blob_client = client.get_blob_client(
-            container=self._container(), blob=blob_name
-        )
-        data = blob_client.download_blob().readall()
-        df = _parse_blob(data, blob_name)
-
-        if filters:
-            for col, val in filters.items():
-                if col in df.columns:
-                    df = df[df[col] == val]
-
-        return df.head(limit)
+        # Streams CSV and range-reads Parquet, stopping once `limit` rows matched
+        return read_blob_frame(self._object(blob_name), filters, limit)
 
     def _sync_list_resources(self) -> list[str]:
         client = self._service_client()
@@ -118,5 +105,25 @@ class AzureBlobConnector(BaseConnector):
             )
         return await asyncio.to_thread(self._sync_fetch_data, blob_name, filters, limit)
 
+    async def stream_data(
+        self,
+        query: str,
+        params: Any = (),
+        batch_rows: int | None = None,
+        columns: list[str] | None = None,
+        text_columns: list[str] | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Read the object *query* as it is consumed (see iter_blob_frames); *params* is unused."""
+        frames = aiter_blob_frames(
+            lambda: self._object(query),
+            columns=columns,
+            batch_rows=batch_rows or settings.CONNECTOR_STREAM_BATCH_ROWS,
+            text_columns=text_columns,
+        )
+        # aclosing: a consumer that stops early also stops the download
+        async with aclosing(frames):
+            async for df in frames:
+                yield df
+
     async def list_resources(self) -> list[str]:
         return await asyncio.to_thread(self._sync_list_resources)
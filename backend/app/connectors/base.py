@@ -2,11 +2,15 @@
 BaseConnector - Abstract base class for all data connectors
 """
 import re
+import sys
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
 
 import pandas as pd
 
+from app.config import settings
+from app.db.connector_pool import connector_pools
+
 
 # Required columns that every data source must provide
 REQUIRED_COLUMNS = {"Date", "Entity_ID", "Entity_Name", "Volume"}
@@ -66,6 +70,8 @@ class BaseConnector(ABC):
       - test_connection  — verify credentials and reachability
       - fetch_data       — pull data as a pandas DataFrame
       - list_resources   — enumerate available tables / files
+
+    and may override stream_data (chunked, unlimited reads for imports).
     """
 
     def __init__(self, config: dict, tenant_id: str) -> None:
@@ -109,6 +115,33 @@ class BaseConnector(ABC):
             source contains data matching the LUCENT schema.
         """
 
+    async def stream_data(
+        self,
+        query: str,
+        params: Any = (),
+        batch_rows: int | None = None,
+        columns: list[str] | None = None,
+        text_columns: list[str] | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Run *query* (bound to *params*, in the driver's parameter style) and
+        yield the full result, without a row limit, as DataFrame chunks of
+        at most *batch_rows* rows (default CONNECTOR_STREAM_BATCH_ROWS).
+
+        Database connectors override this to read through a server-side
+        cursor, so only one chunk is in memory at a time. Storage connectors
+        take *query* as the file key, ignore *params*, read only *columns*
+        when given and keep *text_columns* as strings rather than inferring
+        their type; they override this to read the file as it is consumed.
+        This default fetches the source once and slices it.
+        """
+        batch_rows = batch_rows or settings.CONNECTOR_STREAM_BATCH_ROWS
+        df = await self.fetch_data(query=query, limit=sys.maxsize)
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        for start in range(0, len(df), batch_rows):
+            yield df.iloc[start:start + batch_rows]
+
     @abstractmethod
     async def list_resources(self) -> list[str]:
         """
@@ -118,6 +151,37 @@ class BaseConnector(ABC):
             List of resource name strings (table names, file paths, etc.)
         """
 
+    # ------------------------------------------------------------------
+    # Pooled connections (database connectors)
+    # ------------------------------------------------------------------
+
+    # Driver whose pool serves this connector (see app/db/connector_pool.py); None = not pooled
+    pool_driver: str | None = None
+
+    def _pool_args(self) -> dict:
+        """Arguments the driver pool is created with (and keyed by)."""
+        raise NotImplementedError(f"{self.__class__.__name__} does not use pooled connections")
+
+    def connection(self):
+        """
+        Borrow a driver connection from the tenant's pool for this config.
+
+        Usage:
+            async with connector.connection() as conn:
+                ...
+
+        The connection goes back to the pool on exit, or is discarded when
+        the block raised.
+        """
+        if self.pool_driver is None:
+            raise NotImplementedError(f"{self.__class__.__name__} does not use pooled connections")
+        return connector_pools.connection(self.tenant_id, self.pool_driver, self._pool_args())
+
+    async def invalidate_pool(self) -> None:
+        """Close the pool of this connector's config (after the config changed or was deleted)."""
+        if self.pool_driver is not None:
+            await connector_pools.invalidate(self.tenant_id, self.pool_driver, self._pool_args())
+
     # ------------------------------------------------------------------
     # Shared helpers
     # ------------------------------------------------------------------
@@ -2,15 +2,18 @@
 Google Cloud Storage Connector — uses google-cloud-storage (sync), wrapped in asyncio.to_thread
 """
 import asyncio
-import io
 import json
 import logging
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 
 import pandas as pd
 from google.cloud import storage as gcs
 from google.oauth2 import service_account
 
+from app.config import settings
+from app.services.blob_reader import GCSObject, aiter_blob_frames, read_blob_frame
+
 from .base import BaseConnector
 
 logger = logging.getLogger(__name__)
@@ -18,16 +21,6 @@ logger = logging.getLogger(__name__)
 _DATA_EXTENSIONS = (".csv", ".xlsx", ".xls", ".parquet")
 
 
-def _parse_blob(data: bytes, blob_name: str) -> pd.DataFrame:
-    """Detect format from blob name and parse into a DataFrame."""
-    lower = blob_name.lower()
-    if lower.endswith(".parquet"):
-        return pd.read_parquet(io.BytesIO(data))
-    if lower.endswith((".xlsx", ".xls")):
-        return pd.read_excel(io.BytesIO(data))
-    return pd.read_csv(io.BytesIO(data))
-
-
 class GCSConnector(BaseConnector):
     """Connect to Google Cloud Storage using google-cloud-storage."""
 
@@ -50,6 +43,9 @@ class GCSConnector(BaseConnector):
     def _bucket_name(self) -> str:
         return self.config.get("bucket", "")
 
+    def _object(self, blob_name: str) -> GCSObject:
+        return GCSObject(self._client().bucket(self._bucket_name()).blob(blob_name))
+
     # ------------------------------------------------------------------
     # Sync helpers
     # ------------------------------------------------------------------
@@ -75,18 +71,8 @@ class GCSConnector(BaseConnector):
         filters: dict[str, Any] | None,
         limit: int,
     ) -> pd.DataFrame:
-        client = self._client()
-        bucket = client.get_bucket(self._bucket_name())
-        blob = bucket.blob(blob_name)
-        data = blob.download_as_bytes()
-        df = _parse_blob(data, blob_name)
-
-        if filters:
-            for col, val in filters.items():
-                if col in df.columns:
-                    df = df[df[col] == val]
-
-        return df.head(limit)
+        # Streams CSV and range-reads Parquet, stopping once `limit` rows matched
+        return read_blob_frame(self._object(blob_name), filters, limit)
 
     def _sync_list_resources(self) -> list[str]:
         client = self._client()
@@ -121,5 +107,25 @@ class GCSConnector(BaseConnector):
             )
         return await asyncio.to_thread(self._sync_fetch_data, blob_name, filters, limit)
 
+    async def stream_data(
+        self,
+        query: str,
+        params: Any = (),
+        batch_rows: int | None = None,
+        columns: list[str] | None = None,
+        text_columns: list[str] | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Read the object *query* as it is consumed (see iter_blob_frames); *params* is unused."""
+        frames = aiter_blob_frames(
+            lambda: self._object(query),
+            columns=columns,
+            batch_rows=batch_rows or settings.CONNECTOR_STREAM_BATCH_ROWS,
+            text_columns=text_columns,
+        )
+        # aclosing: a consumer that stops early also stops the download
+        async with aclosing(frames):
+            async for df in frames:
+                yield df
+
     async def list_resources(self) -> list[str]:
         return await asyncio.to_thread(self._sync_list_resources)
@@ -2,18 +2,22 @@
 MySQL Connector — uses aiomysql for fully async operation
 """
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 import aiomysql
 import pandas as pd
 
+from app.config import settings
+
 from .base import BaseConnector, validate_sql_identifier
 
 logger = logging.getLogger(__name__)
 
 
 class MySQLConnector(BaseConnector):
-    """Connect to a MySQL / MariaDB database using aiomysql."""
+    """Connect to a MySQL / MariaDB database using aiomysql (pooled, see BaseConnector.connection)."""
+
+    pool_driver = "aiomysql"
 
     def _conn_kwargs(self) -> dict:
         cfg = self.config
@@ -21,23 +25,23 @@ class MySQLConnector(BaseConnector):
             host=cfg.get("host", "localhost"),
             port=int(cfg.get("port", 3306)),
             db=cfg.get("database", ""),
-            user=cfg.get("user", ""),
+            user=cfg.get("user") or cfg.get("username", ""),
             password=cfg.get("password", ""),
             autocommit=True,
         )
 
+    def _pool_args(self) -> dict:
+        return self._conn_kwargs()
+
     # ------------------------------------------------------------------
     # Interface
     # ------------------------------------------------------------------
 
     async def test_connection(self) -> tuple[bool, str]:
         try:
-            conn = await aiomysql.connect(**self._conn_kwargs())
-            try:
+            async with self.connection() as conn:
                 async with conn.cursor() as cur:
                     await cur.execute("SELECT 1")
-            finally:
-                conn.close()
             return True, "Connection successful"
         except aiomysql.OperationalError as exc:
             code = exc.args[0] if exc.args else 0
@@ -78,22 +82,36 @@ class MySQLConnector(BaseConnector):
             query = f"SELECT * FROM ({query}) AS _lucent_q LIMIT %s"
             params = (limit,)
 
-        conn = await aiomysql.connect(**self._conn_kwargs())
-        try:
+        async with self.connection() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cur:
                 await cur.execute(query, params)
                 rows = await cur.fetchall()
 
-            if not rows:
-                return pd.DataFrame()
-            return pd.DataFrame(rows)
-        finally:
-            conn.close()
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows)
+
+    async def stream_data(
+        self,
+        query: str,
+        params: Any = (),
+        batch_rows: int | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Read *query* with an unbuffered (server-side) cursor, *batch_rows* rows per chunk."""
+        batch_rows = batch_rows or settings.CONNECTOR_STREAM_BATCH_ROWS
+        async with self.connection() as conn:
+            async with conn.cursor(aiomysql.SSCursor) as cur:
+                await cur.execute(query, params or None)
+                columns = [desc[0] for desc in cur.description]
+                while True:
+                    rows = await cur.fetchmany(batch_rows)
+                    if not rows:
+                        break
+                    yield pd.DataFrame(list(rows), columns=columns)
 
     async def list_resources(self) -> list[str]:
         database = self.config.get("database", "")
-        conn = await aiomysql.connect(**self._conn_kwargs())
-        try:
+        async with self.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
                     """
@@ -106,6 +124,14 @@ class MySQLConnector(BaseConnector):
                     (database,),
                 )
                 rows = await cur.fetchall()
-            return [row[0] for row in rows]
-        finally:
-            conn.close()
+        return [row[0] for row in rows]
+
+    async def execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a raw (metadata) query with %s parameters and return its rows."""
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                if params:
+                    await cur.execute(sql, params)
+                else:
+                    await cur.execute(sql)
+                return list(await cur.fetchall())
@@ -3,18 +3,22 @@ PostgreSQL Connector — uses asyncpg for fully async operation
 """
 import asyncio
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 import asyncpg
 import pandas as pd
 
+from app.config import settings
+
 from .base import BaseConnector, validate_sql_identifier
 
 logger = logging.getLogger(__name__)
 
 
 class PostgresConnector(BaseConnector):
-    """Connect to a PostgreSQL database using asyncpg."""
+    """Connect to a PostgreSQL database using asyncpg (pooled, see BaseConnector.connection)."""
+
+    pool_driver = "asyncpg"
 
     # ------------------------------------------------------------------
     # Helpers
@@ -25,21 +29,21 @@ class PostgresConnector(BaseConnector):
         host = cfg.get("host", "localhost")
         port = cfg.get("port", 5432)
         database = cfg.get("database", "")
-        user = cfg.get("user", "")
+        user = cfg.get("user") or cfg.get("username", "")
         password = cfg.get("password", "")
         return f"postgresql://{user}:{password}@{host}:{port}/{database}"
 
+    def _pool_args(self) -> dict:
+        return {"dsn": self._dsn()}
+
     # ------------------------------------------------------------------
     # Interface
     # ------------------------------------------------------------------
 
     async def test_connection(self) -> tuple[bool, str]:
         try:
-            conn = await asyncpg.connect(dsn=self._dsn())
-            try:
+            async with self.connection() as conn:
                 await conn.execute("SELECT 1")
-            finally:
-                await conn.close()
             return True, "Connection successful"
         except asyncpg.InvalidPasswordError:
             return False, "Authentication failed — invalid credentials"
@@ -78,26 +82,45 @@ class PostgresConnector(BaseConnector):
             # Wrap user-supplied query to enforce row limit
             query = f"SELECT * FROM ({query}) AS _lucent_q LIMIT {limit}"
 
-        conn = await asyncpg.connect(dsn=self._dsn())
-        try:
+        async with self.connection() as conn:
             if filters:
                 rows = await conn.fetch(query, *filters.values())
             else:
                 rows = await conn.fetch(query)
 
-            if not rows:
-                return pd.DataFrame()
+        if not rows:
+            return pd.DataFrame()
 
-            columns = list(rows[0].keys())
-            data = [list(row.values()) for row in rows]
-            return pd.DataFrame(data, columns=columns)
-        finally:
-            await conn.close()
+        columns = list(rows[0].keys())
+        data = [list(row.values()) for row in rows]
+        return pd.DataFrame(data, columns=columns)
+
+    async def stream_data(
+        self,
+        query: str,
+        params: Any = (),
+        batch_rows: int | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Read *query* through a server-side cursor, *batch_rows* typed rows per chunk."""
+        batch_rows = batch_rows or settings.CONNECTOR_STREAM_BATCH_ROWS
+        async with self.connection() as conn:
+            # Cursors only live inside a transaction
+            async with conn.transaction(readonly=True):
+                cursor = await conn.cursor(query, *params)
+                columns = None
+                while True:
+                    rows = await cursor.fetch(batch_rows)
+                    if not rows:
+                        break
+                    if columns is None:
+                        columns = list(rows[0].keys())
+                    yield pd.DataFrame([tuple(row) for row in rows], columns=columns)
+                    if len(rows) < batch_rows:
+                        break
 
     async def list_resources(self) -> list[str]:
         schema = self.config.get("schema", "public")
-        conn = await asyncpg.connect(dsn=self._dsn())
-        try:
+        async with self.connection() as conn:
             rows = await conn.fetch(
                 """
                 SELECT table_name
@@ -108,6 +131,10 @@ class PostgresConnector(BaseConnector):
                 """,
                 schema,
             )
-            return [row["table_name"] for row in rows]
-        finally:
-            await conn.close()
+        return [row["table_name"] for row in rows]
+
+    async def execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a raw (metadata) query with $n parameters and return its rows as tuples."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(sql, *params)
+        return [tuple(row) for row in rows]
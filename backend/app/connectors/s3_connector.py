@@ -2,14 +2,17 @@
 AWS S3 Connector — uses boto3 (sync), wrapped in asyncio.to_thread
 """
 import asyncio
-import io
 import logging
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 
 import boto3
 import botocore.exceptions
 import pandas as pd
 
+from app.config import settings
+from app.services.blob_reader import S3Object, aiter_blob_frames, read_blob_frame
+
 from .base import BaseConnector
 
 logger = logging.getLogger(__name__)
@@ -18,17 +21,6 @@ logger = logging.getLogger(__name__)
 _DATA_EXTENSIONS = (".csv", ".xlsx", ".xls", ".parquet")
 
 
-def _parse_file(body_bytes: bytes, key: str) -> pd.DataFrame:
-    """Detect format from the S3 key and parse into a DataFrame."""
-    lower = key.lower()
-    if lower.endswith(".parquet"):
-        return pd.read_parquet(io.BytesIO(body_bytes))
-    if lower.endswith((".xlsx", ".xls")):
-        return pd.read_excel(io.BytesIO(body_bytes))
-    # Default: CSV
-    return pd.read_csv(io.BytesIO(body_bytes))
-
-
 class S3Connector(BaseConnector):
     """Connect to an AWS S3 bucket using boto3."""
 
@@ -50,6 +42,9 @@ class S3Connector(BaseConnector):
     def _bucket(self) -> str:
         return self.config.get("bucket", "")
 
+    def _object(self, key: str) -> S3Object:
+        return S3Object(self._client(), self._bucket(), key)
+
     # ------------------------------------------------------------------
     # Sync helpers (run inside asyncio.to_thread)
     # ------------------------------------------------------------------
@@ -77,17 +72,8 @@ class S3Connector(BaseConnector):
         filters: dict[str, Any] | None,
         limit: int,
     ) -> pd.DataFrame:
-        client = self._client()
-        response = client.get_object(Bucket=self._bucket(), Key=key)
-        body_bytes = response["Body"].read()
-        df = _parse_file(body_bytes, key)
-
-        if filters:
-            for col, val in filters.items():
-                if col in df.columns:
-                    df = df[df[col] == val]
-
-        return df.head(limit)
+        # Streams CSV and range-reads Parquet, stopping once `limit` rows matched
+        return read_blob_frame(self._object(key), filters, limit)
 
     def _sync_list_resources(self) -> list[str]:
         client = self._client()
@@ -124,5 +110,25 @@ class S3Connector(BaseConnector):
             )
         return await asyncio.to_thread(self._sync_fetch_data, key, filters, limit)
 
+    async def stream_data(
+        self,
+        query: str,
+        params: Any = (),
+        batch_rows: int | None = None,
+        columns: list[str] | None = None,
+        text_columns: list[str] | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Read the object *query* as it is consumed (see iter_blob_frames); *params* is unused."""
+        frames = aiter_blob_frames(
+            lambda: self._object(query),
+            columns=columns,
+            batch_rows=batch_rows or settings.CONNECTOR_STREAM_BATCH_ROWS,
+            text_columns=text_columns,
+        )
+        # aclosing: a consumer that stops early also stops the download
+        async with aclosing(frames):
+            async for df in frames:
+                yield df
+
     async def list_resources(self) -> list[str]:
         return await asyncio.to_thread(self._sync_list_resources)
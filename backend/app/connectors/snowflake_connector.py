@@ -3,12 +3,14 @@ Snowflake Connector — uses snowflake-connector-python (sync), wrapped in async
 """
 import asyncio
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 import pandas as pd
 import snowflake.connector
 from snowflake.connector import errors as sf_errors
 
+from app.config import settings
+
 from .base import BaseConnector, validate_sql_identifier
 
 logger = logging.getLogger(__name__)
@@ -156,5 +158,32 @@ class SnowflakeConnector(BaseConnector):
             self._sync_fetch_data, query, table, filters, limit
         )
 
+    async def stream_data(
+        self,
+        query: str,
+        params: Any = (),
+        batch_rows: int | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Read *query* as Arrow result batches (fetch_arrow_batches), converted
+        and re-sliced to at most *batch_rows* rows per chunk. Each batch is
+        downloaded on a worker thread when the previous one was consumed.
+        """
+        batch_rows = batch_rows or settings.CONNECTOR_STREAM_BATCH_ROWS
+        conn = await asyncio.to_thread(self._connect)
+        try:
+            cur = conn.cursor()
+            await asyncio.to_thread(cur.execute, query, params or None)
+            batches = await asyncio.to_thread(cur.fetch_arrow_batches)
+            while True:
+                table = await asyncio.to_thread(next, batches, None)
+                if table is None:
+                    break
+                df = table.to_pandas()
+                for start in range(0, len(df), batch_rows):
+                    yield df.iloc[start:start + batch_rows]
+        finally:
+            conn.close()
+
     async def list_resources(self) -> list[str]:
         return await asyncio.to_thread(self._sync_list_resources)
@@ -2,19 +2,22 @@
 SQL Server Connector — uses aioodbc for fully async operation via ODBC Driver 17
 """
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
-import aioodbc
 import pyodbc
 import pandas as pd
 
+from app.config import settings
+
 from .base import BaseConnector, validate_sql_identifier, validate_qualified_identifier
 
 logger = logging.getLogger(__name__)
 
 
 class SQLServerConnector(BaseConnector):
-    """Connect to a Microsoft SQL Server database using aioodbc."""
+    """Connect to a Microsoft SQL Server database using aioodbc (pooled, see BaseConnector.connection)."""
+
+    pool_driver = "aioodbc"
 
     # ------------------------------------------------------------------
     # Helpers
@@ -54,6 +57,9 @@ class SQLServerConnector(BaseConnector):
             f"TrustServerCertificate={trust_cert}"
         )
 
+    def _pool_args(self) -> dict:
+        return {"dsn": self._dsn()}
+
     def _schema(self) -> str:
         return self.config.get("schema", "dbo")
 
@@ -73,7 +79,7 @@ class SQLServerConnector(BaseConnector):
         host = self.config.get("host", "localhost")
         database = self.config.get("database", "")
         try:
-            async with aioodbc.connect(dsn=self._dsn()) as conn:
+            async with self.connection() as conn:
                 async with conn.cursor() as cur:
                     await cur.execute("SELECT 1")
             return True, f"Connected to {database} on {host}"
@@ -151,7 +157,7 @@ class SQLServerConnector(BaseConnector):
             sql = f"SELECT * FROM ({query}) AS _lucent_q ORDER BY (SELECT NULL) OFFSET 0 ROWS FETCH NEXT {int(limit)} ROWS ONLY"
             params = ()
 
-        async with aioodbc.connect(dsn=self._dsn()) as conn:
+        async with self.connection() as conn:
             async with conn.cursor() as cur:
                 if params:
                     await cur.execute(sql, params)
@@ -169,6 +175,32 @@ class SQLServerConnector(BaseConnector):
         data = [list(row) for row in rows]
         return pd.DataFrame(data, columns=columns)
 
+    async def stream_data(
+        self,
+        query: str,
+        params: Any = (),
+        batch_rows: int | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Read *query* with fetchmany, *batch_rows* rows per chunk.
+
+        ODBC result sets are forward-only and streamed from the server, so
+        rows beyond the current chunk are never held client-side.
+        """
+        batch_rows = batch_rows or settings.CONNECTOR_STREAM_BATCH_ROWS
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                if params:
+                    await cur.execute(query, params)
+                else:
+                    await cur.execute(query)
+                columns = [desc[0] for desc in cur.description]
+                while True:
+                    rows = await cur.fetchmany(batch_rows)
+                    if not rows:
+                        break
+                    yield pd.DataFrame([tuple(row) for row in rows], columns=columns)
+
     async def list_resources(self) -> list[str]:
         """
         Return all base tables in the database as ``schema.table`` strings.
@@ -179,7 +211,7 @@ class SQLServerConnector(BaseConnector):
         Returns:
             Sorted list of "schema.table" name strings
         """
-        async with aioodbc.connect(dsn=self._dsn()) as conn:
+        async with self.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(
                     """
@@ -192,3 +224,13 @@ class SQLServerConnector(BaseConnector):
                 rows = await cur.fetchall()
 
         return [row[0] for row in rows]
+
+    async def execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a raw (metadata) query with ? parameters and return its rows."""
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                if params:
+                    await cur.execute(sql, params)
+                else:
+                    await cur.execute(sql)
+                return await cur.fetchall()
@@ -0,0 +1,328 @@
+# ============================================
+# Pooled connections to external connector databases (per worker)
+# ============================================
+"""
+Connection pools for the database connectors (PostgreSQL, MySQL, SQL Server).
+
+Connector reads, wizard metadata queries and column introspection used to
+open a fresh driver connection per call, paying TCP + TLS + authentication
+on every click. Pools are keyed by (tenant, driver, fingerprint of the
+connection arguments): a changed config (new host, rotated password) maps to
+a new pool, and `invalidate` retires the old one as soon as its borrowed
+connections come back.
+
+- Pools are created lazily with CONNECTOR_POOL_MAX_SIZE connections at most
+  and closed once unused for CONNECTOR_POOL_IDLE_SEC; at most
+  CONNECTOR_POOL_MAX_POOLS are kept open, least recently used first out.
+- A pooled connection idle for more than CONNECTOR_POOL_HEALTH_CHECK_SEC is
+  pinged before it is handed out; a dead one is discarded and replaced.
+  Idle times are keyed by each driver's `identity` of a connection, since
+  asyncpg hands out a new proxy object for the same connection every time.
+- A connection whose user raised (timeouts and cancellation included) is
+  discarded rather than returned, since it may be mid-query.
+
+Drivers are imported on first use, like the connectors themselves.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, str, str]
+
+
+class _AsyncpgDriver:
+    async def create_pool(self, args: Dict[str, Any], max_size: int, idle_seconds: float):
+        import asyncpg
+        return await asyncpg.create_pool(
+            **args, min_size=0, max_size=max_size, max_inactive_connection_lifetime=idle_seconds
+        )
+
+    async def acquire(self, pool):
+        return await pool.acquire()
+
+    def identity(self, conn):
+        # Every acquire() wraps the pooled connection in a new PoolConnectionProxy
+        return conn._con
+
+    async def release(self, pool, conn, discard: bool) -> None:
+        if discard:
+            conn.terminate()
+        await pool.release(conn)
+
+    async def ping(self, conn) -> None:
+        await conn.execute("SELECT 1")
+
+    async def close(self, pool) -> None:
+        await pool.close()
+
+
+class _AiomysqlDriver:
+    async def create_pool(self, args: Dict[str, Any], max_size: int, idle_seconds: float):
+        import aiomysql
+        return await aiomysql.create_pool(
+            **args, minsize=0, maxsize=max_size, pool_recycle=int(idle_seconds)
+        )
+
+    async def acquire(self, pool):
+        return await pool.acquire()
+
+    def identity(self, conn):
+        return conn
+
+    async def release(self, pool, conn, discard: bool) -> None:
+        if discard:
+            conn.close()
+        await pool.release(conn)
+
+    async def ping(self, conn) -> None:
+        await conn.ping(reconnect=False)
+
+    async def close(self, pool) -> None:
+        pool.close()
+        await pool.wait_closed()
+
+
+class _AioodbcDriver:
+    async def create_pool(self, args: Dict[str, Any], max_size: int, idle_seconds: float):
+        import aioodbc
+        return await aioodbc.create_pool(
+            **args, minsize=0, maxsize=max_size, pool_recycle=int(idle_seconds)
+        )
+
+    async def acquire(self, pool):
+        return await pool.acquire()
+
+    def identity(self, conn):
+        return conn
+
+    async def release(self, pool, conn, discard: bool) -> None:
+        if discard:
+            await conn.close()
+        await pool.release(conn)
+
+    async def ping(self, conn) -> None:
+        async with conn.cursor() as cur:
+            await cur.execute("SELECT 1")
+
+    async def close(self, pool) -> None:
+        pool.close()
+        await pool.wait_closed()
+
+
+_DRIVERS: Dict[str, Any] = {
+    "asyncpg": _AsyncpgDriver(),
+    "aiomysql": _AiomysqlDriver(),
+    "aioodbc": _AioodbcDriver(),
+}
+
+
+@dataclass
+class _PoolEntry:
+    driver: Any
+    pool: Any
+    last_used: float
+    in_use: int = 0
+    retired: bool = False
+    closed: bool = False
+    # driver.identity(connection) -> monotonic time it was returned, for health
+    # checks; weak so connections the pool closed on its own drop out
+    released_at: "weakref.WeakKeyDictionary[Any, float]" = field(default_factory=weakref.WeakKeyDictionary)
+
+
+def pool_key(tenant_id: str, driver: str, connect_args: Dict[str, Any]) -> PoolKey:
+    """Pool identity; credentials only enter it hashed."""
+    fingerprint = hashlib.sha256(
+        json.dumps(connect_args, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return tenant_id, driver, fingerprint
+
+
+class ConnectorPoolManager:
+    """Per-worker registry of driver pools, one per (tenant, connection config)."""
+
+    def __init__(
+        self,
+        max_size: int,
+        idle_seconds: float,
+        health_check_seconds: float,
+        max_pools: int,
+        drivers: Optional[Dict[str, Any]] = None,
+    ):
+        self.max_size = max_size
+        self.idle_seconds = idle_seconds
+        self.health_check_seconds = health_check_seconds
+        self.max_pools = max_pools
+        self._drivers = drivers or _DRIVERS
+        self._pools: Dict[PoolKey, _PoolEntry] = {}
+        self._lock = asyncio.Lock()
+        self.created = 0
+        self.evicted = 0
+        self.discarded = 0
+
+    @asynccontextmanager
+    async def connection(
+        self, tenant_id: str, driver: str, connect_args: Dict[str, Any]
+    ) -> AsyncIterator[Any]:
+        """Borrow a driver connection from the (tenant, config) pool."""
+        entry = await self._entry(pool_key(tenant_id, driver, connect_args), driver, connect_args)
+        try:
+            conn = await self._checkout(entry)
+        except BaseException:
+            await self._done(entry)
+            raise
+        discard = False
+        try:
+            yield conn
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            try:
+                await self._checkin(entry, conn, discard)
+            finally:
+                await self._done(entry)
+
+    async def invalidate(
+        self, tenant_id: str, driver: Optional[str] = None, connect_args: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Retire the pool of one connection config (or every pool of the tenant).
+
+        Idle pools close now; pools with borrowed connections close when the
+        last one is returned. New borrowers get a fresh pool.
+        """
+        async with self._lock:
+            if driver is not None and connect_args is not None:
+                keys = [pool_key(tenant_id, driver, connect_args)]
+            else:
+                keys = [k for k in self._pools if k[0] == tenant_id and (driver is None or k[1] == driver)]
+            retired = [self._pools.pop(k) for k in keys if k in self._pools]
+        for entry in retired:
+            entry.retired = True
+            if entry.in_use == 0:
+                await self._close(entry)
+        return len(retired)
+
+    async def evict_idle(self) -> int:
+        """Close pools unused for longer than idle_seconds."""
+        now = time.monotonic()
+        async with self._lock:
+            keys = [
+                k for k, e in self._pools.items()
+                if e.in_use == 0 and now - e.last_used > self.idle_seconds
+            ]
+            idle = [self._pools.pop(k) for k in keys]
+        for entry in idle:
+            await self._close(entry)
+        self.evicted += len(idle)
+        return len(idle)
+
+    async def close(self) -> None:
+        """Close every pool (application shutdown)."""
+        async with self._lock:
+            entries = list(self._pools.values())
+            self._pools.clear()
+        for entry in entries:
+            entry.retired = True
+            await self._close(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pools": len(self._pools),
+            "in_use": sum(e.in_use for e in self._pools.values()),
+            "created": self.created,
+            "evicted": self.evicted,
+            "discarded": self.discarded,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _entry(self, key: PoolKey, driver_name: str, connect_args: Dict[str, Any]) -> _PoolEntry:
+        """Pool of `key` (created on first use), already counted as in use."""
+        driver = self._drivers.get(driver_name)
+        if driver is None:
+            raise ValueError(f"No connection pool support for driver '{driver_name}'")
+        await self.evict_idle()
+        async with self._lock:
+            entry = self._pools.get(key)
+            if entry is None:
+                await self._make_room()
+                pool = await driver.create_pool(connect_args, self.max_size, self.idle_seconds)
+                entry = self._pools[key] = _PoolEntry(driver=driver, pool=pool, last_used=time.monotonic())
+                self.created += 1
+            entry.last_used = time.monotonic()
+            entry.in_use += 1
+            return entry
+
+    async def _make_room(self) -> None:
+        """Close least recently used idle pools while at max_pools (caller holds the lock)."""
+        while len(self._pools) >= self.max_pools:
+            idle = [(e.last_used, k) for k, e in self._pools.items() if e.in_use == 0]
+            if not idle:
+                return
+            _, key = min(idle)
+            await self._close(self._pools.pop(key))
+            self.evicted += 1
+
+    async def _checkout(self, entry: _PoolEntry):
+        # A pool holds at most max_size stale connections; one more try gets a fresh one
+        for _ in range(self.max_size + 1):
+            conn = await entry.driver.acquire(entry.pool)
+            idle_since = entry.released_at.pop(entry.driver.identity(conn), None)
+            if idle_since is None or time.monotonic() - idle_since <= self.health_check_seconds:
+                return conn
+            try:
+                await entry.driver.ping(conn)
+                return conn
+            except Exception as e:
+                logger.info(f"Discarding dead pooled connector connection: {e}")
+                await self._checkin(entry, conn, discard=True)
+        raise ConnectionError("No healthy connection available from connector pool")
+
+    async def _checkin(self, entry: _PoolEntry, conn, discard: bool) -> None:
+        # Identity is taken before release: a released proxy no longer knows its connection
+        identity = entry.driver.identity(conn)
+        if discard:
+            self.discarded += 1
+            entry.released_at.pop(identity, None)
+        else:
+            entry.released_at[identity] = time.monotonic()
+        try:
+            await entry.driver.release(entry.pool, conn, discard)
+        except Exception as e:
+            logger.error(f"Error returning connector connection to its pool: {e}")
+
+    async def _done(self, entry: _PoolEntry) -> None:
+        entry.in_use -= 1
+        entry.last_used = time.monotonic()
+        if entry.retired and entry.in_use == 0:
+            await self._close(entry)
+
+    async def _close(self, entry: _PoolEntry) -> None:
+        if entry.closed:
+            return
+        entry.closed = True
+        try:
+            await entry.driver.close(entry.pool)
+        except Exception as e:
+            logger.error(f"Error closing connector pool: {e}")
+
+
+connector_pools = ConnectorPoolManager(
+    max_size=settings.CONNECTOR_POOL_MAX_SIZE,
+    idle_seconds=settings.CONNECTOR_POOL_IDLE_SEC,
+    health_check_seconds=settings.CONNECTOR_POOL_HEALTH_CHECK_SEC,
+    max_pools=settings.CONNECTOR_POOL_MAX_POOLS,
+)
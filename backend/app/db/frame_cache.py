@@ -0,0 +1,117 @@
+# ============================================
+# In-process DataFrame cache (per worker)
+# ============================================
+"""
+Memory-bounded LRU of decoded DataFrames sitting in front of the Redis
+frame keys (`dataset:`, `preprocessed:`).
+
+Each entry remembers the dataset *version* it was decoded at. The version is
+a small Redis key (`dataset_version:{id}`) that writers bump whenever the
+dataset's data changes (save_preprocessed_data, reset_preprocessing,
+delete_dataset). Readers fetch the current version — one tiny GET — and only
+use a cached frame whose version matches, so every worker sees changes made
+by any other worker on its next read.
+
+Cached frames are never handed out directly: callers get a copy because much
+of the preprocessing code mutates frames in place.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    dataset_id: str
+    version: str
+    frame: pd.DataFrame
+    nbytes: int
+
+
+class FrameCache:
+    """LRU cache of DataFrames bounded by their in-memory size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: str, version: str) -> Optional[pd.DataFrame]:
+        """Return a copy of the cached frame for `key` at `version`, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.version != version:
+                self._remove(key)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            frame = entry.frame
+        return frame.copy()
+
+    def put(self, key: str, dataset_id: str, version: str, frame: pd.DataFrame) -> None:
+        """Cache a frame (the caller keeps ownership of `frame`; a copy is stored)."""
+        if self.max_bytes <= 0:
+            return
+        nbytes = int(frame.memory_usage(deep=True).sum())
+        if nbytes > self.max_bytes:
+            logger.debug(f"Frame {key} ({nbytes} bytes) exceeds cache capacity; not cached")
+            return
+        stored = frame.copy()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(dataset_id, version, stored, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_dataset(self, dataset_id: str) -> int:
+        """Drop every cached frame of a dataset; returns how many were dropped."""
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if e.dataset_id == dataset_id]
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
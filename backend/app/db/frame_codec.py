@@ -0,0 +1,146 @@
+# ============================================
+# DataFrame Codec for Redis-cached datasets
+# ============================================
+"""
+Versioned binary encoding for the DataFrames we keep in Redis
+(`dataset:{id}`, `preprocessed:{id}` and `preprocessed:{id}:{entity}`).
+
+Binary payloads start with a 10-byte header:
+
+    b"LCNTFRM"  |  version (1 byte)  |  format (1 byte)  |  compression (1 byte)
+
+followed by an Arrow IPC stream or a Parquet file. Anything without the
+header is treated as the legacy JSON encoding (`to_json(orient="split")`
+or a JSON list of records) so keys written before the switch keep working
+until they expire.
+"""
+
+import json
+import logging
+from io import BytesIO, StringIO
+from typing import Optional, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LCNTFRM"
+CODEC_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+FORMATS = {"arrow": 1, "parquet": 2}
+COMPRESSIONS = {"none": 0, "lz4": 1, "zstd": 2}
+_FORMAT_NAMES = {v: k for k, v in FORMATS.items()}
+_COMPRESSION_NAMES = {v: k for k, v in COMPRESSIONS.items()}
+
+
+def encode_frame(
+    df: pd.DataFrame,
+    fmt: str = "parquet",
+    compression: str = "zstd",
+) -> Union[bytes, str]:
+    """Encode a DataFrame for storage in Redis.
+
+    Args:
+        df: Frame to encode.
+        fmt: "parquet", "arrow" (Arrow IPC stream) or "json" (legacy text).
+        compression: "zstd", "lz4" or "none" (ignored for json).
+
+    Returns:
+        Binary payload with the codec header, or a JSON string when fmt is
+        "json" or the frame cannot be represented in Arrow (e.g. columns of
+        mixed Python types).
+    """
+    if fmt == "json":
+        return _encode_json(df)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown frame format '{fmt}' (expected arrow, parquet or json)")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown frame compression '{compression}' (expected lz4, zstd or none)")
+
+    try:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df)
+        sink = BytesIO()
+        if fmt == "arrow":
+            options = pa.ipc.IpcWriteOptions(
+                compression=None if compression == "none" else _arrow_codec(compression)
+            )
+            with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        else:
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, sink, compression=compression)
+    except Exception as e:
+        logger.warning(f"Falling back to JSON frame encoding: {e}")
+        return _encode_json(df)
+
+    header = MAGIC + bytes([CODEC_VERSION, FORMATS[fmt], COMPRESSIONS[compression]])
+    return header + sink.getvalue()
+
+
+def decode_frame(data: Union[bytes, str]) -> pd.DataFrame:
+    """Decode a payload written by encode_frame or by the legacy JSON writers."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data)
+        if data.startswith(MAGIC):
+            return _decode_binary(data)
+        data = data.decode("utf-8")
+    return _decode_json(data)
+
+
+def is_binary_frame(data: Union[bytes, str, None]) -> bool:
+    return isinstance(data, (bytes, bytearray)) and bytes(data[:len(MAGIC)]) == MAGIC
+
+
+def describe_frame(data: Union[bytes, str]) -> Optional[dict]:
+    """Return {"version", "format", "compression"} for a binary payload, None for JSON."""
+    if not is_binary_frame(data):
+        return None
+    version, fmt, compression = data[len(MAGIC):HEADER_SIZE]
+    return {
+        "version": version,
+        "format": _FORMAT_NAMES.get(fmt, "unknown"),
+        "compression": _COMPRESSION_NAMES.get(compression, "unknown"),
+    }
+
+
+# --------------------------------------------
+# Internals
+# --------------------------------------------
+
+def _arrow_codec(compression: str) -> str:
+    return "lz4_frame" if compression == "lz4" else compression
+
+
+def _decode_binary(data: bytes) -> pd.DataFrame:
+    version, fmt, _ = data[len(MAGIC):HEADER_SIZE]
+    if version > CODEC_VERSION:
+        raise ValueError(f"Unsupported frame codec version {version} (max {CODEC_VERSION})")
+
+    import pyarrow as pa
+
+    body = pa.py_buffer(memoryview(data)[HEADER_SIZE:])
+    if fmt == FORMATS["arrow"]:
+        table = pa.ipc.open_stream(body).read_all()
+    elif fmt == FORMATS["parquet"]:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(pa.BufferReader(body))
+    else:
+        raise ValueError(f"Unknown frame format id {fmt}")
+    return table.to_pandas()
+
+
+def _encode_json(df: pd.DataFrame) -> str:
+    return df.to_json(orient="split", date_format="iso")
+
+
+def _decode_json(text: str) -> pd.DataFrame:
+    parsed = json.loads(text)
+    # Handle both 'split' and records / 'dict' orientations
+    if isinstance(parsed, dict) and "columns" in parsed and "data" in parsed:
+        return pd.read_json(StringIO(text), orient="split")
+    return pd.DataFrame(parsed)
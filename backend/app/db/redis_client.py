@@ -4,19 +4,32 @@
 
 import redis.asyncio as redis
 import logging
-from typing import Optional
+import time
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
 
 from app.config import settings
+from app.db.frame_cache import FrameCache
+from app.db.frame_codec import decode_frame, encode_frame
 
 logger = logging.getLogger(__name__)
 
 # Global Redis client
 redis_client: Optional[redis.Redis] = None
 
+# Second client without response decoding, for binary payloads (DataFrames)
+redis_binary_client: Optional[redis.Redis] = None
+
+# Per-worker cache of decoded frames, validated against dataset_version:{id}
+REDIS_FRAME_VERSION_PREFIX = "dataset_version:"
+REDIS_FRAME_VERSION_TTL = 3600 * 24  # Outlives every dataset / preprocessed key
+frame_cache = FrameCache(max_bytes=settings.FRAME_CACHE_MAX_MB * 1024 * 1024)
+
 
 async def init_redis():
     """Initialize Redis connection"""
-    global redis_client
+    global redis_client, redis_binary_client
     try:
         redis_client = redis.from_url(
             settings.REDIS_URL,
@@ -27,15 +40,25 @@ async def init_redis():
         )
         # Test connection
         await redis_client.ping()
+        redis_binary_client = redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+        )
         logger.info("✅ Redis connection established")
     except Exception as e:
         logger.warning(f"⚠️ Redis connection failed (non-fatal): {e}")
         redis_client = None
+        redis_binary_client = None
 
 
 async def close_redis():
     """Close Redis connection"""
-    global redis_client
+    global redis_client, redis_binary_client
+    if redis_binary_client:
+        await redis_binary_client.close()
+        redis_binary_client = None
     if redis_client:
         await redis_client.close()
         logger.info("Redis connection closed")
@@ -54,6 +77,111 @@ async def get_redis() -> redis.Redis:
     return redis_client
 
 
+async def get_redis_binary() -> Optional[redis.Redis]:
+    """Redis client that returns raw bytes (for codec-encoded DataFrames)."""
+    return redis_binary_client
+
+
+# DataFrame helpers — see app/db/frame_codec.py for the wire format
+async def frame_set(key: str, df: pd.DataFrame, expire: int) -> bool:
+    """Encode and store a DataFrame. Returns False when Redis is unavailable."""
+    client = await get_redis_binary()
+    if client is None:
+        return False
+    payload = encode_frame(
+        df,
+        fmt=settings.REDIS_FRAME_FORMAT,
+        compression=settings.REDIS_FRAME_COMPRESSION,
+    )
+    await client.set(key, payload, ex=expire)
+    return True
+
+
+async def frame_get(key: str, dataset_id: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """Load a DataFrame stored by frame_set (or by the legacy JSON writers).
+
+    With `dataset_id`, the per-worker frame cache is consulted first and
+    filled on a miss; the caller always receives its own copy.
+    """
+    client = await get_redis_binary()
+    if client is None:
+        return None
+    version = await get_frame_version(dataset_id) if dataset_id else None
+    if version is not None:
+        cached = frame_cache.get(key, version)
+        if cached is not None:
+            return cached
+    data = await client.get(key)
+    if not data:
+        return None
+    df = decode_frame(data)
+    if version is not None:
+        frame_cache.put(key, dataset_id, version, df)
+    return df
+
+
+async def frame_mget(keys: List[str], dataset_id: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+    """Load several DataFrames in one round trip; missing keys are omitted."""
+    client = await get_redis_binary()
+    if client is None or not keys:
+        return {}
+    version = await get_frame_version(dataset_id) if dataset_id else None
+    frames: Dict[str, pd.DataFrame] = {}
+    if version is not None:
+        for key in keys:
+            cached = frame_cache.get(key, version)
+            if cached is not None:
+                frames[key] = cached
+    remaining = [k for k in keys if k not in frames]
+    if not remaining:
+        return frames
+    for key, data in zip(remaining, await client.mget(remaining)):
+        if not data:
+            continue
+        try:
+            frames[key] = decode_frame(data)
+        except Exception as e:
+            logger.error(f"Error decoding cached frame {key}: {e}")
+            continue
+        if version is not None:
+            frame_cache.put(key, dataset_id, version, frames[key])
+    return frames
+
+
+async def get_frame_version(dataset_id: str) -> Optional[str]:
+    """Current data version of a dataset (created on first use)."""
+    client = await get_redis()
+    if client is None:
+        return None
+    key = f"{REDIS_FRAME_VERSION_PREFIX}{dataset_id}"
+    version = await client.get(key)
+    if version is None:
+        # Seed with a unique value so an expired counter never repeats a version
+        await client.set(key, time.time_ns(), nx=True, ex=REDIS_FRAME_VERSION_TTL)
+        version = await client.get(key)
+    return version
+
+
+async def bump_frame_version(dataset_id: str) -> None:
+    """Mark a dataset's frames as changed for every worker.
+
+    Call after the new data has been written (or deleted) so readers can
+    never cache old data under the new version.
+    """
+    frame_cache.invalidate_dataset(dataset_id)
+    client = await get_redis()
+    if client is None:
+        return
+    await client.set(
+        f"{REDIS_FRAME_VERSION_PREFIX}{dataset_id}", time.time_ns(), ex=REDIS_FRAME_VERSION_TTL
+    )
+
+
+def frame_cache_stats() -> Dict[str, Any]:
+    """Hit / miss / eviction counters of this worker's frame cache."""
+    return frame_cache.stats()
+
+
 # Cache helper functions
 async def cache_set(key: str, value: str, expire: int = 3600) -> bool:
     """Set value in cache with expiration"""
@@ -11,7 +11,8 @@ from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 from statsmodels.tsa.stattools import adfuller, acf, pacf
 
-from .base import BaseForecaster, ForecastOutput
+from .arima_search import ndiffs, nsdiffs, stepwise_search
+from .base import BaseForecaster, ForecastOutput, series_from_state, series_to_state
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,10 @@ class ARIMAForecaster(BaseForecaster):
         confidence_level: float = 0.95,
         order: Tuple[int, int, int] = (1, 1, 1),
         seasonal_order: Optional[Tuple[int, int, int, int]] = None,
-        auto: bool = True
+        auto: bool = True,
+        search: str = "stepwise",
+        max_fits: int = 24,
+        n_jobs: int = 1
     ):
         """
         Initialize ARIMA forecaster.
@@ -40,11 +44,22 @@ class ARIMAForecaster(BaseForecaster):
             order: (p, d, q) - AR order, differencing, MA order
             seasonal_order: (P, D, Q, s) - Seasonal parameters
             auto: Whether to auto-detect parameters
+            search: Order search used when auto — "stepwise" (Hyndman–Khandakar,
+                deterministic, bounded by max_fits) or "grid" (legacy exhaustive
+                grid with a 30s wall-clock budget)
+            max_fits: Maximum candidate fits for the stepwise search
+            n_jobs: Processes used to fit stepwise candidates in parallel
         """
         super().__init__(frequency, confidence_level)
+        if search not in ("stepwise", "grid"):
+            raise ValueError(f"Unknown ARIMA search '{search}' (expected stepwise or grid)")
         self.order = order
         self.seasonal_order = seasonal_order
         self.auto = auto
+        self.search = search
+        self.max_fits = max_fits
+        self.n_jobs = n_jobs
+        self.start_params: Optional[np.ndarray] = None
 
     def fit(self, y: pd.Series, exog: Optional[pd.DataFrame] = None) -> None:
         """Fit ARIMA model with cascading fallback on failure.
@@ -100,16 +115,13 @@ class ARIMAForecaster(BaseForecaster):
         try:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
-                if seasonal_order and seasonal_order[3] > 1:
-                    self.model = SARIMAX(
-                        y,
-                        order=order,
-                        seasonal_order=seasonal_order,
-                        enforce_stationarity=False,
-                        enforce_invertibility=False,
-                    ).fit(disp=False)
-                else:
-                    self.model = ARIMA(y, order=order).fit()
+                try:
+                    self.model = self._fit_model(y, order, seasonal_order, self.start_params)
+                except Exception:
+                    if self.start_params is None:
+                        raise
+                    # Warm start did not fit this order/sample — start from scratch
+                    self.model = self._fit_model(y, order, seasonal_order, None)
             self.is_fitted = True
             logger.info(
                 f"ARIMA fit OK (fallback_level={self.fallback_level}): "
@@ -123,6 +135,123 @@ class ARIMAForecaster(BaseForecaster):
             )
             return False
 
+    def _fit_model(
+        self,
+        y: pd.Series,
+        order: Tuple[int, int, int],
+        seasonal_order: Optional[Tuple[int, int, int, int]],
+        start_params: Optional[np.ndarray],
+    ):
+        fit_kwargs = {} if start_params is None else {"start_params": start_params}
+        model = self._build_model(y, order, seasonal_order)
+        if not isinstance(model, ARIMA):
+            fit_kwargs["disp"] = False
+        return model.fit(**fit_kwargs)
+
+    def _build_model(
+        self,
+        y: pd.Series,
+        order: Tuple[int, int, int],
+        seasonal_order: Optional[Tuple[int, int, int, int]],
+    ):
+        if seasonal_order and seasonal_order[3] > 1:
+            return SARIMAX(
+                y,
+                order=order,
+                seasonal_order=seasonal_order,
+                enforce_stationarity=False,
+                enforce_invertibility=False,
+            )
+        return ARIMA(y, order=order)
+
+    def _filter_model(self, y: pd.Series, params: np.ndarray):
+        """Results for `y` under fixed parameters — a Kalman filter pass, no optimisation."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return self._build_model(y, self.order, self.seasonal_order).filter(params)
+
+    def update(self, y: pd.Series, exog: Optional[pd.DataFrame] = None, refit: bool = False) -> str:
+        """Extend the fit with new observations under the fitted parameters.
+
+        Same result as statsmodels `results.append(new, refit=False)`: one
+        Kalman filter pass, no order search and no optimisation.
+
+        When `y` revises the training data, or `refit` is set, the selected
+        order is re-estimated warm-started from the fitted parameters.
+        """
+        if not self.is_fitted:
+            self.fit(y, exog)
+            return "full"
+
+        new = self._new_observations(y)
+        if new is not None and not refit:
+            try:
+                if len(new) > 0:
+                    y = self._validate_data(y)
+                    self.model = self._filter_model(y, np.asarray(self.model.params, dtype=float))
+                    self._training_data = y
+                return "append"
+            except Exception as e:
+                logger.warning(f"ARIMA append failed, re-estimating order {self.order}: {e}")
+
+        auto, start_params = self.auto, self.start_params
+        self.auto = False
+        self.start_params = np.asarray(self.model.params, dtype=float)
+        try:
+            self.fit(y, exog)
+        finally:
+            self.auto, self.start_params = auto, start_params
+        return "refit"
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """Selected orders, fitted parameters and training series."""
+        if not self.is_fitted:
+            return None
+        return {
+            "method": "arima",
+            "frequency": self.frequency,
+            "confidence_level": self.confidence_level,
+            "order": list(self.order),
+            "seasonal_order": list(self.seasonal_order) if self.seasonal_order else None,
+            "auto": self.auto,
+            "search": self.search,
+            "fallback_level": getattr(self, "fallback_level", 0),
+            "params": [float(v) for v in np.asarray(self.model.params, dtype=float)],
+            "training": series_to_state(self._training_data),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "ARIMAForecaster":
+        forecaster = cls(
+            frequency=state["frequency"],
+            confidence_level=state["confidence_level"],
+            order=tuple(state["order"]),
+            seasonal_order=tuple(state["seasonal_order"]) if state.get("seasonal_order") else None,
+            auto=state.get("auto", True),
+            search=state.get("search", "stepwise"),
+        )
+        y = series_from_state(state["training"])
+        forecaster.model = forecaster._filter_model(y, np.asarray(state["params"], dtype=float))
+        forecaster._training_data = y
+        forecaster.fallback_level = state.get("fallback_level", 0)
+        forecaster.is_fitted = True
+        return forecaster
+
+    def fixed_clone(self, warm_start: bool = False) -> Optional["ARIMAForecaster"]:
+        """ARIMA with the selected (seasonal) order fixed; optionally warm-started."""
+        if not self.is_fitted:
+            return None
+        clone = ARIMAForecaster(
+            frequency=self.frequency,
+            confidence_level=self.confidence_level,
+            order=self.order,
+            seasonal_order=self.seasonal_order,
+            auto=False,
+        )
+        if warm_start:
+            clone.start_params = np.asarray(self.model.params, dtype=float)
+        return clone
+
     def _simpler_auto_arima(self, y: pd.Series) -> Tuple[Tuple[int, int, int], None]:
         """Simpler grid search used by fallback level 1: max p=q=2, d=1, no seasonal."""
         best_aic = float('inf')
@@ -252,6 +381,7 @@ class ARIMAForecaster(BaseForecaster):
             'order': self.order,
             'seasonal_order': self.seasonal_order,
             'auto': self.auto,
+            'search': self.search,
             'frequency': self.frequency,
             'confidence_level': self.confidence_level
         }
@@ -271,7 +401,34 @@ class ARIMAForecaster(BaseForecaster):
         }
 
     def _auto_arima(self, y: pd.Series) -> Tuple[Tuple[int, int, int], Optional[Tuple[int, int, int, int]]]:
-        """Auto ARIMA parameter selection with joint seasonal search.
+        """Auto ARIMA parameter selection (stepwise by default, see arima_search)."""
+        if self.search == "grid":
+            return self._grid_auto_arima(y)
+        return self._stepwise_auto_arima(y)
+
+    def _stepwise_auto_arima(self, y: pd.Series) -> Tuple[Tuple[int, int, int], Optional[Tuple[int, int, int, int]]]:
+        """Hyndman–Khandakar search: fix D then d by tests, then walk (p,q)x(P,Q) neighbours."""
+        seasonal_period = self._detect_seasonal_period(y)
+        if seasonal_period is None or len(y) < 2 * seasonal_period + 5:
+            seasonal_period = None
+
+        D = nsdiffs(y, seasonal_period) if seasonal_period else 0
+        d = self._find_d(y.diff(seasonal_period).dropna() if D else y)
+
+        result = stepwise_search(
+            y,
+            d=d,
+            seasonal_period=seasonal_period,
+            D=D,
+            max_fits=self.max_fits,
+            n_jobs=self.n_jobs,
+        )
+        if result is None:
+            return (1, d, 1), None
+        return result.order, result.seasonal_order
+
+    def _grid_auto_arima(self, y: pd.Series) -> Tuple[Tuple[int, int, int], Optional[Tuple[int, int, int, int]]]:
+        """Legacy grid search with joint seasonal search.
 
         If a seasonal period is detected, jointly searches (p,d,q) x (P,D,Q)
         using AIC. Matches old R `auto.arima` bounds: max p=3, max q=3, max P=2, max Q=2.
@@ -393,26 +550,8 @@ class ARIMAForecaster(BaseForecaster):
         return None
 
     def _find_d(self, y: pd.Series) -> int:
-        """Find optimal differencing order using ADF test"""
-        max_d = 2
-        for d in range(max_d + 1):
-            if d == 0:
-                test_series = y
-            else:
-                test_series = y.diff(d).dropna()
-
-            if len(test_series) < 10:
-                return d
-
-            try:
-                result = adfuller(test_series, autolag='AIC')
-                p_value = result[1]
-                if p_value < 0.05:  # Stationary at 5% level
-                    return d
-            except Exception:
-                continue
-
-        return 1  # Default to d=1
+        """Find optimal differencing order using ADF test (cached per series)"""
+        return ndiffs(y, max_d=2)
 
     def _detect_seasonality(self, y: pd.Series) -> Optional[Tuple[int, int, int, int]]:
         """Deprecated — kept for backward compatibility.
@@ -0,0 +1,254 @@
+"""
+ARIMA order search — stepwise (Hyndman–Khandakar) neighbourhood search.
+
+Instead of fitting every (p,q)x(P,Q) combination, the search starts from a
+handful of standard models and repeatedly evaluates the neighbours of the
+current best (each order +/-1, and p/q or P/Q together), moving while AIC
+improves. The differencing orders are fixed up front by unit-root / seasonal
+strength tests, which are cached per series so repeated searches on the same
+data (auto_detect_params, CV folds re-using a training window) skip them.
+
+The search is deterministic: the number of fits is bounded by `max_fits`
+(not wall time), candidates are evaluated in a fixed order and ties are
+broken towards the simpler model. Each round's neighbours are independent,
+so they can be fitted in parallel across processes (`n_jobs`).
+"""
+import hashlib
+import logging
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.stattools import adfuller
+
+from .parallel import process_pool
+
+logger = logging.getLogger(__name__)
+
+Order = Tuple[int, int, int]
+SeasonalOrder = Optional[Tuple[int, int, int, int]]
+Candidate = Tuple[Order, SeasonalOrder]
+
+# Candidates are scored on at most this many trailing observations; the chosen
+# order is then refitted on the full series by the forecaster
+SEARCH_WINDOW = 240
+
+# Seasonal strength above which one seasonal difference is taken (Wang, Smith & Hyndman 2006)
+SEASONAL_STRENGTH_THRESHOLD = 0.64
+
+_TEST_CACHE_SIZE = 256
+_test_cache: "OrderedDict[tuple, int]" = OrderedDict()
+_test_cache_lock = threading.Lock()
+
+
+@dataclass
+class SearchResult:
+    order: Order
+    seasonal_order: SeasonalOrder
+    aic: float
+    fits: int
+    elapsed_sec: float
+
+
+# ============================================
+# Differencing tests (cached)
+# ============================================
+
+def _cached_test(name: str, y: pd.Series, args: tuple, compute: Callable[[], int]) -> int:
+    values = np.ascontiguousarray(y.to_numpy(dtype=float))
+    key = (name, hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest(), args)
+    with _test_cache_lock:
+        if key in _test_cache:
+            _test_cache.move_to_end(key)
+            return _test_cache[key]
+    result = compute()
+    with _test_cache_lock:
+        _test_cache[key] = result
+        while len(_test_cache) > _TEST_CACHE_SIZE:
+            _test_cache.popitem(last=False)
+    return result
+
+
+def ndiffs(y: pd.Series, max_d: int = 2) -> int:
+    """Number of differences needed for stationarity (ADF test at 5%)."""
+    def compute() -> int:
+        for d in range(max_d + 1):
+            test_series = y if d == 0 else y.diff(d).dropna()
+            if len(test_series) < 10:
+                return d
+            try:
+                if adfuller(test_series, autolag='AIC')[1] < 0.05:
+                    return d
+            except Exception:
+                continue
+        return 1  # Default to d=1
+
+    return _cached_test("ndiffs", y, (max_d,), compute)
+
+
+def nsdiffs(y: pd.Series, period: int) -> int:
+    """Number of seasonal differences (0 or 1) from the STL seasonal strength."""
+    def compute() -> int:
+        if period < 2 or len(y) < 2 * period + 1:
+            return 0
+        try:
+            from statsmodels.tsa.seasonal import STL
+
+            fit = STL(y.to_numpy(dtype=float), period=period, robust=True).fit()
+            denom = np.var(fit.seasonal + fit.resid)
+            strength = max(0.0, 1.0 - np.var(fit.resid) / denom) if denom > 0 else 0.0
+            return int(strength >= SEASONAL_STRENGTH_THRESHOLD)
+        except Exception:
+            return 0
+
+    return _cached_test("nsdiffs", y, (period,), compute)
+
+
+# ============================================
+# Candidate fitting
+# ============================================
+
+def fit_aic(y: pd.Series, order: Order, seasonal_order: SeasonalOrder) -> float:
+    """AIC of one candidate, inf if the fit fails (module-level so it pickles)."""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if seasonal_order and seasonal_order[3] > 1:
+                model = SARIMAX(
+                    y,
+                    order=order,
+                    seasonal_order=seasonal_order,
+                    enforce_stationarity=False,
+                    enforce_invertibility=False,
+                ).fit(disp=False, maxiter=50)
+            else:
+                model = ARIMA(y, order=order).fit()
+        aic = float(model.aic)
+        return aic if np.isfinite(aic) else float('inf')
+    except Exception:
+        return float('inf')
+
+
+# ============================================
+# Stepwise search
+# ============================================
+
+def _complexity(candidate: Candidate) -> tuple:
+    (p, _, q), seasonal = candidate
+    P, _, Q, _ = seasonal or (0, 0, 0, 0)
+    return (p + q + P + Q, p, q, P, Q)
+
+
+def stepwise_search(
+    y: pd.Series,
+    d: int,
+    seasonal_period: Optional[int] = None,
+    D: int = 0,
+    max_p: int = 3,
+    max_q: int = 3,
+    max_P: int = 2,
+    max_Q: int = 2,
+    max_fits: int = 24,
+    n_jobs: int = 1,
+    window: Optional[int] = SEARCH_WINDOW,
+) -> Optional[SearchResult]:
+    """Hyndman–Khandakar stepwise search over (p,q)[x(P,Q)] with d and D fixed.
+
+    Candidates are compared on the last `window` observations (all of them if
+    None), which bounds the cost of each fit on long series.
+
+    Returns None when no candidate could be fitted.
+    """
+    seasonal = seasonal_period is not None and seasonal_period > 1
+    if window and len(y) > window:
+        y = y.iloc[-window:]
+
+    def candidate(p: int, q: int, P: int = 0, Q: int = 0) -> Optional[Candidate]:
+        if not (0 <= p <= max_p and 0 <= q <= max_q):
+            return None
+        if not seasonal:
+            return (p, d, q), None
+        if not (0 <= P <= max_P and 0 <= Q <= max_Q):
+            return None
+        return (p, d, q), (P, D, Q, seasonal_period)
+
+    if seasonal:
+        starts = [candidate(2, 2, 1, 1), candidate(0, 0, 0, 0),
+                  candidate(1, 0, 1, 0), candidate(0, 1, 0, 1)]
+    else:
+        starts = [candidate(2, 2), candidate(0, 0), candidate(1, 0), candidate(0, 1)]
+
+    def neighbours(c: Candidate) -> List[Optional[Candidate]]:
+        (p, _, q), so = c
+        P, _, Q, _ = so or (0, 0, 0, 0)
+        steps = [(dp, dq, 0, 0) for dp, dq in
+                 [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1)]]
+        if seasonal:
+            steps += [(0, 0, dP, dQ) for dP, dQ in
+                      [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1)]]
+        return [candidate(p + dp, q + dq, P + dP, Q + dQ) for dp, dq, dP, dQ in steps]
+
+    started = time.perf_counter()
+    scores: Dict[Candidate, float] = {}
+    executor = process_pool(n_jobs, purpose="ARIMA search")
+
+    def evaluate(batch: List[Optional[Candidate]]) -> None:
+        todo: List[Candidate] = []
+        for c in batch:
+            if c is not None and c not in scores and c not in todo:
+                todo.append(c)
+        todo = todo[:max(0, max_fits - len(scores))]
+        if not todo:
+            return
+        ys = [y] * len(todo)
+        orders = [c[0] for c in todo]
+        seasonal_orders = [c[1] for c in todo]
+        if executor is not None:
+            aics = list(executor.map(fit_aic, ys, orders, seasonal_orders))
+        else:
+            aics = list(map(fit_aic, ys, orders, seasonal_orders))
+        scores.update(zip(todo, aics))
+
+    def best_of(pool) -> Candidate:
+        return min(pool, key=lambda c: (scores[c], _complexity(c)))
+
+    try:
+        evaluate(starts)
+        if not scores:
+            return None
+        best = best_of(scores)
+        while len(scores) < max_fits:
+            pending = [c for c in neighbours(best) if c is not None and c not in scores]
+            if not pending:
+                break
+            evaluate(pending)
+            challenger = best_of([c for c in neighbours(best) if c in scores] + [best])
+            if challenger == best:
+                break
+            best = challenger
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    if not np.isfinite(scores[best]):
+        return None
+    result = SearchResult(
+        order=best[0],
+        seasonal_order=best[1],
+        aic=scores[best],
+        fits=len(scores),
+        elapsed_sec=time.perf_counter() - started,
+    )
+    logger.info(
+        f"ARIMA stepwise search: order={result.order}, seasonal={result.seasonal_order}, "
+        f"AIC={result.aic:.2f} after {result.fits} fits in {result.elapsed_sec:.1f}s"
+    )
+    return result
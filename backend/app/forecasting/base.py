@@ -79,6 +79,62 @@ class BaseForecaster(ABC):
         """
         pass
 
+    def fixed_clone(self, warm_start: bool = False) -> Optional["BaseForecaster"]:
+        """
+        Unfitted copy that refits this fitted model's selected structure
+        without repeating the parameter search (used by cross-validation).
+
+        Args:
+            warm_start: Also start the optimiser from this model's fitted parameters
+
+        Returns:
+            A new forecaster, or None if the method has no search to skip
+        """
+        return None
+
+    def update(self, y: pd.Series, exog: Optional[pd.DataFrame] = None, refit: bool = False) -> str:
+        """
+        Bring the fitted model up to date with `y` (the training series plus
+        newer observations) without repeating the model selection.
+
+        Args:
+            y: Full time series, normally the training data with new observations appended
+            exog: Optional exogenous variables
+            refit: Re-estimate the parameters instead of only filtering the new observations
+
+        Returns:
+            How the model was updated: "append" (parameters kept, new
+            observations filtered in), "refit" (selected structure re-estimated)
+            or "full" (fitted from scratch)
+        """
+        self.fit(y, exog=exog)
+        return "full"
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """
+        JSON-serialisable fitted state, restorable with from_state().
+
+        Returns:
+            The state dict, or None if the model is not fitted or cannot be persisted
+        """
+        return None
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "BaseForecaster":
+        """Rebuild a fitted forecaster from get_state() output without refitting."""
+        raise NotImplementedError(f"{cls.__name__} does not support restoring fitted state")
+
+    def _new_observations(self, y: pd.Series) -> Optional[pd.Series]:
+        """Observations of `y` after the training data, or None unless `y` only appends to it."""
+        train = self._training_data
+        y = y.dropna()
+        if train is None or len(y) < len(train):
+            return None
+        head = y.iloc[:len(train)]
+        if not head.index.equals(train.index) or not np.allclose(head.to_numpy(dtype=float), train.to_numpy(dtype=float)):
+            return None
+        return y.iloc[len(train):]
+
     def _validate_data(self, y: pd.Series) -> pd.Series:
         """Validate and prepare input data"""
         if y is None or len(y) == 0:
@@ -112,3 +168,15 @@ class BaseForecaster(ABC):
         """Calculate forecast accuracy metrics"""
         from .metrics import calculate_all_metrics
         return calculate_all_metrics(y_true, y_pred)
+
+
+def series_to_state(y: pd.Series) -> Dict[str, Any]:
+    """JSON-safe form of a datetime-indexed series, used in get_state()."""
+    return {
+        "index": [ts.isoformat() for ts in pd.DatetimeIndex(y.index)],
+        "values": [float(v) for v in y.to_numpy(dtype=float)],
+    }
+
+
+def series_from_state(raw: Dict[str, Any]) -> pd.Series:
+    return pd.Series(raw["values"], index=pd.DatetimeIndex(pd.to_datetime(raw["index"])), dtype=float)
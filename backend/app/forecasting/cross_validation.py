@@ -1,18 +1,21 @@
 """
 Cross-validation engine for time-series forecasting.
 
-Supports rolling-window and expanding-window walk-forward CV.
+Supports rolling-window and expanding-window walk-forward CV. Folds are
+independent, so they can be fitted in parallel across a process pool.
 """
 from __future__ import annotations
 
 import logging
+import pickle
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from app.forecasting.base import BaseForecaster
+from app.forecasting.parallel import process_pool
 
 
 logger = logging.getLogger(__name__)
@@ -89,6 +92,19 @@ def _plan_folds(
     return initial_train, step, folds, reduced
 
 
+def _fit_fold(
+    forecaster: BaseForecaster,
+    train: pd.Series,
+    train_exog: Optional[pd.DataFrame],
+    test: pd.Series,
+) -> Tuple[float, float, float]:
+    """Fit one fold and score it on its test window (module-level so it pickles)."""
+    forecaster.fit(train, exog=train_exog)
+    output = forecaster.predict(len(test), exog=None)
+    predictions = output.predictions["value"].to_numpy()
+    return _metrics(test.to_numpy(), predictions[: len(test)])
+
+
 def run_cv(
     series: pd.Series,
     forecaster_factory: Callable[[], BaseForecaster],
@@ -97,6 +113,7 @@ def run_cv(
     initial_train_size: float,
     horizon: int,
     exog: Optional[pd.DataFrame] = None,
+    n_jobs: int = 1,
 ) -> CVRunResult:
     """Run walk-forward cross-validation.
 
@@ -108,6 +125,7 @@ def run_cv(
         initial_train_size: Fraction of data for the first fold's training set (0.5-0.9).
         horizon: Forecast horizon (number of periods predicted per fold).
         exog: Optional exogenous variables aligned to `series`.
+        n_jobs: Worker processes used to fit folds in parallel (1 = serial).
 
     Returns:
         CVRunResult with per-fold metrics and averages.
@@ -118,6 +136,7 @@ def run_cv(
 
     result = CVRunResult(method=method, requested_folds=requested_folds, reduced_folds=reduced)
 
+    tasks = []
     for k in range(folds):
         if method == "expanding":
             train_start = 0
@@ -135,28 +154,63 @@ def run_cv(
 
         train = series.iloc[train_start:train_end]
         test = series.iloc[test_start:test_end]
-
         train_exog = exog.iloc[train_start:train_end] if exog is not None else None
+        tasks.append((k, train, train_exog, test))
 
+    forecasters = []
+    for k, *_ in tasks:
         try:
-            forecaster = forecaster_factory()
-            forecaster.fit(train, exog=train_exog)
-            output = forecaster.predict(len(test), exog=None)
-            predictions = output.predictions["value"].to_numpy()
-            mae, rmse, mape = _metrics(test.to_numpy(), predictions[: len(test)])
-            result.folds.append(
-                CVFoldResult(
-                    fold_index=k,
-                    train_size=int(train_end - train_start),
-                    test_size=int(test_end - test_start),
-                    mae=mae,
-                    rmse=rmse,
-                    mape=mape,
-                )
-            )
+            forecasters.append(forecaster_factory())
         except Exception as exc:
             logger.warning(f"CV fold {k} failed: {exc}")
+            forecasters.append(None)
+
+    executor = None
+    if n_jobs > 1 and len(tasks) > 1:
+        try:
+            pickle.dumps(forecasters)
+            executor = process_pool(min(n_jobs, len(tasks)), purpose="CV folds")
+        except Exception as exc:
+            logger.debug(f"CV folds running serially: forecaster cannot be pickled ({exc})")
+
+    outcomes: list = []
+    try:
+        futures = [
+            executor.submit(_fit_fold, forecaster, *task[1:])
+            if executor is not None and forecaster is not None else None
+            for forecaster, task in zip(forecasters, tasks)
+        ]
+        for forecaster, task, future in zip(forecasters, tasks, futures):
+            if forecaster is None:
+                outcomes.append(None)
+                continue
+            try:
+                outcomes.append(
+                    future.result() if future is not None else _fit_fold(forecaster, *task[1:])
+                )
+            except Exception as exc:
+                outcomes.append(exc)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    for (k, train, _, test), outcome in zip(tasks, outcomes):
+        if outcome is None:
             continue
+        if isinstance(outcome, Exception):
+            logger.warning(f"CV fold {k} failed: {outcome}")
+            continue
+        mae, rmse, mape = outcome
+        result.folds.append(
+            CVFoldResult(
+                fold_index=k,
+                train_size=len(train),
+                test_size=len(test),
+                mae=mae,
+                rmse=rmse,
+                mape=mape,
+            )
+        )
 
     # Compute averages
     if result.folds:
@@ -9,7 +9,7 @@ import logging
 
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
-from .base import BaseForecaster, ForecastOutput
+from .base import BaseForecaster, ForecastOutput, series_from_state, series_to_state
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +97,122 @@ class ETSForecaster(BaseForecaster):
             except Exception as e2:
                 raise ValueError(f"Failed to fit ETS model: {str(e2)}")
 
+    def fixed_clone(self, warm_start: bool = False) -> Optional["ETSForecaster"]:
+        """ETS with the detected trend/seasonality fixed (no warm start for ETS)."""
+        if not self.is_fitted:
+            return None
+        return ETSForecaster(
+            frequency=self.frequency,
+            confidence_level=self.confidence_level,
+            error=self.error,
+            trend=self.trend,
+            seasonal=self.seasonal,
+            seasonal_periods=self.seasonal_periods,
+            damped_trend=self.damped_trend,
+            auto=False,
+        )
+
+    def _filter_model(self, y: pd.Series, params: Dict[str, Any]):
+        """Results for `y` under fixed smoothing parameters and initial states (no optimisation)."""
+        trend_component = self.trend if self.trend and self.trend != 'none' else None
+        seasonal_component = self.seasonal if self.seasonal and self.seasonal != 'none' else None
+        damped = bool(self.damped_trend and trend_component)
+        smoothing = {'smoothing_level': params['smoothing_level']}
+        if trend_component:
+            smoothing['smoothing_trend'] = params['smoothing_trend']
+        if seasonal_component:
+            smoothing['smoothing_seasonal'] = params['smoothing_seasonal']
+        if damped:
+            smoothing['damping_trend'] = params['damping_trend']
+
+        return ExponentialSmoothing(
+            y,
+            trend=trend_component,
+            seasonal=seasonal_component,
+            seasonal_periods=self.seasonal_periods if seasonal_component else None,
+            damped_trend=damped,
+            initialization_method='known',
+            initial_level=params['initial_level'],
+            initial_trend=params['initial_trend'] if trend_component else None,
+            initial_seasonal=np.asarray(params['initial_seasons'], dtype=float) if seasonal_component else None,
+        ).fit(optimized=False, **smoothing)
+
+    def _fitted_params(self) -> Dict[str, Any]:
+        params = self.model.params
+        state = {
+            name: float(params[name])
+            for name in ('smoothing_level', 'smoothing_trend', 'smoothing_seasonal', 'damping_trend',
+                         'initial_level', 'initial_trend')
+            if params.get(name) is not None and np.isfinite(params[name])
+        }
+        state['initial_seasons'] = [float(v) for v in np.atleast_1d(params.get('initial_seasons', []))]
+        return state
+
+    def update(self, y: pd.Series, exog: Optional[pd.DataFrame] = None, refit: bool = False) -> str:
+        """Run the smoothing recursions over new observations with the fitted parameters.
+
+        When `y` revises the training data, or `refit` is set, the detected
+        trend/seasonality is kept and only the parameters are re-estimated.
+        """
+        if not self.is_fitted:
+            self.fit(y, exog)
+            return "full"
+
+        new = self._new_observations(y)
+        if new is not None and not refit:
+            try:
+                if len(new) > 0:
+                    y = self._validate_data(y)
+                    self.model = self._filter_model(y, self._fitted_params())
+                    self._training_data = y
+                return "append"
+            except Exception as e:
+                logger.warning(f"ETS state update failed, re-estimating parameters: {e}")
+
+        auto = self.auto
+        self.auto = False
+        try:
+            self.fit(y, exog)
+        finally:
+            self.auto = auto
+        return "refit"
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """Model structure, smoothing parameters, initial states and training series."""
+        if not self.is_fitted:
+            return None
+        return {
+            'method': 'ets',
+            'frequency': self.frequency,
+            'confidence_level': self.confidence_level,
+            'error': self.error,
+            'trend': self.trend,
+            'seasonal': self.seasonal,
+            'seasonal_periods': self.seasonal_periods,
+            'damped_trend': self.damped_trend,
+            'auto': self.auto,
+            'params': self._fitted_params(),
+            'training': series_to_state(self._training_data),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "ETSForecaster":
+        forecaster = cls(
+            frequency=state['frequency'],
+            confidence_level=state['confidence_level'],
+            error=state.get('error', 'add'),
+            trend=state.get('trend'),
+            seasonal=state.get('seasonal'),
+            seasonal_periods=state.get('seasonal_periods'),
+            damped_trend=state.get('damped_trend', False),
+            auto=state.get('auto', True),
+        )
+        y = series_from_state(state['training'])
+        forecaster.model = forecaster._filter_model(y, state['params'])
+        forecaster._training_data = y
+        forecaster.is_fitted = True
+        return forecaster
+
     def predict(self, horizon: int, exog: Optional[pd.DataFrame] = None) -> ForecastOutput:
         """Generate predictions"""
         if not self.is_fitted:
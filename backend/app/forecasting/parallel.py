@@ -0,0 +1,47 @@
+"""
+Process pools for CPU-bound work inside a single forecast (ARIMA candidate
+fits, cross-validation folds).
+
+Pools are only created when n_jobs > 1 and the current process is allowed to
+have children; otherwise callers get None and run serially. Pool workers exit
+on their own once the process that created them is gone, so killing a
+forecast job (cancel, CPU limit) does not leave orphans behind.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _exit_with_parent(parent_pid: int) -> None:
+    """Pool initializer: stop a worker once the process that owns it is gone."""
+    def watch() -> None:
+        while os.getppid() == parent_pid:
+            time.sleep(1.0)
+        os._exit(0)
+
+    threading.Thread(target=watch, daemon=True).start()
+
+
+def process_pool(n_jobs: int, purpose: str = "work") -> Optional[Executor]:
+    """ProcessPoolExecutor with `n_jobs` workers, or None to run serially."""
+    if n_jobs <= 1:
+        return None
+    if multiprocessing.current_process().daemon:
+        # Daemonic processes (Celery prefork children) may not have children
+        logger.debug(f"Running {purpose} serially: daemonic process cannot spawn workers")
+        return None
+    try:
+        return ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_exit_with_parent,
+            initargs=(os.getpid(),),
+        )
+    except Exception as e:
+        logger.warning(f"Running {purpose} serially: could not start worker pool: {e}")
+        return None
@@ -0,0 +1,50 @@
+"""
+Fitted-model persistence - encode forecaster state for the storage backend
+
+A fitted model is stored as its `get_state()` dict (orders / structure,
+fitted parameters, training series) rather than a pickle of the statsmodels
+or Prophet objects: it is a few KB of gzipped JSON, safe to load, and does
+not break when a library upgrade changes the internals of its result classes.
+"""
+import gzip
+import json
+from typing import Any, Dict, Optional
+
+from .base import BaseForecaster
+from .arima import ARIMAForecaster
+from .ets import ETSForecaster
+from .prophet_forecaster import ProphetForecaster
+
+MODEL_STATE_VERSION = 1
+
+_FORECASTERS = {
+    "arima": ARIMAForecaster,
+    "ets": ETSForecaster,
+    "prophet": ProphetForecaster,
+}
+
+
+def dump_model_state(forecaster: BaseForecaster) -> Optional[Dict[str, Any]]:
+    """Versioned state of a fitted forecaster, or None if it cannot be persisted."""
+    state = forecaster.get_state()
+    if state is None:
+        return None
+    return {"version": MODEL_STATE_VERSION, **state}
+
+
+def load_forecaster(state: Dict[str, Any]) -> BaseForecaster:
+    """Rebuild a fitted forecaster from dump_model_state() output."""
+    if state.get("version") != MODEL_STATE_VERSION:
+        raise ValueError(f"Unsupported model state version: {state.get('version')!r}")
+    forecaster_cls = _FORECASTERS.get(state.get("method"))
+    if forecaster_cls is None:
+        raise ValueError(f"Unknown forecasting method in model state: {state.get('method')!r}")
+    return forecaster_cls.from_state(state)
+
+
+def encode_model_state(state: Dict[str, Any]) -> bytes:
+    return gzip.compress(json.dumps(state).encode("utf-8"))
+
+
+def decode_model_state(data: bytes) -> Dict[str, Any]:
+    return json.loads(gzip.decompress(data).decode("utf-8"))
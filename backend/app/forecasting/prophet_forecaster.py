@@ -7,7 +7,7 @@ import pandas as pd
 import numpy as np
 import logging
 
-from .base import BaseForecaster, ForecastOutput
+from .base import BaseForecaster, ForecastOutput, series_from_state
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +16,36 @@ logging.getLogger('prophet').setLevel(logging.WARNING)
 logging.getLogger('cmdstanpy').setLevel(logging.WARNING)
 warnings.filterwarnings('ignore', category=FutureWarning)
 
+# Compiled Stan model shared by every Prophet instance in this process
+_stan_models: Dict[str, Any] = {}
+
+
+def _load_prophet():
+    """Import Prophet and make its CmdStanPy backend reuse one loaded Stan model.
+
+    Each `Prophet()` otherwise builds a new CmdStanModel, which starts the
+    model executable to read its metadata. The model itself holds no fit
+    state, so sharing it between instances is safe.
+    """
+    try:
+        from prophet import Prophet
+        from prophet.models import CmdStanPyBackend
+    except ImportError:
+        raise ImportError("Prophet is not installed. Install it with: pip install prophet")
+
+    if not getattr(CmdStanPyBackend.load_model, "shared", False):
+        load_model = CmdStanPyBackend.load_model
+
+        def load_shared_model(self):
+            model = _stan_models.get("cmdstanpy")
+            if model is None:
+                model = _stan_models["cmdstanpy"] = load_model(self)
+            return model
+
+        load_shared_model.shared = True
+        CmdStanPyBackend.load_model = load_shared_model
+    return Prophet
+
 
 class ProphetForecaster(BaseForecaster):
     """Facebook Prophet forecaster"""
@@ -57,14 +87,12 @@ class ProphetForecaster(BaseForecaster):
         self._df_train = None
         self._regressor_columns: List[str] = []
         self._regressor_means: Dict[str, float] = {}
+        self._init_params: Optional[Dict[str, Any]] = None
 
     def fit(self, y: pd.Series, exog: Optional[pd.DataFrame] = None) -> None:
         """Fit Prophet model to the data"""
         # Import Prophet here to avoid import errors if not installed
-        try:
-            from prophet import Prophet
-        except ImportError:
-            raise ImportError("Prophet is not installed. Install it with: pip install prophet")
+        Prophet = _load_prophet()
 
         y = self._validate_data(y)
         self._training_data = y
@@ -110,23 +138,18 @@ class ProphetForecaster(BaseForecaster):
                 )
 
             # Initialize Prophet model
-            self.model = Prophet(
-                changepoint_prior_scale=self.changepoint_prior_scale,
-                seasonality_prior_scale=self.seasonality_prior_scale,
-                seasonality_mode=self.seasonality_mode,
-                yearly_seasonality=self.yearly_seasonality,
-                weekly_seasonality=self.weekly_seasonality,
-                daily_seasonality=self.daily_seasonality,
-                holidays_prior_scale=self.holidays_prior_scale,
-                interval_width=self.confidence_level
-            )
-
-            # Register regressors before fitting
-            for col in self._regressor_columns:
-                self.model.add_regressor(col)
-
-            # Fit the model
-            self.model.fit(self._df_train)
+            self.model = self._new_model(Prophet)
+
+            # Fit the model (optionally warm-started from a previous fit, see update())
+            if self._init_params is not None:
+                try:
+                    self.model.fit(self._df_train, init=self._init_params)
+                except Exception as e:
+                    logger.warning(f"Prophet warm start failed, fitting from scratch: {e}")
+                    self.model = self._new_model(Prophet)
+                    self.model.fit(self._df_train)
+            else:
+                self.model.fit(self._df_train)
             self.is_fitted = True
             logger.info("Prophet model fitted successfully")
 
@@ -136,8 +159,103 @@ class ProphetForecaster(BaseForecaster):
             logger.error(f"Prophet fitting failed: {e}")
             raise ValueError(f"Failed to fit Prophet model: {str(e)}")
 
+    def _new_model(self, Prophet):
+        """Unfitted Prophet with this forecaster's settings and regressors registered."""
+        model = Prophet(
+            changepoint_prior_scale=self.changepoint_prior_scale,
+            seasonality_prior_scale=self.seasonality_prior_scale,
+            seasonality_mode=self.seasonality_mode,
+            yearly_seasonality=self.yearly_seasonality,
+            weekly_seasonality=self.weekly_seasonality,
+            daily_seasonality=self.daily_seasonality,
+            holidays_prior_scale=self.holidays_prior_scale,
+            interval_width=self.confidence_level
+        )
+
+        # Register regressors before fitting
+        for col in self._regressor_columns:
+            model.add_regressor(col)
+        return model
+
+    def update(self, y: pd.Series, exog: Optional[pd.DataFrame] = None, refit: bool = False) -> str:
+        """Refit on `y` warm-started from the fitted parameters.
+
+        Prophet has no state-space form to filter new observations through,
+        so the model is re-optimised, but starting from the previous optimum
+        (trend, changepoint deltas, seasonality coefficients) converges in a
+        fraction of the iterations of a cold fit.
+        """
+        if not self.is_fitted:
+            self.fit(y, exog)
+            return "full"
+
+        params = self.model.params
+        self._init_params = {
+            name: float(params[name][0][0]) for name in ('k', 'm', 'sigma_obs')
+        }
+        self._init_params.update({
+            name: np.asarray(params[name][0], dtype=float) for name in ('delta', 'beta')
+        })
+        try:
+            self.fit(y, exog)
+        finally:
+            self._init_params = None
+        return "refit"
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """Prophet's own JSON serialisation plus the training frame used for metrics."""
+        if not self.is_fitted:
+            return None
+        from prophet.serialize import model_to_json
+
+        df_train = self._df_train.copy()
+        df_train['ds'] = df_train['ds'].dt.strftime('%Y-%m-%dT%H:%M:%S')
+        return {
+            'method': 'prophet',
+            'frequency': self.frequency,
+            'confidence_level': self.confidence_level,
+            'settings': {
+                'changepoint_prior_scale': self.changepoint_prior_scale,
+                'seasonality_prior_scale': self.seasonality_prior_scale,
+                'seasonality_mode': self.seasonality_mode,
+                'yearly_seasonality': self.yearly_seasonality,
+                'weekly_seasonality': self.weekly_seasonality,
+                'daily_seasonality': self.daily_seasonality,
+                'holidays_prior_scale': self.holidays_prior_scale,
+            },
+            'model': model_to_json(self.model),
+            'train': df_train.to_dict(orient='list'),
+            'regressor_columns': list(self._regressor_columns),
+            'regressor_means': dict(self._regressor_means),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "ProphetForecaster":
+        _load_prophet()
+        from prophet.serialize import model_from_json
+
+        forecaster = cls(
+            frequency=state['frequency'],
+            confidence_level=state['confidence_level'],
+            **state['settings'],
+        )
+        forecaster.model = model_from_json(state['model'])
+        forecaster._df_train = pd.DataFrame(state['train'])
+        forecaster._df_train['ds'] = pd.to_datetime(forecaster._df_train['ds'])
+        forecaster._training_data = series_from_state({
+            'index': state['train']['ds'], 'values': state['train']['y'],
+        })
+        forecaster._regressor_columns = list(state.get('regressor_columns') or [])
+        forecaster._regressor_means = dict(state.get('regressor_means') or {})
+        forecaster.is_fitted = True
+        return forecaster
+
     def predict(self, horizon: int, exog: Optional[pd.DataFrame] = None) -> ForecastOutput:
-        """Generate predictions"""
+        """Generate predictions.
+
+        `exog` optionally holds known future regressor values (date-indexed);
+        regressors without a value for a forecast date use their training mean.
+        """
         if not self.is_fitted:
             raise ValueError("Model must be fitted before prediction")
 
@@ -154,18 +272,9 @@ class ProphetForecaster(BaseForecaster):
 
         # Add regressor columns to future dataframe
         if self._regressor_columns:
+            aligned = self._align_regressors(future['ds'], exog)
             for col in self._regressor_columns:
-                # For historical dates, use actual values from training data
-                col_values = []
-                for ds in future['ds']:
-                    # Check if this date exists in training data
-                    match = self._df_train[self._df_train['ds'] == ds]
-                    if len(match) > 0 and col in self._df_train.columns:
-                        col_values.append(float(match[col].iloc[0]))
-                    else:
-                        # Future dates: use mean value as default
-                        col_values.append(self._regressor_means.get(col, 0.0))
-                future[col] = col_values
+                future[col] = aligned[col].to_numpy()
 
         forecast = self.model.predict(future)
 
@@ -246,6 +355,41 @@ class ProphetForecaster(BaseForecaster):
             residuals=residuals
         )
 
+    def _align_regressors(self, ds: pd.Series, exog: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Regressor values for every date in `ds`, aligned with one reindex per source.
+
+        Training dates use the values the model was fitted on; other dates use
+        the caller-supplied `exog` (date-indexed) where it has a value, and the
+        training mean otherwise.
+        """
+        dates = pd.DatetimeIndex(ds)
+        history = self._df_train.set_index('ds')[self._regressor_columns]
+        history = history[~history.index.duplicated(keep='last')]
+        aligned = history.reindex(dates)
+
+        if exog is not None and len(exog) > 0:
+            supplied = exog.reindex(columns=self._regressor_columns)
+            supplied.index = pd.DatetimeIndex(supplied.index)
+            supplied = supplied[~supplied.index.duplicated(keep='last')]
+            supplied = supplied.apply(pd.to_numeric, errors='coerce')
+            aligned = aligned.fillna(supplied.reindex(dates))
+
+        return aligned.fillna(self._regressor_means).fillna(0.0)
+
+    @staticmethod
+    def warm_up() -> bool:
+        """Import Prophet and load the Stan model ahead of the first fit.
+
+        Called by long-lived workers at startup; returns False when Prophet
+        or CmdStan is unavailable (the first fit then reports the error).
+        """
+        try:
+            _load_prophet()()
+            return True
+        except Exception as e:
+            logger.warning(f"Prophet warm-up failed: {e}")
+            return False
+
     def get_params(self) -> Dict[str, Any]:
         """Return model parameters"""
         return {
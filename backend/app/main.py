@@ -20,7 +20,9 @@ import logging
 from app.config import settings
 from app.db.database import init_db, close_db
 from app.db.redis_client import init_redis, close_redis
+from app.db.connector_pool import connector_pools
 from app.api.v1.api import api_router
+from app.services.forecast_events import event_hub
 
 # Configure logging
 logging.basicConfig(
@@ -45,6 +47,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("👋 Shutting down LUCENT Backend...")
     await close_db()
+    await connector_pools.close()
+    await event_hub.close()
     await close_redis()
     logger.info("✅ Connections closed")
 
@@ -13,6 +13,7 @@ from app.models.dataset import Dataset
 from app.models.connector_data_source import ConnectorDataSource
 from app.models.data_snapshot import DataSnapshot, SnapshotStatus
 from app.models.forecast_prediction import ForecastPrediction
+from app.models.forecast_prediction_point import ForecastPredictionPoint
 from app.models.invite import Invite
 from app.models.api_key import ApiKey
 
@@ -34,6 +35,7 @@ __all__ = [
     "DataSnapshot",
     "SnapshotStatus",
     "ForecastPrediction",
+    "ForecastPredictionPoint",
     "Invite",
     "ApiKey",
 ]
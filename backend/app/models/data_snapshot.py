@@ -31,11 +31,13 @@ class DataSnapshot(Base):
     dataset_id = Column(String(36), nullable=True)                    # Original dataset if from file upload
     connector_data_source_id = Column(String(36), nullable=True)     # Connector recipe if from connector
 
-    # S3 object location, format: "{tenant_id}/snapshots/{hash}.parquet.gz"
+    # S3 object location, format: "{tenant_id}/snapshots/{hash}.parquet" (".parquet.gz" before zstd)
     s3_key = Column(String(1000), nullable=False)
 
-    # SHA-256 hash of the raw data for deduplication; indexed for fast lookups
+    # Content hash of the data for deduplication; indexed for fast lookups
     data_hash = Column(String(64), nullable=False, index=True)
+    # Algorithm that produced data_hash (1 = legacy sorted-JSON SHA-256, 2 = row-hash sum)
+    hash_version = Column(Integer, nullable=False, default=2, server_default="1")
 
     # Data dimensions
     row_count = Column(Integer, nullable=False)
@@ -43,7 +45,7 @@ class DataSnapshot(Base):
 
     # Storage metadata
     file_size_bytes = Column(BigInteger, nullable=True)
-    compression = Column(String(20), default="gzip")
+    compression = Column(String(20), default="gzip")     # Parquet codec the file was written with
     format = Column(String(20), default="parquet")
 
     # Lifecycle
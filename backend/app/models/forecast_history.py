@@ -54,6 +54,9 @@ class ForecastHistory(Base):
     processing_time_ms = Column(Integer)
     entity_count = Column(Integer, default=1)
 
+    # Storage key of the fitted model state ({tenant_id}/models/{id}.json.gz)
+    model_key = Column(String(512), nullable=True)
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), index=True)
     started_at = Column(DateTime, nullable=True)
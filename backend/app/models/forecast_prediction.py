@@ -25,7 +25,8 @@ class ForecastPrediction(Base):
 
     # Full time-series output — list of dicts:
     # [{"date": "2026-01-01", "value": 42.3, "lower_bound": 38.1, "upper_bound": 46.5}, ...]
-    predicted_values = Column(JSON, nullable=False)
+    # Null for runs stored as ForecastPredictionPoint rows (see app/services/prediction_store.py)
+    predicted_values = Column(JSON, nullable=True)
 
     # Accuracy metrics — all keys optional depending on method:
     # {"mae": 1.2, "rmse": 1.8, "mape": 3.5, "mse": 3.24, "r2": 0.92, "aic": -120.4, "bic": -115.1}
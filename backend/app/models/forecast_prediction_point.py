@@ -0,0 +1,36 @@
+"""
+ForecastPredictionPoint Model - One row per predicted date.
+The queryable form of a ForecastPrediction's series: range reads ("entity X
+between two dates") and aggregates ("sum across entities per date") run in
+PostgreSQL over an index instead of parsing JSON blobs in Python.
+"""
+from sqlalchemy import Column, String, Float, Date, ForeignKey, Index
+
+from app.db.database import Base
+
+
+class ForecastPredictionPoint(Base):
+    __tablename__ = "forecast_prediction_points"
+
+    # One point per date of a prediction series
+    forecast_prediction_id = Column(
+        String(36), ForeignKey("forecast_predictions.id", ondelete="CASCADE"), primary_key=True
+    )
+    date = Column(Date, primary_key=True)
+
+    # Denormalised from the parent rows so range / aggregate queries need no join
+    tenant_id = Column(String(36), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    forecast_history_id = Column(String(36), ForeignKey("forecast_history.id", ondelete="CASCADE"), nullable=False)
+    entity_id = Column(String(255), nullable=False)
+
+    value = Column(Float, nullable=False)
+    lower_bound = Column(Float, nullable=True)
+    upper_bound = Column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_forecast_prediction_points_run_entity_date", "tenant_id", "forecast_history_id", "entity_id", "date"),
+        Index("ix_forecast_prediction_points_entity_date", "tenant_id", "entity_id", "date"),
+    )
+
+    def __repr__(self):
+        return f"<ForecastPredictionPoint(forecast_prediction_id={self.forecast_prediction_id}, date={self.date})>"
@@ -89,3 +89,15 @@ class PlatformStats(BaseModel):
     active_users: int
     pending_approvals: int
     forecasts_last_24h: int = 0
+
+
+class FrameCacheStats(BaseModel):
+    """Counters of the serving worker's in-process DataFrame cache"""
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    invalidations: int
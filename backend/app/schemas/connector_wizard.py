@@ -148,6 +148,7 @@ class WizardImportResponse(BaseModel):
     row_count: int = Field(..., description="Total rows imported")
     entity_count: int = Field(..., description="Number of distinct entities imported")
     status: str = Field(..., description="Import status: 'completed' or 'failed'")
+    sync_mode: str = Field("full", description="'full', or 'incremental' when new rows were merged into the previous dataset")
 
 
 # ============================================
@@ -185,3 +186,7 @@ class UserImportRequest(BaseModel):
     """User imports data filtered by their RLS-allowed entities + date range."""
     date_range_start: Optional[datetime] = Field(None, description="Start of date range filter")
     date_range_end: Optional[datetime] = Field(None, description="End of date range filter")
+    incremental: bool = Field(
+        False,
+        description="Fetch only rows from the previous import's latest date on and merge them into its dataset",
+    )
@@ -173,6 +173,17 @@ class UploadResponse(BaseModel):
     entities: List[str] = []
 
 
+class UploadProgressResponse(BaseModel):
+    """Parse progress of an upload tagged with a client-chosen upload_id"""
+    upload_id: str
+    stage: str  # "receiving", "validated", "parsing", "parsed", "completed" or "failed"
+    bytes_read: int = 0
+    total_bytes: int = 0
+    rows_parsed: int = 0
+    percent: float = 0.0
+    detail: Optional[str] = None
+
+
 # ============================================
 # Sample Data Schema
 # ============================================
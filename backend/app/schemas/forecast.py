@@ -1,8 +1,8 @@
 """
 Forecast Schemas - Pydantic models for forecasting operations
 """
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Optional, List, Dict, Any, Literal, Union
 from datetime import datetime
 from enum import Enum
 
@@ -22,6 +22,7 @@ class ForecastStatus(str, Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class ForecastFrequency(str, Enum):
@@ -75,6 +76,13 @@ class CrossValidationRequest(BaseModel):
     folds: int = Field(5, ge=2, le=10)
     method: str = Field("rolling", description="'rolling' or 'expanding'")
     initial_train_size: float = Field(0.7, ge=0.5, le=0.9)
+    refit: Literal["reuse", "warm_start", "search"] = Field(
+        "search",
+        description="'search' (re-search the model per fold), 'reuse' the structure selected "
+                    "on the full series, or 'warm_start' (reuse it and start from its fitted "
+                    "parameters). 'reuse' and 'warm_start' are faster but the full series "
+                    "includes every fold's test window, so their metrics are optimistic"
+    )
 
 
 # ============================================
@@ -107,6 +115,27 @@ class ForecastRequest(BaseModel):
     # Regressor columns — explicit list only; no implicit auto-detection
     regressor_columns: Optional[List[str]] = None
 
+    # Known future regressor values (Prophet): {"YYYY-MM-DD": {column: value}}.
+    # Forecast dates / columns not listed fall back to the training mean.
+    future_regressors: Optional[Dict[str, Dict[str, float]]] = None
+
+    # Reuse the result of an identical earlier forecast (same data + settings)
+    use_cache: bool = True
+
+    # Forecast history id of an earlier run of this series whose stored model
+    # is updated with the new observations instead of fitting from scratch
+    update_from: Optional[str] = None
+
+    @field_validator("future_regressors")
+    @classmethod
+    def validate_future_regressor_dates(cls, v: Optional[Dict[str, Dict[str, float]]]):
+        for date in v or {}:
+            try:
+                datetime.fromisoformat(date)
+            except ValueError:
+                raise ValueError(f"future_regressors has an invalid date: {date!r}")
+        return v
+
 
 class BatchForecastRequest(BaseModel):
     """Request to run forecasts for multiple entities"""
@@ -237,6 +266,9 @@ class ForecastResultResponse(BaseModel):
     # Non-fatal advisories surfaced during execution
     warnings: List[str] = []
 
+    # True when the model output was served from the forecast result cache
+    cache_hit: bool = False
+
     # Timestamps
     created_at: datetime
     completed_at: Optional[datetime] = None
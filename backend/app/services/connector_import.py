@@ -0,0 +1,345 @@
+"""
+Connector Import - Query planning and incremental aggregation of connector imports
+
+A user import reads the mapped columns of a data source (date, entity_id,
+entity_name, volume, ...), restricted to the user's RLS values and date
+window, and collapses transaction rows into one row per entity and date:
+volume is summed, entity_name keeps one value.
+
+- plan_import_query builds the dialect-specific SELECT for SQL connectors.
+  When date, entity_id and volume are mapped it pushes the aggregation down
+  as a GROUP BY, so only aggregated rows cross the network; RLS values are
+  bound as parameters.
+- filter_import_rows applies the same projection and filters in pandas, for
+  file-based connectors.
+- ImportAggregator aggregates a chunk at a time as rows stream from
+  BaseConnector.stream_data (all raw rows for file connectors, re-typing and
+  sorting pushed-down rows for SQL ones), so memory is bounded by the number
+  of (entity, date) groups rather than by the number of source rows.
+- Incremental sync: each aggregated import records its watermark (latest
+  date) per data source and import scope (user, mapping, RLS values and
+  date window). An incremental import fetches only
+  the rows from the watermark day on and merge_increment splices them into
+  the previous dataset, replacing its rows from that day (which may have been
+  partial) onwards.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from app.db.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Group keys and summed measure of the auto-aggregation, in output order
+GROUP_COLUMNS = ("date", "entity_id")
+SUM_COLUMNS = ("volume",)
+
+# Identifier quotes per SQL dialect (connector type value)
+_QUOTES = {
+    "postgres": ('"', '"'),
+    "mysql": ("`", "`"),
+    "sqlserver": ("[", "]"),
+    "snowflake": ('"', '"'),
+    "bigquery": ("`", "`"),
+}
+SQL_DIALECTS = frozenset(_QUOTES)
+
+# SQL Server rejects statements with more than 2100 parameters
+_SQLSERVER_MAX_IN_PARAMS = 2000
+
+# {data source}:{scope fingerprint} -> SyncState JSON of the latest import
+REDIS_SYNC_STATE_PREFIX = "connector_sync:"
+
+
+class ImportScopeError(ValueError):
+    """Raised when the user's RLS restriction cannot be applied to the source rows."""
+
+
+@dataclass
+class ImportQuery:
+    """SQL for one import; params are positional (tuple) or named (dict, BigQuery)."""
+    sql: str
+    params: Any
+    aggregated: bool
+
+
+def _quote(name: str, dialect: str) -> str:
+    open_q, close_q = _QUOTES[dialect]
+    return f"{open_q}{name.replace(close_q, close_q + close_q)}{close_q}"
+
+
+def _rls_predicate(column: str, values: Sequence[str], dialect: str) -> tuple:
+    """(predicate, positional params, named params) restricting *column* to *values*."""
+    values = [str(v) for v in values]
+    if dialect == "postgres":
+        # One array parameter whose type asyncpg infers from the column; the
+        # column stays uncast so an index on it can serve the filter
+        return f"{column} = ANY($1)", [values], {}
+    if dialect == "bigquery":
+        return f"CAST({column} AS STRING) IN UNNEST(@rls_values)", [], {"rls_values": values}
+    if dialect == "sqlserver" and len(values) > _SQLSERVER_MAX_IN_PARAMS:
+        return f"{column} IN (SELECT value FROM OPENJSON(?))", [json.dumps(values)], {}
+    placeholder = "?" if dialect == "sqlserver" else "%s"
+    return f"{column} IN ({', '.join([placeholder] * len(values))})", values, {}
+
+
+def plan_import_query(
+    dialect: str,
+    schema: str,
+    table: str,
+    column_map: Dict[str, str],
+    rls_values: Sequence[str] = (),
+    date_start: Optional[date] = None,
+    date_end: Optional[date] = None,
+) -> ImportQuery:
+    """
+    Build the import SELECT for a SQL connector.
+
+    *column_map* maps roles to remote columns (names already validated);
+    the "rls_column" role only filters. With date, entity_id and volume
+    mapped, the query returns SUM(volume) per (date, entity_id) and
+    MIN(entity_name); otherwise every mapped role, row by row.
+    """
+    if dialect not in SQL_DIALECTS:
+        raise ValueError(f"No SQL dialect for connector type '{dialect}'")
+    q = lambda name: _quote(name, dialect)  # noqa: E731
+    roles = {role: col for role, col in column_map.items() if role != "rls_column"}
+
+    where: List[str] = []
+    params: List[Any] = []
+    named: Dict[str, Any] = {}
+    rls_column = column_map.get("rls_column")
+    if rls_column and rls_values:
+        predicate, params, named = _rls_predicate(q(rls_column), rls_values, dialect)
+        where.append(predicate)
+    date_column = roles.get("date")
+    if date_column:
+        # Bounds are rendered from date objects, so inlining them is safe; an
+        # untyped literal compares against date, timestamp and text columns alike
+        if date_start:
+            where.append(f"{q(date_column)} >= '{date_start.isoformat()}'")
+        if date_end:
+            where.append(f"{q(date_column)} <= '{date_end.isoformat()}'")
+
+    aggregated = all(role in roles for role in (*GROUP_COLUMNS, *SUM_COLUMNS))
+    if aggregated:
+        keys = [q(roles[role]) for role in GROUP_COLUMNS]
+        select = [f"{q(roles[role])} AS {q(role)}" for role in GROUP_COLUMNS]
+        select += [f"SUM({q(roles[role])}) AS {q(role)}" for role in SUM_COLUMNS]
+        if "entity_name" in roles:
+            select.append(f"MIN({q(roles['entity_name'])}) AS {q('entity_name')}")
+    else:
+        select = [f"{q(col)} AS {q(role)}" for role, col in roles.items()]
+
+    sql = f"SELECT {', '.join(select)} FROM {q(schema)}.{q(table)}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    if aggregated:
+        sql += " GROUP BY " + ", ".join(keys)
+    return ImportQuery(sql=sql, params=named if dialect == "bigquery" else tuple(params), aggregated=aggregated)
+
+
+def filter_import_rows(
+    df: pd.DataFrame,
+    column_map: Dict[str, str],
+    rls_values: Sequence[str] = (),
+    date_start: Optional[date] = None,
+    date_end: Optional[date] = None,
+) -> pd.DataFrame:
+    """The pandas counterpart of plan_import_query's projection and WHERE clause.
+
+    Raises ImportScopeError when RLS values are given but the mapped RLS
+    column is missing, rather than returning rows the user may not see.
+    """
+    rls_column = column_map.get("rls_column")
+    if rls_column and rls_values:
+        if rls_column not in df.columns:
+            raise ImportScopeError(f"RLS column '{rls_column}' not found in the source")
+        df = df[df[rls_column].astype(str).isin([str(v) for v in rls_values])]
+    roles = {role: col for role, col in column_map.items() if role != "rls_column" and col in df.columns}
+    df = pd.DataFrame({role: df[col] for role, col in roles.items()})
+    if "date" in df.columns and (date_start or date_end):
+        dates = pd.to_datetime(df["date"], errors="coerce")
+        keep = pd.Series(True, index=df.index)
+        if date_start:
+            keep &= dates >= pd.Timestamp(date_start)
+        if date_end:
+            keep &= dates <= pd.Timestamp(date_end)
+        df = df[keep]
+    return df
+
+
+class ImportAggregator:
+    """Sum volume by entity_id + date over a stream of chunks.
+
+    Chunks without group keys or a volume column are kept as they are (the
+    import then stores the raw rows, as before streaming).
+    """
+
+    def __init__(self, merge_rows: int = 200_000):
+        self.merge_rows = merge_rows
+        self.raw_rows = 0
+        self.aggregated = False
+        self._parts: List[pd.DataFrame] = []
+        self._part_rows = 0
+        self._threshold = merge_rows
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+        chunk = chunk.copy()
+        self.raw_rows += len(chunk)
+        if "date" in chunk.columns:
+            chunk["date"] = pd.to_datetime(chunk["date"], errors="coerce")
+
+        group_cols = self._group_columns(chunk)
+        sum_cols = [c for c in SUM_COLUMNS if c in chunk.columns]
+        if not group_cols or not sum_cols:
+            self._parts.append(chunk)
+            return
+
+        self.aggregated = True
+        for col in sum_cols:
+            chunk[col] = pd.to_numeric(chunk[col], errors="coerce")
+        partial = self._aggregate(chunk)
+        self._parts.append(partial)
+        self._part_rows += len(partial)
+
+        # Collapse partial aggregates once they outgrow the threshold; the
+        # threshold grows with the collapsed size so re-aggregation stays linear
+        if self._part_rows > self._threshold:
+            merged = self._aggregate(pd.concat(self._parts, ignore_index=True))
+            self._parts = [merged]
+            self._part_rows = len(merged)
+            self._threshold = max(self.merge_rows, 2 * len(merged))
+
+    def result(self) -> pd.DataFrame:
+        """The aggregated import (sorted by entity_id, date), or the raw rows."""
+        if not self._parts:
+            return pd.DataFrame()
+        df = pd.concat(self._parts, ignore_index=True)
+        if not self.aggregated:
+            return df
+        df = self._aggregate(df)
+        sort_cols = [c for c in ("entity_id", "date") if c in df.columns]
+        return df.sort_values(sort_cols).reset_index(drop=True)
+
+    @staticmethod
+    def _group_columns(df: pd.DataFrame) -> List[str]:
+        return [c for c in GROUP_COLUMNS if c in df.columns]
+
+    def _aggregate(self, df: pd.DataFrame) -> pd.DataFrame:
+        agg = {col: "sum" for col in SUM_COLUMNS if col in df.columns}
+        if "entity_name" in df.columns:
+            agg["entity_name"] = "first"
+        return df.groupby(self._group_columns(df), as_index=False).agg(agg)
+
+
+# ------------------------------------------------------------------
+# Incremental sync
+# ------------------------------------------------------------------
+
+@dataclass
+class SyncState:
+    """The dataset an import scope was last written to and its latest date."""
+    dataset_id: str
+    watermark: date
+
+
+def supports_incremental(column_map: Dict[str, str]) -> bool:
+    """Incremental sync needs the aggregated shape: date, entity_id and volume mapped."""
+    return all(role in column_map for role in (*GROUP_COLUMNS, *SUM_COLUMNS))
+
+
+def import_scope(
+    user_id: str,
+    column_map: Dict[str, str],
+    rls_values: Sequence[str] = (),
+    date_start: Optional[date] = None,
+    date_end: Optional[date] = None,
+) -> str:
+    """Fingerprint of who imports what; only an import of the same scope can be extended.
+
+    The user is part of the scope: users sharing RLS values still each get
+    their own dataset.
+    """
+    payload = json.dumps(
+        {
+            "user_id": str(user_id),
+            "column_map": column_map,
+            "rls_values": sorted(str(v) for v in rls_values),
+            "date_start": date_start,
+            "date_end": date_end,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _sync_state_key(data_source_id: str, scope: str) -> str:
+    return f"{REDIS_SYNC_STATE_PREFIX}{data_source_id}:{scope}"
+
+
+async def load_sync_state(data_source_id: str, scope: str) -> Optional[SyncState]:
+    try:
+        redis = await get_redis()
+        if redis is None:
+            return None
+        data = await redis.get(_sync_state_key(data_source_id, scope))
+        if not data:
+            return None
+        state = json.loads(data)
+        return SyncState(state["dataset_id"], date.fromisoformat(state["watermark"]))
+    except Exception as e:
+        logger.error(f"Error loading sync state of data source {data_source_id}: {e}")
+        return None
+
+
+async def save_sync_state(data_source_id: str, scope: str, state: SyncState, expire: int) -> None:
+    """Record the watermark; it expires with the dataset frame it describes."""
+    try:
+        redis = await get_redis()
+        if redis is None:
+            return
+        await redis.set(
+            _sync_state_key(data_source_id, scope), json.dumps(asdict(state), default=str), ex=expire
+        )
+    except Exception as e:
+        logger.error(f"Error saving sync state of data source {data_source_id}: {e}")
+
+
+def import_watermark(df: pd.DataFrame) -> Optional[date]:
+    """Latest date of an aggregated import, or None when it has no dates."""
+    if "date" not in df.columns:
+        return None
+    latest = pd.to_datetime(df["date"], errors="coerce").max()
+    return None if pd.isna(latest) else latest.date()
+
+
+def merge_increment(
+    existing: pd.DataFrame, delta: pd.DataFrame, watermark: date
+) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Replace the rows of *existing* dated on or after *watermark* with
+    *delta* (the aggregated rows fetched from that day on).
+
+    Returns the merged import, sorted like ImportAggregator.result(), and
+    the entity ids whose series changed: those in *delta* and those whose
+    rows from the watermark on are gone from the source.
+    """
+    cutoff = pd.Timestamp(watermark)
+    dates = pd.to_datetime(existing["date"], errors="coerce")
+    replaced = existing[dates >= cutoff]
+    kept = existing[dates < cutoff].assign(date=dates[dates < cutoff])
+
+    affected = set(replaced["entity_id"].astype(str)) | set(delta["entity_id"].astype(str))
+    merged = pd.concat([kept, delta], ignore_index=True) if not delta.empty else kept
+    merged = merged.sort_values(["entity_id", "date"]).reset_index(drop=True)
+    return merged, sorted(affected)
@@ -10,7 +10,7 @@ from cryptography.fernet import Fernet
 
 from app.models.connector import Connector, ConnectorType
 from app.config import settings
-from app.connectors import get_connector
+from app.connectors import BaseConnector, get_connector
 from app.core.validators import sanitize_sql_query, sanitize_file_path
 from app.connectors.base import validate_sql_identifier
 
@@ -134,6 +134,20 @@ async def list_connector_resources(connector: Connector) -> List[str]:
     return await conn.list_resources()
 
 
+async def invalidate_connector_pool(connector: Connector) -> None:
+    """
+    Close the pooled connections opened with the connector's stored config.
+
+    Call before the config is replaced or the connector deleted; connections
+    borrowed at that moment are closed when they are returned.
+    """
+    try:
+        config = decrypt_config(connector.config)
+        await get_connector(connector.type.value, config, connector.tenant_id).invalidate_pool()
+    except Exception as exc:
+        logger.warning("Could not close connection pool of connector %s: %s", connector.id, exc)
+
+
 async def get_connector_columns_from_db(connector: Connector) -> List[str]:
     """
     Get column names from a connector's data source.
@@ -143,11 +157,11 @@ async def get_connector_columns_from_db(connector: Connector) -> List[str]:
     connector_type = connector.type
 
     if connector_type == ConnectorType.POSTGRES:
-        return await _get_postgres_columns(config)
+        return await _get_postgres_columns(get_connector("postgres", config, connector.tenant_id), config)
     elif connector_type == ConnectorType.MYSQL:
-        return await _get_mysql_columns(config)
+        return await _get_mysql_columns(get_connector("mysql", config, connector.tenant_id), config)
     elif connector_type == ConnectorType.SQLSERVER:
-        return await _get_sqlserver_columns(config)
+        return await _get_sqlserver_columns(get_connector("sqlserver", config, connector.tenant_id), config)
     elif connector_type == ConnectorType.BIGQUERY:
         return await _get_bigquery_columns(config)
     elif connector_type == ConnectorType.SNOWFLAKE:
@@ -158,28 +172,13 @@ async def get_connector_columns_from_db(connector: Connector) -> List[str]:
         raise ValueError(f"Column discovery not supported for connector type: {connector_type.value}")
 
 
-async def _get_postgres_columns(config: Dict[str, Any]) -> List[str]:
+async def _get_postgres_columns(source: BaseConnector, config: Dict[str, Any]) -> List[str]:
     """Get columns from PostgreSQL database"""
-    import asyncpg
-
-    host = config.get('host', 'localhost')
-    port = config.get('port', 5432)
-    database = config.get('database')
-    user = config.get('user')
-    password = config.get('password')
     schema = config.get('schema', 'public')
     table = config.get('table')
     query = config.get('query')
 
-    conn = await asyncpg.connect(
-        host=host,
-        port=port,
-        database=database,
-        user=user,
-        password=password
-    )
-
-    try:
+    async with source.connection() as conn:
         if table:
             # Get columns from specific table
             columns = await conn.fetch("""
@@ -196,31 +195,15 @@ async def _get_postgres_columns(config: Dict[str, Any]) -> List[str]:
             return [attr.name for attr in stmt.get_attributes()]
         else:
             raise ValueError("Either 'table' or 'query' must be specified in connector config")
-    finally:
-        await conn.close()
 
 
-async def _get_mysql_columns(config: Dict[str, Any]) -> List[str]:
+async def _get_mysql_columns(source: BaseConnector, config: Dict[str, Any]) -> List[str]:
     """Get columns from MySQL database"""
-    import aiomysql
-
-    host = config.get('host', 'localhost')
-    port = config.get('port', 3306)
     database = config.get('database')
-    user = config.get('user')
-    password = config.get('password')
     table = config.get('table')
     query = config.get('query')
 
-    conn = await aiomysql.connect(
-        host=host,
-        port=port,
-        db=database,
-        user=user,
-        password=password
-    )
-
-    try:
+    async with source.connection() as conn:
         async with conn.cursor() as cur:
             if table:
                 await cur.execute(f"""
@@ -238,26 +221,15 @@ async def _get_mysql_columns(config: Dict[str, Any]) -> List[str]:
                 return [desc[0] for desc in cur.description]
             else:
                 raise ValueError("Either 'table' or 'query' must be specified in connector config")
-    finally:
-        conn.close()
 
 
-async def _get_sqlserver_columns(config: Dict[str, Any]) -> List[str]:
+async def _get_sqlserver_columns(source: BaseConnector, config: Dict[str, Any]) -> List[str]:
     """Get columns from SQL Server database"""
-    import aioodbc
-
-    host = config.get('host', 'localhost')
-    port = config.get('port', 1433)
-    database = config.get('database')
-    user = config.get('user')
-    password = config.get('password')
     schema = config.get('schema', 'dbo')
     table = config.get('table')
     query = config.get('query')
 
-    dsn = f"DRIVER={{ODBC Driver 18 for SQL Server}};SERVER={host},{port};DATABASE={database};UID={user};PWD={password}"
-
-    async with aioodbc.connect(dsn=dsn) as conn:
+    async with source.connection() as conn:
         async with conn.cursor() as cur:
             if table:
                 await cur.execute("""
@@ -3,10 +3,12 @@ Dataset Service - File upload, validation, and data processing
 """
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 from io import BytesIO, StringIO
+import asyncio
 import json
+import os
 import uuid
 import logging
 
@@ -20,7 +22,8 @@ from app.schemas.datasets import (
     ColumnInfo, ColumnType, DateRange, DataSummaryResponse,
     MissingValueInfo, DataStructureResponse, DataPreviewResponse
 )
-from app.db.redis_client import get_redis
+from app.db.redis_client import bump_frame_version, frame_get, frame_set, get_redis
+from app.services import upload_ingest
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -29,6 +32,8 @@ logger = logging.getLogger(__name__)
 REDIS_DATASET_PREFIX = "dataset:"
 REDIS_DATASET_META_PREFIX = "dataset_meta:"
 REDIS_DATASET_TTL = 3600 * 4  # 4 hours
+REDIS_UPLOAD_PROGRESS_PREFIX = "upload_progress:"
+REDIS_UPLOAD_PROGRESS_TTL = 3600
 
 
 class DatasetService:
@@ -45,43 +50,63 @@ class DatasetService:
 
     async def upload_file(
         self,
-        file_content: bytes,
+        file_path: str,
         filename: str,
-        content_type: str
-    ) -> Tuple[Dataset, pd.DataFrame]:
-        """Upload and parse a file (CSV or Excel). Returns dataset and DataFrame."""
+        content_type: str,
+        file_size: Optional[int] = None,
+        progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+    ) -> Dataset:
+        """Parse a spooled upload (CSV or Excel) from disk and register the dataset.
+
+        The header is validated before the body is read, and CSVs are parsed in
+        row chunks; `progress` (if given) is awaited with a status dict after
+        each stage/chunk.
+        """
 
         # Determine file type
         file_type = self._get_file_type(filename, content_type)
         if file_type not in ["csv", "xlsx", "xls"]:
             raise ValueError(f"Unsupported file type: {file_type}. Supported types: csv, xlsx, xls")
 
+        if file_size is None:
+            file_size = os.path.getsize(file_path)
+
+        async def report(stage: str, bytes_read: int = 0, rows: int = 0) -> None:
+            if progress is None:
+                return
+            percent = round(100.0 * bytes_read / file_size, 1) if file_size else 0.0
+            await progress({
+                "stage": stage,
+                "bytes_read": bytes_read,
+                "total_bytes": file_size,
+                "rows_parsed": rows,
+                "percent": min(percent, 100.0),
+            })
+
+        # Validate the header before touching the body
+        encoding = await asyncio.to_thread(upload_ingest.sniff_encoding, file_path) if file_type == "csv" else None
+        try:
+            columns = await asyncio.to_thread(upload_ingest.read_header, file_path, file_type, encoding)
+        except Exception as e:
+            logger.error(f"Error parsing file: {str(e)}")
+            raise ValueError(f"Error parsing file: {str(e)}")
+        self._validate_header(columns)
+        await report("validated")
+
         # Parse the file
-        df = self._parse_file(file_content, file_type)
+        df = await self._parse_file(file_path, file_type, encoding, report)
 
         # Validate basic structure
         if df.empty:
             raise ValueError("The uploaded file is empty")
 
-        if len(df.columns) < 4:
-            raise ValueError("File must have at least 4 columns: Date, Entity_ID, Entity_Name, Volume")
-
-        # Validate required columns
-        is_valid, missing_cols = self.validate_required_columns(df)
-        if not is_valid:
-            raise ValueError(
-                f"Missing required columns: {', '.join(missing_cols)}. "
-                f"Required columns are: Date, Entity_ID, Entity_Name, Volume. "
-                f"Found columns: {', '.join(df.columns.tolist())}"
-            )
-
         # Create dataset record
         dataset = Dataset(
             id=str(uuid.uuid4()),
             tenant_id=self.tenant_id,
             name=self._generate_name(filename),
             filename=filename,
-            file_size=len(file_content),
+            file_size=file_size,
             file_type=file_type,
             row_count=len(df),
             column_count=len(df.columns),
@@ -157,29 +182,25 @@ class DatasetService:
             ext = filename.split(".")[-1].lower() if "." in filename else ""
             return ext if ext in ["csv", "xlsx", "xls"] else "unknown"
 
-    def _parse_file(self, file_content: bytes, file_type: str) -> pd.DataFrame:
-        """Parse file content into DataFrame"""
-        buffer = BytesIO(file_content)
-
+    async def _parse_file(
+        self,
+        file_path: str,
+        file_type: str,
+        encoding: Optional[str],
+        report: Callable[..., Awaitable[None]]
+    ) -> pd.DataFrame:
+        """Parse a spooled file into a DataFrame (CSV in row chunks, Excel in one read)"""
         try:
             if file_type == "csv":
-                # Try different encodings
-                for encoding in ["utf-8-sig", "utf-8", "windows-1256", "iso-8859-6", "latin-1", "cp1252"]:
-                    try:
-                        buffer.seek(0)
-                        df = pd.read_csv(buffer, encoding=encoding)
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    raise ValueError("Could not decode CSV file. Supported encodings: UTF-8, Arabic (Windows-1256), Latin-1.")
+                df = await self._parse_csv(file_path, encoding, report)
             elif file_type in ["xlsx", "xls"]:
-                df = pd.read_excel(buffer)
+                df = await asyncio.to_thread(pd.read_excel, file_path)
             else:
                 raise ValueError(f"Unsupported file type: {file_type}")
 
             # Clean column names
             df.columns = df.columns.str.strip()
+            await report("parsed", os.path.getsize(file_path), len(df))
 
             return df
 
@@ -187,6 +208,61 @@ class DatasetService:
             logger.error(f"Error parsing file: {str(e)}")
             raise ValueError(f"Error parsing file: {str(e)}")
 
+    async def _parse_csv(
+        self,
+        file_path: str,
+        encoding: str,
+        report: Callable[..., Awaitable[None]]
+    ) -> pd.DataFrame:
+        """Parse a CSV in row chunks with the same column types as a single read.
+
+        The encoding was sniffed from a prefix of the file; if a later byte
+        does not decode, the parse restarts with the next candidate encoding.
+        """
+        candidates = upload_ingest.fallback_encodings(encoding)
+        for attempt, candidate in enumerate(candidates):
+            try:
+                chunks = await self._read_csv_chunks(file_path, candidate, report)
+                # Columns whose type flips between chunks are re-read as text
+                mixed = upload_ingest.mixed_type_columns(chunks)
+                if mixed:
+                    chunks = None
+                    chunks = await self._read_csv_chunks(
+                        file_path, candidate, report, dtype={column: str for column in mixed}
+                    )
+                break
+            except UnicodeDecodeError:
+                if attempt == len(candidates) - 1:
+                    raise
+                logger.info(
+                    f"CSV is not {candidate} past its sniffed prefix, retrying as {candidates[attempt + 1]}"
+                )
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+    async def _read_csv_chunks(
+        self,
+        file_path: str,
+        encoding: str,
+        report: Callable[..., Awaitable[None]],
+        dtype: Optional[Dict[str, type]] = None
+    ) -> List[pd.DataFrame]:
+        chunks = []
+        rows = 0
+        reader = upload_ingest.iter_csv_chunks(
+            file_path, encoding, settings.UPLOAD_PARSE_CHUNK_ROWS, dtype=dtype
+        )
+        while True:
+            item = await asyncio.to_thread(next, reader, None)
+            if item is None:
+                break
+            chunk, bytes_read = item
+            chunks.append(chunk)
+            rows += len(chunk)
+            await report("parsing", bytes_read, rows)
+        return chunks
+
     def _generate_name(self, filename: str) -> str:
         """Generate user-friendly name from filename"""
         name = filename.rsplit(".", 1)[0]
@@ -195,11 +271,27 @@ class DatasetService:
 
     def validate_required_columns(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """Validate data has required columns: Date, Entity_ID, Entity_Name, Volume"""
+        return self._check_required_columns(df.columns.tolist())
+
+    def _check_required_columns(self, columns: List[str]) -> Tuple[bool, List[str]]:
         required = ['Date', 'Entity_ID', 'Entity_Name', 'Volume']
         # Check for exact match (case-sensitive)
-        missing = [col for col in required if col not in df.columns]
+        missing = [col for col in required if col not in columns]
         return len(missing) == 0, missing
 
+    def _validate_header(self, columns: List[str]) -> None:
+        """Reject an upload from its header alone, before the body is parsed"""
+        if len(columns) < 4:
+            raise ValueError("File must have at least 4 columns: Date, Entity_ID, Entity_Name, Volume")
+
+        is_valid, missing_cols = self._check_required_columns(columns)
+        if not is_valid:
+            raise ValueError(
+                f"Missing required columns: {', '.join(missing_cols)}. "
+                f"Required columns are: Date, Entity_ID, Entity_Name, Volume. "
+                f"Found columns: {', '.join(columns)}"
+            )
+
     def _detect_column_types(self, df: pd.DataFrame) -> Dict[str, str]:
         """Detect column types"""
         types = {}
@@ -369,35 +461,24 @@ class DatasetService:
         }
 
     async def _store_data_in_redis(self, key: str, df: pd.DataFrame) -> None:
-        """Store DataFrame in Redis"""
+        """Store DataFrame in Redis (binary frame codec, see app/db/frame_codec.py)"""
         try:
-            redis = await get_redis()
-            if redis is None:
+            if not await frame_set(key, df, expire=REDIS_DATASET_TTL):
                 logger.warning("Redis client not available, skipping cache storage")
                 return
-            # Convert to JSON-serializable format
-            data = df.to_json(orient="split", date_format="iso")
-            await redis.set(key, data, ex=REDIS_DATASET_TTL)
             logger.info(f"Stored dataset in Redis: {key}")
         except Exception as e:
             logger.error(f"Error storing data in Redis: {str(e)}")
             # Continue even if Redis storage fails
             pass
 
-    async def _get_data_from_redis(self, key: str) -> Optional[pd.DataFrame]:
-        """Retrieve DataFrame from Redis"""
+    async def _get_data_from_redis(self, key: str, dataset_id: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """Retrieve DataFrame from Redis (binary or legacy JSON encoding).
+
+        Passing `dataset_id` serves repeat reads from the per-worker frame cache.
+        """
         try:
-            redis = await get_redis()
-            if redis is None:
-                logger.warning("Redis client not available")
-                return None
-            data = await redis.get(key)
-            if data:
-                # Handle both string and bytes (redis client may return string if decode_responses=True)
-                if isinstance(data, str):
-                    return pd.read_json(StringIO(data), orient="split")
-                else:
-                    return pd.read_json(BytesIO(data), orient="split")
+            return await frame_get(key, dataset_id=dataset_id)
         except Exception as e:
             logger.error(f"Error retrieving data from Redis: {str(e)}")
         return None
@@ -430,6 +511,33 @@ class DatasetService:
             logger.error(f"Error retrieving metadata from Redis: {str(e)}")
         return None
 
+    def _upload_progress_key(self, upload_id: str) -> str:
+        return f"{REDIS_UPLOAD_PROGRESS_PREFIX}{self.tenant_id}:{upload_id}"
+
+    async def record_upload_progress(self, upload_id: str, status: Dict[str, Any]) -> None:
+        """Publish the parse progress of a client-tagged upload"""
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return
+            key = self._upload_progress_key(upload_id)
+            await redis.set(key, json.dumps(status), ex=REDIS_UPLOAD_PROGRESS_TTL)
+        except Exception as e:
+            logger.error(f"Error storing upload progress in Redis: {str(e)}")
+
+    async def get_upload_progress(self, upload_id: str) -> Optional[Dict[str, Any]]:
+        """Latest progress recorded for an upload, or None if unknown/expired"""
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return None
+            data = await redis.get(self._upload_progress_key(upload_id))
+            if data:
+                return json.loads(data)
+        except Exception as e:
+            logger.error(f"Error retrieving upload progress from Redis: {str(e)}")
+        return None
+
     # ============================================
     # Dataset CRUD Operations
     # ============================================
@@ -577,6 +685,7 @@ class DatasetService:
                     await redis.delete(dataset.redis_key)
                 # Delete metadata
                 await redis.delete(f"{REDIS_DATASET_META_PREFIX}{dataset_id}")
+                await bump_frame_version(dataset_id)
             return True
         except Exception as e:
             logger.error(f"Error deleting dataset: {str(e)}")
@@ -598,7 +707,7 @@ class DatasetService:
             raise ValueError("Dataset not found")
 
         # Get data from Redis
-        df = await self._get_data_from_redis(dataset.redis_key)
+        df = await self._get_data_from_redis(dataset.redis_key, dataset.id)
         if df is None:
             raise ValueError("Dataset data has expired. Please re-upload the file.")
 
@@ -630,7 +739,7 @@ class DatasetService:
             raise ValueError("Dataset not found")
 
         # Get data from Redis
-        df = await self._get_data_from_redis(dataset.redis_key)
+        df = await self._get_data_from_redis(dataset.redis_key, dataset.id)
         if df is None:
             # Use cached summary if data expired
             if dataset.summary:
@@ -703,7 +812,7 @@ class DatasetService:
             raise ValueError("Dataset not found")
 
         # Get data from Redis
-        df = await self._get_data_from_redis(dataset.redis_key)
+        df = await self._get_data_from_redis(dataset.redis_key, dataset.id)
         if df is None:
             raise ValueError("Dataset data has expired. Please re-upload the file.")
 
@@ -751,7 +860,7 @@ class DatasetService:
         if not dataset:
             raise ValueError("Dataset not found")
 
-        df = await self._get_data_from_redis(dataset.redis_key)
+        df = await self._get_data_from_redis(dataset.redis_key, dataset.id)
         if df is None:
             raise ValueError("Dataset data has expired. Please re-upload the file.")
 
@@ -848,7 +957,7 @@ class DatasetService:
         dataset.entity_column = entity_column
 
         # Re-extract entities and date range
-        df = await self._get_data_from_redis(dataset.redis_key)
+        df = await self._get_data_from_redis(dataset.redis_key, dataset.id)
         if df is not None:
             if entity_column:
                 dataset.entities = [str(e) for e in df[entity_column].unique().tolist()[:100]]
@@ -0,0 +1,36 @@
+"""
+Execution engines — run forecast fit/predict/CV off the API event loop.
+
+Usage:
+    from app.services.execution import ForecastJob, get_execution_engine
+
+    engine = get_execution_engine()
+    result = await engine.submit(job)
+"""
+
+from .base import (
+    ExecutionEngine,
+    ForecastJob,
+    ForecastJobResult,
+    JobCancelledError,
+    JobTimeoutError,
+)
+from .factory import get_execution_engine, reset_execution_engine
+from .inline_engine import InlineEngine
+from .process_engine import ProcessPoolEngine
+from .thread_engine import ThreadPoolEngine
+from .warm_pool_engine import WarmPoolEngine
+
+__all__ = [
+    "ExecutionEngine",
+    "ForecastJob",
+    "ForecastJobResult",
+    "JobCancelledError",
+    "JobTimeoutError",
+    "InlineEngine",
+    "ThreadPoolEngine",
+    "ProcessPoolEngine",
+    "WarmPoolEngine",
+    "get_execution_engine",
+    "reset_execution_engine",
+]
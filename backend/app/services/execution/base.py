@@ -0,0 +1,272 @@
+"""
+Abstract execution engine interface.
+
+An execution engine runs the CPU-heavy part of a forecast (fit + predict +
+cross-validation) somewhere other than the FastAPI event loop. Every engine
+receives a picklable ForecastJob and returns a ForecastJobResult, so the
+service layer does not care whether the work ran inline, in a thread, in an
+isolated worker process or on a Celery worker.
+
+Engines enforce two per-job limits:
+    cpu_time_limit  — CPU seconds the job may burn (process / Celery engines)
+    timeout         — wall-clock seconds before the caller gives up (all engines)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.forecasting.base import ForecastOutput
+from app.forecasting.cross_validation import CVFoldResult, CVRunResult
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelledError(RuntimeError):
+    """Raised when a forecast job is cancelled before it finished."""
+
+
+class JobTimeoutError(RuntimeError):
+    """Raised when a forecast job exceeds its CPU-time or wall-clock limit."""
+
+
+# ----------------------------------------------------------------------
+# Job payloads
+# ----------------------------------------------------------------------
+
+# Request fields that identify the data rather than change how it is modelled
+_FINGERPRINT_IGNORED_FIELDS = frozenset({
+    "dataset_id", "entity_id", "entity_column", "date_column", "value_column", "use_cache",
+})
+
+
+def _hash_frame(digest, frame: pd.DataFrame) -> None:
+    digest.update(json.dumps([str(c) for c in frame.columns]).encode("utf-8"))
+    digest.update(np.ascontiguousarray(pd.DatetimeIndex(frame.index).asi8).tobytes())
+    digest.update(np.ascontiguousarray(frame.to_numpy(dtype=float)).tobytes())
+
+
+@dataclass
+class ForecastJob:
+    """Picklable description of one fit + predict (+ CV) unit of work.
+
+    `request` is a JSON-mode dump of the ForecastRequest with the effective
+    frequency already applied, so the job can be rebuilt in any process.
+    `model_state` is a persisted fitted model (see app/forecasting/persistence)
+    to update with `series` instead of fitting from scratch; `keep_model`
+    asks for the fitted model's state back in the result.
+    """
+    job_id: str
+    request: Dict[str, Any]
+    series: pd.Series
+    exog: Optional[pd.DataFrame] = None
+    seasonal_period: int = 1
+    cpu_time_limit: Optional[float] = None
+    timeout: Optional[float] = None
+    keep_model: bool = False
+    model_state: Optional[Dict[str, Any]] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        """JSON-safe form used by engines that cannot ship pickles (Celery)."""
+        return {
+            "job_id": self.job_id,
+            "request": self.request,
+            "series": series_to_payload(self.series),
+            "exog": frame_to_payload(self.exog),
+            "seasonal_period": self.seasonal_period,
+            "cpu_time_limit": self.cpu_time_limit,
+            "timeout": self.timeout,
+            "keep_model": self.keep_model,
+            "model_state": self.model_state,
+        }
+
+    def fingerprint(self) -> str:
+        """Content hash of the inputs that determine the job's result.
+
+        Covers the prepared series and regressors and the model settings of
+        the request; identifiers (dataset, entity, column names) are left out,
+        so identical data forecast the same way gives the same fingerprint.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        settings = {k: v for k, v in self.request.items() if k not in _FINGERPRINT_IGNORED_FIELDS}
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(str(self.seasonal_period).encode("utf-8"))
+        _hash_frame(digest, self.series.to_frame(name="y"))
+        if self.exog is not None:
+            _hash_frame(digest, self.exog)
+        return digest.hexdigest()
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "ForecastJob":
+        return cls(
+            job_id=payload["job_id"],
+            request=payload["request"],
+            series=series_from_payload(payload["series"]),
+            exog=frame_from_payload(payload.get("exog")),
+            seasonal_period=int(payload.get("seasonal_period") or 1),
+            cpu_time_limit=payload.get("cpu_time_limit"),
+            timeout=payload.get("timeout"),
+            keep_model=bool(payload.get("keep_model")),
+            model_state=payload.get("model_state"),
+        )
+
+
+@dataclass
+class ForecastJobResult:
+    """Output of a finished ForecastJob."""
+    job_id: str
+    output: ForecastOutput
+    cv_result: Optional[CVRunResult] = None
+    cv_error: Optional[str] = None
+    model_state: Optional[Dict[str, Any]] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        predictions = self.output.predictions.copy()
+        predictions["date"] = pd.to_datetime(predictions["date"]).dt.strftime("%Y-%m-%dT%H:%M:%S")
+        return {
+            "job_id": self.job_id,
+            "output": {
+                "predictions": json_safe(predictions.to_dict(orient="records")),
+                "metrics": json_safe(self.output.metrics),
+                "model_summary": json_safe(self.output.model_summary),
+                "residuals": (
+                    json_safe(np.asarray(self.output.residuals, dtype=float).tolist())
+                    if self.output.residuals is not None else None
+                ),
+            },
+            "cv_result": json_safe(asdict(self.cv_result)) if self.cv_result is not None else None,
+            "cv_error": self.cv_error,
+            "model_state": self.model_state,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "ForecastJobResult":
+        raw = payload["output"]
+        predictions = pd.DataFrame(raw["predictions"])
+        if "date" in predictions.columns:
+            predictions["date"] = pd.to_datetime(predictions["date"])
+        output = ForecastOutput(
+            predictions=predictions,
+            metrics=raw.get("metrics") or {},
+            model_summary=raw.get("model_summary") or {},
+            residuals=(
+                np.array([np.nan if v is None else v for v in raw["residuals"]], dtype=float)
+                if raw.get("residuals") is not None else None
+            ),
+        )
+        cv_result = None
+        if payload.get("cv_result"):
+            raw_cv = dict(payload["cv_result"])
+            folds = [CVFoldResult(**_nan_fields(f)) for f in raw_cv.pop("folds", [])]
+            cv_result = CVRunResult(folds=folds, **_nan_fields(raw_cv))
+        return cls(
+            job_id=payload["job_id"],
+            output=output,
+            cv_result=cv_result,
+            cv_error=payload.get("cv_error"),
+            model_state=payload.get("model_state"),
+        )
+
+
+def series_to_payload(series: pd.Series) -> Dict[str, Any]:
+    """JSON-safe form of a datetime-indexed float series."""
+    return {
+        "index": [ts.isoformat() for ts in series.index],
+        "values": [None if pd.isna(v) else float(v) for v in series.values],
+        "name": series.name,
+    }
+
+
+def series_from_payload(raw: Dict[str, Any]) -> pd.Series:
+    return pd.Series(
+        [np.nan if v is None else v for v in raw["values"]],
+        index=pd.DatetimeIndex(pd.to_datetime(raw["index"])),
+        name=raw.get("name"),
+        dtype=float,
+    )
+
+
+def frame_to_payload(frame: Optional[pd.DataFrame]) -> Optional[Dict[str, Any]]:
+    """JSON-safe form of a datetime-indexed frame (exogenous regressors)."""
+    if frame is None:
+        return None
+    return json_safe(frame.reset_index().to_dict(orient="split"))
+
+
+def frame_from_payload(raw: Optional[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+    if not raw:
+        return None
+    frame = pd.DataFrame(raw["data"], columns=raw["columns"])
+    date_col = frame.columns[0]
+    frame[date_col] = pd.to_datetime(frame[date_col])
+    return frame.set_index(date_col)
+
+
+def json_safe(value: Any) -> Any:
+    """Recursively convert numpy / pandas scalars into JSON-serialisable builtins.
+
+    Non-finite floats become None because JSON has no NaN/Infinity.
+    """
+    if isinstance(value, dict):
+        return {str(k): json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return [json_safe(v) for v in value.tolist()]
+    if isinstance(value, (np.bool_, bool)):
+        return bool(value)
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value) if np.isfinite(value) else None
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    return value
+
+
+def _nan_fields(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore NaN for float fields that json_safe turned into None."""
+    return {k: (float("nan") if v is None else v) for k, v in raw.items()}
+
+
+# ----------------------------------------------------------------------
+# Engine interface
+# ----------------------------------------------------------------------
+
+class ExecutionEngine(ABC):
+    """Abstract engine that runs ForecastJobs off the request event loop."""
+
+    name: str = "abstract"
+
+    @abstractmethod
+    async def submit(self, job: ForecastJob) -> ForecastJobResult:
+        """Run a job to completion and return its result.
+
+        Raises:
+            JobCancelledError: The job was cancelled via cancel().
+            JobTimeoutError: The job exceeded its CPU-time or wall-clock limit.
+            Exception: Whatever the forecaster raised (e.g. ValueError when
+                a model cannot be fitted) is re-raised unchanged.
+        """
+        ...
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job.
+
+        Returns:
+            True if the job was known to this engine and has been cancelled,
+            False otherwise.
+        """
+        return False
+
+    async def shutdown(self) -> None:
+        """Release pools / worker processes held by the engine."""
+        return None
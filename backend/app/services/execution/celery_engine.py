@@ -0,0 +1,89 @@
+"""
+Celery execution engine — ships jobs to a Celery worker.
+
+The job is serialised to JSON (ForecastJob.to_payload) because the Celery app
+only accepts JSON. The CPU-time limit maps onto Celery's soft_time_limit, the
+wall-clock timeout onto the hard time_limit and the result wait. Cancellation
+revokes the task and terminates the worker child running it.
+
+Jobs are routed to the `forecast.execute_job` task defined in
+app.workers.forecast_tasks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Set
+
+from celery.exceptions import (
+    SoftTimeLimitExceeded,
+    TaskRevokedError,
+    TimeLimitExceeded,
+    TimeoutError as CeleryTimeoutError,
+)
+from celery.result import AsyncResult
+
+from app.workers.celery_app import celery_app
+
+from .base import (
+    ExecutionEngine,
+    ForecastJob,
+    ForecastJobResult,
+    JobCancelledError,
+    JobTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+EXECUTE_JOB_TASK = "forecast.execute_job"
+
+
+class CeleryEngine(ExecutionEngine):
+    """Execute jobs on Celery workers and await their results."""
+
+    name = "celery"
+
+    def __init__(self):
+        self._results: Dict[str, AsyncResult] = {}
+        self._cancelled: Set[str] = set()
+
+    async def submit(self, job: ForecastJob) -> ForecastJobResult:
+        options = {}
+        if job.cpu_time_limit:
+            options["soft_time_limit"] = job.cpu_time_limit
+        if job.timeout:
+            options["time_limit"] = job.timeout
+
+        async_result = celery_app.send_task(
+            EXECUTE_JOB_TASK, args=[job.to_payload()], task_id=job.job_id, **options
+        )
+        self._results[job.job_id] = async_result
+        try:
+            payload = await asyncio.to_thread(
+                async_result.get, timeout=job.timeout, propagate=True
+            )
+        except TaskRevokedError:
+            raise JobCancelledError("Forecast was cancelled")
+        except (SoftTimeLimitExceeded, TimeLimitExceeded) as exc:
+            raise JobTimeoutError(f"Forecast exceeded its time limit: {exc}")
+        except CeleryTimeoutError:
+            async_result.revoke(terminate=True)
+            raise JobTimeoutError(f"Forecast exceeded the {job.timeout:.0f}s time limit")
+        except Exception:
+            if job.job_id in self._cancelled:
+                raise JobCancelledError("Forecast was cancelled")
+            raise
+        finally:
+            self._results.pop(job.job_id, None)
+            self._cancelled.discard(job.job_id)
+
+        return ForecastJobResult.from_payload(payload)
+
+    async def cancel(self, job_id: str) -> bool:
+        async_result = self._results.get(job_id)
+        if async_result is None:
+            return False
+        self._cancelled.add(job_id)
+        await asyncio.to_thread(async_result.revoke, terminate=True)
+        return True
@@ -0,0 +1,79 @@
+"""
+Execution engine factory — returns the configured ExecutionEngine singleton.
+
+The engine is selected by FORECAST_EXECUTION_ENGINE:
+
+    inline   →  InlineEngine      (tests / debugging; blocks the event loop)
+    thread   →  ThreadPoolEngine  (off-loop, shares the GIL)
+    process  →  ProcessPoolEngine (default; isolated processes, CPU limits, kill-on-cancel)
+    celery   →  CeleryEngine      (ships jobs to Celery workers)
+    warm_pool → WarmPoolEngine    (long-lived pre-warmed workers; default for Prophet)
+
+Engines are created lazily and cached per name. Call reset_execution_engine()
+to drop the cached instances (useful for testing).
+"""
+
+import logging
+import os
+from typing import Dict, Optional
+
+from app.config import settings
+
+from .base import ExecutionEngine
+from .inline_engine import InlineEngine
+from .process_engine import ProcessPoolEngine
+from .thread_engine import ThreadPoolEngine
+from .warm_pool_engine import WarmPoolEngine
+
+logger = logging.getLogger(__name__)
+
+_engines: Dict[str, ExecutionEngine] = {}
+
+
+def _build_engine(name: str) -> ExecutionEngine:
+    if name == "inline":
+        return InlineEngine()
+    if name == "thread":
+        return ThreadPoolEngine(max_workers=settings.FORECAST_EXECUTION_MAX_WORKERS)
+    if name == "process":
+        return ProcessPoolEngine(max_workers=settings.FORECAST_EXECUTION_MAX_WORKERS)
+    if name == "celery":
+        from .celery_engine import CeleryEngine  # imports the Celery app lazily
+        return CeleryEngine()
+    if name == "warm_pool":
+        return WarmPoolEngine(
+            max_workers=settings.PROPHET_WARM_WORKERS or os.cpu_count() or 1,
+            max_jobs_per_worker=settings.PROPHET_WORKER_MAX_JOBS,
+            max_rss_mb=settings.PROPHET_WORKER_MAX_RSS_MB,
+        )
+    raise ValueError(
+        f"Unknown FORECAST_EXECUTION_ENGINE '{name}' "
+        "(expected inline, thread, process, celery or warm_pool)"
+    )
+
+
+def get_execution_engine(name: Optional[str] = None) -> ExecutionEngine:
+    """Return the execution engine singleton.
+
+    Args:
+        name: Engine to return; defaults to settings.FORECAST_EXECUTION_ENGINE.
+
+    Returns:
+        The cached ExecutionEngine instance for that name.
+    """
+    name = (name or settings.FORECAST_EXECUTION_ENGINE).lower()
+    engine = _engines.get(name)
+    if engine is None:
+        engine = _build_engine(name)
+        logger.info("Execution: using %s engine", engine.name)
+        _engines[name] = engine
+    return engine
+
+
+def reset_execution_engine() -> None:
+    """Drop all cached engines so the next call creates fresh instances.
+
+    Intended for use in tests only.
+    """
+    _engines.clear()
+    logger.debug("Execution engine singletons reset")
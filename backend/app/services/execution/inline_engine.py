@@ -0,0 +1,25 @@
+"""
+Inline execution engine — runs jobs directly in the calling thread.
+
+This blocks the event loop for the duration of the fit, so it is only meant
+for tests, local debugging and code that already runs off the API loop
+(Celery workers, which cannot fork child processes of their own).
+"""
+
+from __future__ import annotations
+
+import logging
+
+from .base import ExecutionEngine, ForecastJob, ForecastJobResult
+from .runner import execute_forecast_job
+
+logger = logging.getLogger(__name__)
+
+
+class InlineEngine(ExecutionEngine):
+    """Execute jobs synchronously; limits and cancellation are not enforced."""
+
+    name = "inline"
+
+    async def submit(self, job: ForecastJob) -> ForecastJobResult:
+        return execute_forecast_job(job)
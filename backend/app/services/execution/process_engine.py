@@ -0,0 +1,240 @@
+"""
+Process execution engine — each job runs in its own short-lived worker process.
+
+A bounded number of jobs (max_workers) run concurrently; the rest wait for a
+free slot without blocking the event loop. Running every job in a fresh
+process gives us the two guarantees a shared pool cannot:
+
+- CPU-time limits are exact: RLIMIT_CPU is applied to the child, which gets
+  SIGXCPU once it has burned `cpu_time_limit` seconds (and SIGKILL shortly
+  after if it ignores it).
+- Cancellation is real: cancel() terminates the child instead of waiting for
+  statsmodels / Prophet to finish.
+
+Workers are forked from a forkserver that pre-imports the forecasting stack,
+so a new job costs a fork rather than a fresh interpreter + statsmodels import.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import math
+import multiprocessing
+import signal
+import weakref
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Dict, Optional, Set, Tuple
+
+try:  # POSIX only — CPU limits are skipped on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+from .base import (
+    ExecutionEngine,
+    ForecastJob,
+    ForecastJobResult,
+    JobCancelledError,
+    JobTimeoutError,
+)
+from .runner import execute_forecast_job
+
+logger = logging.getLogger(__name__)
+
+# Grace period between the soft (SIGXCPU) and hard (SIGKILL) CPU limits.
+_CPU_HARD_LIMIT_GRACE_SEC = 5
+_JOIN_TIMEOUT_SEC = 5
+
+
+class _CpuTimeExceeded(BaseException):
+    """Raised inside the worker on SIGXCPU.
+
+    Derives from BaseException so the `except Exception` fallbacks inside the
+    forecasters cannot swallow it and keep searching.
+    """
+
+
+# ----------------------------------------------------------------------
+# Child-process side
+# ----------------------------------------------------------------------
+
+def _raise_cpu_time_exceeded(signum, frame):
+    raise _CpuTimeExceeded()
+
+
+def _apply_cpu_time_limit(limit: Optional[float]) -> None:
+    if not limit or resource is None or not hasattr(signal, "SIGXCPU"):
+        return
+    soft = int(math.ceil(limit))
+    hard = soft + _CPU_HARD_LIMIT_GRACE_SEC
+    _, current_hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if current_hard != resource.RLIM_INFINITY:
+        soft = min(soft, current_hard)
+        hard = min(hard, current_hard)
+    signal.signal(signal.SIGXCPU, _raise_cpu_time_exceeded)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _process_entry(conn: Connection, job: ForecastJob) -> None:
+    """Worker entry point: run the job and send ("ok"|"error"|"cpu_limit", value) back."""
+    _apply_cpu_time_limit(job.cpu_time_limit)
+    try:
+        message: Tuple[str, Any] = ("ok", execute_forecast_job(job))
+    except _CpuTimeExceeded:
+        message = ("cpu_limit", None)
+    except BaseException as exc:
+        message = ("error", exc)
+    try:
+        conn.send(message)
+    except Exception:
+        # Result or exception could not be pickled — degrade to a plain error.
+        conn.send(("error", RuntimeError(str(message[1]))))
+    finally:
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# Parent side
+# ----------------------------------------------------------------------
+
+def _terminate(proc: BaseProcess) -> None:
+    if proc.is_alive():
+        proc.terminate()
+        proc.join(_JOIN_TIMEOUT_SEC)
+        if proc.is_alive():
+            proc.kill()
+
+
+def _collect(proc: BaseProcess, conn: Connection, timeout: Optional[float]) -> Tuple[str, Any]:
+    """Block (in a helper thread) until the worker reports, exits or times out."""
+    try:
+        if conn.poll(timeout):
+            try:
+                return conn.recv()
+            except EOFError:
+                pass  # child exited without reporting (killed / cancelled)
+        else:
+            _terminate(proc)
+            return "timeout", None
+    finally:
+        conn.close()
+        proc.join(_JOIN_TIMEOUT_SEC)
+    return "exit", proc.exitcode
+
+
+def _job_outcome(job: ForecastJob, status: str, value: Any, was_cancelled: bool) -> ForecastJobResult:
+    """Turn a worker report (status, value) into the job result or the matching error."""
+    if status == "ok":
+        return value
+    if status == "error":
+        raise value
+    if status == "cpu_limit":
+        raise JobTimeoutError(
+            f"Forecast exceeded the {job.cpu_time_limit:.0f}s CPU-time limit"
+        )
+    if status == "timeout":
+        raise JobTimeoutError(f"Forecast exceeded the {job.timeout:.0f}s time limit")
+    if was_cancelled:
+        raise JobCancelledError("Forecast was cancelled")
+    killed_by_cpu_limit = bool(job.cpu_time_limit) and value in (
+        -getattr(signal, "SIGXCPU", 0), -getattr(signal, "SIGKILL", 0),
+    )
+    if killed_by_cpu_limit:
+        raise JobTimeoutError(
+            f"Forecast exceeded the {job.cpu_time_limit:.0f}s CPU-time limit"
+        )
+    raise RuntimeError(f"Forecast worker exited unexpectedly (exit code {value})")
+
+
+def _default_start_method() -> str:
+    methods = multiprocessing.get_all_start_methods()
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+class ProcessPoolEngine(ExecutionEngine):
+    """Execute each job in an isolated worker process, max_workers at a time."""
+
+    name = "process"
+
+    def __init__(self, max_workers: int = 2, start_method: Optional[str] = None):
+        self.max_workers = max_workers
+        self._ctx = multiprocessing.get_context(start_method or _default_start_method())
+        if self._ctx.get_start_method() == "forkserver":
+            self._ctx.set_forkserver_preload(["app.services.execution.runner"])
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pending: Set[str] = set()
+        self._running: Dict[str, BaseProcess] = {}
+        self._cancelled: Set[str] = set()
+        # Workers are not daemonic (so a job may fan out, e.g. the ARIMA search
+        # pool); make sure none outlives the API process.
+        atexit.register(self._terminate_running)
+
+    def _terminate_running(self) -> None:
+        for proc in list(self._running.values()):
+            _terminate(proc)
+
+    def _slot(self) -> asyncio.Semaphore:
+        """Concurrency gate for the current event loop (semaphores are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        slot = self._slots.get(loop)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_workers)
+            self._slots[loop] = slot
+        return slot
+
+    async def submit(self, job: ForecastJob) -> ForecastJobResult:
+        self._pending.add(job.job_id)
+        try:
+            async with self._slot():
+                self._pending.discard(job.job_id)
+                if job.job_id in self._cancelled:
+                    raise JobCancelledError("Forecast was cancelled")
+                status, value = await self._run_in_child(job)
+        finally:
+            self._pending.discard(job.job_id)
+            was_cancelled = job.job_id in self._cancelled
+            self._cancelled.discard(job.job_id)
+
+        return _job_outcome(job, status, value, was_cancelled)
+
+    async def _run_in_child(self, job: ForecastJob) -> Tuple[str, Any]:
+        parent_conn, child_conn = self._ctx.Pipe(duplex=False)
+        proc = self._ctx.Process(
+            target=_process_entry,
+            args=(child_conn, job),
+            name=f"forecast-job-{job.job_id[:8]}",
+            daemon=False,
+        )
+        proc.start()
+        child_conn.close()
+        self._running[job.job_id] = proc
+        try:
+            return await asyncio.to_thread(_collect, proc, parent_conn, job.timeout)
+        except asyncio.CancelledError:
+            # Caller went away — do not leave an orphaned fit burning CPU.
+            _terminate(proc)
+            raise
+        finally:
+            self._running.pop(job.job_id, None)
+
+    async def cancel(self, job_id: str) -> bool:
+        if job_id in self._pending:
+            self._cancelled.add(job_id)
+            return True
+        proc = self._running.get(job_id)
+        if proc is None:
+            return False
+        self._cancelled.add(job_id)
+        await asyncio.to_thread(_terminate, proc)
+        logger.info(f"Cancelled forecast job {job_id} (pid={proc.pid})")
+        return True
+
+    async def shutdown(self) -> None:
+        for job_id, proc in list(self._running.items()):
+            self._cancelled.add(job_id)
+            await asyncio.to_thread(_terminate, proc)
@@ -0,0 +1,213 @@
+"""
+Job runner — the code that actually executes inside an engine.
+
+Everything here is module-level and free of service/DB/Redis state so it can
+be pickled into worker processes or imported by a Celery worker.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from typing import Optional
+
+import pandas as pd
+
+from app.config import settings as app_settings
+from app.forecasting import ARIMAForecaster, ETSForecaster, ProphetForecaster
+from app.forecasting.base import BaseForecaster
+from app.forecasting.cross_validation import run_cv as run_cv_engine, CVRunResult
+from app.forecasting.persistence import dump_model_state, load_forecaster
+from app.schemas.forecast import ForecastMethod, ForecastRequest
+
+from .base import ForecastJob, ForecastJobResult
+
+logger = logging.getLogger(__name__)
+
+
+def create_forecaster(request: ForecastRequest, seasonal_period: int = 1) -> BaseForecaster:
+    """Create appropriate forecaster based on method.
+
+    `seasonal_period` comes from frequency auto-detection and is used to
+    set sensible defaults for seasonal-aware models.
+    """
+    frequency = request.frequency.value
+
+    if request.method == ForecastMethod.ARIMA:
+        settings = request.arima_settings
+        if settings and not settings.auto:
+            # Manual mode — honour user overrides
+            return ARIMAForecaster(
+                frequency=frequency,
+                confidence_level=request.confidence_level,
+                auto=False,
+                order=(settings.p or 1, settings.d or 1, settings.q or 1),
+                seasonal_order=(
+                    settings.P or 0,
+                    settings.D or 0,
+                    settings.Q or 0,
+                    settings.s or seasonal_period
+                ) if (settings.s or seasonal_period > 1) else None
+            )
+        return ARIMAForecaster(
+            frequency=frequency,
+            confidence_level=request.confidence_level,
+            auto=True,
+            search=app_settings.ARIMA_SEARCH,
+            max_fits=app_settings.ARIMA_SEARCH_MAX_FITS,
+            n_jobs=app_settings.ARIMA_SEARCH_N_JOBS
+        )
+
+    elif request.method == ForecastMethod.ETS:
+        settings = request.ets_settings
+        if settings and not settings.auto:
+            return ETSForecaster(
+                frequency=frequency,
+                confidence_level=request.confidence_level,
+                auto=False,
+                trend=settings.trend,
+                seasonal=settings.seasonal,
+                seasonal_periods=settings.seasonal_periods or (seasonal_period if seasonal_period > 1 else None),
+                damped_trend=settings.damped_trend
+            )
+        # Auto mode — supply detected seasonal period as hint
+        return ETSForecaster(
+            frequency=frequency,
+            confidence_level=request.confidence_level,
+            auto=True,
+            seasonal_periods=seasonal_period if seasonal_period > 1 else None
+        )
+
+    else:  # Prophet
+        settings = request.prophet_settings
+        if settings:
+            return ProphetForecaster(
+                frequency=frequency,
+                confidence_level=request.confidence_level,
+                changepoint_prior_scale=settings.changepoint_prior_scale,
+                seasonality_prior_scale=settings.seasonality_prior_scale,
+                seasonality_mode=settings.seasonality_mode,
+                yearly_seasonality=settings.yearly_seasonality,
+                weekly_seasonality=settings.weekly_seasonality,
+                daily_seasonality=settings.daily_seasonality
+            )
+        return ProphetForecaster(
+            frequency=frequency,
+            confidence_level=request.confidence_level
+        )
+
+
+def future_regressor_frame(request: ForecastRequest) -> Optional[pd.DataFrame]:
+    """Caller-supplied future regressor values as a date-indexed frame (None if absent)."""
+    if not request.future_regressors:
+        return None
+    frame = pd.DataFrame.from_dict(request.future_regressors, orient="index")
+    frame.index = pd.to_datetime(frame.index)
+    return frame.sort_index()
+
+
+def run_cross_validation(
+    series,
+    request: ForecastRequest,
+    exog,
+    seasonal_period: int,
+    fitted: Optional[BaseForecaster] = None,
+) -> CVRunResult:
+    """Execute CV using a forecaster factory closure.
+
+    With `fitted` (the model fitted on the full series) and refit "reuse" or
+    "warm_start", folds refit its selected structure instead of repeating the
+    parameter search (e.g. the auto-ARIMA order search) on every fold. That
+    structure (and, for "warm_start", the starting parameters) was chosen
+    with each fold's test window in view, so these opt-in modes trade some
+    look-ahead for speed; the default "search" keeps folds independent.
+    """
+    cv = request.cross_validation
+
+    template = None
+    if fitted is not None and cv.refit in ("reuse", "warm_start"):
+        template = fitted.fixed_clone(warm_start=cv.refit == "warm_start")
+
+    def factory():
+        if template is not None:
+            return copy.deepcopy(template)
+        return create_forecaster(request, seasonal_period=seasonal_period)
+
+    return run_cv_engine(
+        series=series,
+        forecaster_factory=factory,
+        folds=cv.folds,
+        method=cv.method,
+        initial_train_size=cv.initial_train_size,
+        horizon=request.horizon,
+        exog=exog,
+        n_jobs=app_settings.FORECAST_CV_N_JOBS,
+    )
+
+
+def restore_forecaster(job: ForecastJob, request: ForecastRequest) -> Optional[BaseForecaster]:
+    """The fitted model the job should update, or None to fit from scratch.
+
+    A state saved for another method or frequency, or one that no longer
+    loads, falls back to a full fit rather than failing the forecast.
+    """
+    state = job.model_state
+    if not state:
+        return None
+    if (state.get("method"), state.get("frequency")) != (request.method.value, request.frequency.value):
+        logger.warning(
+            f"Stored model is {state.get('method')!r}/{state.get('frequency')!r}, request is "
+            f"{request.method.value!r}/{request.frequency.value!r} — fitting from scratch"
+        )
+        return None
+    try:
+        forecaster = load_forecaster(state)
+    except Exception as exc:
+        logger.warning(f"Could not restore stored model, fitting from scratch: {exc}")
+        return None
+    forecaster.confidence_level = request.confidence_level
+    return forecaster
+
+
+def execute_forecast_job(job: ForecastJob) -> ForecastJobResult:
+    """Fit (or update a stored model), predict and (optionally) cross-validate one series.
+
+    Model errors propagate to the caller; CV errors are non-blocking and are
+    reported through `cv_error` so the main forecast still succeeds.
+    """
+    request = ForecastRequest(**job.request)
+
+    forecaster = restore_forecaster(job, request)
+    if forecaster is not None:
+        update_mode = forecaster.update(job.series, exog=job.exog)
+    else:
+        forecaster = create_forecaster(request, seasonal_period=job.seasonal_period)
+        forecaster.fit(job.series, exog=job.exog)
+        update_mode = None
+    output = forecaster.predict(request.horizon, exog=future_regressor_frame(request))
+    if update_mode is not None:
+        output.model_summary["update_mode"] = update_mode
+
+    cv_result: Optional[CVRunResult] = None
+    cv_error: Optional[str] = None
+    if request.cross_validation and request.cross_validation.enabled:
+        try:
+            cv_result = run_cross_validation(
+                job.series, request, job.exog, job.seasonal_period, fitted=forecaster
+            )
+        except Exception as exc:
+            logger.warning(f"CV failed (non-blocking): {exc}")
+            cv_error = str(exc)
+
+    return ForecastJobResult(
+        job_id=job.job_id,
+        output=output,
+        cv_result=cv_result,
+        cv_error=cv_error,
+        model_state=dump_model_state(forecaster) if job.keep_model else None,
+    )
+
+
+def execute_forecast_payload(payload: dict) -> dict:
+    """JSON-in / JSON-out wrapper around execute_forecast_job (Celery engine)."""
+    return execute_forecast_job(ForecastJob.from_payload(payload)).to_payload()
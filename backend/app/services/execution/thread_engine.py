@@ -0,0 +1,72 @@
+"""
+Thread-pool execution engine.
+
+Moves fit/predict off the event loop into a bounded ThreadPoolExecutor.
+Threads share the GIL, so this keeps the API responsive but does not add
+CPU parallelism for pure-Python model code. Threads cannot be killed, so
+only the wall-clock timeout and cancellation of *queued* jobs are enforced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Set
+
+from .base import (
+    ExecutionEngine,
+    ForecastJob,
+    ForecastJobResult,
+    JobCancelledError,
+    JobTimeoutError,
+)
+from .runner import execute_forecast_job
+
+logger = logging.getLogger(__name__)
+
+
+class ThreadPoolEngine(ExecutionEngine):
+    """Execute jobs in a shared thread pool."""
+
+    name = "thread"
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="forecast-job"
+        )
+        self._futures: Dict[str, Future] = {}
+        self._cancelled: Set[str] = set()
+
+    async def submit(self, job: ForecastJob) -> ForecastJobResult:
+        future = self._executor.submit(execute_forecast_job, job)
+        self._futures[job.job_id] = future
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=job.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise JobTimeoutError(
+                f"Forecast exceeded the {job.timeout:.0f}s time limit"
+            )
+        except asyncio.CancelledError:
+            if job.job_id in self._cancelled:
+                raise JobCancelledError("Forecast was cancelled")
+            future.cancel()
+            raise
+        finally:
+            self._futures.pop(job.job_id, None)
+            self._cancelled.discard(job.job_id)
+
+    async def cancel(self, job_id: str) -> bool:
+        future = self._futures.get(job_id)
+        if future is None:
+            return False
+        # Running threads cannot be interrupted; only queued jobs are dropped.
+        if not future.cancel():
+            return False
+        self._cancelled.add(job_id)
+        return True
+
+    async def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
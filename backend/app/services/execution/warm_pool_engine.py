@@ -0,0 +1,323 @@
+"""
+Warm-pool execution engine — long-lived worker processes that run many jobs.
+
+Workers are started once, import the forecasting stack and load Prophet's
+compiled Stan model up front, then take jobs over a pipe. A Prophet fit then
+costs the fit itself instead of a process start + Prophet import + model load,
+so throughput scales with the number of workers (cores).
+
+To keep memory in check a worker is recycled (replaced by a fresh, pre-warmed
+one) after `max_jobs_per_worker` jobs or once its resident memory passes
+`max_rss_mb`. Limits still hold per job:
+
+- CPU time: the worker's RLIMIT_CPU soft limit is moved to "CPU used so far +
+  cpu_time_limit" for each job; SIGXCPU ends the job and the worker exits.
+- Wall clock / cancellation: the worker running the job is terminated and
+  replaced on the next submit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import math
+import multiprocessing
+import os
+import signal
+import threading
+import weakref
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+try:  # POSIX only — CPU limits are skipped on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+from app.forecasting.parallel import _exit_with_parent
+
+from .base import ExecutionEngine, ForecastJob, ForecastJobResult, JobCancelledError
+from .process_engine import (
+    _CpuTimeExceeded,
+    _JOIN_TIMEOUT_SEC,
+    _default_start_method,
+    _job_outcome,
+    _raise_cpu_time_exceeded,
+    _terminate,
+)
+from .runner import execute_forecast_job
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+def warm_up_worker() -> None:
+    """Default worker warm-up: load Prophet and its Stan model."""
+    from app.forecasting.prophet_forecaster import ProphetForecaster
+
+    ProphetForecaster.warm_up()
+
+
+def _cpu_limits_supported() -> bool:
+    return resource is not None and hasattr(signal, "SIGXCPU")
+
+
+def _set_cpu_budget(limit: Optional[float]) -> None:
+    """Allow `limit` more CPU seconds from now (None lifts the soft limit)."""
+    if not _cpu_limits_supported():
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if limit:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = int(math.ceil(usage.ru_utime + usage.ru_stime + limit))
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    else:
+        soft = hard
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _rss_bytes() -> int:
+    """Current resident memory of this process (peak RSS where /proc is missing)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        if resource is None:
+            return 0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _worker_main(conn: Connection, warmup: Optional[Callable[[], None]]) -> None:
+    """Worker loop: run jobs until told to stop (None) or the pipe closes.
+
+    Each job is answered with (status, value, rss_bytes) where status is
+    "ok", "error" or "cpu_limit", as in the process engine.
+    """
+    _exit_with_parent(os.getppid())  # the API process, or its forkserver
+    if _cpu_limits_supported():
+        signal.signal(signal.SIGXCPU, _raise_cpu_time_exceeded)
+    if warmup is not None:
+        try:
+            warmup()
+        except Exception as exc:
+            logger.warning(f"Worker warm-up failed: {exc}")
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        _set_cpu_budget(job.cpu_time_limit)
+        try:
+            message: Tuple[str, Any] = ("ok", execute_forecast_job(job))
+        except _CpuTimeExceeded:
+            message = ("cpu_limit", None)
+        except BaseException as exc:
+            message = ("error", exc)
+        finally:
+            _set_cpu_budget(None)
+
+        try:
+            conn.send((*message, _rss_bytes()))
+        except Exception:
+            # Result or exception could not be pickled — degrade to a plain error.
+            conn.send(("error", RuntimeError(str(message[1])), _rss_bytes()))
+        if message[0] == "cpu_limit":
+            break  # interrupted mid-fit; let the pool start a clean worker
+    conn.close()
+
+
+# ----------------------------------------------------------------------
+# Parent side
+# ----------------------------------------------------------------------
+
+@dataclass
+class _Worker:
+    proc: BaseProcess
+    conn: Connection
+    jobs: int = 0
+
+
+def _exchange(worker: _Worker, job: ForecastJob, timeout: Optional[float]) -> Tuple[str, Any, int]:
+    """Send a job to a worker and block (in a helper thread) for its answer."""
+    try:
+        worker.conn.send(job)
+        if not worker.conn.poll(timeout):
+            _terminate(worker.proc)
+            return "timeout", None, 0
+        return worker.conn.recv()
+    except (EOFError, OSError):
+        pass  # worker died (killed / cancelled) before answering
+    worker.proc.join(_JOIN_TIMEOUT_SEC)
+    return "exit", worker.proc.exitcode, 0
+
+
+class WarmPoolEngine(ExecutionEngine):
+    """Execute jobs on a pool of pre-warmed, periodically recycled workers."""
+
+    name = "warm_pool"
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_jobs_per_worker: int = 100,
+        max_rss_mb: int = 1024,
+        start_method: Optional[str] = None,
+        warmup: Optional[Callable[[], None]] = warm_up_worker,
+    ):
+        self.max_workers = max_workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024
+        self._warmup = warmup
+        self._ctx = multiprocessing.get_context(start_method or _default_start_method())
+        if self._ctx.get_start_method() == "forkserver":
+            self._ctx.set_forkserver_preload(["app.services.execution.runner"])
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self._running: Dict[str, _Worker] = {}
+        self._pending: Set[str] = set()
+        self._cancelled: Set[str] = set()
+        self._started = False
+        atexit.register(self._terminate_all)
+
+    # -- worker lifecycle ---------------------------------------------
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._warmup),
+            name="forecast-warm-worker",
+            daemon=False,  # jobs may fan out (ARIMA search / CV pools)
+        )
+        proc.start()
+        child_conn.close()
+        return _Worker(proc=proc, conn=parent_conn)
+
+    def _retire(self, worker: _Worker) -> None:
+        try:
+            worker.conn.send(None)
+        except OSError:
+            pass
+        worker.proc.join(_JOIN_TIMEOUT_SEC)
+        _terminate(worker.proc)
+        worker.conn.close()
+
+    def start(self) -> None:
+        """Start idle workers up to max_workers so the first jobs find them warm."""
+        with self._lock:
+            missing = self.max_workers - len(self._idle) - len(self._running)
+        workers = [self._spawn() for _ in range(max(0, missing))]
+        with self._lock:
+            self._idle.extend(workers)
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.proc.is_alive():
+                    return worker
+                worker.conn.close()
+        return self._spawn()
+
+    def _checkin(self, worker: _Worker, rss: int) -> None:
+        """Return a worker to the pool, or replace it once it hit a recycle limit."""
+        worker.jobs += 1
+        recycle = worker.jobs >= self.max_jobs_per_worker or (
+            self.max_rss_bytes > 0 and rss > self.max_rss_bytes
+        )
+        if recycle:
+            logger.info(
+                f"Recycling warm worker pid={worker.proc.pid} after {worker.jobs} jobs "
+                f"(rss={rss / 1024 / 1024:.0f} MB)"
+            )
+            self._retire(worker)
+            worker = self._spawn()
+        with self._lock:
+            self._idle.append(worker)
+
+    def _terminate_all(self) -> None:
+        with self._lock:
+            workers = self._idle + list(self._running.values())
+            self._idle = []
+        for worker in workers:
+            _terminate(worker.proc)
+
+    # -- ExecutionEngine ------------------------------------------------
+
+    def _slot(self) -> asyncio.Semaphore:
+        """Concurrency gate for the current event loop (semaphores are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        slot = self._slots.get(loop)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_workers)
+            self._slots[loop] = slot
+        return slot
+
+    async def submit(self, job: ForecastJob) -> ForecastJobResult:
+        if not self._started:
+            # The whole pool starts (and warms up) with the first job
+            self._started = True
+            await asyncio.to_thread(self.start)
+        self._pending.add(job.job_id)
+        try:
+            async with self._slot():
+                self._pending.discard(job.job_id)
+                if job.job_id in self._cancelled:
+                    raise JobCancelledError("Forecast was cancelled")
+                status, value = await self._run_on_worker(job)
+        finally:
+            self._pending.discard(job.job_id)
+            was_cancelled = job.job_id in self._cancelled
+            self._cancelled.discard(job.job_id)
+
+        return _job_outcome(job, status, value, was_cancelled)
+
+    async def _run_on_worker(self, job: ForecastJob) -> Tuple[str, Any]:
+        worker = await asyncio.to_thread(self._checkout)
+        self._running[job.job_id] = worker
+        try:
+            status, value, rss = await asyncio.to_thread(_exchange, worker, job, job.timeout)
+        except asyncio.CancelledError:
+            # Caller went away — do not leave an orphaned fit burning CPU.
+            _terminate(worker.proc)
+            raise
+        finally:
+            self._running.pop(job.job_id, None)
+
+        if status in ("ok", "error"):
+            await asyncio.to_thread(self._checkin, worker, rss)
+        else:
+            _terminate(worker.proc)
+            worker.conn.close()
+        return status, value
+
+    async def cancel(self, job_id: str) -> bool:
+        if job_id in self._pending:
+            self._cancelled.add(job_id)
+            return True
+        worker = self._running.get(job_id)
+        if worker is None:
+            return False
+        self._cancelled.add(job_id)
+        await asyncio.to_thread(_terminate, worker.proc)
+        logger.info(f"Cancelled forecast job {job_id} (pid={worker.proc.pid})")
+        return True
+
+    async def shutdown(self) -> None:
+        for job_id in list(self._running):
+            self._cancelled.add(job_id)
+        await asyncio.to_thread(self._terminate_all)
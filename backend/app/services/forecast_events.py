@@ -0,0 +1,196 @@
+"""
+Forecast Events - Redis pub/sub channels pushing forecast / batch progress to clients
+
+Writers (ForecastService) publish small JSON deltas next to the state they
+already store: a single forecast publishes its status / progress / error on
+forecast_events:{id} whenever its progress hash is written, a batch
+publishes one event per finished entity and its counts on
+forecast_batch_events:{batch_id}. Readers (the /forecast/events SSE
+endpoints) subscribe through ForecastEventHub, which shares one pub/sub
+connection per worker between every open stream, so an idle dashboard costs
+a queue and nothing on Redis.
+"""
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from app.config import settings
+from app.db.redis_client import get_redis
+from app.schemas.forecast import ForecastStatus
+
+logger = logging.getLogger(__name__)
+
+REDIS_FORECAST_EVENTS_PREFIX = "forecast_events:"
+REDIS_BATCH_EVENTS_PREFIX = "forecast_batch_events:"
+
+# Statuses after which a forecast / batch publishes nothing more
+TERMINAL_STATUSES = frozenset({
+    ForecastStatus.COMPLETED.value,
+    ForecastStatus.FAILED.value,
+    ForecastStatus.CANCELLED.value,
+})
+
+# Events buffered per stream; when a slow client fills it, the backlog is
+# replaced by OVERFLOW_EVENT and the stream re-sends the current state
+SUBSCRIBER_QUEUE_SIZE = 64
+
+# Queue marker for "events were dropped": not published, never sent as is
+OVERFLOW_EVENT = "overflow"
+
+# How long the shared reader waits for a message before re-checking its subscribers
+_READ_TIMEOUT_SEC = 1.0
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Encode one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class ForecastEventHub:
+    """Fans messages of one shared pub/sub connection out to per-stream queues.
+
+    Channels are subscribed on Redis while at least one stream listens to
+    them; a single reader task runs while there is any subscriber.
+    """
+
+    def __init__(self):
+        self._queues: Dict[str, Set[asyncio.Queue]] = {}
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def channel_count(self) -> int:
+        return len(self._queues)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        """Queue receiving the decoded events of `channel` while the context is open.
+
+        Raises RuntimeError when Redis is unavailable.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        async with self._lock:
+            if self._pubsub is None:
+                redis = await get_redis()
+                if redis is None:
+                    raise RuntimeError("Redis is not available")
+                self._pubsub = redis.pubsub()
+            if channel not in self._queues:
+                await self._pubsub.subscribe(channel)
+                self._queues[channel] = set()
+            self._queues[channel].add(queue)
+            if self._reader is None:
+                self._reader = asyncio.create_task(self._read())
+        try:
+            yield queue
+        finally:
+            async with self._lock:
+                queues = self._queues.get(channel, set())
+                queues.discard(queue)
+                if not queues and channel in self._queues:
+                    del self._queues[channel]
+                    try:
+                        await self._pubsub.unsubscribe(channel)
+                    except Exception as e:
+                        logger.error(f"Error unsubscribing from {channel}: {e}")
+
+    async def close(self) -> None:
+        """Stop the reader and drop the pub/sub connection (streams see no more events)."""
+        async with self._lock:
+            if self._reader is not None:
+                self._reader.cancel()
+                self._reader = None
+            if self._pubsub is not None:
+                try:
+                    await self._pubsub.aclose()
+                except Exception as e:
+                    logger.error(f"Error closing forecast event subscription: {e}")
+                self._pubsub = None
+            self._queues.clear()
+
+    async def _read(self) -> None:
+        while self._queues:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=_READ_TIMEOUT_SEC
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error reading forecast events: {e}")
+                await asyncio.sleep(_READ_TIMEOUT_SEC)
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            try:
+                event = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            for queue in tuple(self._queues.get(message["channel"], ())):
+                if queue.full():
+                    # "entity" events are deltas, so none may be lost silently:
+                    # the stream re-reads the state, which includes this event
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait({"type": OVERFLOW_EVENT})
+                    continue
+                queue.put_nowait(event)
+        # No await between the check above and this reset, so a new subscriber
+        # either kept the loop running or sees no reader and starts one
+        self._reader = None
+
+
+# One hub per worker process
+event_hub = ForecastEventHub()
+
+
+async def stream_events(
+    channel: str,
+    read_state: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+    hub: Optional[ForecastEventHub] = None,
+) -> AsyncIterator[str]:
+    """SSE body: the current state, then every event of `channel` until a terminal status.
+
+    The channel is subscribed before `read_state` runs, so nothing published
+    in between is missed. Events are named "status" (initial state),
+    "progress", "entity" (one finished batch entity) and "complete". A
+    client too slow to keep up gets a fresh "status" in place of the events
+    it missed (refetch batch results after one mid-stream); idle
+    streams get a comment every FORECAST_EVENTS_KEEPALIVE_SEC and end after
+    FORECAST_EVENTS_MAX_STREAM_SEC, after which clients reconnect.
+    """
+    loop = asyncio.get_running_loop()
+    async with (hub or event_hub).subscribe(channel) as queue:
+        state = await read_state()
+        if state is None:
+            return
+        yield format_sse("status", state)
+        if state.get("status") in TERMINAL_STATUSES:
+            return
+
+        deadline = loop.time() + settings.FORECAST_EVENTS_MAX_STREAM_SEC
+        while loop.time() < deadline:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=settings.FORECAST_EVENTS_KEEPALIVE_SEC)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            event_type = event.pop("type", None)
+            if event_type == OVERFLOW_EVENT:
+                state = await read_state()
+                if state is None:
+                    return
+                yield format_sse("status", state)
+                if state.get("status") in TERMINAL_STATUSES:
+                    return
+                continue
+            if event_type == "entity":
+                yield format_sse("entity", event)
+                continue
+            if event.get("status") in TERMINAL_STATUSES:
+                yield format_sse("complete", event)
+                return
+            yield format_sse("progress", event)
@@ -3,17 +3,26 @@ Forecast Service - Forecasting operations and result management
 """
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Callable, Sequence, Tuple
 from datetime import datetime
+import asyncio
 import json
+import time
 import uuid
 import logging
+import weakref
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.db.database import async_session_maker
 from app.db.redis_client import get_redis
+from app.services.forecast_events import REDIS_BATCH_EVENTS_PREFIX, REDIS_FORECAST_EVENTS_PREFIX
+from app.services.prediction_store import PredictionWriter, save_predictions
 from app.services.preprocessing_service import PreprocessingService
+from app.services.results_service import store_result_rows
 from app.services.snapshot_service import SnapshotService
+from app.services.storage import get_storage_backend
 from app.schemas.forecast import (
     ForecastMethod, ForecastStatus, ForecastFrequency,
     ForecastRequest, BatchForecastRequest,
@@ -26,26 +35,77 @@ from app.schemas.forecast import (
 from app.forecasting import ARIMAForecaster, ETSForecaster, ProphetForecaster
 from app.forecasting.frequency import detect_frequency as detect_freq, irregular_intervals_pct
 from app.forecasting.data_validator import validate_for_method, DataValidationResult
-from app.forecasting.cross_validation import run_cv as run_cv_engine, CVRunResult
+from app.forecasting.persistence import decode_model_state, encode_model_state
+from app.services.execution import (
+    ExecutionEngine, ForecastJob, ForecastJobResult, JobCancelledError, JobTimeoutError,
+    get_execution_engine,
+)
+from app.services.execution.runner import create_forecaster
 
 logger = logging.getLogger(__name__)
 
 # Redis configuration
 REDIS_FORECAST_PREFIX = "forecast:"
 REDIS_FORECAST_TTL = 3600  # 1 hour
+REDIS_BATCH_PREFIX = "forecast_batch:"
+REDIS_BATCH_RESULTS_PREFIX = "forecast_batch_results:"
+REDIS_PROGRESS_PREFIX = "forecast_progress:"  # small hash updated while running
+REDIS_RESULT_CACHE_PREFIX = "forecast_cache:"  # {tenant}:{job fingerprint} -> job result payload
+REDIS_RESULT_CACHE_INDEX_PREFIX = "forecast_cache_index:"  # {tenant} -> zset of fingerprints by last use
+
+# Storage key of a run's fitted model state (see app/forecasting/persistence)
+MODEL_STATE_KEY = "{tenant_id}/models/{forecast_history_id}.json.gz"
+
+# Fields of ForecastResultResponse mirrored into the progress hash
+_PROGRESS_FIELDS = ("id", "dataset_id", "entity_id", "method", "status", "progress", "created_at", "error")
 
 # Strong references to background tasks to prevent GC from cancelling them
 _background_tasks: set = set()
 
+# forecast_id -> (tenant_id, engine) for jobs currently running in this process
+_running_jobs: Dict[str, Tuple[str, ExecutionEngine]] = {}
+
+# forecast_id -> (monotonic time, status) of the last progress write, for coalescing
+_progress_writes: Dict[str, Tuple[float, str]] = {}
+
+# Per-tenant batch concurrency gates, per event loop (semaphores are loop-bound)
+_tenant_batch_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Tuple[int, asyncio.Semaphore]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _tenant_slots(tenant_id: str, limit: int) -> asyncio.Semaphore:
+    """Return the semaphore capping concurrent batch entities for a tenant."""
+    limit = max(1, int(limit))
+    slots = _tenant_batch_slots.setdefault(asyncio.get_running_loop(), {})
+    current = slots.get(tenant_id)
+    if current is None or current[0] != limit:
+        current = (limit, asyncio.Semaphore(limit))
+        slots[tenant_id] = current
+    return current[1]
+
 
 class ForecastService:
     """Service for running forecasts and managing results"""
 
-    def __init__(self, tenant_id: str, user_id: Optional[str] = None, db: Optional[AsyncSession] = None):
+    def __init__(
+        self,
+        tenant_id: str,
+        user_id: Optional[str] = None,
+        db: Optional[AsyncSession] = None,
+        engine: Optional[ExecutionEngine] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
         self.tenant_id = tenant_id
         self.user_id = user_id
         self.db = db
+        # Background batches outlive the request session; they persist through
+        # sessions of their own (only when the service was given a DB at all)
+        self.session_factory = session_factory or (async_session_maker if db is not None else None)
         self.preprocessing_service = PreprocessingService(tenant_id, user_id)
+        self.engine = engine or get_execution_engine()
+        # Prophet gets its own engine (warm workers) unless one was injected
+        self.prophet_engine = engine or get_execution_engine(settings.PROPHET_EXECUTION_ENGINE or None)
 
     # ============================================
     # Data Preparation
@@ -84,65 +144,158 @@ class ForecastService:
 
             logger.info(f"_get_forecast_data: got {len(df)} rows, columns={list(df.columns)}")
 
-            if len(df) == 0:
-                return None, "Dataset is empty", None
+            return self._prepare_series(df, date_column, value_column, regressor_columns)
 
-            if not date_column:
-                date_column = self._detect_date_column(df)
-            if not value_column:
-                value_column = self._detect_value_column(df)
-
-            if not date_column:
-                return None, "Could not detect date column. Please specify date_column.", None
-            if not value_column:
-                return None, "Could not detect value column. Please specify value_column.", None
+        except Exception as e:
+            logger.error(f"Error preparing forecast data: {e}")
+            return None, str(e), None
 
-            if date_column not in df.columns:
-                return None, f"Date column '{date_column}' not found in dataset", None
-            if value_column not in df.columns:
-                return None, f"Value column '{value_column}' not found in dataset", None
+    def _prepare_series(
+        self,
+        df: pd.DataFrame,
+        date_column: Optional[str] = None,
+        value_column: Optional[str] = None,
+        regressor_columns: Optional[List[str]] = None,
+        coerced: bool = False,
+    ) -> Tuple[Optional[pd.Series], Optional[str], Optional[pd.DataFrame]]:
+        """Turn one entity's rows into (series, error, exog_df).
 
+        `coerced=True` means the date/value columns were already parsed, cleaned
+        and sorted by the batch preparation stage and only need slicing.
+        """
+        if len(df) == 0:
+            return None, "Dataset is empty", None
+
+        if not date_column:
+            date_column = self._detect_date_column(df)
+        if not value_column:
+            value_column = self._detect_value_column(df)
+
+        if not date_column:
+            return None, "Could not detect date column. Please specify date_column.", None
+        if not value_column:
+            return None, "Could not detect value column. Please specify value_column.", None
+
+        if date_column not in df.columns:
+            return None, f"Date column '{date_column}' not found in dataset", None
+        if value_column not in df.columns:
+            return None, f"Value column '{value_column}' not found in dataset", None
+
+        if not coerced:
+            df = df.copy()
             df[date_column] = pd.to_datetime(df[date_column], errors='coerce')
             df = df.dropna(subset=[date_column, value_column])
-            df = df.sort_values(date_column)
+            df = df.sort_values(date_column, kind='stable')
 
             df[value_column] = pd.to_numeric(df[value_column], errors='coerce')
             df = df.dropna(subset=[value_column])
 
-            # Note: per-method min-data validation is done separately in run_forecast
-            # after frequency is detected. Here we keep only a defensive minimum
-            # so the function itself doesn't crash downstream.
-            if len(df) < 2:
-                return None, f"Insufficient data points ({len(df)}). Need at least 2 observations.", None
+        # Note: per-method min-data validation is done separately in run_forecast
+        # after frequency is detected. Here we keep only a defensive minimum
+        # so the function itself doesn't crash downstream.
+        if len(df) < 2:
+            return None, f"Insufficient data points ({len(df)}). Need at least 2 observations.", None
+
+        series = pd.Series(
+            df[value_column].values,
+            index=pd.DatetimeIndex(df[date_column]),
+            name=value_column
+        )
+
+        # Regressor handling — EXPLICIT ONLY (US2)
+        exog_df = None
+        if regressor_columns:
+            missing = [c for c in regressor_columns if c not in df.columns]
+            if missing:
+                return None, f"Regressor column(s) not found in dataset: {', '.join(missing)}", None
+
+            available = [c for c in regressor_columns if c in df.columns]
+            if available:
+                exog_df = df[[date_column] + available].copy()
+                exog_df.set_index(date_column, inplace=True)
+                for col in available:
+                    exog_df[col] = pd.to_numeric(exog_df[col], errors='coerce')
+                col_means = exog_df.mean(numeric_only=True)
+                exog_df = exog_df.fillna(col_means)
+                exog_df = exog_df.dropna(axis=1, how='all')
+
+        return series, None, exog_df
+
+    async def _prepare_batch_data(
+        self,
+        dataset_id: str,
+        entity_requests: List[ForecastRequest],
+        df: Optional[pd.DataFrame] = None,
+    ) -> Dict[str, Tuple[Optional[pd.Series], Optional[str], Optional[pd.DataFrame]]]:
+        """Prepare (series, error, exog_df) for every entity of a batch in one pass.
+
+        The dataset is loaded and deserialised once, dates and values are
+        coerced once for the whole frame, and a single groupby splits it into
+        per-entity series. Entities with their own per-entity preprocessed
+        data keep using it, exactly as in the single-forecast path.
+        """
+        if not entity_requests:
+            return {}
+
+        template = entity_requests[0]
+        entity_ids = [r.entity_id for r in entity_requests]
+        prepared: Dict[str, Tuple[Optional[pd.Series], Optional[str], Optional[pd.DataFrame]]] = {}
 
-            series = pd.Series(
-                df[value_column].values,
-                index=pd.DatetimeIndex(df[date_column]),
-                name=value_column
+        overrides = await self.preprocessing_service.get_entity_overrides(dataset_id, entity_ids)
+        for entity_id, entity_df in overrides.items():
+            prepared[entity_id] = self._prepare_series(
+                entity_df, template.date_column, template.value_column, template.regressor_columns
             )
 
-            # Regressor handling — EXPLICIT ONLY (US2)
-            exog_df = None
-            if regressor_columns:
-                missing = [c for c in regressor_columns if c not in df.columns]
-                if missing:
-                    return None, f"Regressor column(s) not found in dataset: {', '.join(missing)}", None
-
-                available = [c for c in regressor_columns if c in df.columns]
-                if available:
-                    exog_df = df[[date_column] + available].copy()
-                    exog_df.set_index(date_column, inplace=True)
-                    for col in available:
-                        exog_df[col] = pd.to_numeric(exog_df[col], errors='coerce')
-                    col_means = exog_df.mean(numeric_only=True)
-                    exog_df = exog_df.fillna(col_means)
-                    exog_df = exog_df.dropna(axis=1, how='all')
-
-            return series, None, exog_df
+        pending = [e for e in entity_ids if e not in prepared]
+        if not pending:
+            return prepared
 
-        except Exception as e:
-            logger.error(f"Error preparing forecast data: {e}")
-            return None, str(e), None
+        if df is None:
+            df = await self.preprocessing_service.get_dataset_dataframe(dataset_id)
+        if df is None:
+            return {**prepared, **{e: (None, "Dataset not found or expired", None) for e in pending}}
+
+        entity_column = template.entity_column
+        if not entity_column or entity_column not in df.columns:
+            # No usable entity column — every entity forecasts the full dataset
+            whole = self._prepare_series(
+                df, template.date_column, template.value_column, template.regressor_columns
+            )
+            return {**prepared, **{e: whole for e in pending}}
+
+        date_column = template.date_column or self._detect_date_column(df)
+        value_column = template.value_column or self._detect_value_column(df)
+        if (
+            not date_column or not value_column
+            or date_column not in df.columns or value_column not in df.columns
+        ):
+            # Column mapping cannot be resolved — same error for every entity
+            error = self._prepare_series(df, template.date_column, template.value_column)[1]
+            return {**prepared, **{e: (None, error, None) for e in pending}}
+
+        df = df.copy()
+        df[date_column] = pd.to_datetime(df[date_column], errors='coerce')
+        df[value_column] = pd.to_numeric(df[value_column], errors='coerce')
+        df = df.dropna(subset=[date_column, value_column])
+        df = df.sort_values(date_column, kind='stable')
+
+        groups = {
+            str(key): group
+            for key, group in df.groupby(df[entity_column].astype(str), sort=False)
+        }
+        for entity_id in pending:
+            if entity_id == "All Data":
+                group = df
+            else:
+                group = groups.get(str(entity_id))
+            if group is None or len(group) == 0:
+                prepared[entity_id] = (None, "Dataset is empty", None)
+                continue
+            prepared[entity_id] = self._prepare_series(
+                group, date_column, value_column, template.regressor_columns, coerced=True
+            )
+        return prepared
 
     # ============================================
     # Frequency Detection (public for endpoint)
@@ -201,8 +354,13 @@ class ForecastService:
         request: ForecastRequest,
         forecast_id: Optional[str] = None,
         forecast_history_id: Optional[str] = None,
+        prepared: Optional[Tuple[Optional[pd.Series], Optional[str], Optional[pd.DataFrame]]] = None,
     ) -> ForecastResultResponse:
-        """Run a single forecast"""
+        """Run a single forecast.
+
+        `prepared` is a (series, error, exog_df) tuple from the batch
+        preparation stage; when given, the dataset is not loaded again.
+        """
         forecast_id = forecast_id or str(uuid.uuid4())
 
         # Initialize result
@@ -216,31 +374,33 @@ class ForecastService:
             created_at=datetime.utcnow()
         )
 
-        # Store initial status
-        await self._store_result(result)
+        # Progress goes to a small hash; the full result is stored once at the end
+        await self._report_progress(result)
 
         try:
             # Get data
             result.progress = 10
-            await self._store_result(result)
+            await self._report_progress(result)
 
             logger.info(f"Forecast: entity_id={request.entity_id!r}, dataset={request.dataset_id}, method={request.method}, entity_column={request.entity_column!r}")
 
-            series, error, exog_df = await self._get_forecast_data(
-                request.dataset_id,
-                request.entity_id,
-                request.date_column,
-                request.value_column,
-                request.entity_column,
-                request.regressor_columns
-            )
+            if prepared is not None:
+                series, error, exog_df = prepared
+            else:
+                series, error, exog_df = await self._get_forecast_data(
+                    request.dataset_id,
+                    request.entity_id,
+                    request.date_column,
+                    request.value_column,
+                    request.entity_column,
+                    request.regressor_columns
+                )
 
             if error:
                 logger.warning(f"Forecast data error for entity={request.entity_id!r}: {error}")
                 result.status = ForecastStatus.FAILED
                 result.error = error
-                await self._store_result(result)
-                return result
+                return await self._finish_forecast(result)
 
             logger.info(f"Forecast data OK: series_len={len(series)}, exog={exog_df.columns.tolist() if exog_df is not None else None}")
 
@@ -276,33 +436,58 @@ class ForecastService:
                 logger.warning(f"Validation blocked forecast: {validation.blocking_error}")
                 result.status = ForecastStatus.FAILED
                 result.error = validation.blocking_error
-                await self._store_result(result)
-                return result
+                return await self._finish_forecast(result)
             result.warnings.extend(validation.warnings)
 
             # Only pass exog to Prophet (ARIMA/ETS don't support it in our implementation)
             use_exog = exog_df if (request.method == ForecastMethod.PROPHET and exog_df is not None and len(exog_df.columns) > 0) else None
 
             result.progress = 30
-            await self._store_result(result)
-
-            # Create forecaster (now receives effective frequency + seasonal_period)
-            forecaster = self._create_forecaster(request, seasonal_period=detected_period)
+            await self._report_progress(result)
 
-            # Fit model
-            result.progress = 50
-            await self._store_result(result)
-
-            forecaster.fit(series, exog=use_exog)
+            # Incremental re-forecast: update the model stored by an earlier run
+            model_state = None
+            if request.update_from:
+                model_state = await self._load_model_state(request.update_from)
+                if model_state is None:
+                    result.warnings.append(
+                        f"No stored model for forecast {request.update_from}; fitted from scratch."
+                    )
 
-            result.progress = 70
-            await self._store_result(result)
+            # Fit + predict (+ CV) run on the execution engine, off the event loop
+            job = ForecastJob(
+                job_id=forecast_id,
+                request=request.model_dump(mode="json"),
+                series=series,
+                exog=use_exog,
+                seasonal_period=detected_period,
+                cpu_time_limit=settings.FORECAST_JOB_CPU_TIME_LIMIT_SEC or None,
+                timeout=settings.FORECAST_JOB_TIMEOUT_SEC or None,
+                keep_model=self.db is not None and forecast_history_id is not None,
+                model_state=model_state,
+            )
 
-            # Generate predictions
-            output = forecaster.predict(request.horizon, exog=use_exog)
+            result.progress = 50
+            await self._report_progress(result)
+
+            cache_key = job.fingerprint() if request.use_cache and settings.FORECAST_RESULT_CACHE_TTL_SEC > 0 else None
+            job_result = await self._get_cached_job_result(cache_key)
+            if job_result is not None and job.keep_model and job_result.model_state is None:
+                job_result = None  # cached without a model to store for this run
+            if job_result is not None:
+                result.cache_hit = True
+            else:
+                engine = self.prophet_engine if request.method == ForecastMethod.PROPHET else self.engine
+                _running_jobs[forecast_id] = (self.tenant_id, engine)
+                try:
+                    job_result = await engine.submit(job)
+                finally:
+                    _running_jobs.pop(forecast_id, None)
+                await self._store_cached_job_result(cache_key, job_result)
+            output = job_result.output
 
             result.progress = 85
-            await self._store_result(result)
+            await self._report_progress(result)
 
             # Build predictions + metrics
             result.predictions = [
@@ -367,30 +552,28 @@ class ForecastService:
                 )
 
             # --- Cross-validation (US5 of spec 001) ---
-            if request.cross_validation and request.cross_validation.enabled:
-                try:
-                    cv_result = self._run_cross_validation(series, request, use_exog, detected_period)
-                    result.cv_results = CrossValidationResultResponse(
-                        folds=len(cv_result.folds),
-                        method=cv_result.method,
-                        metrics_per_fold=[
-                            MetricsResponse(mae=f.mae, rmse=f.rmse, mape=f.mape)
-                            for f in cv_result.folds
-                        ],
-                        average_metrics=MetricsResponse(
-                            mae=cv_result.average_mae,
-                            rmse=cv_result.average_rmse,
-                            mape=cv_result.average_mape,
-                        ),
+            cv_result = job_result.cv_result
+            if cv_result is not None:
+                result.cv_results = CrossValidationResultResponse(
+                    folds=len(cv_result.folds),
+                    method=cv_result.method,
+                    metrics_per_fold=[
+                        MetricsResponse(mae=f.mae, rmse=f.rmse, mape=f.mape)
+                        for f in cv_result.folds
+                    ],
+                    average_metrics=MetricsResponse(
+                        mae=cv_result.average_mae,
+                        rmse=cv_result.average_rmse,
+                        mape=cv_result.average_mape,
+                    ),
+                )
+                if cv_result.reduced_folds:
+                    result.warnings.append(
+                        f"Requested {cv_result.requested_folds} CV folds; reduced to "
+                        f"{len(cv_result.folds)} due to dataset size."
                     )
-                    if cv_result.reduced_folds:
-                        result.warnings.append(
-                            f"Requested {cv_result.requested_folds} CV folds; reduced to "
-                            f"{len(cv_result.folds)} due to dataset size."
-                        )
-                except Exception as cv_err:
-                    logger.warning(f"CV failed (non-blocking): {cv_err}")
-                    result.warnings.append(f"Cross-validation failed: {cv_err}")
+            elif job_result.cv_error:
+                result.warnings.append(f"Cross-validation failed: {job_result.cv_error}")
 
             result.progress = 100
             result.status = ForecastStatus.COMPLETED
@@ -403,165 +586,249 @@ class ForecastService:
             except Exception as db_err:
                 logger.error(f"Failed to save predictions to DB (non-blocking): {db_err}")
 
+            if job.keep_model and job_result.model_state is not None:
+                await self._save_model_state(forecast_history_id, job_result.model_state)
+
+        except JobCancelledError:
+            logger.info(f"Forecast {forecast_id} cancelled")
+            result.status = ForecastStatus.CANCELLED
+            result.error = "Forecast was cancelled"
+        except JobTimeoutError as e:
+            logger.warning(f"Forecast {forecast_id} timed out: {e}")
+            result.status = ForecastStatus.FAILED
+            result.error = str(e)
         except Exception as e:
             logger.error(f"Forecast failed: {e}", exc_info=True)
             result.status = ForecastStatus.FAILED
             result.error = str(e)
 
+        return await self._finish_forecast(result)
+
+    async def _finish_forecast(self, result: ForecastResultResponse) -> ForecastResultResponse:
+        """Store the final result (the only full write) and publish its terminal status."""
         await self._store_result(result)
+        await self._report_progress(result, force=True)
+        _progress_writes.pop(result.id, None)
         return result
 
-    def _run_cross_validation(
-        self,
-        series: pd.Series,
-        request: ForecastRequest,
-        exog: Optional[pd.DataFrame],
-        seasonal_period: int,
-    ) -> CVRunResult:
-        """Execute CV using a forecaster factory closure."""
-        cv = request.cross_validation
-
-        def factory():
-            return self._create_forecaster(request, seasonal_period=seasonal_period)
-
-        return run_cv_engine(
-            series=series,
-            forecaster_factory=factory,
-            folds=cv.folds,
-            method=cv.method,
-            initial_train_size=cv.initial_train_size,
-            horizon=request.horizon,
-            exog=exog,
-        )
+    async def cancel_forecast(self, forecast_id: str) -> bool:
+        """Cancel a running forecast job.
+
+        Returns True if the job was running on this process's engine and has
+        been cancelled; the final CANCELLED status is written by run_forecast.
+        """
+        tenant_id, engine = _running_jobs.get(forecast_id, (None, None))
+        if tenant_id != self.tenant_id:
+            return False
+        return await engine.cancel(forecast_id)
 
     async def start_batch_forecast(
         self,
-        request: BatchForecastRequest
+        request: BatchForecastRequest,
+        max_concurrency: Optional[int] = None,
     ) -> BatchForecastStatusResponse:
         """Start a batch forecast — returns immediately, processes in background."""
         batch_id = str(uuid.uuid4())
 
         # Store initial batch status in Redis
-        initial_status = BatchForecastStatusResponse(
-            batch_id=batch_id,
-            total=len(request.entity_ids),
-            completed=0,
-            failed=0,
-            in_progress=len(request.entity_ids),
-            status=ForecastStatus.RUNNING,
-            results=[]
-        )
+        initial_status = self._build_batch_status(batch_id, len(request.entity_ids), [])
         await self._store_batch_status(batch_id, initial_status)
 
         # Launch background task with strong reference to prevent GC
-        import asyncio
         loop = asyncio.get_running_loop()
-        task = loop.create_task(self._run_batch_background(batch_id, request))
+        task = loop.create_task(
+            self.run_batch_forecast(request, batch_id=batch_id, max_concurrency=max_concurrency)
+        )
         _background_tasks.add(task)
         task.add_done_callback(_background_tasks.discard)
 
         return initial_status
 
-    async def _run_batch_background(
+    async def run_batch_forecast(
         self,
-        batch_id: str,
-        request: BatchForecastRequest
-    ) -> None:
-        """Background worker that processes batch entities one by one."""
-        results: List[ForecastResultResponse] = []
+        request: BatchForecastRequest,
+        batch_id: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> BatchForecastStatusResponse:
+        """Forecast every entity of a batch concurrently and return the final status.
+
+        Entities fan out over the execution engine, at most `max_concurrency`
+        at a time for this tenant (shared across all of the tenant's batches
+        in this process). Each finished entity is recorded individually so
+        progress stays accurate when entities complete out of order; results
+        in the final status keep the order of request.entity_ids.
+        """
+        batch_id = batch_id or str(uuid.uuid4())
+        total = len(request.entity_ids)
+        results: List[Optional[ForecastResultResponse]] = [None] * total
+
+        # Completed entities are persisted in bulk under one ForecastHistory row
+        writer: Optional[PredictionWriter] = None
+        if self.session_factory is not None and await self._create_batch_history(batch_id, request):
+            writer = PredictionWriter(self.tenant_id, session_factory=self.session_factory)
+            writer.start()
 
         try:
-            # Auto-detect entity column once for the whole batch
-            entity_column = None
-            try:
-                df = await self.preprocessing_service.get_dataset_dataframe(request.dataset_id)
-                if df is not None:
-                    entity_column = self.preprocessing_service._detect_entity_column(df)
-                    logger.info(f"Batch forecast: detected entity_column={entity_column!r}, entities={request.entity_ids}")
-            except Exception as e:
-                logger.warning(f"Batch: could not detect entity column: {e}")
-
-            for i, entity_id in enumerate(request.entity_ids):
-                single_request = ForecastRequest(
-                    dataset_id=request.dataset_id,
-                    entity_id=entity_id,
-                    entity_column=entity_column or request.entity_column,
-                    date_column=request.date_column,
-                    value_column=request.value_column,
-                    method=request.method,
-                    horizon=request.horizon,
-                    frequency=request.frequency,
-                    frequency_auto_detect=request.frequency_auto_detect,
-                    confidence_level=request.confidence_level,
-                    arima_settings=request.arima_settings,
-                    ets_settings=request.ets_settings,
-                    prophet_settings=request.prophet_settings,
-                    cross_validation=request.cross_validation,
-                    regressor_columns=request.regressor_columns
-                )
+            # Load + deserialise the dataset once for the whole batch
+            df = await self.preprocessing_service.get_dataset_dataframe(request.dataset_id)
+            entity_requests = await self._batch_entity_requests(request, df=df)
+            prepared = await self._prepare_batch_data(request.dataset_id, entity_requests, df=df)
+            slots = _tenant_slots(
+                self.tenant_id, max_concurrency or settings.DEFAULT_MAX_CONCURRENT_FORECASTS
+            )
 
-                result = await self.run_forecast(single_request)
-                results.append(result)
-
-                # Update batch status in Redis after each entity
-                completed = sum(1 for r in results if r.status == ForecastStatus.COMPLETED)
-                failed = sum(1 for r in results if r.status == ForecastStatus.FAILED)
-                remaining = len(request.entity_ids) - len(results)
-
-                batch_status = BatchForecastStatusResponse(
-                    batch_id=batch_id,
-                    total=len(request.entity_ids),
-                    completed=completed,
-                    failed=failed,
-                    in_progress=remaining,
-                    status=ForecastStatus.RUNNING if remaining > 0 else (
-                        ForecastStatus.COMPLETED if completed > 0 else ForecastStatus.FAILED
-                    ),
-                    results=results
-                )
-                await self._store_batch_status(batch_id, batch_status)
+            async def _run_entity(index: int, entity_request: ForecastRequest) -> None:
+                async with slots:
+                    result = await self.run_forecast(
+                        entity_request, prepared=prepared.get(entity_request.entity_id)
+                    )
+                results[index] = result
+                await self._record_batch_result(batch_id, index, result)
+                if writer is not None and result.status == ForecastStatus.COMPLETED:
+                    await writer.add(batch_id, result)
 
-            logger.info(f"Batch {batch_id} finished: {sum(1 for r in results if r.status == ForecastStatus.COMPLETED)}/{len(results)} completed")
+            await asyncio.gather(
+                *(_run_entity(i, r) for i, r in enumerate(entity_requests))
+            )
+
+            final_status = self._build_batch_status(batch_id, total, results, final=True)
+            logger.info(f"Batch {batch_id} finished: {final_status.completed}/{total} completed")
 
         except Exception as e:
             # Top-level handler: mark batch as FAILED so it doesn't stay stuck as "running"
             logger.error(f"Batch {batch_id} crashed: {e}", exc_info=True)
-            failed_status = BatchForecastStatusResponse(
-                batch_id=batch_id,
-                total=len(request.entity_ids),
-                completed=sum(1 for r in results if r.status == ForecastStatus.COMPLETED),
-                failed=len(request.entity_ids) - sum(1 for r in results if r.status == ForecastStatus.COMPLETED),
-                in_progress=0,
-                status=ForecastStatus.FAILED,
-                results=results
+            final_status = self._build_batch_status(batch_id, total, results, final=True)
+            final_status.status = ForecastStatus.FAILED
+
+        if writer is not None:
+            await writer.close()
+            await self._finish_batch_history(batch_id, final_status)
+        await self._store_batch_status(batch_id, final_status)
+        return final_status
+
+    async def _batch_entity_requests(
+        self,
+        request: BatchForecastRequest,
+        df: Optional[pd.DataFrame] = None,
+    ) -> List[ForecastRequest]:
+        """Expand a batch request into one ForecastRequest per entity."""
+        # Auto-detect entity column once for the whole batch
+        entity_column = None
+        try:
+            if df is None:
+                df = await self.preprocessing_service.get_dataset_dataframe(request.dataset_id)
+            if df is not None:
+                entity_column = self.preprocessing_service._detect_entity_column(df)
+                logger.info(f"Batch forecast: detected entity_column={entity_column!r}, entities={request.entity_ids}")
+        except Exception as e:
+            logger.warning(f"Batch: could not detect entity column: {e}")
+
+        return [
+            ForecastRequest(
+                dataset_id=request.dataset_id,
+                entity_id=entity_id,
+                entity_column=entity_column or request.entity_column,
+                date_column=request.date_column,
+                value_column=request.value_column,
+                method=request.method,
+                horizon=request.horizon,
+                frequency=request.frequency,
+                frequency_auto_detect=request.frequency_auto_detect,
+                confidence_level=request.confidence_level,
+                arima_settings=request.arima_settings,
+                ets_settings=request.ets_settings,
+                prophet_settings=request.prophet_settings,
+                cross_validation=request.cross_validation,
+                regressor_columns=request.regressor_columns
             )
-            await self._store_batch_status(batch_id, failed_status)
+            for entity_id in request.entity_ids
+        ]
+
+    def _build_batch_status(
+        self,
+        batch_id: str,
+        total: int,
+        results: Sequence[Optional[ForecastResultResponse]],
+        final: bool = False,
+    ) -> BatchForecastStatusResponse:
+        """Aggregate per-entity results (in entity order, None = unfinished) into a batch status."""
+        finished = [r for r in results if r is not None]
+        completed = sum(1 for r in finished if r.status == ForecastStatus.COMPLETED)
+        remaining = 0 if final else total - len(finished)
+        return BatchForecastStatusResponse(
+            batch_id=batch_id,
+            total=total,
+            completed=completed,
+            failed=(total - completed) if final else len(finished) - completed,
+            in_progress=remaining,
+            status=ForecastStatus.RUNNING if remaining > 0 else (
+                ForecastStatus.COMPLETED if completed > 0 else ForecastStatus.FAILED
+            ),
+            results=finished
+        )
+
+    async def _record_batch_result(self, batch_id: str, index: int, result: ForecastResultResponse) -> None:
+        """Record one finished entity in the batch's results hash (field = entity index)."""
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return
+            key = f"{REDIS_BATCH_RESULTS_PREFIX}{batch_id}"
+            await redis.hset(key, str(index), json.dumps(result.model_dump(mode='json'), default=str))
+            await redis.expire(key, REDIS_FORECAST_TTL)
+            await redis.publish(f"{REDIS_BATCH_EVENTS_PREFIX}{batch_id}", json.dumps({
+                "type": "entity",
+                "index": index,
+                "id": result.id,
+                "entity_id": result.entity_id,
+                "status": result.status.value,
+                "error": result.error,
+            }))
+        except Exception as e:
+            logger.error(f"Error recording batch result: {e}")
 
     async def _store_batch_status(self, batch_id: str, status: BatchForecastStatusResponse) -> None:
-        """Store batch forecast status in Redis."""
+        """Store batch forecast status in Redis and publish its counts."""
         try:
             redis = await get_redis()
             if redis is None:
                 return
-            key = f"forecast_batch:{batch_id}"
+            key = f"{REDIS_BATCH_PREFIX}{batch_id}"
             data = status.model_dump(mode='json')
             await redis.set(key, json.dumps(data, default=str), ex=REDIS_FORECAST_TTL)
+            data.pop("results", None)
+            await redis.publish(
+                f"{REDIS_BATCH_EVENTS_PREFIX}{batch_id}", json.dumps({"type": "batch", **data}, default=str)
+            )
         except Exception as e:
             logger.error(f"Error storing batch status: {e}")
 
     async def get_batch_status(self, batch_id: str) -> Optional[BatchForecastStatusResponse]:
-        """Get batch forecast status from Redis."""
+        """Get batch forecast status from Redis.
+
+        While the batch is running, progress is computed from the per-entity
+        results hash so it reflects entities that finished out of order.
+        """
         try:
             redis = await get_redis()
             if redis is None:
                 return None
-            key = f"forecast_batch:{batch_id}"
-            data = await redis.get(key)
-            if data:
-                if isinstance(data, bytes):
-                    data = data.decode('utf-8')
-                return BatchForecastStatusResponse(**json.loads(data))
-            return None
+            data = await redis.get(f"{REDIS_BATCH_PREFIX}{batch_id}")
+            if not data:
+                return None
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            status = BatchForecastStatusResponse(**json.loads(data))
+            if status.status != ForecastStatus.RUNNING:
+                return status
+
+            recorded = await redis.hgetall(f"{REDIS_BATCH_RESULTS_PREFIX}{batch_id}") or {}
+            results: List[Optional[ForecastResultResponse]] = [None] * status.total
+            for field, value in recorded.items():
+                index = int(field)
+                if 0 <= index < status.total:
+                    results[index] = ForecastResultResponse(**json.loads(value))
+            return self._build_batch_status(batch_id, status.total, results)
         except Exception as e:
             logger.error(f"Error getting batch status: {e}")
             return None
@@ -609,74 +876,14 @@ class ForecastService:
         `seasonal_period` comes from frequency auto-detection and is used to
         set sensible defaults for seasonal-aware models.
         """
-        frequency = request.frequency.value
-
-        if request.method == ForecastMethod.ARIMA:
-            settings = request.arima_settings
-            if settings and not settings.auto:
-                # Manual mode — honour user overrides
-                return ARIMAForecaster(
-                    frequency=frequency,
-                    confidence_level=request.confidence_level,
-                    auto=False,
-                    order=(settings.p or 1, settings.d or 1, settings.q or 1),
-                    seasonal_order=(
-                        settings.P or 0,
-                        settings.D or 0,
-                        settings.Q or 0,
-                        settings.s or seasonal_period
-                    ) if (settings.s or seasonal_period > 1) else None
-                )
-            return ARIMAForecaster(
-                frequency=frequency,
-                confidence_level=request.confidence_level,
-                auto=True
-            )
-
-        elif request.method == ForecastMethod.ETS:
-            settings = request.ets_settings
-            if settings and not settings.auto:
-                return ETSForecaster(
-                    frequency=frequency,
-                    confidence_level=request.confidence_level,
-                    auto=False,
-                    trend=settings.trend,
-                    seasonal=settings.seasonal,
-                    seasonal_periods=settings.seasonal_periods or (seasonal_period if seasonal_period > 1 else None),
-                    damped_trend=settings.damped_trend
-                )
-            # Auto mode — supply detected seasonal period as hint
-            return ETSForecaster(
-                frequency=frequency,
-                confidence_level=request.confidence_level,
-                auto=True,
-                seasonal_periods=seasonal_period if seasonal_period > 1 else None
-            )
-
-        else:  # Prophet
-            settings = request.prophet_settings
-            if settings:
-                return ProphetForecaster(
-                    frequency=frequency,
-                    confidence_level=request.confidence_level,
-                    changepoint_prior_scale=settings.changepoint_prior_scale,
-                    seasonality_prior_scale=settings.seasonality_prior_scale,
-                    seasonality_mode=settings.seasonality_mode,
-                    yearly_seasonality=settings.yearly_seasonality,
-                    weekly_seasonality=settings.weekly_seasonality,
-                    daily_seasonality=settings.daily_seasonality
-                )
-            return ProphetForecaster(
-                frequency=frequency,
-                confidence_level=request.confidence_level
-            )
+        return create_forecaster(request, seasonal_period=seasonal_period)
 
     # ============================================
     # Result Storage
     # ============================================
 
     async def _store_result(self, result: ForecastResultResponse) -> None:
-        """Store forecast result in Redis"""
+        """Store forecast result in Redis (full result + rows list, see results_service)"""
         try:
             redis = await get_redis()
             if redis is None:
@@ -685,42 +892,226 @@ class ForecastService:
             key = f"{REDIS_FORECAST_PREFIX}{result.id}"
             data = result.model_dump(mode='json')
             await redis.set(key, json.dumps(data, default=str), ex=REDIS_FORECAST_TTL)
+            # Row-per-entry copy for paginated reads and streamed exports
+            await store_result_rows(redis, result, REDIS_FORECAST_TTL)
 
         except Exception as e:
             logger.error(f"Error storing forecast result: {e}")
 
+    async def _get_cached_job_result(self, cache_key: Optional[str]) -> Optional[ForecastJobResult]:
+        """Model output of an identical earlier job, or None on a miss."""
+        if cache_key is None:
+            return None
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return None
+
+            data = await redis.get(f"{REDIS_RESULT_CACHE_PREFIX}{self.tenant_id}:{cache_key}")
+            if not data:
+                return None
+            await redis.zadd(f"{REDIS_RESULT_CACHE_INDEX_PREFIX}{self.tenant_id}", {cache_key: time.time()})
+            logger.info(f"Forecast result cache hit: {cache_key}")
+            return ForecastJobResult.from_payload(json.loads(data))
+
+        except Exception as e:
+            logger.error(f"Error reading forecast result cache: {e}")
+            return None
+
+    async def _store_cached_job_result(self, cache_key: Optional[str], job_result: ForecastJobResult) -> None:
+        """Cache a job's model output (TTL), evicting the tenant's least recently used entries."""
+        if cache_key is None:
+            return
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return
+
+            ttl = settings.FORECAST_RESULT_CACHE_TTL_SEC
+            index_key = f"{REDIS_RESULT_CACHE_INDEX_PREFIX}{self.tenant_id}"
+            await redis.set(
+                f"{REDIS_RESULT_CACHE_PREFIX}{self.tenant_id}:{cache_key}",
+                json.dumps(job_result.to_payload()),
+                ex=ttl,
+            )
+            await redis.zadd(index_key, {cache_key: time.time()})
+            await redis.expire(index_key, ttl)
+
+            overflow = await redis.zcard(index_key) - settings.FORECAST_RESULT_CACHE_MAX_ENTRIES
+            if overflow > 0:
+                evicted = await redis.zrange(index_key, 0, overflow - 1)
+                await redis.delete(*[f"{REDIS_RESULT_CACHE_PREFIX}{self.tenant_id}:{k}" for k in evicted])
+                await redis.zrem(index_key, *evicted)
+
+        except Exception as e:
+            logger.error(f"Error storing forecast result cache: {e}")
+
+    async def _report_progress(self, result: ForecastResultResponse, force: bool = False) -> None:
+        """Record status/progress of a running forecast in its progress hash.
+
+        Writes are coalesced: a progress-only change within
+        FORECAST_PROGRESS_MIN_INTERVAL_SEC of the previous write is dropped,
+        status changes (and `force`) always go through. Every write is also
+        published on forecast_events:{id} for the SSE status stream.
+        """
+        now = time.monotonic()
+        status = result.status.value
+        previous = _progress_writes.get(result.id)
+        if (
+            not force
+            and previous is not None
+            and previous[1] == status
+            and now - previous[0] < settings.FORECAST_PROGRESS_MIN_INTERVAL_SEC
+        ):
+            return
+        _progress_writes[result.id] = (now, status)
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return
+
+            key = f"{REDIS_PROGRESS_PREFIX}{result.id}"
+            if previous is None:
+                data = result.model_dump(mode='json', include=set(_PROGRESS_FIELDS))
+                mapping = {k: json.dumps(data.get(k), default=str) for k in _PROGRESS_FIELDS}
+            else:
+                mapping = {
+                    "status": json.dumps(status),
+                    "progress": json.dumps(result.progress),
+                    "error": json.dumps(result.error),
+                }
+            await redis.hset(key, mapping=mapping)
+            if previous is None:
+                await redis.expire(key, REDIS_FORECAST_TTL)
+            await redis.publish(f"{REDIS_FORECAST_EVENTS_PREFIX}{result.id}", json.dumps({
+                "id": result.id,
+                "status": status,
+                "progress": result.progress,
+                "error": result.error,
+            }))
+
+        except Exception as e:
+            logger.error(f"Error storing forecast progress: {e}")
+
     async def _save_predictions_to_db(
         self,
         forecast_history_id: str,
         result: ForecastResultResponse,
     ) -> None:
-        """Persist forecast predictions to PostgreSQL for permanent storage."""
-        from app.models import ForecastPrediction
-
-        prediction = ForecastPrediction(
-            id=str(uuid.uuid4()),
-            tenant_id=self.tenant_id,
-            forecast_history_id=forecast_history_id,
-            entity_id=result.entity_id or "unknown",
-            entity_name=None,
-            predicted_values=[
-                {"date": p.date, "value": p.value, "lower_bound": p.lower_bound, "upper_bound": p.upper_bound}
-                for p in (result.predictions or [])
-            ],
-            metrics=result.metrics.model_dump() if result.metrics else None,
-            model_summary=result.model_summary.model_dump() if result.model_summary else None,
-            cv_results=result.cv_results.model_dump() if result.cv_results else None,
-        )
-        self.db.add(prediction)
-        await self.db.flush()
+        """Persist forecast predictions to PostgreSQL for permanent storage.
+
+        The series goes to forecast_prediction_points (one row per date, bulk
+        COPY); the ForecastPrediction row keeps metrics and model summary.
+        Batches buffer their results in a PredictionWriter instead.
+        """
+        await save_predictions(self.db, self.tenant_id, [(forecast_history_id, result)])
         logger.info(
             "Saved prediction to DB: forecast_history_id=%s entity=%s",
             forecast_history_id,
             result.entity_id,
         )
 
+    async def _create_batch_history(self, batch_id: str, request: BatchForecastRequest) -> bool:
+        """Record a batch as one ForecastHistory row (id = batch_id) its predictions attach to."""
+        from app.models.forecast_history import (
+            ForecastHistory, ForecastMethod as FHMethod, ForecastStatus as FHStatus,
+        )
+
+        try:
+            async with self.session_factory() as session:
+                session.add(ForecastHistory(
+                    id=batch_id,
+                    tenant_id=self.tenant_id,
+                    user_id=self.user_id,
+                    dataset_id=request.dataset_id,
+                    method=FHMethod(request.method.value),
+                    config=request.model_dump(mode='json'),
+                    status=FHStatus.RUNNING,
+                    entity_count=len(request.entity_ids),
+                    started_at=datetime.utcnow(),
+                ))
+                await session.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create batch ForecastHistory (non-blocking): {e}")
+            return False
+
+    async def _persist_batch_results(
+        self,
+        batch_id: str,
+        results: List[ForecastResultResponse],
+        status: BatchForecastStatusResponse,
+    ) -> None:
+        """Write a finished batch's completed results and close its ForecastHistory row.
+
+        Used when the entities ran elsewhere (Celery subtasks) and the results
+        only come together once the batch is over.
+        """
+        writer = PredictionWriter(self.tenant_id, session_factory=self.session_factory, flush_interval=0)
+        for result in results:
+            if result.status == ForecastStatus.COMPLETED:
+                await writer.add(batch_id, result)
+        await writer.close()
+        await self._finish_batch_history(batch_id, status)
+
+    async def _finish_batch_history(self, batch_id: str, status: BatchForecastStatusResponse) -> None:
+        from sqlalchemy import update
+        from app.models.forecast_history import ForecastHistory, ForecastStatus as FHStatus
+
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    update(ForecastHistory)
+                    .where(ForecastHistory.id == batch_id, ForecastHistory.tenant_id == self.tenant_id)
+                    .values(
+                        status=FHStatus.COMPLETED if status.status == ForecastStatus.COMPLETED else FHStatus.FAILED,
+                        completed_at=datetime.utcnow(),
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to finish batch ForecastHistory (non-blocking): {e}")
+
+    async def _save_model_state(self, forecast_history_id: str, state: Dict[str, Any]) -> None:
+        """Upload a run's fitted model state and link it to its ForecastHistory row (non-blocking)."""
+        from sqlalchemy import update
+        from app.models import ForecastHistory
+
+        key = MODEL_STATE_KEY.format(tenant_id=self.tenant_id, forecast_history_id=forecast_history_id)
+        try:
+            data = await asyncio.to_thread(encode_model_state, state)
+            await get_storage_backend().upload(key, data, content_type="application/gzip")
+            await self.db.execute(
+                update(ForecastHistory)
+                .where(ForecastHistory.id == forecast_history_id, ForecastHistory.tenant_id == self.tenant_id)
+                .values(model_key=key)
+            )
+            await self.db.flush()
+        except Exception as e:
+            logger.error(f"Failed to save fitted model (non-blocking): {e}")
+
+    async def _load_model_state(self, forecast_history_id: str) -> Optional[Dict[str, Any]]:
+        """Fitted model state stored by an earlier run of this tenant, or None."""
+        if self.db is None:
+            return None
+        from sqlalchemy import select
+        from app.models import ForecastHistory
+
+        try:
+            key = (await self.db.execute(
+                select(ForecastHistory.model_key)
+                .where(ForecastHistory.id == forecast_history_id, ForecastHistory.tenant_id == self.tenant_id)
+            )).scalar_one_or_none()
+            if not key:
+                return None
+            data = await get_storage_backend().download(key)
+            return await asyncio.to_thread(decode_model_state, data)
+        except Exception as e:
+            logger.error(f"Error loading fitted model for forecast {forecast_history_id}: {e}")
+            return None
+
     async def get_forecast_status(self, forecast_id: str) -> Optional[ForecastResultResponse]:
-        """Get forecast status/result from Redis"""
+        """Get forecast status/result from Redis (progress only while running)"""
         try:
             redis = await get_redis()
             if redis is None:
@@ -733,12 +1124,36 @@ class ForecastService:
                 if isinstance(data, bytes):
                     data = data.decode('utf-8')
                 return ForecastResultResponse(**json.loads(data))
+
+            # Still running: only the progress hash exists
+            progress = await redis.hgetall(f"{REDIS_PROGRESS_PREFIX}{forecast_id}")
+            if progress:
+                return ForecastResultResponse(**{k: json.loads(v) for k, v in progress.items()})
             return None
 
         except Exception as e:
             logger.error(f"Error getting forecast status: {e}")
             return None
 
+    async def get_forecast_progress(self, forecast_id: str) -> Optional[Dict[str, Any]]:
+        """Status / progress / error of a forecast from its progress hash only (no result payload)."""
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return None
+            progress = await redis.hmget(
+                f"{REDIS_PROGRESS_PREFIX}{forecast_id}", "id", "status", "progress", "error"
+            )
+            if progress[1] is None:
+                return None
+            return {
+                field: json.loads(value) if value is not None else None
+                for field, value in zip(("id", "status", "progress", "error"), progress)
+            }
+        except Exception as e:
+            logger.error(f"Error getting forecast progress: {e}")
+            return None
+
     # ============================================
     # Method Information
     # ============================================
@@ -0,0 +1,373 @@
+"""
+Prediction Store - Forecast predictions as rows, queried in PostgreSQL
+
+Each prediction series is written as ForecastPredictionPoint rows (one per
+date) with a bulk COPY, instead of one JSON blob per entity. Range reads
+("entity X between two dates") and aggregates ("sum across entities per
+date") are single indexed SQL queries; nothing is parsed in Python loops.
+
+save_predictions() persists any number of finished results in two
+statements; PredictionWriter buffers the results of a running batch and
+flushes them through it every PREDICTION_WRITE_BATCH_SIZE results or
+PREDICTION_WRITE_INTERVAL_SEC seconds.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import ForecastPrediction, ForecastPredictionPoint
+from app.schemas.forecast import ForecastResultResponse, PredictionResponse
+
+logger = logging.getLogger(__name__)
+
+# Column order of the records written by write_points
+POINT_COLUMNS = (
+    "forecast_prediction_id",
+    "date",
+    "tenant_id",
+    "forecast_history_id",
+    "entity_id",
+    "value",
+    "lower_bound",
+    "upper_bound",
+)
+
+# Value columns of a point, returned by range reads and aggregated by aggregate()
+VALUE_COLUMNS = ("value", "lower_bound", "upper_bound")
+
+AGGREGATES = {
+    "sum": func.sum,
+    "avg": func.avg,
+    "min": func.min,
+    "max": func.max,
+    "count": func.count,
+}
+
+GROUP_BY_COLUMNS = ("date", "entity_id")
+
+
+def point_records(
+    tenant_id: str,
+    forecast_history_id: str,
+    forecast_prediction_id: str,
+    entity_id: str,
+    predictions: Sequence[PredictionResponse],
+) -> List[Tuple]:
+    """COPY-ready records (POINT_COLUMNS order) for one prediction series."""
+    return [
+        (
+            forecast_prediction_id,
+            date.fromisoformat(p.date[:10]),
+            tenant_id,
+            forecast_history_id,
+            entity_id,
+            p.value,
+            p.lower_bound,
+            p.upper_bound,
+        )
+        for p in predictions
+    ]
+
+
+async def write_points(db: AsyncSession, records: Sequence[Tuple]) -> None:
+    """Bulk-insert point records in the session's transaction.
+
+    Uses asyncpg's binary COPY when the session runs on asyncpg, and a
+    single executemany INSERT on any other driver. The parent
+    ForecastPrediction rows must already be flushed.
+    """
+    if not records:
+        return
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    if hasattr(driver, "copy_records_to_table"):
+        await driver.copy_records_to_table(
+            ForecastPredictionPoint.__tablename__, records=list(records), columns=list(POINT_COLUMNS)
+        )
+    else:
+        await db.execute(
+            insert(ForecastPredictionPoint), [dict(zip(POINT_COLUMNS, r)) for r in records]
+        )
+
+
+async def save_predictions(
+    db: AsyncSession,
+    tenant_id: str,
+    items: Sequence[Tuple[str, ForecastResultResponse]],
+) -> List[str]:
+    """Persist finished results as ForecastPrediction rows + their points, in bulk.
+
+    One executemany INSERT for the prediction rows and one COPY for all of
+    their points, whatever the number of results. Runs in the caller's
+    transaction (no commit).
+
+    Args:
+        items: (forecast_history_id, result) pairs.
+
+    Returns:
+        The new ForecastPrediction ids, in the order of `items`.
+    """
+    if not items:
+        return []
+    rows, records = [], []
+    for forecast_history_id, result in items:
+        prediction_id = str(uuid.uuid4())
+        entity_id = result.entity_id or "unknown"
+        rows.append({
+            "id": prediction_id,
+            "tenant_id": tenant_id,
+            "forecast_history_id": forecast_history_id,
+            "entity_id": entity_id,
+            "entity_name": None,
+            "predicted_values": None,
+            "metrics": result.metrics.model_dump() if result.metrics else None,
+            "model_summary": result.model_summary.model_dump() if result.model_summary else None,
+            "cv_results": result.cv_results.model_dump() if result.cv_results else None,
+        })
+        records.extend(point_records(
+            tenant_id, forecast_history_id, prediction_id, entity_id, result.predictions or []
+        ))
+    await db.execute(insert(ForecastPrediction), rows)
+    await write_points(db, records)
+    return [row["id"] for row in rows]
+
+
+class PredictionWriter:
+    """Buffers finished results and persists them with save_predictions() in bulk.
+
+    Each flush opens its own session from `session_factory` and commits, so
+    the writer can outlive the request that started a batch. Flushes happen
+    when `flush_size` results are buffered, every `flush_interval` seconds
+    while used as an async context manager, and on exit. Write errors are
+    logged and do not fail the batch.
+
+    Usage:
+        async with PredictionWriter(tenant_id) as writer:
+            await writer.add(forecast_history_id, result)
+    """
+
+    def __init__(
+        self,
+        tenant_id: str,
+        session_factory: Optional[Callable[[], Any]] = None,
+        flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        if session_factory is None:
+            from app.db.database import async_session_maker as session_factory
+        self.tenant_id = tenant_id
+        self.session_factory = session_factory
+        self.flush_size = max(1, flush_size or settings.PREDICTION_WRITE_BATCH_SIZE)
+        self.flush_interval = flush_interval if flush_interval is not None else settings.PREDICTION_WRITE_INTERVAL_SEC
+        self.written = 0
+        self.flushes = 0
+        self._buffer: List[Tuple[str, ForecastResultResponse]] = []
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "PredictionWriter":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the interval flusher (needs a running event loop)."""
+        if self.flush_interval > 0 and self._timer is None:
+            self._timer = asyncio.get_running_loop().create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """Stop the interval flusher and write whatever is still buffered."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush()
+
+    async def add(self, forecast_history_id: str, result: ForecastResultResponse) -> None:
+        self._buffer.append((forecast_history_id, result))
+        if len(self._buffer) >= self.flush_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write everything buffered so far in one transaction."""
+        async with self._lock:
+            items, self._buffer = self._buffer, []
+            if not items:
+                return
+            started = time.monotonic()
+            try:
+                async with self.session_factory() as session:
+                    await save_predictions(session, self.tenant_id, items)
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"Failed to save {len(items)} predictions to DB (non-blocking): {e}")
+                return
+            self.written += len(items)
+            self.flushes += 1
+            logger.info(
+                "Saved %d predictions to DB in %.0f ms (flush %d)",
+                len(items), (time.monotonic() - started) * 1000, self.flushes,
+            )
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+
+class PredictionStore:
+    """Tenant-scoped range and aggregate queries over ForecastPredictionPoint."""
+
+    def __init__(self, tenant_id: str):
+        self.tenant_id = tenant_id
+
+    # ============================================
+    # Single Series
+    # ============================================
+
+    async def count_points(self, db: AsyncSession, forecast_prediction_id: str) -> int:
+        return await db.scalar(
+            select(func.count()).where(
+                ForecastPredictionPoint.forecast_prediction_id == forecast_prediction_id,
+                ForecastPredictionPoint.tenant_id == self.tenant_id,
+            )
+        ) or 0
+
+    async def read_series(
+        self,
+        db: AsyncSession,
+        forecast_prediction_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Rows of one prediction series in date order (prediction-row dicts)."""
+        stmt = (
+            select(ForecastPredictionPoint.date, *_value_columns())
+            .where(
+                ForecastPredictionPoint.forecast_prediction_id == forecast_prediction_id,
+                ForecastPredictionPoint.tenant_id == self.tenant_id,
+            )
+            .order_by(ForecastPredictionPoint.date)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [
+            {"date": row.date.isoformat(), **{c: getattr(row, c) for c in VALUE_COLUMNS}}
+            for row in await db.execute(stmt)
+        ]
+
+    # ============================================
+    # Range / Aggregate Queries
+    # ============================================
+
+    def range_query(
+        self,
+        entity_ids: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        forecast_history_id: Optional[str] = None,
+        latest_only: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Select:
+        """SELECT for the points matching the filters, ordered by entity and date."""
+        return (
+            select(
+                ForecastPredictionPoint.forecast_history_id,
+                ForecastPredictionPoint.entity_id,
+                ForecastPredictionPoint.date,
+                *_value_columns(),
+            )
+            .where(*self._conditions(entity_ids, start_date, end_date, forecast_history_id, latest_only))
+            .order_by(
+                ForecastPredictionPoint.entity_id,
+                ForecastPredictionPoint.date,
+                ForecastPredictionPoint.forecast_history_id,
+            )
+            .offset(offset)
+            .limit(limit)
+        )
+
+    def aggregate_query(
+        self,
+        group_by: str = "date",
+        agg: str = "sum",
+        entity_ids: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        forecast_history_id: Optional[str] = None,
+        latest_only: bool = False,
+    ) -> Select:
+        """SELECT ... GROUP BY `group_by` applying `agg` to every value column.
+
+        Raises:
+            ValueError: If `group_by` or `agg` is not supported.
+        """
+        if group_by not in GROUP_BY_COLUMNS:
+            raise ValueError(f"Cannot group predictions by '{group_by}' (expected one of {', '.join(GROUP_BY_COLUMNS)})")
+        if agg not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate '{agg}' (expected one of {', '.join(AGGREGATES)})")
+
+        key = getattr(ForecastPredictionPoint, group_by)
+        function = AGGREGATES[agg]
+        return (
+            select(
+                key,
+                func.count().label("points"),
+                *(function(getattr(ForecastPredictionPoint, c)).label(c) for c in VALUE_COLUMNS),
+            )
+            .where(*self._conditions(entity_ids, start_date, end_date, forecast_history_id, latest_only))
+            .group_by(key)
+            .order_by(key)
+        )
+
+    async def query_range(self, db: AsyncSession, **filters) -> List[Dict[str, Any]]:
+        """Points matching range_query(**filters) as dicts."""
+        return [dict(row._mapping) for row in await db.execute(self.range_query(**filters))]
+
+    async def aggregate(self, db: AsyncSession, **options) -> List[Dict[str, Any]]:
+        """Rows of aggregate_query(**options) as dicts."""
+        return [dict(row._mapping) for row in await db.execute(self.aggregate_query(**options))]
+
+    def _conditions(
+        self,
+        entity_ids: Optional[Sequence[str]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        forecast_history_id: Optional[str],
+        latest_only: bool,
+    ) -> list:
+        conditions = [ForecastPredictionPoint.tenant_id == self.tenant_id]
+        if forecast_history_id is not None:
+            conditions.append(ForecastPredictionPoint.forecast_history_id == forecast_history_id)
+        if entity_ids:
+            conditions.append(ForecastPredictionPoint.entity_id.in_(list(entity_ids)))
+        if start_date is not None:
+            conditions.append(ForecastPredictionPoint.date >= start_date)
+        if end_date is not None:
+            conditions.append(ForecastPredictionPoint.date <= end_date)
+        if latest_only:
+            # Newest prediction per entity (DISTINCT ON), so runs are not double-counted
+            latest = (
+                select(ForecastPrediction.id)
+                .where(ForecastPrediction.tenant_id == self.tenant_id)
+                .distinct(ForecastPrediction.entity_id)
+                .order_by(ForecastPrediction.entity_id, ForecastPrediction.created_at.desc())
+            )
+            if entity_ids:
+                latest = latest.where(ForecastPrediction.entity_id.in_(list(entity_ids)))
+            conditions.append(ForecastPredictionPoint.forecast_prediction_id.in_(latest))
+        return conditions
+
+
+def _value_columns() -> list:
+    return [getattr(ForecastPredictionPoint, c) for c in VALUE_COLUMNS]
@@ -8,7 +8,9 @@ from datetime import datetime
 import json
 import logging
 
-from app.db.redis_client import get_redis
+from app.db.redis_client import (
+    bump_frame_version, frame_get, frame_mget, frame_set, get_frame_version, get_redis,
+)
 from app.schemas.preprocessing import (
     MissingValueMethod, DuplicateMethod, OutlierMethod, OutlierAction,
     AggregationFrequency, AggregationMethod,
@@ -24,6 +26,7 @@ logger = logging.getLogger(__name__)
 # Redis key prefixes
 REDIS_PREPROCESSED_PREFIX = "preprocessed:"
 REDIS_PREPROCESSED_TTL = 3600 * 2  # 2 hours
+REDIS_ENTITIES_PREFIX = "dataset_entities:"
 
 
 class PreprocessingService:
@@ -40,34 +43,11 @@ class PreprocessingService:
     async def get_dataset_dataframe(self, dataset_id: str) -> Optional[pd.DataFrame]:
         """Retrieve dataset as DataFrame from Redis"""
         try:
-            redis = await get_redis()
-            if redis is None:
-                return None
-
-            # Try preprocessed data first
-            preprocessed_key = f"{REDIS_PREPROCESSED_PREFIX}{dataset_id}"
-            data = await redis.get(preprocessed_key)
-
-            if not data:
-                # Fall back to original dataset
-                original_key = f"dataset:{dataset_id}"
-                data = await redis.get(original_key)
-
-            if data:
-                if isinstance(data, bytes):
-                    data = data.decode('utf-8')
-                df_dict = json.loads(data)
-
-                # Handle both 'split' and 'dict' orientations
-                if isinstance(df_dict, dict) and 'columns' in df_dict and 'data' in df_dict:
-                    # Data is in 'split' orientation
-                    from io import StringIO
-                    return pd.read_json(StringIO(data), orient='split')
-                else:
-                    # Data is in 'dict' orientation (column names as keys)
-                    return pd.DataFrame(df_dict)
-
-            return None
+            # Try preprocessed data first, then fall back to original dataset
+            df = await frame_get(f"{REDIS_PREPROCESSED_PREFIX}{dataset_id}", dataset_id=dataset_id)
+            if df is None:
+                df = await frame_get(f"dataset:{dataset_id}", dataset_id=dataset_id)
+            return df
         except Exception as e:
             logger.error(f"Error retrieving dataset: {e}")
             return None
@@ -80,17 +60,13 @@ class PreprocessingService:
     ) -> bool:
         """Save preprocessed DataFrame to Redis"""
         try:
-            redis = await get_redis()
-            if redis is None:
-                return False
-
             key = f"{REDIS_PREPROCESSED_PREFIX}{dataset_id}"
             if entity_id:
                 key = f"{key}:{entity_id}"
 
-            # Convert DataFrame to JSON-serializable format
-            data = df.to_dict(orient='records')
-            await redis.set(key, json.dumps(data, default=str), ex=REDIS_PREPROCESSED_TTL)
+            if not await frame_set(key, df, expire=REDIS_PREPROCESSED_TTL):
+                return False
+            await bump_frame_version(dataset_id)
             return True
         except Exception as e:
             logger.error(f"Error saving preprocessed data: {e}")
@@ -105,50 +81,144 @@ class PreprocessingService:
         dataset_id: str,
         entity_column: Optional[str] = None
     ) -> Tuple[List[EntityInfo], Optional[str]]:
-        """Get list of entities in a dataset"""
+        """Get list of entities in a dataset.
+
+        The listing is computed in one groupby pass and cached in Redis
+        against the dataset's frame version, so it is rebuilt only after the
+        data changes.
+        """
+        # Read the version before the data: a concurrent write bumps it after
+        # our load, so the listing is stored under the old version and missed
+        version = await self._frame_version(dataset_id)
+        cached = await self._get_cached_entities(dataset_id, entity_column, version)
+        if cached is not None:
+            return cached
+
         df = await self.get_dataset_dataframe(dataset_id)
         if df is None:
             return [], None
 
         # Try to detect entity column if not provided
+        requested_column = entity_column
         if not entity_column:
             entity_column = self._detect_entity_column(df)
 
         if not entity_column or entity_column not in df.columns:
             # No entity column - treat entire dataset as single entity
-            return [EntityInfo(
+            entities, entity_column = [EntityInfo(
                 name="All Data",
                 row_count=len(df),
                 has_missing=df.isnull().any().any(),
                 missing_count=int(df.isnull().sum().sum())
             )], None
+        else:
+            entities = self._summarize_entities(df, entity_column)
+
+        await self._store_cached_entities(dataset_id, requested_column, entities, entity_column, version)
+        return entities, entity_column
+
+    def _summarize_entities(self, df: pd.DataFrame, entity_column: str) -> List[EntityInfo]:
+        """Row count, date range and missing count per entity in a single groupby pass."""
+        keys = df[entity_column]
+        summary = pd.DataFrame({
+            "row_count": keys.groupby(keys, sort=False, dropna=False).size(),
+            "missing_count": df.isnull().sum(axis=1).groupby(keys, sort=False, dropna=False).sum(),
+        })
+
+        date_col = self._detect_date_column(df)
+        if date_col:
+            dates = pd.to_datetime(df[date_col], errors='coerce')
+            grouped_dates = dates.groupby(keys, sort=False, dropna=False)
+            summary["start"] = grouped_dates.min()
+            summary["end"] = grouped_dates.max()
+        else:
+            summary["start"] = pd.NaT
+            summary["end"] = pd.NaT
 
         entities = []
-        for entity_name in df[entity_column].unique():
-            entity_df = df[df[entity_column] == entity_name]
-            date_col = self._detect_date_column(entity_df)
+        for name, row_count, missing_count, start, end in zip(
+            summary.index, summary["row_count"], summary["missing_count"],
+            summary["start"], summary["end"],
+        ):
             date_range = None
-            if date_col:
-                try:
-                    dates = pd.to_datetime(entity_df[date_col], errors='coerce')
-                    valid_dates = dates.dropna()
-                    if len(valid_dates) > 0:
-                        date_range = {
-                            "start": valid_dates.min().strftime("%Y-%m-%d"),
-                            "end": valid_dates.max().strftime("%Y-%m-%d")
-                        }
-                except Exception:
-                    pass
-
+            if pd.notna(start) and pd.notna(end):
+                date_range = {
+                    "start": start.strftime("%Y-%m-%d"),
+                    "end": end.strftime("%Y-%m-%d")
+                }
             entities.append(EntityInfo(
-                name=str(entity_name),
-                row_count=len(entity_df),
+                name=str(name),
+                row_count=int(row_count),
                 date_range=date_range,
-                has_missing=entity_df.isnull().any().any(),
-                missing_count=int(entity_df.isnull().sum().sum())
+                has_missing=bool(missing_count > 0),
+                missing_count=int(missing_count)
             ))
+        return entities
 
-        return entities, entity_column
+    def _entities_cache_key(self, dataset_id: str, entity_column: Optional[str]) -> str:
+        return f"{REDIS_ENTITIES_PREFIX}{dataset_id}:{entity_column or ''}"
+
+    async def _frame_version(self, dataset_id: str) -> Optional[str]:
+        try:
+            return await get_frame_version(dataset_id)
+        except Exception as e:
+            logger.debug(f"No frame version for {dataset_id}: {e}")
+            return None
+
+    async def _get_cached_entities(
+        self,
+        dataset_id: str,
+        entity_column: Optional[str],
+        version: Optional[str]
+    ) -> Optional[Tuple[List[EntityInfo], Optional[str]]]:
+        """Return the cached entity listing if it was built at `version`."""
+        if version is None:
+            return None
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return None
+            data = await redis.get(self._entities_cache_key(dataset_id, entity_column))
+            if not data:
+                return None
+            cached = json.loads(data)
+            if cached.get("version") != version:
+                return None
+            return (
+                [EntityInfo(**e) for e in cached["entities"]],
+                cached.get("entity_column"),
+            )
+        except Exception as e:
+            logger.debug(f"Entity listing cache miss for {dataset_id}: {e}")
+            return None
+
+    async def _store_cached_entities(
+        self,
+        dataset_id: str,
+        requested_column: Optional[str],
+        entities: List[EntityInfo],
+        entity_column: Optional[str],
+        version: Optional[str]
+    ) -> None:
+        """Cache a listing under the version read before its data was loaded."""
+        if version is None:
+            return
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return
+            payload = {
+                "version": version,
+                "entity_column": entity_column,
+                "entities": [e.model_dump() for e in entities],
+            }
+            await redis.set(
+                self._entities_cache_key(dataset_id, requested_column),
+                json.dumps(payload),
+                ex=REDIS_PREPROCESSED_TTL,
+            )
+        except Exception as e:
+            logger.error(f"Error caching entity listing: {e}")
 
     async def get_entity_data(
         self,
@@ -160,21 +230,11 @@ class PreprocessingService:
         # Check for per-entity preprocessed data first
         if entity_id and entity_id != "All Data":
             try:
-                redis = await get_redis()
-                if redis:
-                    entity_key = f"{REDIS_PREPROCESSED_PREFIX}{dataset_id}:{entity_id}"
-                    data = await redis.get(entity_key)
-                    if data:
-                        if isinstance(data, bytes):
-                            data = data.decode('utf-8')
-                        parsed = json.loads(data)
-                        if isinstance(parsed, list):
-                            return pd.DataFrame(parsed)
-                        elif isinstance(parsed, dict) and 'columns' in parsed:
-                            from io import StringIO
-                            return pd.read_json(StringIO(data if isinstance(data, str) else json.dumps(parsed)), orient='split')
-                        else:
-                            return pd.DataFrame(parsed)
+                entity_df = await frame_get(
+                    f"{REDIS_PREPROCESSED_PREFIX}{dataset_id}:{entity_id}", dataset_id=dataset_id
+                )
+                if entity_df is not None:
+                    return entity_df
             except Exception as e:
                 logger.debug(f"No per-entity preprocessed data for {entity_id}: {e}")
 
@@ -191,6 +251,27 @@ class PreprocessingService:
         # Compare as strings to handle int/str mismatch
         return df[df[entity_column].astype(str) == str(entity_id)].copy()
 
+    async def get_entity_overrides(
+        self,
+        dataset_id: str,
+        entity_ids: List[str]
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch per-entity preprocessed data for many entities in one round trip.
+
+        Returns only the entities that have their own preprocessed key; the
+        rest should be sliced from the dataset frame.
+        """
+        candidates = [e for e in entity_ids if e and e != "All Data"]
+        if not candidates:
+            return {}
+        keys = {f"{REDIS_PREPROCESSED_PREFIX}{dataset_id}:{e}": e for e in candidates}
+        try:
+            frames = await frame_mget(list(keys), dataset_id=dataset_id)
+        except Exception as e:
+            logger.debug(f"Could not fetch per-entity preprocessed data: {e}")
+            return {}
+        return {keys[key]: frame for key, frame in frames.items()}
+
     async def get_entity_stats(
         self,
         dataset_id: str,
@@ -1144,11 +1225,33 @@ class PreprocessingService:
                 key = f"{key}:{entity_id}"
 
             await redis.delete(key)
+            await bump_frame_version(dataset_id)
             return True
         except Exception as e:
             logger.error(f"Error resetting preprocessing: {e}")
             return False
 
+    async def invalidate_entities(self, dataset_id: str, entity_ids: List[str]) -> bool:
+        """Drop preprocessed data made stale by new rows of *entity_ids*.
+
+        Per-entity preprocessed series of other entities stay cached; the
+        whole-dataset preprocessed frame spans every entity and is dropped,
+        so reads fall back to the updated dataset.
+        """
+        try:
+            redis = await get_redis()
+            if redis is None:
+                return False
+
+            keys = [f"{REDIS_PREPROCESSED_PREFIX}{dataset_id}"]
+            keys += [f"{REDIS_PREPROCESSED_PREFIX}{dataset_id}:{e}" for e in entity_ids]
+            await redis.delete(*keys)
+            await bump_frame_version(dataset_id)
+            return True
+        except Exception as e:
+            logger.error(f"Error invalidating preprocessed entities: {e}")
+            return False
+
     async def get_preprocessed_data(
         self,
         dataset_id: str,
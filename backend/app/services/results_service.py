@@ -1,17 +1,23 @@
 """
 Results Service - Forecast result retrieval, pagination, CSV export, and report generation
+
+Predictions can be read a slice at a time (PredictionReader) so paginated
+reads and streamed CSV / NDJSON exports never materialise the whole series:
+finished results are mirrored into a Redis list (forecast_rows:{id}) read
+with LRANGE, and the PostgreSQL copy is sliced in SQL.
 """
 import csv
 import io
 import json
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator, Awaitable, Callable
 
-from sqlalchemy import select
+from sqlalchemy import JSON, column, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.redis_client import get_redis
+from app.services.prediction_store import PredictionStore
 from app.schemas.forecast import (
     ForecastResultResponse,
     MetricsResponse,
@@ -24,6 +30,92 @@ from app.schemas.forecast import (
 logger = logging.getLogger(__name__)
 
 REDIS_FORECAST_PREFIX = "forecast:"
+REDIS_RESULT_ROWS_PREFIX = "forecast_rows:"  # list of JSON prediction rows, for slice reads
+REDIS_RESULT_META_PREFIX = "forecast_meta:"  # result without its predictions
+REDIS_BATCH_PREFIX = "forecast_batch:"
+REDIS_BATCH_RESULTS_PREFIX = "forecast_batch_results:"
+
+# Prediction columns of CSV / NDJSON exports
+PREDICTION_COLUMNS = ("date", "value", "lower_bound", "upper_bound")
+
+# Rows fetched (and written to Redis) per round trip while streaming
+STREAM_CHUNK_ROWS = 1000
+
+# Rows list outlives the meta key a little, so a visible meta key always has its rows
+_ROWS_TTL_MARGIN_SEC = 60
+
+RowFetcher = Callable[[int, int], Awaitable[List[Dict[str, Any]]]]
+
+
+async def store_result_rows(redis, result: ForecastResultResponse, ttl: int) -> None:
+    """Mirror a result into its rows list + meta key for PredictionReader.
+
+    The meta key is written last: readers treat it as the marker that the
+    rows list is complete.
+    """
+    rows_key = f"{REDIS_RESULT_ROWS_PREFIX}{result.id}"
+    await redis.delete(rows_key)
+    rows = [json.dumps(p.model_dump(mode='json')) for p in result.predictions]
+    for start in range(0, len(rows), STREAM_CHUNK_ROWS):
+        await redis.rpush(rows_key, *rows[start:start + STREAM_CHUNK_ROWS])
+    if rows:
+        await redis.expire(rows_key, ttl + _ROWS_TTL_MARGIN_SEC)
+    meta = result.model_dump(mode='json', exclude={"predictions"})
+    await redis.set(f"{REDIS_RESULT_META_PREFIX}{result.id}", json.dumps(meta, default=str), ex=ttl)
+
+
+class PredictionReader:
+    """Slice access to one forecast's predictions without loading the whole series.
+
+    `result` carries everything but the predictions (its `predictions` list
+    is empty); `total` is the number of prediction rows.
+    """
+
+    def __init__(self, result: ForecastResultResponse, total: int, fetch: RowFetcher):
+        self.result = result
+        self.total = total
+        self._fetch = fetch
+
+    async def read(self, start: int, stop: int) -> List[PredictionResponse]:
+        """Predictions [start, stop) in date order."""
+        start, stop = max(0, start), min(stop, self.total)
+        if stop <= start:
+            return []
+        return [PredictionResponse(**row) for row in await self._fetch(start, stop)]
+
+    async def page(self, page: int, page_size: int) -> Tuple[List[PredictionResponse], int, int, int]:
+        """Same contract as ResultsService.paginate_predictions, reading only the page."""
+        total_pages = max(1, (self.total + page_size - 1) // page_size)
+        page = max(1, min(page, total_pages))
+        start = (page - 1) * page_size
+        return await self.read(start, start + page_size), self.total, total_pages, page
+
+    async def iter_chunks(self, chunk_rows: int = STREAM_CHUNK_ROWS) -> AsyncIterator[List[PredictionResponse]]:
+        for start in range(0, self.total, chunk_rows):
+            yield await self.read(start, start + chunk_rows)
+
+
+async def stream_csv(
+    chunks: AsyncIterator[List[Dict[str, Any]]],
+    columns: Tuple[str, ...] = PREDICTION_COLUMNS,
+) -> AsyncIterator[str]:
+    """Encode row chunks as CSV text, one piece per chunk (header first)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    async for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        for row in chunk:
+            writer.writerow([row.get(c) for c in columns])
+        yield buffer.getvalue()
+
+
+async def stream_ndjson(chunks: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[str]:
+    """Encode row chunks as newline-delimited JSON, one piece per chunk."""
+    async for chunk in chunks:
+        yield "".join(json.dumps(row, default=str) + "\n" for row in chunk)
 
 
 class ResultsService:
@@ -82,15 +174,9 @@ class ResultsService:
         self, db: AsyncSession, forecast_id: str
     ) -> Optional[ForecastResultResponse]:
         """Reconstruct a ForecastResultResponse from PostgreSQL records."""
-        from app.models import ForecastHistory, ForecastPrediction
+        from app.models import ForecastPrediction
 
-        # Load forecast history
-        history = await db.scalar(
-            select(ForecastHistory).where(
-                ForecastHistory.id == forecast_id,
-                ForecastHistory.tenant_id == self.tenant_id,
-            )
-        )
+        history = await self._get_history(db, forecast_id)
         if history is None:
             return None
 
@@ -105,41 +191,182 @@ class ResultsService:
 
         # Pick the first prediction to reconstruct the response
         # (single forecast = 1 prediction, batch = multiple)
-        predictions = []
-        metrics = None
-        model_summary = None
-        cv_results = None
-        entity_id = history.entity_id or "unknown"
-
-        if db_predictions:
-            pred = db_predictions[0]
-            entity_id = pred.entity_id
-            predictions = [
-                PredictionResponse(**p)
-                for p in (pred.predicted_values or [])
-            ]
-            if pred.metrics:
-                metrics = MetricsResponse(**pred.metrics)
-            if pred.model_summary:
-                model_summary = ModelSummaryResponse(**pred.model_summary)
-            if pred.cv_results:
-                cv_results = CrossValidationResultResponse(**pred.cv_results)
+        pred = db_predictions[0] if db_predictions else None
+        result = self._build_db_result(history, pred)
+        if pred is not None:
+            rows = pred.predicted_values
+            if rows is None:
+                rows = await PredictionStore(self.tenant_id).read_series(db, pred.id)
+            result.predictions = [PredictionResponse(**p) for p in rows]
+        return result
+
+    async def _get_history(self, db: AsyncSession, forecast_id: str):
+        from app.models import ForecastHistory
+
+        return await db.scalar(
+            select(ForecastHistory).where(
+                ForecastHistory.id == forecast_id,
+                ForecastHistory.tenant_id == self.tenant_id,
+            )
+        )
 
+    @staticmethod
+    def _build_db_result(history, pred) -> ForecastResultResponse:
+        """Result for a ForecastHistory row and its (optional) prediction row, without predictions."""
         return ForecastResultResponse(
             id=history.id,
             dataset_id=history.dataset_id,
-            entity_id=entity_id,
+            entity_id=pred.entity_id if pred is not None else (history.entity_id or "unknown"),
             method=history.method.value if history.method else "arima",
             status=ForecastStatus(history.status.value) if history.status else ForecastStatus.COMPLETED,
             progress=100 if history.status and history.status.value == "completed" else 0,
-            predictions=predictions,
-            metrics=metrics,
-            model_summary=model_summary,
-            cv_results=cv_results,
+            metrics=MetricsResponse(**pred.metrics) if pred is not None and pred.metrics else None,
+            model_summary=(
+                ModelSummaryResponse(**pred.model_summary)
+                if pred is not None and pred.model_summary else None
+            ),
+            cv_results=(
+                CrossValidationResultResponse(**pred.cv_results)
+                if pred is not None and pred.cv_results else None
+            ),
             created_at=history.created_at,
             completed_at=history.completed_at,
         )
 
+    # ============================================
+    # Slice Reads
+    # ============================================
+
+    async def open_predictions(
+        self, forecast_id: str, db: Optional[AsyncSession] = None
+    ) -> Optional[PredictionReader]:
+        """
+        Open a forecast's predictions for slice reads.
+
+        Same tiers as get_result — the Redis rows list first, then the
+        PostgreSQL copy (sliced in SQL) — falling back to a full result
+        still cached in the legacy single-key form. Returns None when no
+        store has the result.
+        """
+        try:
+            redis = await get_redis()
+            if redis is not None:
+                meta = await redis.get(f"{REDIS_RESULT_META_PREFIX}{forecast_id}")
+                if meta is not None:
+                    rows_key = f"{REDIS_RESULT_ROWS_PREFIX}{forecast_id}"
+
+                    async def _fetch_redis(start: int, stop: int) -> List[Dict[str, Any]]:
+                        return [json.loads(row) for row in await redis.lrange(rows_key, start, stop - 1)]
+
+                    return PredictionReader(
+                        ForecastResultResponse(**json.loads(meta)),
+                        await redis.llen(rows_key),
+                        _fetch_redis,
+                    )
+        except Exception as e:
+            logger.error(f"Redis slice read error for {forecast_id}: {e}")
+
+        if db is not None:
+            try:
+                reader = await self._open_predictions_from_db(db, forecast_id)
+                if reader is not None:
+                    return reader
+            except Exception as e:
+                logger.error(f"DB slice read error for {forecast_id}: {e}")
+
+        result = await self.get_result(forecast_id)
+        if result is None:
+            return None
+        predictions = result.predictions
+        result = result.model_copy(update={"predictions": []})
+
+        async def _fetch_memory(start: int, stop: int) -> List[Dict[str, Any]]:
+            return [p.model_dump() for p in predictions[start:stop]]
+
+        return PredictionReader(result, len(predictions), _fetch_memory)
+
+    async def _open_predictions_from_db(
+        self, db: AsyncSession, forecast_id: str
+    ) -> Optional[PredictionReader]:
+        """PredictionReader over the stored series, sliced by PostgreSQL.
+
+        Reads the forecast_prediction_points rows (indexed by prediction and
+        date); rows written before the points table keep their series in the
+        predicted_values JSON column, which is sliced with json_array_elements.
+        """
+        from sqlalchemy.orm import defer
+        from app.models import ForecastPrediction
+
+        history = await self._get_history(db, forecast_id)
+        if history is None:
+            return None
+
+        row = (await db.execute(
+            select(ForecastPrediction, func.json_array_length(ForecastPrediction.predicted_values))
+            .options(defer(ForecastPrediction.predicted_values))
+            .where(
+                ForecastPrediction.forecast_history_id == forecast_id,
+                ForecastPrediction.tenant_id == self.tenant_id,
+            )
+            .limit(1)
+        )).first()
+        pred, total = (row[0], row[1]) if row is not None else (None, 0)
+        store = PredictionStore(self.tenant_id)
+
+        if pred is not None and total is None:
+            async def _fetch_points(start: int, stop: int) -> List[Dict[str, Any]]:
+                return await store.read_series(db, pred.id, offset=start, limit=stop - start)
+
+            total = await store.count_points(db, pred.id)
+            return PredictionReader(self._build_db_result(history, pred), total, _fetch_points)
+
+        async def _fetch_db(start: int, stop: int) -> List[Dict[str, Any]]:
+            elements = (
+                func.json_array_elements(ForecastPrediction.predicted_values)
+                .table_valued(column("value", JSON), with_ordinality="ordinality")
+                .render_derived()
+                .lateral()
+            )
+            values = await db.scalars(
+                select(elements.c.value)
+                .select_from(ForecastPrediction)
+                .join(elements, true())
+                .where(ForecastPrediction.id == pred.id)
+                .order_by(elements.c.ordinality)
+                .offset(start)
+                .limit(stop - start)
+            )
+            return [json.loads(v) if isinstance(v, str) else v for v in values]
+
+        return PredictionReader(self._build_db_result(history, pred), total, _fetch_db)
+
+    async def batch_exists(self, batch_id: str) -> bool:
+        """Whether a batch's status is still in Redis (without loading its results)."""
+        redis = await get_redis()
+        if redis is None:
+            return False
+        return bool(await redis.exists(f"{REDIS_BATCH_PREFIX}{batch_id}"))
+
+    async def iter_batch_rows(self, batch_id: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Prediction rows of every entity of a batch (entity_id first), one entity per chunk.
+
+        Entities are read from the batch's per-entity results hash one at a
+        time, so only a single entity's result is held in memory.
+        """
+        redis = await get_redis()
+        if redis is None:
+            return
+        key = f"{REDIS_BATCH_RESULTS_PREFIX}{batch_id}"
+        for field in sorted(await redis.hkeys(key), key=int):
+            raw = await redis.hget(key, field)
+            if raw is None:
+                continue
+            result = ForecastResultResponse(**json.loads(raw))
+            yield [
+                {"entity_id": result.entity_id, **p.model_dump()}
+                for p in result.predictions
+            ]
+
     # ============================================
     # Paginated Predictions
     # ============================================
@@ -195,11 +422,11 @@ class ResultsService:
 
         return output.getvalue()
 
-    def get_csv_filename(self, result: ForecastResultResponse) -> str:
-        """Build a descriptive filename for the CSV download."""
+    def get_csv_filename(self, result: ForecastResultResponse, extension: str = "csv") -> str:
+        """Build a descriptive filename for the CSV (or other `extension`) download."""
         ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         entity = result.entity_id.replace(" ", "_")
-        return f"forecast_{entity}_{result.method.value}_{ts}.csv"
+        return f"forecast_{entity}_{result.method.value}_{ts}.{extension}"
 
     # ============================================
     # Export Report
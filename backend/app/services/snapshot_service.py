@@ -1,31 +1,95 @@
 """
 Snapshot Service - DataFrame snapshot management.
 
-Compresses a pandas DataFrame to parquet+gzip, uploads it to S3 (or the
+Writes a pandas DataFrame to parquet (zstd by default, row groups of
+SNAPSHOT_ROW_GROUP_ROWS with column statistics), uploads it to S3 (or the
 configured storage backend), and records a DataSnapshot row in PostgreSQL.
 
 Key guarantees:
-- SHA-256 deduplication: identical DataFrames reuse the same snapshot.
+- Content-hash deduplication: identical DataFrames (in any row or column
+  order) reuse the same snapshot.
 - Status transitions: PENDING → UPLOADING → READY (FAILED on error).
 - Async-safe: all pandas/pyarrow operations are offloaded via asyncio.to_thread().
+- Selective reads: get_snapshot_data() projects columns and pushes entity /
+  date predicates down to the parquet row groups, so only the row groups
+  that can match are fetched — by byte range when the backend supports it.
 """
 import asyncio
+import functools
 import hashlib
 import io
 import logging
+import json
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Iterable, Optional, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models import DataSnapshot, SnapshotStatus
 from app.services.storage import get_storage_backend
 
 logger = logging.getLogger(__name__)
 
+# data_hash algorithms (DataSnapshot.hash_version):
+#   1 — SHA-256 of the row- and column-sorted frame as JSON records (legacy)
+#   2 — commutative sum of per-row hashes, see fingerprint_frames()
+LEGACY_HASH_VERSION = 1
+DATA_HASH_VERSION = 2
+
+# Rows hashed per slice; bounds the temporary uint64 arrays hash_pandas_object creates
+HASH_CHUNK_ROWS = 1_000_000
+
+_MIX_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+# Parquet codecs a snapshot may be written with (DataSnapshot.compression)
+SNAPSHOT_COMPRESSIONS = ("zstd", "lz4", "snappy", "gzip", "none")
+
+
+def fingerprint_frames(chunks: Iterable[pd.DataFrame]) -> str:
+    """Order-insensitive SHA-256 fingerprint of the rows of one or more frames.
+
+    Each row is hashed with `pd.util.hash_pandas_object` (columns in name
+    order, index ignored) and the row hashes are folded into two wrapping
+    64-bit sums — one of the raw hashes, one of a remixed copy. Addition is
+    commutative, so row order does not matter and chunks can be fed in as
+    they are produced (e.g. one per Arrow record batch) without holding the
+    whole frame; the result is the same however the rows are split. The
+    column names, dtypes and row count are part of the digest.
+    """
+    schema = None
+    rows = 0
+    total = np.uint64(0)
+    mixed_total = np.uint64(0)
+    with np.errstate(over="ignore"):
+        for chunk in chunks:
+            columns = sorted(chunk.columns, key=str)
+            chunk_schema = [[str(c), str(chunk[c].dtype)] for c in columns]
+            if schema is None:
+                schema = chunk_schema
+            elif chunk_schema != schema:
+                raise ValueError("All chunks must have the same columns and dtypes")
+            if len(chunk) == 0:
+                continue
+
+            hashes = pd.util.hash_pandas_object(chunk[columns], index=False).to_numpy()
+            mixed = (hashes ^ (hashes >> np.uint64(31))) * _MIX_MULTIPLIER
+            total += hashes.sum(dtype=np.uint64)
+            mixed_total += mixed.sum(dtype=np.uint64)
+            rows += len(chunk)
+
+    digest = hashlib.sha256(f"rowhash-v{DATA_HASH_VERSION}".encode("utf-8"))
+    digest.update(json.dumps(schema or []).encode("utf-8"))
+    digest.update(np.array([rows, total, mixed_total], dtype=np.uint64).tobytes())
+    return digest.hexdigest()
+
 
 class SnapshotService:
     """Manages creation and retrieval of DataFrame snapshots backed by S3."""
@@ -45,17 +109,21 @@ class SnapshotService:
         dataset_id: Optional[str] = None,
         connector_data_source_id: Optional[str] = None,
         retention_days: Optional[int] = None,
+        sort_by: Optional[Sequence[str]] = None,
     ) -> DataSnapshot:
         """
         Snapshot a DataFrame to storage and persist the metadata in DB.
 
         Steps:
-        1. Compute SHA-256 hash of the (sorted) DataFrame.
+        1. Compute the order-insensitive content hash of the DataFrame.
         2. Check for an existing READY snapshot with the same tenant + hash.
-           If found, return it immediately (deduplication).
+           If found, return it immediately (deduplication). With
+           SNAPSHOT_LEGACY_HASH_LOOKUP, snapshots still carrying a version-1
+           hash are matched too and upgraded to the current hash.
         3. Create a DataSnapshot record in PENDING state.
-        4. Compress DataFrame → parquet + gzip in a thread.
-        5. Upload to storage (key: ``{tenant_id}/snapshots/{hash}.parquet.gz``).
+        4. Write the DataFrame to parquet in a thread, compressed with
+           SNAPSHOT_COMPRESSION in row groups of SNAPSHOT_ROW_GROUP_ROWS.
+        5. Upload to storage (key: ``{tenant_id}/snapshots/{hash}.parquet``).
         6. Update status → READY, store row/column counts and file size.
         7. Return the DataSnapshot ORM object.
 
@@ -70,12 +138,26 @@ class SnapshotService:
             retention_days: If provided, the snapshot will expire after this
                 many days and will be deleted by the daily retention task.
                 Pass ``None`` (default) for a snapshot that never expires.
+            sort_by: Columns to cluster rows by before writing, typically
+                ``[entity_column, date_column]``. Each row group then covers
+                a narrow entity / date range, so its min/max statistics let
+                filtered reads skip it. The content hash is order-insensitive,
+                so sorting does not affect deduplication.
         """
+        compression = settings.SNAPSHOT_COMPRESSION
+        if compression not in SNAPSHOT_COMPRESSIONS:
+            raise ValueError(
+                f"Unknown snapshot compression '{compression}' "
+                f"(expected one of {', '.join(SNAPSHOT_COMPRESSIONS)})"
+            )
+
         data_hash = await asyncio.to_thread(self.compute_data_hash, df)
-        s3_key = f"{self.tenant_id}/snapshots/{data_hash}.parquet.gz"
+        s3_key = f"{self.tenant_id}/snapshots/{data_hash}.parquet"
 
         # --- Deduplication check ---
         existing = await self._find_existing_snapshot(db, data_hash)
+        if existing is None and settings.SNAPSHOT_LEGACY_HASH_LOOKUP:
+            existing = await self._find_legacy_snapshot(db, df, data_hash)
         if existing is not None:
             logger.info(
                 "Snapshot dedup hit — reusing snapshot id=%s hash=%s",
@@ -95,9 +177,10 @@ class SnapshotService:
             connector_data_source_id=connector_data_source_id,
             s3_key=s3_key,
             data_hash=data_hash,
+            hash_version=DATA_HASH_VERSION,
             row_count=len(df),
             column_count=len(df.columns),
-            compression="gzip",
+            compression=compression,
             format="parquet",
             status=SnapshotStatus.PENDING,
             created_by=self.user_id,
@@ -111,7 +194,9 @@ class SnapshotService:
             snapshot.status = SnapshotStatus.UPLOADING
             await db.flush()
 
-            parquet_bytes = await asyncio.to_thread(self._compress_to_parquet_gz, df)
+            parquet_bytes = await asyncio.to_thread(
+                self._to_parquet, df, compression, settings.SNAPSHOT_ROW_GROUP_ROWS, sort_by
+            )
 
             # --- Upload ---
             storage = get_storage_backend()
@@ -141,11 +226,66 @@ class SnapshotService:
 
         return snapshot
 
-    async def get_snapshot_data(self, snapshot: DataSnapshot) -> pd.DataFrame:
-        """Download a snapshot from storage and return it as a DataFrame."""
+    async def get_snapshot_data(
+        self,
+        snapshot: DataSnapshot,
+        columns: Optional[Sequence[str]] = None,
+        entity_column: Optional[str] = None,
+        entity_ids: Optional[Sequence[Any]] = None,
+        date_column: Optional[str] = None,
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None,
+    ) -> pd.DataFrame:
+        """
+        Read a snapshot from storage as a DataFrame, optionally a slice of it.
+
+        Filters are evaluated against the row-group statistics first: row
+        groups whose entity / date range cannot match are never read, and
+        only the requested columns are decoded. When the storage backend
+        offers a seekable reader (see StorageBackend.open_reader) only the
+        footer and the surviving row groups are fetched; otherwise the
+        object is downloaded whole and filtered in memory.
+
+        Args:
+            snapshot: READY snapshot to read.
+            columns: Columns to return (default: all). The stored index is
+                always restored.
+            entity_column: Column holding the entity id; required with entity_ids.
+            entity_ids: Keep only rows whose entity is one of these.
+            date_column: Column holding the date; required with start_date / end_date.
+            start_date: Keep rows dated on or after this (inclusive).
+            end_date: Keep rows dated on or before this (inclusive).
+
+        Raises:
+            ValueError: If a filter names a column the snapshot does not have.
+        """
+        if entity_ids is not None and not entity_column:
+            raise ValueError("entity_column is required when filtering by entity_ids")
+        if (start_date is not None or end_date is not None) and not date_column:
+            raise ValueError("date_column is required when filtering by date")
+
         storage = get_storage_backend()
-        raw_bytes = await storage.download(snapshot.s3_key)
-        df = await asyncio.to_thread(self._decompress_parquet_gz, raw_bytes)
+        read = functools.partial(
+            self._read_parquet,
+            columns=columns,
+            entity_column=entity_column,
+            entity_ids=entity_ids,
+            date_column=date_column,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        def _read_ranges() -> Optional[pd.DataFrame]:
+            reader = storage.open_reader(snapshot.s3_key)
+            if reader is None:
+                return None
+            with reader:
+                return read(reader)
+
+        df = await asyncio.to_thread(_read_ranges)
+        if df is None:
+            raw_bytes = await storage.download(snapshot.s3_key)
+            df = await asyncio.to_thread(read, io.BytesIO(raw_bytes))
         return df
 
     # ------------------------------------------------------------------
@@ -155,11 +295,23 @@ class SnapshotService:
     @staticmethod
     def compute_data_hash(df: pd.DataFrame) -> str:
         """
-        Compute a stable SHA-256 hash of a DataFrame for deduplication.
+        Compute a stable fingerprint of a DataFrame for deduplication.
+
+        The same logical data always produces the same hash regardless of
+        column or row ordering (see fingerprint_frames); rows are hashed in
+        slices of HASH_CHUNK_ROWS, nothing is sorted or serialised.
+        """
+        return fingerprint_frames(
+            df.iloc[start:start + HASH_CHUNK_ROWS]
+            for start in range(0, max(len(df), 1), HASH_CHUNK_ROWS)
+        )
 
-        The DataFrame is normalised (columns and rows sorted) before hashing
-        so that the same logical data always produces the same hash regardless
-        of column or row ordering.
+    @staticmethod
+    def compute_legacy_data_hash(df: pd.DataFrame) -> str:
+        """
+        Hash version 1: SHA-256 of the row- and column-sorted frame as JSON.
+
+        Only used to match snapshots created before hash version 2.
         """
         # Sort for stability: columns first, then rows
         normalised = df.reindex(sorted(df.columns), axis=1)
@@ -200,15 +352,175 @@ class SnapshotService:
         )
         return result.scalar_one_or_none()
 
+    async def _find_legacy_snapshot(
+        self,
+        db: AsyncSession,
+        df: pd.DataFrame,
+        data_hash: str,
+    ) -> Optional[DataSnapshot]:
+        """Match a READY snapshot hashed with the legacy algorithm, upgrading its hash.
+
+        The legacy hash (a full sort + JSON dump) is only computed while the
+        tenant still has version-1 snapshots; a matched snapshot gets the
+        current hash so the next lookup for the same data is a direct hit.
+        Its storage key is left as is.
+        """
+        has_legacy = await db.execute(
+            select(DataSnapshot.id).where(
+                DataSnapshot.tenant_id == self.tenant_id,
+                DataSnapshot.hash_version == LEGACY_HASH_VERSION,
+                DataSnapshot.status == SnapshotStatus.READY,
+            ).limit(1)
+        )
+        if has_legacy.scalar_one_or_none() is None:
+            return None
+
+        legacy_hash = await asyncio.to_thread(self.compute_legacy_data_hash, df)
+        result = await db.execute(
+            select(DataSnapshot).where(
+                DataSnapshot.tenant_id == self.tenant_id,
+                DataSnapshot.data_hash == legacy_hash,
+                DataSnapshot.hash_version == LEGACY_HASH_VERSION,
+                DataSnapshot.status == SnapshotStatus.READY,
+            )
+        )
+        snapshot = result.scalars().first()
+        if snapshot is not None:
+            snapshot.data_hash = data_hash
+            snapshot.hash_version = DATA_HASH_VERSION
+            await db.flush()
+            logger.info("Upgraded legacy snapshot hash: id=%s", snapshot.id)
+        return snapshot
+
     @staticmethod
-    def _compress_to_parquet_gz(df: pd.DataFrame) -> bytes:
-        """Serialise a DataFrame to parquet with gzip compression; return raw bytes."""
+    def _to_parquet(
+        df: pd.DataFrame,
+        compression: str,
+        row_group_rows: int,
+        sort_by: Optional[Sequence[str]] = None,
+    ) -> bytes:
+        """Serialise a DataFrame to parquet in row groups with statistics; return raw bytes."""
+        if sort_by:
+            df = df.sort_values(list(sort_by), kind="stable")
+        table = pa.Table.from_pandas(df, preserve_index=True)
         buffer = io.BytesIO()
-        df.to_parquet(buffer, engine="pyarrow", compression="gzip", index=True)
+        pq.write_table(
+            table,
+            buffer,
+            compression=compression,
+            row_group_size=max(int(row_group_rows), 1),
+            write_statistics=True,
+        )
         return buffer.getvalue()
 
     @staticmethod
-    def _decompress_parquet_gz(raw_bytes: bytes) -> pd.DataFrame:
-        """Read a gzip-compressed parquet byte stream back into a DataFrame."""
-        buffer = io.BytesIO(raw_bytes)
-        return pd.read_parquet(buffer, engine="pyarrow")
+    def _read_parquet(
+        source,
+        columns: Optional[Sequence[str]] = None,
+        entity_column: Optional[str] = None,
+        entity_ids: Optional[Sequence[Any]] = None,
+        date_column: Optional[str] = None,
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None,
+    ) -> pd.DataFrame:
+        """Read a parquet file (path or seekable file object), pruning row groups by the filters.
+
+        Row groups are selected from the footer's min/max statistics and only
+        those (and only the needed columns) are read; the surviving rows are
+        then filtered exactly. Snapshots written with any codec — including
+        the older ``.parquet.gz`` ones, which are plain parquet with gzip
+        pages — are read the same way.
+        """
+        parquet = pq.ParquetFile(source)
+        schema = parquet.schema_arrow
+
+        # (column, allowed values or None, lower bound or None, upper bound or None)
+        filters = []
+        if entity_ids is not None:
+            _require_field(schema, entity_column)
+            allowed = pa.array(list(entity_ids), type=schema.field(entity_column).type)
+            filters.append((entity_column, allowed, None, None))
+        if start_date is not None or end_date is not None:
+            _require_field(schema, date_column)
+            field = schema.field(date_column)
+            filters.append((
+                date_column,
+                None,
+                _scalar_for(field, start_date) if start_date is not None else None,
+                _scalar_for(field, end_date) if end_date is not None else None,
+            ))
+
+        metadata = parquet.metadata
+        row_groups = [
+            i for i in range(metadata.num_row_groups)
+            if all(_row_group_may_match(metadata.row_group(i), *f) for f in filters)
+        ]
+
+        read_columns = None
+        if columns is not None:
+            index_columns = [
+                c for c in (schema.pandas_metadata or {}).get("index_columns", [])
+                if isinstance(c, str)
+            ]
+            filter_columns = [f[0] for f in filters]
+            read_columns = list(dict.fromkeys([*columns, *index_columns, *filter_columns]))
+
+        table = parquet.read_row_groups(row_groups, columns=read_columns, use_pandas_metadata=True)
+        if filters:
+            mask = None
+            for name, allowed, lower, upper in filters:
+                column = table.column(name)
+                for condition in (
+                    pc.is_in(column, value_set=allowed) if allowed is not None else None,
+                    pc.greater_equal(column, lower) if lower is not None else None,
+                    pc.less_equal(column, upper) if upper is not None else None,
+                ):
+                    if condition is not None:
+                        mask = condition if mask is None else pc.and_(mask, condition)
+            table = table.filter(mask)
+        if read_columns is not None:
+            extra = [c for c in filter_columns if c not in columns and c not in index_columns]
+            table = table.drop_columns(extra)
+        return table.to_pandas()
+
+
+def _row_group_may_match(row_group, name: str, allowed, lower, upper) -> bool:
+    """False only when the row group's min/max statistics rule out every row."""
+    for j in range(row_group.num_columns):
+        chunk = row_group.column(j)
+        if chunk.path_in_schema == name:
+            break
+    else:
+        return True
+    stats = chunk.statistics
+    if stats is None or not stats.has_min_max:
+        return True
+    low, high = stats.min, stats.max
+    if lower is not None and high < lower.as_py():
+        return False
+    if upper is not None and low > upper.as_py():
+        return False
+    if allowed is not None:
+        return any(v is not None and low <= v <= high for v in allowed.to_pylist())
+    return True
+
+
+def _require_field(schema: pa.Schema, name: Optional[str]) -> None:
+    if not name or schema.get_field_index(name) < 0:
+        raise ValueError(f"Snapshot has no column '{name}'")
+
+
+def _scalar_for(field: pa.Field, value: Any) -> pa.Scalar:
+    """Coerce a filter bound (str, date, Timestamp...) to the column's Arrow type."""
+    if pa.types.is_timestamp(field.type):
+        ts = pd.Timestamp(value)
+        if field.type.tz is not None and ts.tzinfo is None:
+            ts = ts.tz_localize(field.type.tz)
+        elif field.type.tz is None and ts.tzinfo is not None:
+            ts = ts.tz_convert(None)
+        return pa.scalar(ts, type=field.type)
+    if pa.types.is_date(field.type):
+        return pa.scalar(pd.Timestamp(value).date(), type=field.type)
+    if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+        return pa.scalar(str(value), type=field.type)
+    return pa.scalar(value, type=field.type)
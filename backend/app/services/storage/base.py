@@ -6,13 +6,14 @@ StorageBackend and implement every abstract method.
 
 Expected key structure:
     {tenant_id}/working/{dataset_id}.parquet
-    {tenant_id}/snapshots/{sha256hash}.parquet.gz
+    {tenant_id}/snapshots/{hash}.parquet      (pre-zstd snapshots: .parquet.gz)
     {tenant_id}/exports/{export_id}.csv
+    {tenant_id}/models/{forecast_history_id}.json.gz
 """
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import BinaryIO, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -109,3 +110,26 @@ class StorageBackend(ABC):
             Sorted list of matching keys.
         """
         ...
+
+    # ------------------------------------------------------------------
+    # Partial reads
+    # ------------------------------------------------------------------
+
+    def open_reader(self, key: str) -> Optional[BinaryIO]:
+        """Open a blocking, seekable reader for partial reads of an object.
+
+        Lets callers such as the parquet reader fetch only the byte ranges
+        they need (footer, selected row groups) instead of the whole object.
+        Blocking — call it, and read from the result, in a worker thread.
+
+        Args:
+            key: Object key to open.
+
+        Returns:
+            A binary file object (close it when done), or None if the
+            backend cannot read byte ranges; callers then use download().
+
+        Raises:
+            FileNotFoundError: If the key does not exist.
+        """
+        return None
@@ -12,7 +12,7 @@ import asyncio
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import aiofiles
 
@@ -144,3 +144,10 @@ class LocalBackend(StorageBackend):
         result = await asyncio.to_thread(_walk)
         logger.debug("LocalBackend list_keys — prefix=%s found=%d", prefix, len(result))
         return result
+
+    def open_reader(self, key: str) -> Optional[BinaryIO]:
+        """Open the file at *key* for seekable reads (blocking)."""
+        path = self._full_path(key)
+        if not path.is_file():
+            raise FileNotFoundError(f"Local storage key not found: '{key}' (path={path})")
+        return open(path, "rb")
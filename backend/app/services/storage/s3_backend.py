@@ -7,16 +7,35 @@ CranL endpoint format:  https://storage-{bucket-name}.cranl.net
 """
 
 import asyncio
+import io
 import logging
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import boto3
 import botocore.exceptions
 
+from app.services.blob_reader import BlobRangeReader, S3Object
+
 from .base import StorageBackend
 
 logger = logging.getLogger(__name__)
 
+# Reads through an S3 reader are buffered to this size, so the many small
+# reads of a parquet footer become one ranged GET
+_RANGE_READ_BUFFER_BYTES = 1024 * 1024
+
+
+class _BackendS3Object(S3Object):
+    """S3Object whose failed ranged reads raise like the backend's other calls."""
+
+    def read_range(self, start: int, end: int) -> bytes:
+        try:
+            return super().read_range(start, end)
+        except botocore.exceptions.ClientError as exc:
+            code = exc.response["Error"]["Code"]
+            logger.error("S3 ranged read failed — key=%s code=%s", self.name, code)
+            raise RuntimeError(f"S3 ranged read failed for key '{self.name}': {code}") from exc
+
 
 class S3Backend(StorageBackend):
     """Storage backend backed by an S3-compatible object store."""
@@ -166,6 +185,19 @@ class S3Backend(StorageBackend):
             logger.error("S3 list_keys failed — prefix=%s code=%s", prefix, code)
             raise RuntimeError(f"S3 list_keys failed for prefix '{prefix}': {code}") from exc
 
+    def open_reader(self, key: str) -> Optional[BinaryIO]:
+        """Seekable reader that fetches byte ranges of the object on demand (blocking)."""
+        try:
+            size = self._client.head_object(Bucket=self._bucket, Key=key)["ContentLength"]
+        except botocore.exceptions.ClientError as exc:
+            code = exc.response["Error"]["Code"]
+            if code in ("404", "NoSuchKey"):
+                raise FileNotFoundError(f"S3 key not found: '{key}'") from exc
+            logger.error("S3 open_reader failed — key=%s code=%s", key, code)
+            raise RuntimeError(f"S3 open_reader failed for key '{key}': {code}") from exc
+        raw = BlobRangeReader(_BackendS3Object(self._client, self._bucket, key), size=size)
+        return io.BufferedReader(raw, buffer_size=_RANGE_READ_BUFFER_BYTES)
+
     # ------------------------------------------------------------------
     # Async interface (StorageBackend contract)
     # ------------------------------------------------------------------
@@ -0,0 +1,153 @@
+# ============================================
+# Streaming upload ingestion
+# ============================================
+"""
+Helpers that keep dataset uploads off the heap until they are parsed:
+
+- `spool_upload` copies the request body to a temp file in chunks and stops
+  as soon as the size limit is crossed.
+- `sniff_encoding` decides the CSV encoding from a prefix of the file rather
+  than re-reading the whole payload once per candidate encoding.
+- `read_header` returns the column names without reading the body, so
+  required-column validation fails fast.
+- `iter_csv_chunks` parses the file in row chunks and reports how far
+  through the file it is; `mixed_type_columns` finds the columns whose
+  per-chunk type inference disagrees, to be re-read as text like a single
+  `read_csv` would.
+
+Peak memory of an upload is then about twice the parsed DataFrame (the
+chunks and their concatenation), instead of the raw bytes, a BytesIO copy
+and a decoded copy per attempt.
+"""
+
+import codecs
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tried in order; latin-1 decodes any byte sequence so it is the last resort
+CSV_ENCODINGS = ["utf-8-sig", "utf-8", "windows-1256", "iso-8859-6", "latin-1", "cp1252"]
+
+SPOOL_CHUNK_BYTES = 1024 * 1024
+SNIFF_BYTES = 256 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Raised while spooling once the upload exceeds the allowed size."""
+
+
+@dataclass
+class SpooledUpload:
+    path: str
+    size: int
+
+    def cleanup(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+async def spool_upload(upload, max_bytes: int, suffix: str = "") -> SpooledUpload:
+    """Copy an UploadFile to a temp file under UPLOAD_DIR, chunk by chunk.
+
+    Raises UploadTooLargeError (and removes the partial file) as soon as more
+    than `max_bytes` have been received.
+    """
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="upload-", suffix=suffix, dir=settings.UPLOAD_DIR)
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await upload.read(SPOOL_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds {max_bytes} bytes")
+                out.write(chunk)
+    except BaseException:
+        SpooledUpload(path, size).cleanup()
+        raise
+    return SpooledUpload(path, size)
+
+
+def sniff_encoding(path: str, sample_bytes: int = SNIFF_BYTES) -> str:
+    """Pick the first candidate encoding that decodes the file's prefix.
+
+    An incremental decoder is used so a multi-byte character cut at the end
+    of the sample does not count as an error.
+    """
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    for encoding in CSV_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("Could not decode CSV file. Supported encodings: UTF-8, Arabic (Windows-1256), Latin-1.")
+
+
+def fallback_encodings(encoding: str) -> List[str]:
+    """`encoding` followed by the candidates after it, for a file that stops
+    decoding past the sniffed prefix."""
+    if encoding not in CSV_ENCODINGS:
+        return [encoding]
+    return CSV_ENCODINGS[CSV_ENCODINGS.index(encoding):]
+
+
+def read_header(path: str, file_type: str, encoding: Optional[str] = None) -> List[str]:
+    """Column names of a CSV/Excel file, read without parsing the body."""
+    if file_type == "csv":
+        header = pd.read_csv(path, encoding=encoding, nrows=0)
+    elif file_type in ["xlsx", "xls"]:
+        header = pd.read_excel(path, nrows=0)
+    else:
+        raise ValueError(f"Unsupported file type: {file_type}")
+    return [str(c).strip() for c in header.columns]
+
+
+def iter_csv_chunks(
+    path: str,
+    encoding: str,
+    chunk_rows: int,
+    dtype: Optional[Dict[str, type]] = None,
+) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """Yield (chunk, bytes_consumed) pairs while parsing a CSV in row chunks."""
+    with open(path, "rb") as f:
+        reader = pd.read_csv(f, encoding=encoding, chunksize=chunk_rows, dtype=dtype)
+        for chunk in reader:
+            # The parser reads ahead in blocks, so this is an upper bound
+            yield chunk, f.tell()
+
+
+def mixed_type_columns(chunks: Sequence[pd.DataFrame]) -> List[str]:
+    """Columns inferred as different kinds of data in different chunks.
+
+    Numeric kinds combine under concat the way a single read infers them
+    (int + float is float), and an all-missing chunk says nothing about its
+    column. Anything else, e.g. a code column numeric in early chunks and
+    alphanumeric later, would concat into mixed int/str objects where a
+    single read gives strings.
+    """
+    kinds: Dict[str, set] = {}
+    for chunk in chunks:
+        for column in chunk.columns:
+            values = chunk[column]
+            if values.isna().all():
+                continue
+            kinds.setdefault(column, set()).add(values.dtype.kind)
+    return [
+        column for column, seen in kinds.items()
+        if len(seen) > 1 and not seen <= {"i", "u", "f"}
+    ]
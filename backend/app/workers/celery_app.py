@@ -3,6 +3,7 @@ Celery Application - Task queue configuration using Redis as broker/backend
 """
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 from app.config import settings
 
@@ -30,8 +31,11 @@ celery_app.conf.update(
     # Result expiry (1 hour, matching forecast TTL)
     result_expires=3600,
 
-    # Concurrency — keep low to avoid memory spikes from statsmodels / prophet
-    worker_concurrency=2,
+    # Concurrency — children are recycled after N tasks or a memory threshold,
+    # so statsmodels / prophet memory growth stays bounded
+    worker_concurrency=settings.CELERY_WORKER_CONCURRENCY,
+    worker_max_tasks_per_child=settings.CELERY_WORKER_MAX_TASKS_PER_CHILD or None,
+    worker_max_memory_per_child=(settings.CELERY_WORKER_MAX_MEMORY_MB * 1024) or None,  # KiB
 
     # Auto-discover tasks in the workers and tasks packages
     imports=[
@@ -48,3 +52,11 @@ celery_app.conf.update(
         },
     },
 )
+
+
+@worker_process_init.connect
+def _warm_up_prophet(**kwargs):
+    """Load Prophet's Stan model once per worker child instead of on every fit."""
+    from app.forecasting.prophet_forecaster import ProphetForecaster
+
+    ProphetForecaster.warm_up()
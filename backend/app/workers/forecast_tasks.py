@@ -7,24 +7,110 @@ Redis by the service layer so the frontend can poll /forecast/status/{id}.
 """
 import asyncio
 import logging
-from typing import Dict, Any, List
+import uuid
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional
 
+from celery import chord, group
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.db.redis_client import close_redis, get_redis, init_redis
 from app.workers.celery_app import celery_app
+from app.services.execution import get_execution_engine
+from app.services.execution.base import (
+    frame_from_payload, frame_to_payload, series_from_payload, series_to_payload,
+)
+from app.services.execution.runner import execute_forecast_payload
 from app.services.forecast_service import ForecastService
-from app.schemas.forecast import ForecastRequest, BatchForecastRequest
+from app.schemas.forecast import ForecastRequest, BatchForecastRequest, ForecastResultResponse
 
 logger = logging.getLogger(__name__)
 
+# Redis counter of running batch entities per tenant (Celery-wide concurrency cap)
+REDIS_TENANT_SLOTS_PREFIX = "forecast_slots:"
+TENANT_SLOT_TTL = 3600          # Safety net if a worker dies while holding a slot
+TENANT_SLOT_RETRY_SEC = 5       # Back-off before retrying an entity that found no free slot
+
 
 def _run_async(coro):
-    """Run an async coroutine in a fresh event loop (Celery-safe)."""
+    """Run an async coroutine in a fresh event loop (Celery-safe).
+
+    The Redis client is bound to the event loop it was created on, so it is
+    opened and closed around each coroutine.
+    """
+    async def _with_redis():
+        await init_redis()
+        try:
+            return await coro
+        finally:
+            await close_redis()
+
     loop = asyncio.new_event_loop()
     try:
-        return loop.run_until_complete(coro)
+        return loop.run_until_complete(_with_redis())
     finally:
         loop.close()
 
 
+@asynccontextmanager
+async def _task_sessions():
+    """Session factory for one task's event loop.
+
+    The application's pooled engine keeps connections bound to the loop that
+    opened them, and every task runs in a fresh loop, so tasks that write to
+    the database get their own unpooled engine, disposed afterwards.
+    """
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+def _prepared_to_payload(prepared) -> Optional[Dict[str, Any]]:
+    """JSON form of a (series, error, exog_df) tuple for a Celery subtask."""
+    if prepared is None:
+        return None
+    series, error, exog = prepared
+    return {
+        "series": series_to_payload(series) if series is not None else None,
+        "error": error,
+        "exog": frame_to_payload(exog),
+    }
+
+
+def _prepared_from_payload(payload: Optional[Dict[str, Any]]):
+    if payload is None:
+        return None
+    series = series_from_payload(payload["series"]) if payload.get("series") else None
+    return series, payload.get("error"), frame_from_payload(payload.get("exog"))
+
+
+async def _acquire_tenant_slot(tenant_id: str, limit: int) -> bool:
+    """Take one of the tenant's concurrent-forecast slots; False if all are in use."""
+    redis = await get_redis()
+    if redis is None:
+        return True
+    key = f"{REDIS_TENANT_SLOTS_PREFIX}{tenant_id}"
+    in_use = await redis.incr(key)
+    await redis.expire(key, TENANT_SLOT_TTL)
+    if in_use > limit:
+        await redis.decr(key)
+        return False
+    return True
+
+
+async def _release_tenant_slot(tenant_id: str) -> None:
+    redis = await get_redis()
+    if redis is None:
+        return
+    key = f"{REDIS_TENANT_SLOTS_PREFIX}{tenant_id}"
+    if await redis.decr(key) < 0:
+        await redis.set(key, 0, ex=TENANT_SLOT_TTL)
+
+
 @celery_app.task(
     name="forecast.run",
     bind=True,
@@ -45,7 +131,8 @@ def run_forecast_task(self, tenant_id: str, user_id: str, request_data: Dict[str
         # Extract the pre-generated forecast_id from the dispatcher
         forecast_id = request_data.pop("_forecast_id", None)
         request = ForecastRequest(**request_data)
-        service = ForecastService(tenant_id, user_id)
+        # Prefork workers are daemonic and cannot spawn job processes — run inline.
+        service = ForecastService(tenant_id, user_id, engine=get_execution_engine("inline"))
         result = _run_async(service.run_forecast(request, forecast_id=forecast_id))
         return result.model_dump(mode="json")
     except Exception as exc:
@@ -64,19 +151,133 @@ def run_batch_forecast_task(
     tenant_id: str,
     user_id: str,
     request_data: Dict[str, Any],
+    max_concurrency: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Run a batch forecast (multiple entities) asynchronously via Celery.
 
-    Each entity is forecasted sequentially inside this single task.
-    For true parallelism per entity, the caller can dispatch N individual
-    run_forecast_task calls instead.
+    Entities fan out as one forecast.run_batch_entity subtask each (a chord),
+    so they run in parallel across workers; at most `max_concurrency` of a
+    tenant's entities run at once. forecast.finalize_batch assembles the
+    results in entity order once every subtask has finished and persists the
+    completed ones under the batch's ForecastHistory row, created here.
+
+    Returns the initial batch status (progress is tracked in Redis).
     """
     try:
+        batch_id = request_data.pop("_batch_id", None) or str(uuid.uuid4())
         request = BatchForecastRequest(**request_data)
-        service = ForecastService(tenant_id, user_id)
-        result = _run_async(service.run_batch_forecast(request))
-        return result.model_dump(mode="json")
+        limit = max_concurrency or settings.DEFAULT_MAX_CONCURRENT_FORECASTS
+        service = ForecastService(tenant_id, user_id, engine=get_execution_engine("inline"))
+
+        async def _prepare():
+            status = service._build_batch_status(batch_id, len(request.entity_ids), [])
+            await service._store_batch_status(batch_id, status)
+            async with _task_sessions() as sessions:
+                service.session_factory = sessions
+                persist = await service._create_batch_history(batch_id, request)
+            # Load the dataset once and split it into per-entity series here,
+            # so the entity subtasks never touch the full dataset.
+            df = await service.preprocessing_service.get_dataset_dataframe(request.dataset_id)
+            entity_requests = await service._batch_entity_requests(request, df=df)
+            prepared = await service._prepare_batch_data(request.dataset_id, entity_requests, df=df)
+            return status, entity_requests, prepared, persist
+
+        initial_status, entity_requests, prepared, persist = _run_async(_prepare())
+
+        chord(group(
+            run_batch_entity_task.s(
+                tenant_id, user_id, batch_id, index,
+                entity_request.model_dump(mode="json"), limit,
+                _prepared_to_payload(prepared.get(entity_request.entity_id)),
+            )
+            for index, entity_request in enumerate(entity_requests)
+        ))(finalize_batch_task.s(tenant_id, batch_id, len(entity_requests), persist=persist))
+
+        return initial_status.model_dump(mode="json")
     except Exception as exc:
         logger.error(f"Celery batch forecast task failed: {exc}", exc_info=True)
         raise self.retry(exc=exc)
+
+
+@celery_app.task(
+    name="forecast.run_batch_entity",
+    bind=True,
+    max_retries=None,
+)
+def run_batch_entity_task(
+    self,
+    tenant_id: str,
+    user_id: str,
+    batch_id: str,
+    index: int,
+    request_data: Dict[str, Any],
+    max_concurrency: int,
+    prepared_data: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Forecast one entity of a batch and record it in the batch's results hash.
+
+    `prepared_data` carries the entity's series (and regressors) as split by
+    forecast.run_batch; without it the entity is loaded from Redis.
+
+    If the tenant already has `max_concurrency` entities running, the task is
+    re-queued after a short back-off instead of occupying a worker.
+    """
+    request = ForecastRequest(**request_data)
+
+    async def _run() -> Optional[Dict[str, Any]]:
+        if not await _acquire_tenant_slot(tenant_id, max_concurrency):
+            return None
+        try:
+            service = ForecastService(tenant_id, user_id, engine=get_execution_engine("inline"))
+            result = await service.run_forecast(
+                request, prepared=_prepared_from_payload(prepared_data)
+            )
+            await service._record_batch_result(batch_id, index, result)
+            return result.model_dump(mode="json")
+        finally:
+            await _release_tenant_slot(tenant_id)
+
+    payload = _run_async(_run())
+    if payload is None:
+        raise self.retry(countdown=TENANT_SLOT_RETRY_SEC)
+    return payload
+
+
+@celery_app.task(name="forecast.finalize_batch")
+def finalize_batch_task(
+    results: List[Dict[str, Any]],
+    tenant_id: str,
+    batch_id: str,
+    total: int,
+    persist: bool = False,
+) -> Dict[str, Any]:
+    """Chord callback: persist the completed results when forecast.run_batch
+    created the batch's ForecastHistory row, then store the final batch
+    status (results arrive in entity order)."""
+    service = ForecastService(tenant_id, engine=get_execution_engine("inline"))
+    entity_results = [ForecastResultResponse(**r) for r in results]
+    status = service._build_batch_status(batch_id, total, entity_results, final=True)
+
+    async def _finalize():
+        if persist:
+            async with _task_sessions() as sessions:
+                service.session_factory = sessions
+                await service._persist_batch_results(batch_id, entity_results, status)
+        await service._store_batch_status(batch_id, status)
+
+    _run_async(_finalize())
+    return status.model_dump(mode="json")
+
+
+@celery_app.task(name="forecast.execute_job")
+def execute_forecast_job_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute a single fit/predict(/CV) job for the Celery execution engine.
+
+    The payload is a ForecastJob.to_payload() dict; the return value is a
+    ForecastJobResult.to_payload() dict. Time limits are applied per call by
+    CeleryEngine via soft_time_limit / time_limit.
+    """
+    return execute_forecast_payload(payload)
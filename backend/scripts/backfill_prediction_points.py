@@ -0,0 +1,78 @@
+"""
+Move predictions stored as JSON blobs into forecast_prediction_points.
+
+ForecastPrediction rows written before the points table keep their series in
+`predicted_values`; they are readable as is, but invisible to the range /
+aggregate queries of PredictionStore. This copies each such series into
+point rows (bulk COPY) and clears the JSON column, one batch per transaction.
+
+Usage:
+    cd backend && PYTHONPATH=. python scripts/backfill_prediction_points.py [--batch-size 200] [--dry-run]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Ensure the project root is on sys.path when run directly
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import select
+
+from app.db.database import async_session_maker, engine
+from app.models import ForecastPrediction
+from app.schemas.forecast import PredictionResponse
+from app.services.prediction_store import point_records, write_points
+
+
+async def backfill(batch_size: int, dry_run: bool) -> int:
+    moved = points = 0
+    while True:
+        async with async_session_maker() as session:
+            predictions = (await session.execute(
+                select(ForecastPrediction)
+                .where(ForecastPrediction.predicted_values.is_not(None))
+                .order_by(ForecastPrediction.created_at)
+                .limit(batch_size)
+            )).scalars().all()
+            if not predictions:
+                break
+
+            records = []
+            for pred in predictions:
+                records.extend(point_records(
+                    pred.tenant_id,
+                    pred.forecast_history_id,
+                    pred.id,
+                    pred.entity_id,
+                    [PredictionResponse(**row) for row in pred.predicted_values],
+                ))
+                pred.predicted_values = None
+            moved += len(predictions)
+            points += len(records)
+
+            if dry_run:
+                print(f"Would move {len(predictions)} predictions ({len(records)} points)")
+                break
+            await session.flush()
+            await write_points(session, records)
+            await session.commit()
+            print(f"Moved {moved} predictions ({points} points)")
+
+    await engine.dispose()
+    print(f"Done: {moved} predictions, {points} points{' (dry run)' if dry_run else ''}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--batch-size", type=int, default=200, help="Predictions per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Report the first batch without writing")
+    args = parser.parse_args()
+    return asyncio.run(backfill(args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Auto-ARIMA order search benchmark — legacy grid vs. stepwise search.
+
+Runs both searches of `ARIMAForecaster._auto_arima` on the 20 synthetic
+datasets from `tests/data/synthetic.py::make_benchmark_suite` and reports,
+per dataset, the search wall time, the number of candidate fits and the AIC
+of the selected model (refitted the same way for both searches).
+
+Usage:
+    cd backend && PYTHONPATH=. python scripts/benchmark_arima_search.py [--n-jobs N] [--max-fits F]
+
+AICs are only strictly comparable when both searches chose the same
+differencing (d, D); rows where they differ are marked with "*".
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Ensure the project root is on sys.path when run directly
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+# Silence statsmodels / pandas chatter during long benchmarks
+warnings.filterwarnings("ignore")
+
+from app.forecasting import arima_search
+from app.forecasting.arima import ARIMAForecaster
+from tests.data.synthetic import make_benchmark_suite
+
+
+def _frequency(series: pd.Series) -> str:
+    freq = pd.infer_freq(series.index) if len(series) >= 3 else None
+    return "M" if freq and freq.startswith("M") else "D"
+
+
+def _run(series: pd.Series, search: str, n_jobs: int, max_fits: int) -> Tuple[tuple, tuple, float, int, float]:
+    forecaster = ARIMAForecaster(
+        frequency=_frequency(series), auto=True, search=search, max_fits=max_fits, n_jobs=n_jobs
+    )
+    y = forecaster._validate_data(series)
+    arima_search._test_cache.clear()  # time the differencing tests too
+
+    fits = {"n": 0}
+    original = arima_search.fit_aic
+
+    def counting_fit(*args, **kwargs):
+        fits["n"] += 1
+        return original(*args, **kwargs)
+
+    # Count fits for the grid search (it calls SARIMAX/ARIMA directly)
+    import app.forecasting.arima as arima_module
+    original_sarimax, original_arima = arima_module.SARIMAX, arima_module.ARIMA
+
+    def counted(cls):
+        def factory(*args, **kwargs):
+            fits["n"] += 1
+            return cls(*args, **kwargs)
+        return factory
+
+    arima_module.SARIMAX, arima_module.ARIMA = counted(original_sarimax), counted(original_arima)
+    arima_search.fit_aic = counting_fit
+    try:
+        start = time.perf_counter()
+        order, seasonal = forecaster._auto_arima(y)
+        elapsed = time.perf_counter() - start
+    finally:
+        arima_module.SARIMAX, arima_module.ARIMA = original_sarimax, original_arima
+        arima_search.fit_aic = original
+
+    if search == "stepwise" and n_jobs > 1:
+        fits["n"] = -1  # counted inside worker processes; not visible here
+    aic = arima_search.fit_aic(y, order, seasonal)
+    return order, seasonal, aic, fits["n"], elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n-jobs", type=int, default=1)
+    parser.add_argument("--max-fits", type=int, default=24)
+    parser.add_argument("--only", nargs="*", help="Dataset names to run (default: all)")
+    args = parser.parse_args()
+
+    suite: Dict[str, pd.Series] = make_benchmark_suite()
+    if args.only:
+        suite = {k: v for k, v in suite.items() if k in args.only}
+
+    print(f"{'dataset':<24} {'grid s':>7} {'fits':>5} {'grid AIC':>10}   "
+          f"{'step s':>7} {'fits':>5} {'step AIC':>10}  {'dAIC':>7}  orders (grid | stepwise)")
+    totals: List[Tuple[float, float]] = []
+    deltas: List[float] = []
+    for name, series in suite.items():
+        g_order, g_seasonal, g_aic, g_fits, g_s = _run(series, "grid", 1, args.max_fits)
+        s_order, s_seasonal, s_aic, s_fits, s_s = _run(series, "stepwise", args.n_jobs, args.max_fits)
+        totals.append((g_s, s_s))
+
+        same_diff = g_order[1] == s_order[1] and (g_seasonal or (0, 0))[1] == (s_seasonal or (0, 0))[1]
+        delta = s_aic - g_aic if np.isfinite(g_aic) and np.isfinite(s_aic) else float("nan")
+        if same_diff and np.isfinite(delta):
+            deltas.append(delta)
+        fits_s = "-" if s_fits < 0 else str(s_fits)
+        print(f"{name:<24} {g_s:>7.2f} {g_fits:>5} {g_aic:>10.2f}   "
+              f"{s_s:>7.2f} {fits_s:>5} {s_aic:>10.2f}  {delta:>7.2f}{'' if same_diff else '*'} "
+              f" {g_order}{g_seasonal or ''} | {s_order}{s_seasonal or ''}")
+
+    grid_total = sum(g for g, _ in totals)
+    step_total = sum(s for _, s in totals)
+    print(f"\nTotal search time: grid {grid_total:.1f}s, stepwise {step_total:.1f}s "
+          f"(grid / stepwise = {grid_total / step_total:.2f}x)")
+    if deltas:
+        print(f"AIC (stepwise - grid) on {len(deltas)} comparable datasets: "
+              f"median {np.median(deltas):+.2f}, worst {max(deltas):+.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Redis DataFrame codec benchmark — payload size and encode/decode latency.
+
+Compares the legacy JSON path (`to_json(orient="split")` + `pd.read_json`)
+with the binary codec in app/db/frame_codec.py (Arrow IPC / Parquet with
+lz4 / zstd) on a synthetic multi-entity dataset shaped like an upload.
+
+Usage:
+    cd backend && PYTHONPATH=. python scripts/benchmark_frame_codec.py [--rows N] [--repeat R]
+
+Nothing is written to Redis; the numbers are pure serialisation cost, which
+dominates load latency for large keys.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# Ensure the project root is on sys.path when run directly
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from app.db.frame_codec import decode_frame, encode_frame
+
+
+CODECS: List[Tuple[str, str, str]] = [
+    ("json (legacy)", "json", "none"),
+    ("arrow", "arrow", "none"),
+    ("arrow + lz4", "arrow", "lz4"),
+    ("arrow + zstd", "arrow", "zstd"),
+    ("parquet + lz4", "parquet", "lz4"),
+    ("parquet + zstd", "parquet", "zstd"),
+]
+
+
+def make_dataset(rows: int, entities: int = 500, seed: int = 0) -> pd.DataFrame:
+    """Daily sales for `entities` SKUs, `rows` rows in total, a few regressors."""
+    rng = np.random.default_rng(seed)
+    per_entity = max(1, rows // entities)
+    dates = pd.date_range("2019-01-01", periods=per_entity, freq="D")
+    n = per_entity * entities
+    return pd.DataFrame({
+        "date": np.tile(dates.strftime("%Y-%m-%d"), entities),
+        "entity_id": np.repeat([f"SKU-{i:05d}" for i in range(entities)], per_entity),
+        "value": rng.gamma(2.0, 50.0, n).round(2),
+        "price": rng.uniform(5, 50, n).round(2),
+        "promo": rng.integers(0, 2, n),
+        "store": rng.choice(["north", "south", "east", "west"], n),
+    })
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_dataset(args.rows)
+    print(f"Dataset: {len(df):,} rows x {len(df.columns)} columns "
+          f"({df.memory_usage(deep=True).sum() / 1e6:.1f} MB in memory)\n")
+    print(f"{'codec':<16} {'size MB':>9} {'ratio':>7} {'encode s':>9} {'decode s':>9}")
+
+    baseline_size = None
+    for label, fmt, compression in CODECS:
+        payload = encode_frame(df, fmt=fmt, compression=compression)
+        raw = payload.encode("utf-8") if isinstance(payload, str) else payload
+        baseline_size = baseline_size or len(raw)
+
+        encode_s = _time(lambda: encode_frame(df, fmt=fmt, compression=compression), args.repeat)
+        decode_s = _time(lambda: decode_frame(raw), args.repeat)
+        print(f"{label:<16} {len(raw) / 1e6:>9.1f} {baseline_size / len(raw):>6.1f}x "
+              f"{encode_s:>9.3f} {decode_s:>9.3f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Snapshot fingerprint benchmark — sorted-JSON SHA-256 vs. row-hash sum.
+
+Builds a long-format dataset (date, entity, value and a few attribute
+columns, the shape snapshots usually have) and times
+`SnapshotService.compute_legacy_data_hash` (sort every column, sort all
+rows, dump JSON, SHA-256) against `SnapshotService.compute_data_hash`
+(per-row `hash_pandas_object` folded into wrapping sums). It also checks
+that the new fingerprint ignores row and column order.
+
+Usage:
+    cd backend && PYTHONPATH=. python scripts/benchmark_snapshot_hash.py [--rows 2000000] [--skip-legacy]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ensure the project root is on sys.path when run directly
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from app.services.snapshot_service import SnapshotService
+
+
+def _dataset(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    entities = np.array([f"SKU-{i:05d}" for i in range(max(1, rows // 730))])
+    return pd.DataFrame({
+        "date": pd.Timestamp("2022-01-01") + pd.to_timedelta(rng.integers(0, 730, rows), unit="D"),
+        "entity_id": entities[rng.integers(0, len(entities), rows)],
+        "value": rng.normal(100, 15, rows).round(2),
+        "price": rng.uniform(1, 50, rows).round(2),
+        "promo": rng.integers(0, 2, rows),
+        "region": np.array(["north", "south", "east", "west"])[rng.integers(0, 4, rows)],
+    })
+
+
+def _time(fn, df: pd.DataFrame):
+    start = time.perf_counter()
+    value = fn(df)
+    return value, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the row-hash fingerprint")
+    args = parser.parse_args()
+
+    df = _dataset(args.rows)
+    print(f"{len(df):,} rows x {len(df.columns)} columns, {df.memory_usage(deep=True).sum() / 1e6:.0f} MB in memory")
+
+    new_hash, new_s = _time(SnapshotService.compute_data_hash, df)
+    shuffled = df.sample(frac=1.0, random_state=1)[df.columns[::-1]]
+    shuffled_hash, _ = _time(SnapshotService.compute_data_hash, shuffled)
+    assert shuffled_hash == new_hash, "row-hash fingerprint must ignore row/column order"
+
+    if not args.skip_legacy:
+        _, legacy_s = _time(SnapshotService.compute_legacy_data_hash, df)
+        print(f"sorted JSON SHA-256 : {legacy_s:8.2f} s")
+    print(f"row-hash sum        : {new_s:8.2f} s  (order-insensitive: shuffled copy matches)")
+    if not args.skip_legacy:
+        print(f"speed-up            : {legacy_s / new_s:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
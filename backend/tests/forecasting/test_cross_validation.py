@@ -119,3 +119,55 @@ def test_cv_reduces_folds_for_small_data():
     )
     assert result.reduced_folds is True
     assert result.requested_folds == 5
+
+
+def test_parallel_folds_match_serial():
+    series = _series(100)
+    kwargs = dict(folds=4, method="expanding", initial_train_size=0.7, horizon=5)
+
+    serial = run_cv(series, forecaster_factory=_DummyForecaster, **kwargs)
+    parallel = run_cv(series, forecaster_factory=_DummyForecaster, n_jobs=2, **kwargs)
+
+    assert [f.fold_index for f in parallel.folds] == [f.fold_index for f in serial.folds]
+    assert parallel.average_mae == pytest.approx(serial.average_mae)
+
+
+@pytest.mark.parametrize("refit, searches", [("reuse", 1), ("warm_start", 1), ("search", 4)])
+def test_cv_reuses_full_series_arima_order(refit, searches):
+    from unittest.mock import patch
+
+    from app.forecasting.arima import ARIMAForecaster
+    from app.schemas.forecast import CrossValidationRequest, ForecastMethod, ForecastRequest
+    from app.services.execution.runner import create_forecaster, run_cross_validation
+    from tests.data.synthetic import random_walk
+
+    series = random_walk(n=80)
+    request = ForecastRequest(
+        dataset_id="ds", entity_id="e", method=ForecastMethod.ARIMA, horizon=5,
+        cross_validation=CrossValidationRequest(enabled=True, folds=3, refit=refit),
+    )
+    original = ARIMAForecaster._auto_arima
+    calls = {"n": 0}
+
+    def _counting(self, y):
+        calls["n"] += 1
+        return original(self, y)
+
+    with patch.object(ARIMAForecaster, "_auto_arima", _counting):
+        fitted = create_forecaster(request)
+        fitted.fit(series)
+        result = run_cross_validation(series, request, None, 1, fitted=fitted)
+
+    assert len(result.folds) == 3
+    assert calls["n"] == searches
+
+
+def test_cv_refit_rejects_unknown_strategies():
+    from pydantic import ValidationError
+
+    from app.schemas.forecast import CrossValidationRequest
+
+    with pytest.raises(ValidationError):
+        CrossValidationRequest(enabled=True, refit="warmstart")
+    # Reusing the full-series fit is opt-in: it sees every fold's test window
+    assert CrossValidationRequest(enabled=True).refit == "search"
@@ -0,0 +1,200 @@
+"""Tests for the per-tenant connector connection pools (reuse, health checks, eviction, invalidation)."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.db.connector_pool import ConnectorPoolManager
+
+
+class _Conn:
+    def __init__(self, n: int):
+        self.n = n
+        self.alive = True
+        self.closed = False
+
+
+class _Pool:
+    def __init__(self, args):
+        self.args = args
+        self.free: list[_Conn] = []
+        self.opened = 0
+        self.closed = False
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.pools: list[_Pool] = []
+        self.pings = 0
+
+    async def create_pool(self, args, max_size, idle_seconds):
+        self.pools.append(_Pool(args))
+        return self.pools[-1]
+
+    async def acquire(self, pool):
+        if pool.free:
+            return pool.free.pop()
+        pool.opened += 1
+        return _Conn(pool.opened)
+
+    def identity(self, conn):
+        return conn
+
+    async def release(self, pool, conn, discard):
+        if discard:
+            conn.closed = True
+        else:
+            pool.free.append(conn)
+
+    async def ping(self, conn):
+        self.pings += 1
+        if not conn.alive:
+            raise ConnectionResetError("server closed the connection")
+
+    async def close(self, pool):
+        pool.closed = True
+
+
+def _manager(driver, **kwargs) -> ConnectorPoolManager:
+    options = dict(max_size=3, idle_seconds=300, health_check_seconds=30, max_pools=10)
+    options.update(kwargs)
+    return ConnectorPoolManager(**options, drivers={"fake": driver})
+
+
+ARGS = {"dsn": "postgresql://u:p@db/sales"}
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused_per_tenant_and_config():
+    driver = _FakeDriver()
+    pools = _manager(driver)
+
+    for _ in range(5):
+        async with pools.connection("t-1", "fake", ARGS) as conn:
+            assert conn.n == 1
+    async with pools.connection("t-1", "fake", ARGS) as first, pools.connection("t-1", "fake", ARGS) as second:
+        assert {first.n, second.n} == {1, 2}
+    async with pools.connection("t-2", "fake", ARGS):
+        pass
+    async with pools.connection("t-1", "fake", {**ARGS, "dsn": "postgresql://u:rotated@db/sales"}):
+        pass
+
+    assert len(driver.pools) == 3
+    assert driver.pools[0].opened == 2
+    assert pools.stats()["pools"] == 3 and pools.stats()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_block_discards_its_connection():
+    driver = _FakeDriver()
+    pools = _manager(driver)
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with pools.connection("t-1", "fake", ARGS) as conn:
+            raise asyncio.TimeoutError()
+
+    assert conn.closed and driver.pools[0].free == []
+    async with pools.connection("t-1", "fake", ARGS) as fresh:
+        assert fresh is not conn
+    assert pools.stats()["discarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_connection_is_pinged_and_replaced_when_dead():
+    driver = _FakeDriver()
+    pools = _manager(driver, health_check_seconds=0.05)
+
+    async with pools.connection("t-1", "fake", ARGS) as conn:
+        pass
+    async with pools.connection("t-1", "fake", ARGS) as again:
+        assert again is conn and driver.pings == 0
+
+    await asyncio.sleep(0.06)
+    conn.alive = False
+    async with pools.connection("t-1", "fake", ARGS) as replacement:
+        assert replacement is not conn and replacement.n == 2
+    assert driver.pings == 1 and conn.closed
+
+
+class _Proxy:
+    """A fresh wrapper per acquire, like asyncpg's PoolConnectionProxy."""
+
+    def __init__(self, con: _Conn):
+        self._con = con
+
+
+class _ProxyDriver(_FakeDriver):
+    async def acquire(self, pool):
+        return _Proxy(await super().acquire(pool))
+
+    def identity(self, conn):
+        return conn._con
+
+    async def release(self, pool, conn, discard):
+        con, conn._con = conn._con, None
+        await super().release(pool, con, discard)
+
+    async def ping(self, conn):
+        await super().ping(conn._con)
+
+
+@pytest.mark.asyncio
+async def test_stale_check_follows_the_connection_behind_per_acquire_proxies():
+    driver = _ProxyDriver()
+    pools = _manager(driver, health_check_seconds=0.05)
+
+    async with pools.connection("t-1", "fake", ARGS) as proxy:
+        conn = proxy._con
+    await asyncio.sleep(0.06)
+    conn.alive = False
+    async with pools.connection("t-1", "fake", ARGS) as replacement:
+        assert replacement._con is not conn and replacement._con.n == 2
+    assert driver.pings == 1 and conn.closed
+
+    # One idle timestamp per pooled connection, none per proxy
+    entry = next(iter(pools._pools.values()))
+    assert list(entry.released_at.keys()) == driver.pools[0].free
+
+
+@pytest.mark.asyncio
+async def test_idle_pools_are_evicted_and_capped():
+    driver = _FakeDriver()
+    pools = _manager(driver, max_pools=2)
+
+    for tenant in ("t-1", "t-2", "t-3"):
+        async with pools.connection(tenant, "fake", ARGS):
+            pass
+    assert [p.closed for p in driver.pools] == [True, False, False]
+
+    with patch("app.db.connector_pool.time.monotonic", return_value=1e12):
+        assert await pools.evict_idle() == 2
+    assert all(p.closed for p in driver.pools) and pools.stats()["pools"] == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_waits_for_borrowed_connections():
+    driver = _FakeDriver()
+    pools = _manager(driver)
+
+    async with pools.connection("t-1", "fake", ARGS):
+        assert await pools.invalidate("t-1", "fake", ARGS) == 1
+        assert not driver.pools[0].closed
+    assert driver.pools[0].closed
+
+    async with pools.connection("t-1", "fake", ARGS):
+        pass
+    assert len(driver.pools) == 2
+    assert await pools.invalidate("t-1") == 1 and driver.pools[1].closed
+
+
+def test_unknown_driver_is_rejected():
+    pools = _manager(_FakeDriver())
+
+    async def _borrow():
+        async with pools.connection("t-1", "odbc-nope", ARGS):
+            pass
+
+    with pytest.raises(ValueError, match="odbc-nope"):
+        asyncio.run(_borrow())
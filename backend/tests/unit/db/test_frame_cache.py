@@ -0,0 +1,103 @@
+"""Tests for the per-worker DataFrame LRU and its Redis version invalidation."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.db import redis_client
+from app.db.frame_cache import FrameCache
+from app.db.frame_codec import encode_frame
+
+
+def _frame(n: int = 100, offset: float = 0.0) -> pd.DataFrame:
+    return pd.DataFrame({"value": np.arange(n, dtype=float) + offset})
+
+
+def test_hit_returns_independent_copy():
+    cache = FrameCache(max_bytes=10_000_000)
+    cache.put("dataset:1", "1", "v1", _frame())
+
+    first = cache.get("dataset:1", "v1")
+    first["value"] = -1.0
+    second = cache.get("dataset:1", "v1")
+
+    assert second["value"].iloc[0] == 0.0
+    assert cache.stats()["hits"] == 2
+
+
+def test_version_mismatch_is_a_miss_and_drops_entry():
+    cache = FrameCache(max_bytes=10_000_000)
+    cache.put("dataset:1", "1", "v1", _frame())
+
+    assert cache.get("dataset:1", "v2") is None
+    stats = cache.stats()
+    assert (stats["misses"], stats["invalidations"], stats["entries"]) == (1, 1, 0)
+
+
+def test_lru_eviction_respects_byte_budget():
+    frame_bytes = int(_frame().memory_usage(deep=True).sum())
+    cache = FrameCache(max_bytes=frame_bytes * 2)
+    cache.put("a", "ds", "v", _frame())
+    cache.put("b", "ds", "v", _frame())
+    cache.get("a", "v")                      # "b" is now least recently used
+    cache.put("c", "ds", "v", _frame())
+
+    assert cache.get("b", "v") is None
+    assert cache.get("a", "v") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size_bytes"] <= cache.max_bytes
+
+
+def test_oversized_frame_is_not_cached():
+    cache = FrameCache(max_bytes=100)
+    cache.put("big", "ds", "v", _frame(1000))
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalidate_dataset_only_touches_that_dataset():
+    cache = FrameCache(max_bytes=10_000_000)
+    cache.put("dataset:1", "1", "v", _frame())
+    cache.put("preprocessed:1", "1", "v", _frame())
+    cache.put("dataset:2", "2", "v", _frame())
+
+    assert cache.invalidate_dataset("1") == 2
+    assert cache.get("dataset:2", "v") is not None
+
+
+@pytest.mark.asyncio
+async def test_frame_get_uses_cache_until_version_is_bumped():
+    class _FakeRedis:
+        def __init__(self):
+            self.store: dict = {}
+            self.gets: list = []
+
+        async def get(self, key):
+            self.gets.append(key)
+            return self.store.get(key)
+
+        async def set(self, key, value, ex=None, nx=False):
+            if nx and key in self.store:
+                return None
+            self.store[key] = value if isinstance(value, bytes) else str(value)
+            return True
+
+    fake = _FakeRedis()
+    fake.store["dataset:1"] = encode_frame(_frame())
+
+    with patch.object(redis_client, "redis_client", fake), \
+         patch.object(redis_client, "redis_binary_client", fake), \
+         patch.object(redis_client, "frame_cache", FrameCache(max_bytes=10_000_000)):
+        await redis_client.frame_get("dataset:1", dataset_id="1")
+        await redis_client.frame_get("dataset:1", dataset_id="1")
+        assert fake.gets.count("dataset:1") == 1
+        assert redis_client.frame_cache_stats()["hits"] == 1
+
+        fake.store["dataset:1"] = encode_frame(_frame(offset=100.0))
+        await redis_client.bump_frame_version("1")
+        refreshed = await redis_client.frame_get("dataset:1", dataset_id="1")
+
+    assert refreshed["value"].iloc[0] == 100.0
+    assert fake.gets.count("dataset:1") == 2
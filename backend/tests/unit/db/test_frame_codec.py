@@ -0,0 +1,98 @@
+"""Round-trip tests for the Redis DataFrame codec (binary + legacy JSON)."""
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.db import redis_client
+from app.db.frame_codec import MAGIC, decode_frame, describe_frame, encode_frame
+
+
+@pytest.fixture
+def frame():
+    n = 200
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=n, freq="D"),
+        "entity_id": np.where(np.arange(n) % 2 == 0, "A", "B"),
+        "value": np.linspace(0.0, 10.0, n),
+        "units": np.arange(n, dtype="int64"),
+        "note": [None if i % 7 == 0 else f"n{i}" for i in range(n)],
+    })
+
+
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+@pytest.mark.parametrize("compression", ["none", "lz4", "zstd"])
+def test_binary_round_trip_preserves_values_and_dtypes(frame, fmt, compression):
+    payload = encode_frame(frame, fmt=fmt, compression=compression)
+
+    assert payload.startswith(MAGIC)
+    assert describe_frame(payload) == {"version": 1, "format": fmt, "compression": compression}
+    pd.testing.assert_frame_equal(decode_frame(payload), frame)
+
+
+def test_legacy_split_json_is_read_transparently(frame):
+    legacy = frame.to_json(orient="split", date_format="iso")
+
+    for data in (legacy, legacy.encode("utf-8")):
+        decoded = decode_frame(data)
+        assert list(decoded.columns) == list(frame.columns)
+        assert len(decoded) == len(frame)
+        np.testing.assert_allclose(decoded["value"], frame["value"])
+
+
+def test_legacy_records_json_is_read_transparently(frame):
+    legacy = json.dumps(frame.head(5).to_dict(orient="records"), default=str).encode("utf-8")
+
+    decoded = decode_frame(legacy)
+
+    assert list(decoded.columns) == list(frame.columns)
+    assert decoded["units"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_unencodable_frame_falls_back_to_json():
+    mixed = pd.DataFrame({"mixed": [1, "two", 3.0]})
+
+    payload = encode_frame(mixed)
+
+    assert isinstance(payload, str)
+    assert decode_frame(payload)["mixed"].tolist() == [1, "two", 3.0]
+
+
+def test_unknown_codec_version_is_rejected(frame):
+    payload = bytearray(encode_frame(frame))
+    payload[len(MAGIC)] = 99
+
+    with pytest.raises(ValueError, match="version"):
+        decode_frame(bytes(payload))
+
+
+@pytest.mark.asyncio
+async def test_frame_set_and_get_through_binary_client(frame):
+    class _FakeBinaryRedis:
+        def __init__(self):
+            self.store: dict[str, bytes] = {}
+
+        async def set(self, key, value, ex=None):
+            self.store[key] = value if isinstance(value, bytes) else value.encode("utf-8")
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def mget(self, keys):
+            return [self.store.get(k) for k in keys]
+
+    fake = _FakeBinaryRedis()
+    fake.store["legacy"] = frame.to_json(orient="split", date_format="iso").encode("utf-8")
+
+    with patch.object(redis_client, "redis_binary_client", fake):
+        assert await redis_client.frame_set("dataset:1", frame, expire=60)
+        assert fake.store["dataset:1"].startswith(MAGIC)
+        pd.testing.assert_frame_equal(await redis_client.frame_get("dataset:1"), frame)
+
+        frames = await redis_client.frame_mget(["dataset:1", "missing", "legacy"])
+        assert set(frames) == {"dataset:1", "legacy"}
+        assert await redis_client.frame_get("missing") is None
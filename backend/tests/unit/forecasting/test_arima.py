@@ -97,3 +97,81 @@ def test_arima_manual_order():
     assert forecaster.order == (1, 1, 1)
     output = forecaster.predict(horizon=5)
     _assert_predictions_ok(output, horizon=5)
+
+
+def test_stepwise_search_is_deterministic_and_respects_fit_budget():
+    from app.forecasting import arima_search
+
+    series = daily_weekly_seasonal(n=120)
+    calls = {"n": 0}
+    original = arima_search.fit_aic
+
+    def _counting(*args, **kwargs):
+        calls["n"] += 1
+        return original(*args, **kwargs)
+
+    with patch.object(arima_search, "fit_aic", _counting):
+        first = arima_search.stepwise_search(series, d=1, seasonal_period=7, D=1, max_fits=10)
+        second = arima_search.stepwise_search(series, d=1, seasonal_period=7, D=1, max_fits=10)
+
+    assert first.fits <= 10 and calls["n"] == first.fits + second.fits
+    assert (first.order, first.seasonal_order, first.aic) == (
+        second.order, second.seasonal_order, second.aic
+    )
+    assert first.order[1] == 1 and first.seasonal_order[1::2] == (1, 7)
+
+
+def test_differencing_tests_are_cached_per_series():
+    from app.forecasting import arima_search
+
+    series = random_walk(n=80)
+    arima_search._test_cache.clear()
+    with patch.object(arima_search, "adfuller", wraps=arima_search.adfuller) as adf:
+        d1 = arima_search.ndiffs(series)
+        calls = adf.call_count
+        d2 = arima_search.ndiffs(series.copy())
+    assert d1 == d2 == 1
+    assert calls > 0 and adf.call_count == calls
+
+
+def test_grid_search_mode_still_available():
+    series = daily_weekly_seasonal(n=60)
+    forecaster = ARIMAForecaster(frequency="D", auto=True, search="grid")
+    forecaster.fit(series)
+    assert forecaster.is_fitted
+    assert forecaster.get_params()["search"] == "grid"
+    with pytest.raises(ValueError, match="Unknown ARIMA search"):
+        ARIMAForecaster(search="exhaustive")
+
+
+def test_update_appends_new_observations_with_stored_model():
+    from app.forecasting.persistence import (
+        decode_model_state, dump_model_state, encode_model_state, load_forecaster,
+    )
+
+    series = daily_weekly_seasonal(n=150)
+    forecaster = ARIMAForecaster(frequency="D", auto=True)
+    with patch.object(ARIMAForecaster, "_auto_arima", return_value=((1, 1, 1), (1, 0, 0, 7))):
+        forecaster.fit(series.iloc[:120])
+
+    restored = load_forecaster(decode_model_state(encode_model_state(dump_model_state(forecaster))))
+    np.testing.assert_allclose(
+        restored.predict(7).predictions["value"], forecaster.predict(7).predictions["value"]
+    )
+
+    with patch.object(ARIMAForecaster, "_auto_arima") as search:
+        assert restored.update(series) == "append"
+    search.assert_not_called()
+
+    expected = forecaster.model.append(series.iloc[120:]).forecast(7)
+    output = restored.predict(7)
+    np.testing.assert_allclose(output.predictions["value"], expected.to_numpy())
+    assert output.predictions["date"].iloc[0] == series.index[-1] + pd.Timedelta(days=1)
+
+    # Revised history cannot be appended: the stored order is re-estimated
+    revised = series.copy()
+    revised.iloc[5] += 10.0
+    with patch.object(ARIMAForecaster, "_auto_arima") as search:
+        assert restored.update(revised) == "refit"
+    search.assert_not_called()
+    assert restored.order == (1, 1, 1) and restored.auto is True
@@ -71,3 +71,21 @@ def test_ets_coefficients_in_model_summary():
     assert coeffs is None or isinstance(coeffs, list)
     if isinstance(coeffs, list) and len(coeffs) > 0:
         assert "name" in coeffs[0] and "estimate" in coeffs[0]
+
+
+def test_ets_update_runs_recursions_over_new_observations():
+    from app.forecasting.persistence import dump_model_state, load_forecaster
+
+    series = daily_weekly_seasonal(n=150)
+    forecaster = ETSForecaster(frequency="D", auto=True, seasonal_periods=7)
+    forecaster.fit(series.iloc[:120])
+    params = dict(forecaster.model.params)
+
+    restored = load_forecaster(dump_model_state(forecaster))
+    np.testing.assert_allclose(restored.model.fittedvalues, forecaster.model.fittedvalues)
+
+    assert restored.update(series) == "append"
+    assert len(restored.model.fittedvalues) == 150
+    # Parameters carried over, not re-estimated
+    assert restored.model.params["smoothing_level"] == params["smoothing_level"]
+    _assert_predictions_ok(restored.predict(horizon=7), horizon=7)
@@ -1,7 +1,8 @@
-"""Prophet forecaster tests — skipped when CmdStan is not available."""
+"""Prophet forecaster tests — model fits are skipped when CmdStan is not available."""
 from __future__ import annotations
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from tests.data.synthetic import daily_weekly_seasonal
@@ -16,7 +17,7 @@ def _cmdstan_available() -> bool:
         return False
 
 
-pytestmark = pytest.mark.skipif(
+requires_cmdstan = pytest.mark.skipif(
     not _cmdstan_available(), reason="CmdStan not installed"
 )
 
@@ -33,6 +34,7 @@ def _assert_predictions_ok(output, horizon: int):
     assert np.all(values <= upper + 1e-6)
 
 
+@requires_cmdstan
 def test_prophet_fit_and_predict():
     from app.forecasting.prophet_forecaster import ProphetForecaster
 
@@ -54,6 +56,7 @@ def test_prophet_fit_and_predict():
         assert np.isfinite(output.metrics[key])
 
 
+@requires_cmdstan
 def test_prophet_residuals_returned():
     from app.forecasting.prophet_forecaster import ProphetForecaster
 
@@ -68,3 +71,50 @@ def test_prophet_residuals_returned():
     output = forecaster.predict(horizon=5)
     assert output.residuals is not None
     assert len(output.residuals) >= 50
+
+
+def test_regressor_alignment_uses_history_supplied_values_then_mean():
+    """Alignment needs no fitted model: it only reads the training frame."""
+    from app.forecasting.prophet_forecaster import ProphetForecaster
+
+    forecaster = ProphetForecaster(frequency="D")
+    history = pd.date_range("2024-01-01", periods=5, freq="D")
+    forecaster._df_train = pd.DataFrame({
+        "ds": history, "y": np.arange(5.0), "promo": [1.0, 0.0, 1.0, 0.0, 1.0], "price": np.arange(10.0, 15.0),
+    })
+    forecaster._regressor_columns = ["promo", "price"]
+    forecaster._regressor_means = {"promo": 0.6, "price": 12.0}
+
+    future_dates = pd.date_range("2024-01-01", periods=8, freq="D")
+    supplied = pd.DataFrame(
+        {"promo": [0.0, 5.0, 1.0], "unused": [9.0, 9.0, 9.0]},
+        index=pd.to_datetime(["2024-01-02", "2024-01-06", "2024-01-07"]),
+    )
+    aligned = forecaster._align_regressors(pd.Series(future_dates), supplied)
+
+    # Training dates keep the fitted values even if the caller sends others
+    assert aligned["promo"].tolist() == [1.0, 0.0, 1.0, 0.0, 1.0, 5.0, 1.0, 0.6]
+    assert aligned["price"].tolist() == [10.0, 11.0, 12.0, 13.0, 14.0, 12.0, 12.0, 12.0]
+    assert list(aligned.columns) == ["promo", "price"]
+
+    without_supplied = forecaster._align_regressors(pd.Series(future_dates))
+    assert without_supplied["promo"].tolist()[5:] == [0.6, 0.6, 0.6]
+
+
+def test_future_regressors_reach_predict_as_frame():
+    from app.schemas.forecast import ForecastMethod, ForecastRequest
+    from app.services.execution.runner import future_regressor_frame
+
+    request = ForecastRequest(
+        dataset_id="d", entity_id="e", method=ForecastMethod.PROPHET,
+        future_regressors={"2024-02-02": {"promo": 1.0}, "2024-02-01": {"promo": 0.0}},
+    )
+    frame = future_regressor_frame(request)
+    assert list(frame.index) == list(pd.to_datetime(["2024-02-01", "2024-02-02"]))
+    assert frame["promo"].tolist() == [0.0, 1.0]
+
+    with pytest.raises(ValueError):
+        ForecastRequest(
+            dataset_id="d", entity_id="e", method=ForecastMethod.PROPHET,
+            future_regressors={"next tuesday": {"promo": 1.0}},
+        )
@@ -0,0 +1,218 @@
+"""Connector import tests — query planning, pushed-down vs. pandas aggregation, chunked aggregation, incremental sync."""
+from __future__ import annotations
+
+import sqlite3
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.connector_import import (
+    ImportAggregator,
+    ImportScopeError,
+    SyncState,
+    filter_import_rows,
+    import_scope,
+    import_watermark,
+    load_sync_state,
+    merge_increment,
+    plan_import_query,
+    save_sync_state,
+)
+
+
+def _transactions(rows: int = 20_000, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    entity = rng.integers(0, 40, rows)
+    return pd.DataFrame({
+        "date": (pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 90, rows), unit="D")).strftime("%Y-%m-%d"),
+        "entity_id": [f"SKU-{e:03d}" for e in entity],
+        "entity_name": [f"Product {e}" for e in entity],
+        "volume": rng.integers(1, 20, rows).astype(float),
+    })
+
+
+def _chunks(df: pd.DataFrame, size: int):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+def test_chunked_aggregation_matches_one_shot_groupby():
+    raw = _transactions()
+    aggregator = ImportAggregator(merge_rows=1_000)
+    for chunk in _chunks(raw, 1_500):
+        aggregator.add(chunk)
+
+    expected = raw.assign(date=pd.to_datetime(raw["date"]))
+    expected = (
+        expected.groupby(["date", "entity_id"], as_index=False)
+        .agg({"volume": "sum", "entity_name": "first"})
+        .sort_values(["entity_id", "date"])
+        .reset_index(drop=True)
+    )
+    result = aggregator.result()
+
+    assert aggregator.aggregated and aggregator.raw_rows == len(raw)
+    pd.testing.assert_frame_equal(result, expected)
+    # Partial aggregates were collapsed along the way, never holding raw rows
+    assert aggregator._part_rows < len(raw)
+
+
+def test_decimal_volumes_are_summed_numerically():
+    aggregator = ImportAggregator()
+    aggregator.add(pd.DataFrame({
+        "date": ["2025-01-01", "2025-01-01", "2025-01-02"],
+        "entity_id": ["A", "A", "A"],
+        "volume": [Decimal("1.5"), Decimal("2.5"), None],
+    }))
+
+    result = aggregator.result()
+
+    assert result["volume"].tolist() == [4.0, 0.0]
+    assert result["volume"].dtype == float
+
+
+def test_unaggregatable_chunks_are_kept_as_rows():
+    aggregator = ImportAggregator()
+    for chunk in _chunks(pd.DataFrame({"entity_id": list("ABCDE"), "note": range(5)}), 2):
+        aggregator.add(chunk)
+
+    result = aggregator.result()
+
+    assert not aggregator.aggregated
+    assert result["entity_id"].tolist() == list("ABCDE")
+    assert ImportAggregator().result().empty
+
+
+COLUMN_MAP = {
+    "date": "SaleDate",
+    "entity_id": "Sku",
+    "entity_name": "SkuName",
+    "volume": "Qty",
+    "rls_column": "Store",
+}
+
+
+def test_plan_pushes_group_by_and_binds_rls_values():
+    plan = plan_import_query(
+        "postgres", "public", "sales", COLUMN_MAP,
+        rls_values=["S1", "S2"], date_start=date(2025, 1, 1), date_end=date(2025, 3, 31),
+    )
+
+    assert plan.aggregated
+    assert plan.sql == (
+        'SELECT "SaleDate" AS "date", "Sku" AS "entity_id", SUM("Qty") AS "volume", '
+        'MIN("SkuName") AS "entity_name" FROM "public"."sales" '
+        "WHERE \"Store\" = ANY($1) AND \"SaleDate\" >= '2025-01-01' AND \"SaleDate\" <= '2025-03-31' "
+        'GROUP BY "SaleDate", "Sku"'
+    )
+    assert plan.params == (["S1", "S2"],)
+
+    mysql = plan_import_query("mysql", "shop", "sales", COLUMN_MAP, rls_values=["S1", "O'Brien"])
+    assert "`Store` IN (%s, %s)" in mysql.sql and mysql.params == ("S1", "O'Brien")
+    assert "O'Brien" not in mysql.sql
+
+    bigquery = plan_import_query("bigquery", "ds", "sales", COLUMN_MAP, rls_values=["S1"])
+    assert "CAST(`Store` AS STRING) IN UNNEST(@rls_values)" in bigquery.sql
+    assert bigquery.params == {"rls_values": ["S1"]}
+
+    many = plan_import_query("sqlserver", "dbo", "sales", COLUMN_MAP, rls_values=[f"S{i}" for i in range(5000)])
+    assert "[Store] IN (SELECT value FROM OPENJSON(?))" in many.sql and len(many.params) == 1
+
+
+def test_plan_without_a_measure_selects_rows():
+    plan = plan_import_query("snowflake", "PUBLIC", "SALES", {"date": "D", "entity_id": "E", "rls_column": "R"})
+
+    assert not plan.aggregated
+    assert plan.sql == 'SELECT "D" AS "date", "E" AS "entity_id" FROM "PUBLIC"."SALES"'
+    assert plan.params == ()
+
+
+def test_pushed_down_query_matches_the_pandas_path():
+    """Run the generated SQL (SQL Server dialect, which SQLite accepts) against the pandas fallback."""
+    raw = _transactions(5_000).rename(columns={
+        "date": "SaleDate", "entity_id": "Sku", "entity_name": "SkuName", "volume": "Qty",
+    })
+    raw["Store"] = np.where(np.arange(len(raw)) % 3 == 0, "S1", "S2")
+    connection = sqlite3.connect(":memory:")
+    raw.to_sql("sales", connection, index=False)
+    window = dict(rls_values=["S1"], date_start=date(2025, 2, 1), date_end=date(2025, 2, 28))
+
+    plan = plan_import_query("sqlserver", "main", "sales", COLUMN_MAP, **window)
+    pushed = ImportAggregator()
+    pushed.add(pd.read_sql_query(plan.sql, connection, params=plan.params))
+
+    local = ImportAggregator()
+    for chunk in _chunks(raw, 700):
+        local.add(filter_import_rows(chunk, COLUMN_MAP, **window))
+
+    expected = local.result()
+    result = pushed.result()[expected.columns]
+    assert pushed.raw_rows < local.raw_rows
+    assert len(expected) > 0
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_file_rows_are_refused_when_the_rls_column_is_missing():
+    raw = _transactions(100)
+    column_map = {**{role: role for role in raw.columns}, "rls_column": "store"}
+
+    with pytest.raises(ImportScopeError, match="'store'"):
+        filter_import_rows(raw, column_map, rls_values=["S1"])
+
+    # Without RLS values there is nothing to enforce
+    assert len(filter_import_rows(raw, column_map)) == len(raw)
+
+
+def test_incremental_merge_matches_a_full_reimport():
+    history = _transactions(6_000, seed=1)
+    aggregator = ImportAggregator()
+    aggregator.add(history)
+    previous = aggregator.result()
+    watermark = import_watermark(previous)
+
+    # The source gains a day and late rows for the watermark day
+    new_day = _transactions(300, seed=2).assign(date=str(watermark + timedelta(days=1)))
+    late = _transactions(50, seed=3).assign(date=str(watermark))
+    source = pd.concat([history, new_day, late], ignore_index=True)
+
+    delta = ImportAggregator()
+    delta.add(filter_import_rows(source, {role: role for role in source.columns}, date_start=watermark))
+    merged, affected = merge_increment(previous, delta.result(), watermark)
+
+    full = ImportAggregator()
+    full.add(source)
+    pd.testing.assert_frame_equal(merged, full.result())
+    assert delta.raw_rows < len(source) / 10
+    assert set(affected) == set(new_day["entity_id"]) | set(late["entity_id"]) | set(
+        previous.loc[previous["date"] >= pd.Timestamp(watermark), "entity_id"]
+    )
+    assert import_watermark(merged) == watermark + timedelta(days=1)
+
+
+@pytest.mark.asyncio
+async def test_sync_state_is_kept_per_scope():
+    class _FakeRedis:
+        def __init__(self):
+            self.store: dict = {}
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def set(self, key, value, ex=None):
+            self.store[key] = value
+
+    fake = _FakeRedis()
+    scope = import_scope("user-1", COLUMN_MAP, ["S1", "S2"], date(2025, 1, 1))
+    assert scope == import_scope("user-1", COLUMN_MAP, ["S2", "S1"], date(2025, 1, 1))
+    assert scope != import_scope("user-1", COLUMN_MAP, ["S1"], date(2025, 1, 1))
+    # Same selection by another user: a separate dataset
+    assert scope != import_scope("user-2", COLUMN_MAP, ["S1", "S2"], date(2025, 1, 1))
+
+    with patch("app.services.connector_import.get_redis", AsyncMock(return_value=fake)):
+        await save_sync_state("ds-1", scope, SyncState("dataset-1", date(2025, 3, 31)), expire=60)
+        assert await load_sync_state("ds-1", scope) == SyncState("dataset-1", date(2025, 3, 31))
+        assert await load_sync_state("ds-1", "other-scope") is None
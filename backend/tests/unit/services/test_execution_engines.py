@@ -0,0 +1,248 @@
+"""Tests for the forecast execution engines (inline / thread / process / warm pool)."""
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.schemas.forecast import (
+    CrossValidationRequest,
+    ForecastFrequency,
+    ForecastMethod,
+    ForecastRequest,
+)
+from app.services.execution import (
+    ForecastJob,
+    ForecastJobResult,
+    InlineEngine,
+    JobCancelledError,
+    JobTimeoutError,
+    ProcessPoolEngine,
+    ThreadPoolEngine,
+    WarmPoolEngine,
+)
+from app.services.execution import process_engine, warm_pool_engine
+from tests.data.synthetic import daily_weekly_seasonal
+
+
+def _job(job_id: str = "job-1", cv: bool = False, **kwargs) -> ForecastJob:
+    request = ForecastRequest(
+        dataset_id="00000000-0000-0000-0000-000000000000",
+        entity_id="ENTITY_A",
+        method=ForecastMethod.ETS,
+        horizon=14,
+        frequency=ForecastFrequency.DAILY,
+        cross_validation=CrossValidationRequest(enabled=cv, folds=2, method="rolling") if cv else None,
+    )
+    return ForecastJob(
+        job_id=job_id,
+        request=request.model_dump(mode="json"),
+        series=daily_weekly_seasonal(n=120),
+        seasonal_period=7,
+        **kwargs,
+    )
+
+
+def _busy_job(job):
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        pass
+
+
+_warm_ups = {"n": 0}
+
+
+def _count_warm_up():
+    _warm_ups["n"] += 1
+
+
+def _worker_info_job(job):
+    if job.job_id == "fail":
+        raise ValueError("model could not be fitted")
+    return os.getpid(), _warm_ups["n"]
+
+
+def test_job_payload_round_trip():
+    job = _job()
+    job.exog = pd.DataFrame({"promo": np.arange(120, dtype=float)}, index=job.series.index)
+
+    restored = ForecastJob.from_payload(job.to_payload())
+
+    pd.testing.assert_series_equal(restored.series, job.series, check_freq=False, check_names=False)
+    pd.testing.assert_frame_equal(restored.exog, job.exog, check_freq=False, check_names=False)
+    assert restored.request == job.request
+    assert restored.seasonal_period == 7
+
+
+@pytest.mark.asyncio
+async def test_inline_engine_runs_job_and_result_payload_round_trips():
+    result = await InlineEngine().submit(_job(cv=True))
+
+    assert len(result.output.predictions) == 14
+    assert result.cv_result is not None and len(result.cv_result.folds) == 2
+
+    restored = ForecastJobResult.from_payload(result.to_payload())
+    assert len(restored.output.predictions) == 14
+    assert restored.cv_result.average_mae == pytest.approx(result.cv_result.average_mae)
+
+
+@pytest.mark.asyncio
+async def test_job_returns_model_state_and_next_job_updates_it():
+    engine = InlineEngine()
+    first = _job("first", keep_model=True)
+    first.series = first.series.iloc[:100]
+    stored = (await engine.submit(first)).model_state
+    assert stored["method"] == "ets" and stored["version"] == 1
+
+    job = _job("update", model_state=stored)
+    payload_job = ForecastJob.from_payload(job.to_payload())
+    result = await engine.submit(payload_job)
+
+    assert result.model_state is None
+    assert result.output.model_summary["update_mode"] == "append"
+    assert len(result.output.predictions) == 14
+
+    # A model stored for another method is ignored, not an error
+    job = _job("other", model_state={**stored, "method": "arima"})
+    assert "update_mode" not in (await engine.submit(job)).output.model_summary
+
+
+@pytest.mark.asyncio
+async def test_thread_engine_runs_jobs_concurrently():
+    engine = ThreadPoolEngine(max_workers=2)
+    try:
+        results = await asyncio.gather(
+            engine.submit(_job("a")), engine.submit(_job("b"))
+        )
+    finally:
+        await engine.shutdown()
+
+    assert [r.job_id for r in results] == ["a", "b"]
+    assert all(len(r.output.predictions) == 14 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_process_engine_returns_result():
+    engine = ProcessPoolEngine(max_workers=1, start_method="fork")
+    result = await engine.submit(_job())
+
+    assert result.job_id == "job-1"
+    assert len(result.output.predictions) == 14
+
+
+@pytest.mark.asyncio
+async def test_process_engine_propagates_model_errors():
+    job = _job()
+    job.series = job.series.iloc[:1]
+    engine = ProcessPoolEngine(max_workers=1, start_method="fork")
+
+    with pytest.raises(Exception) as exc_info:
+        await engine.submit(job)
+    assert not isinstance(exc_info.value, (JobCancelledError, JobTimeoutError))
+
+
+@pytest.mark.asyncio
+async def test_process_engine_cancel_terminates_worker(monkeypatch):
+    monkeypatch.setattr(process_engine, "execute_forecast_job", _busy_job)
+    engine = ProcessPoolEngine(max_workers=1, start_method="fork")
+
+    task = asyncio.create_task(engine.submit(_job("slow")))
+    for _ in range(100):
+        if "slow" in engine._running:
+            break
+        await asyncio.sleep(0.05)
+
+    assert await engine.cancel("slow") is True
+    with pytest.raises(JobCancelledError):
+        await task
+    assert await engine.cancel("slow") is False
+
+
+@pytest.mark.asyncio
+async def test_process_engine_enforces_cpu_time_limit(monkeypatch):
+    monkeypatch.setattr(process_engine, "execute_forecast_job", _busy_job)
+    engine = ProcessPoolEngine(max_workers=1, start_method="fork")
+
+    with pytest.raises(JobTimeoutError, match="CPU-time"):
+        await engine.submit(_job("cpu", cpu_time_limit=1))
+
+
+@pytest.mark.asyncio
+async def test_process_engine_enforces_wall_clock_timeout(monkeypatch):
+    monkeypatch.setattr(process_engine, "execute_forecast_job", _busy_job)
+    engine = ProcessPoolEngine(max_workers=1, start_method="fork")
+
+    with pytest.raises(JobTimeoutError, match="time limit"):
+        await engine.submit(_job("wall", timeout=0.5))
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_reuses_warm_worker_and_recycles_after_max_jobs(monkeypatch):
+    monkeypatch.setattr(warm_pool_engine, "execute_forecast_job", _worker_info_job)
+    engine = WarmPoolEngine(
+        max_workers=1, max_jobs_per_worker=3, start_method="fork", warmup=_count_warm_up
+    )
+    try:
+        first = await engine.submit(_job("a"))
+        with pytest.raises(ValueError, match="could not be fitted"):
+            await engine.submit(_job("fail"))
+        second = await engine.submit(_job("b"))
+        third = await engine.submit(_job("c"))
+    finally:
+        await engine.shutdown()
+
+    # Same warm worker for "a", "fail" and "b": a model error does not cost the worker
+    assert first[0] == second[0] != os.getpid()
+    # ...then it hit max_jobs_per_worker and "c" ran on a fresh, warmed-up replacement
+    assert third[0] != second[0]
+    assert first[1] == second[1] == third[1] == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_recycles_on_memory_threshold(monkeypatch):
+    monkeypatch.setattr(warm_pool_engine, "execute_forecast_job", _worker_info_job)
+    engine = WarmPoolEngine(max_workers=1, max_rss_mb=1, start_method="fork", warmup=None)
+    try:
+        pids = [(await engine.submit(_job(f"j{i}")))[0] for i in range(3)]
+    finally:
+        await engine.shutdown()
+
+    assert len(set(pids)) == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_enforces_cpu_limit_and_replaces_worker(monkeypatch):
+    monkeypatch.setattr(warm_pool_engine, "execute_forecast_job", _busy_job)
+    engine = WarmPoolEngine(max_workers=1, start_method="fork", warmup=None)
+    try:
+        with pytest.raises(JobTimeoutError, match="CPU-time"):
+            await engine.submit(_job("cpu", cpu_time_limit=1))
+
+        monkeypatch.setattr(warm_pool_engine, "execute_forecast_job", _worker_info_job)
+        pid, _ = await engine.submit(_job("after"))
+    finally:
+        await engine.shutdown()
+
+    assert pid != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_cancel_terminates_running_job(monkeypatch):
+    monkeypatch.setattr(warm_pool_engine, "execute_forecast_job", _busy_job)
+    engine = WarmPoolEngine(max_workers=1, start_method="fork", warmup=None)
+    try:
+        task = asyncio.create_task(engine.submit(_job("slow")))
+        for _ in range(100):
+            if "slow" in engine._running:
+                break
+            await asyncio.sleep(0.05)
+
+        assert await engine.cancel("slow") is True
+        with pytest.raises(JobCancelledError):
+            await task
+    finally:
+        await engine.shutdown()
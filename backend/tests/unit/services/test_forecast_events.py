@@ -0,0 +1,162 @@
+"""Forecast event tests — shared pub/sub fan-out and the SSE status stream."""
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.services.forecast_events import ForecastEventHub, stream_events
+
+
+class _FakePubSub:
+    def __init__(self):
+        self.channels: set[str] = set()
+        self.subscribe_calls = 0
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.subscribe_calls += 1
+        self.channels.add(channel)
+
+    async def unsubscribe(self, channel):
+        self.channels.discard(channel)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.pubsubs: list[_FakePubSub] = []
+
+    def pubsub(self):
+        self.pubsubs.append(_FakePubSub())
+        return self.pubsubs[-1]
+
+    async def publish(self, channel, message):
+        receivers = [p for p in self.pubsubs if channel in p.channels]
+        for pubsub in receivers:
+            pubsub.messages.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(receivers)
+
+
+def _parse(chunks):
+    events = []
+    for chunk in chunks:
+        if chunk.startswith(":"):
+            events.append(("keepalive", None))
+            continue
+        name, data = chunk.strip().split("\n")
+        events.append((name.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+@pytest.fixture
+def fake_redis():
+    redis = _FakeRedis()
+
+    async def _get_redis():
+        return redis
+
+    with patch("app.services.forecast_events.get_redis", new=_get_redis):
+        yield redis
+
+
+@pytest.mark.asyncio
+async def test_streams_share_one_subscription_per_channel(fake_redis):
+    hub = ForecastEventHub()
+
+    async with hub.subscribe("forecast_events:a") as first, hub.subscribe("forecast_events:a") as second:
+        async with hub.subscribe("forecast_events:b") as other:
+            assert len(fake_redis.pubsubs) == 1
+            assert fake_redis.pubsubs[0].subscribe_calls == 2
+
+            await fake_redis.publish("forecast_events:a", json.dumps({"status": "running", "progress": 40}))
+            assert await asyncio.wait_for(first.get(), 1) == {"status": "running", "progress": 40}
+            assert await asyncio.wait_for(second.get(), 1) == {"status": "running", "progress": 40}
+            assert other.empty()
+        assert fake_redis.pubsubs[0].channels == {"forecast_events:a"}
+
+    assert hub.channel_count == 0 and fake_redis.pubsubs[0].channels == set()
+    await asyncio.sleep(1.1)
+    assert hub._reader is None
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_state_then_deltas_until_terminal(fake_redis):
+    hub = ForecastEventHub()
+    channel = "forecast_batch_events:b-1"
+
+    async def _publish_later():
+        await asyncio.sleep(0.15)
+        await fake_redis.publish(channel, json.dumps({"type": "entity", "entity_id": "A", "status": "completed"}))
+        await fake_redis.publish(channel, json.dumps({"type": "batch", "status": "completed", "completed": 1}))
+        await fake_redis.publish(channel, json.dumps({"type": "entity", "entity_id": "late", "status": "failed"}))
+
+    async def _state():
+        return {"status": "running", "completed": 0}
+
+    publisher = asyncio.create_task(_publish_later())
+    with patch("app.services.forecast_events.settings.FORECAST_EVENTS_KEEPALIVE_SEC", 0.1):
+        chunks = [chunk async for chunk in stream_events(channel, _state, hub=hub)]
+    await publisher
+
+    events = _parse(chunks)
+    assert events[0] == ("status", {"status": "running", "completed": 0})
+    assert ("keepalive", None) in events
+    assert [e for e in events if e[0] != "keepalive"][1:] == [
+        ("entity", {"entity_id": "A", "status": "completed"}),
+        ("complete", {"status": "completed", "completed": 1}),
+    ]
+    assert hub.channel_count == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_of_finished_forecast_is_one_event(fake_redis):
+    async def _state():
+        return {"id": "fc-1", "status": "failed", "progress": 30, "error": "boom"}
+
+    chunks = [chunk async for chunk in stream_events("forecast_events:fc-1", _state, hub=ForecastEventHub())]
+
+    assert _parse(chunks) == [("status", {"id": "fc-1", "status": "failed", "progress": 30, "error": "boom"})]
+
+
+@pytest.mark.asyncio
+async def test_stream_that_fell_behind_resends_the_current_state(fake_redis):
+    hub = ForecastEventHub()
+    channel = "forecast_batch_events:b-2"
+    reads = []
+
+    async def _state():
+        reads.append(len(reads))
+        if len(reads) == 1:
+            # Four entities finish while the first state is still being read
+            for entity in "ABCD":
+                await fake_redis.publish(channel, json.dumps({"type": "entity", "entity_id": entity}))
+            await asyncio.sleep(0.1)
+            return {"status": "running", "completed": 0}
+        return {"status": "running", "completed": 4}
+
+    async def _finish_after_resync():
+        while len(reads) < 2:
+            await asyncio.sleep(0.01)
+        await fake_redis.publish(channel, json.dumps({"type": "batch", "status": "completed", "completed": 4}))
+
+    publisher = asyncio.create_task(_finish_after_resync())
+    with patch("app.services.forecast_events.SUBSCRIBER_QUEUE_SIZE", 3):
+        chunks = [chunk async for chunk in stream_events(channel, _state, hub=hub)]
+    await publisher
+
+    assert _parse(chunks) == [
+        ("status", {"status": "running", "completed": 0}),
+        ("status", {"status": "running", "completed": 4}),
+        ("complete", {"status": "completed", "completed": 4}),
+    ]
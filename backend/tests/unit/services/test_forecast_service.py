@@ -1,7 +1,9 @@
 """End-to-end test of ForecastService.run_forecast with mocked data layer."""
 from __future__ import annotations
 
+import asyncio
 import json
+from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
 import numpy as np
@@ -9,12 +11,16 @@ import pandas as pd
 import pytest
 
 from app.schemas.forecast import (
+    BatchForecastRequest,
     ForecastFrequency,
     ForecastMethod,
     ForecastRequest,
+    ForecastResultResponse,
     ForecastStatus,
     CrossValidationRequest,
 )
+from app.services.execution import InlineEngine
+from app.services import forecast_service
 from app.services.forecast_service import ForecastService
 from tests.data.synthetic import daily_weekly_seasonal
 
@@ -50,6 +56,7 @@ def stub_redis():
     class _FakeRedis:
         def __init__(self):
             self.store: dict[str, str] = {}
+            self.published: list[tuple[str, dict]] = []
 
         async def set(self, key, value, ex=None):
             self.store[key] = value
@@ -57,8 +64,52 @@ def stub_redis():
         async def get(self, key):
             return self.store.get(key)
 
-        async def delete(self, key):
-            self.store.pop(key, None)
+        async def delete(self, *keys):
+            for key in keys:
+                self.store.pop(key, None)
+
+        async def hset(self, key, field=None, value=None, mapping=None):
+            entry = self.store.setdefault(key, {})
+            if field is not None:
+                entry[field] = value
+            entry.update(mapping or {})
+
+        async def hgetall(self, key):
+            return dict(self.store.get(key, {}))
+
+        async def hmget(self, key, *fields):
+            entry = self.store.get(key, {})
+            return [entry.get(field) for field in fields]
+
+        async def publish(self, channel, message):
+            self.published.append((channel, json.loads(message)))
+            return 0
+
+        async def expire(self, key, seconds):
+            return True
+
+        async def zadd(self, key, mapping):
+            self.store.setdefault(key, {}).update(mapping)
+
+        async def zcard(self, key):
+            return len(self.store.get(key, {}))
+
+        async def zrange(self, key, start, end):
+            members = sorted(self.store.get(key, {}).items(), key=lambda kv: kv[1])
+            return [m for m, _ in members][start:end + 1]
+
+        async def zrem(self, key, *members):
+            for member in members:
+                self.store.get(key, {}).pop(member, None)
+
+        async def rpush(self, key, *values):
+            self.store.setdefault(key, []).extend(values)
+
+        async def llen(self, key):
+            return len(self.store.get(key, []))
+
+        async def lrange(self, key, start, end):
+            return self.store.get(key, [])[start:end + 1]
 
     return _FakeRedis()
 
@@ -135,6 +186,149 @@ async def test_run_forecast_with_cv_populates_cv_results(
     assert np.isfinite(result.cv_results.average_metrics.mae)
 
 
+@pytest.mark.asyncio
+async def test_run_forecast_writes_full_result_once(
+    synthetic_dataset, stub_preprocessing_service, stub_redis
+):
+    """Progress goes to the small hash (coalesced); the full result is stored once."""
+    get_df, get_entity = stub_preprocessing_service
+    service = ForecastService(tenant_id="tenant-123")
+    full_writes = []
+    seen_while_running = []
+    original_report = service._report_progress
+
+    async def _record_set(key, value, ex=None):
+        full_writes.append(key)
+        stub_redis.store[key] = value
+
+    async def _report(result, force=False):
+        await original_report(result, force=force)
+        seen_while_running.append(await service.get_forecast_status(result.id))
+
+    with patch.object(service.preprocessing_service, "get_dataset_dataframe", new=get_df), \
+         patch.object(service.preprocessing_service, "get_entity_data", new=get_entity), \
+         patch.object(stub_redis, "set", new=_record_set), \
+         patch.object(service, "_report_progress", new=_report), \
+         patch("app.services.forecast_service.settings.FORECAST_PROGRESS_MIN_INTERVAL_SEC", 60.0), \
+         patch("app.services.forecast_service.get_redis", return_value=stub_redis):
+        request = ForecastRequest(
+            dataset_id="dataset-1",
+            entity_id="ENTITY_A",
+            method=ForecastMethod.ETS,
+            horizon=7,
+        )
+        result = await service.run_forecast(request, forecast_id="fc-progress")
+        status = await service.get_forecast_status("fc-progress")
+        state = await service.get_forecast_progress("fc-progress")
+
+    assert result.status == ForecastStatus.COMPLETED
+    assert [k for k in full_writes if k.startswith("forecast:")] == ["forecast:fc-progress"]
+
+    # While running, status comes from the progress hash; coalescing kept the first write
+    running = seen_while_running[0]
+    assert running.status == ForecastStatus.RUNNING
+    assert running.entity_id == "ENTITY_A" and running.predictions == []
+    assert all(s.progress == 0 for s in seen_while_running[:-1])
+
+    progress = stub_redis.store["forecast_progress:fc-progress"]
+    assert json.loads(progress["status"]) == "completed"
+    assert json.loads(progress["progress"]) == 100
+    assert len(status.predictions) == 7
+    assert len(stub_redis.store["forecast_rows:fc-progress"]) == 7
+    assert "predictions" not in json.loads(stub_redis.store["forecast_meta:fc-progress"])
+
+    # Every progress-hash write is pushed to the event channel, ending with the terminal status
+    events = [e for c, e in stub_redis.published if c == "forecast_events:fc-progress"]
+    assert events[0]["status"] == "running"
+    assert (events[-1]["status"], events[-1]["progress"]) == ("completed", 100)
+    assert state == {
+        "id": "fc-progress", "status": "completed", "progress": 100, "error": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_forecast_serves_identical_requests_from_result_cache(
+    synthetic_dataset, stub_preprocessing_service, stub_redis
+):
+    """Same data + settings skip the fit; the cache keeps the tenant's most recent entries."""
+    get_df, get_entity = stub_preprocessing_service
+
+    class _CountingEngine(InlineEngine):
+        submitted = 0
+
+        async def submit(self, job):
+            _CountingEngine.submitted += 1
+            return await super().submit(job)
+
+    service = ForecastService(tenant_id="tenant-123", engine=_CountingEngine())
+
+    def _request(entity_id: str = "ENTITY_A", horizon: int = 7, **kwargs) -> ForecastRequest:
+        return ForecastRequest(
+            dataset_id="dataset-1", entity_id=entity_id, method=ForecastMethod.ETS, horizon=horizon, **kwargs
+        )
+
+    with patch.object(service.preprocessing_service, "get_dataset_dataframe", new=get_df), \
+         patch.object(service.preprocessing_service, "get_entity_data", new=get_entity), \
+         patch("app.services.forecast_service.get_redis", return_value=stub_redis):
+        first = await service.run_forecast(_request())
+        # Different entity id, same rows: the cache is keyed by content, not identifiers
+        repeat = await service.run_forecast(_request(entity_id="ENTITY_A_COPY"))
+        assert _CountingEngine.submitted == 1
+        bypassed = await service.run_forecast(_request(use_cache=False))
+        assert _CountingEngine.submitted == 2
+
+        with patch("app.services.forecast_service.settings.FORECAST_RESULT_CACHE_MAX_ENTRIES", 1):
+            await service.run_forecast(_request(horizon=5))  # evicts the horizon=7 entry
+            evicted = await service.run_forecast(_request())
+        assert _CountingEngine.submitted == 4
+
+    assert not first.cache_hit and repeat.cache_hit
+    assert not bypassed.cache_hit and not evicted.cache_hit
+    assert repeat.id != first.id and repeat.entity_id == "ENTITY_A_COPY"
+    assert repeat.status == ForecastStatus.COMPLETED
+    assert [p.value for p in repeat.predictions] == [p.value for p in first.predictions]
+    assert repeat.metrics == first.metrics
+
+
+@pytest.mark.asyncio
+async def test_run_forecast_stores_model_and_updates_it_on_the_next_run(
+    stub_preprocessing_service, stub_redis
+):
+    get_df, get_entity = stub_preprocessing_service
+    service = ForecastService(tenant_id="tenant-123", db=AsyncMock(), engine=InlineEngine())
+    saved = {}
+
+    async def _save(forecast_history_id, state):
+        saved[forecast_history_id] = state
+
+    async def _load(forecast_history_id):
+        return saved.get(forecast_history_id)
+
+    request = dict(
+        dataset_id="dataset-1", entity_id="ENTITY_A", method=ForecastMethod.ETS, horizon=7,
+    )
+    with patch.object(service.preprocessing_service, "get_dataset_dataframe", new=get_df), \
+         patch.object(service.preprocessing_service, "get_entity_data", new=get_entity), \
+         patch.object(service, "_save_predictions_to_db", new=AsyncMock()), \
+         patch.object(service, "_save_model_state", new=_save), \
+         patch.object(service, "_load_model_state", new=_load), \
+         patch("app.services.forecast_service.get_redis", return_value=stub_redis):
+        first = await service.run_forecast(ForecastRequest(**request), forecast_history_id="hist-1")
+        second = await service.run_forecast(
+            ForecastRequest(**request, update_from="hist-1"), forecast_history_id="hist-2"
+        )
+        missing = await service.run_forecast(ForecastRequest(**request, update_from="hist-404"))
+
+    assert first.status == second.status == ForecastStatus.COMPLETED
+    assert saved["hist-1"]["method"] == "ets" and "hist-2" in saved
+    assert "update_mode" not in first.model_summary.diagnostics
+    assert second.model_summary.diagnostics["update_mode"] == "append"
+    assert [p.value for p in second.predictions] == [p.value for p in first.predictions]
+
+    assert missing.status == ForecastStatus.COMPLETED
+    assert any("No stored model" in w for w in missing.warnings)
+
+
 @pytest.mark.asyncio
 async def test_run_forecast_blocks_insufficient_data(stub_redis):
     """Dataset with only 6 rows should be rejected up-front by the validator."""
@@ -167,3 +361,231 @@ async def test_run_forecast_blocks_insufficient_data(stub_redis):
 
     assert result.status == ForecastStatus.FAILED
     assert "observations" in (result.error or "") or "Insufficient" in (result.error or "")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", list(ForecastMethod))
+async def test_auto_detect_parameters_recommends_for_every_method(method, stub_preprocessing_service):
+    get_df, get_entity = stub_preprocessing_service
+    service = ForecastService(tenant_id="tenant-123")
+    with patch.object(service.preprocessing_service, "get_dataset_dataframe", new=get_df), \
+         patch.object(service.preprocessing_service, "get_entity_data", new=get_entity):
+        response = await service.auto_detect_parameters(method, "dataset-1", "ENTITY_A")
+
+    assert response.method == method
+    assert isinstance(response.recommended_params, dict) and response.recommended_params
+    assert response.data_characteristics is not None
+
+
+@pytest.mark.asyncio
+async def test_batch_forecast_runs_entities_concurrently_with_ordered_results(
+    synthetic_dataset, stub_redis
+):
+    """Entities finish out of order; progress and final ordering stay correct."""
+    entity_ids = ["A", "B", "C", "D", "E"]
+    delays = {"A": 0.25, "B": 0.05, "C": 0.15, "D": 0.0, "E": 0.1}
+    running = {"now": 0, "peak": 0}
+    service = ForecastService(tenant_id="tenant-batch")
+
+    async def _fake_run_forecast(request, **kwargs):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(delays[request.entity_id])
+        running["now"] -= 1
+        status = ForecastStatus.FAILED if request.entity_id == "C" else ForecastStatus.COMPLETED
+        return ForecastResultResponse(
+            id=f"fc-{request.entity_id}",
+            dataset_id=request.dataset_id,
+            entity_id=request.entity_id,
+            method=request.method,
+            status=status,
+            created_at=datetime.utcnow(),
+        )
+
+    async def _get_df(_):
+        return synthetic_dataset
+
+    batch = BatchForecastRequest(
+        dataset_id="dataset-1", entity_ids=entity_ids, method=ForecastMethod.ETS, horizon=7,
+    )
+    with patch.object(service, "run_forecast", new=_fake_run_forecast), \
+         patch.object(service.preprocessing_service, "get_dataset_dataframe", new=_get_df), \
+         patch("app.services.forecast_service.get_redis", return_value=stub_redis):
+        initial = await service.start_batch_forecast(batch, max_concurrency=2)
+        await asyncio.sleep(0.12)
+        mid = await service.get_batch_status(initial.batch_id)
+        while (await service.get_batch_status(initial.batch_id)).status == ForecastStatus.RUNNING:
+            await asyncio.sleep(0.02)
+        final = await service.get_batch_status(initial.batch_id)
+        # The final status is stored before it is published
+        await asyncio.gather(*forecast_service._background_tasks)
+
+    assert running["peak"] == 2
+    assert mid.status == ForecastStatus.RUNNING
+    assert mid.completed + mid.failed + mid.in_progress == len(entity_ids)
+    assert 0 < len(mid.results) < len(entity_ids)
+
+    assert final.status == ForecastStatus.COMPLETED
+    assert [r.entity_id for r in final.results] == entity_ids
+    assert (final.completed, final.failed, final.in_progress) == (4, 1, 0)
+
+    events = [e for c, e in stub_redis.published if c == f"forecast_batch_events:{initial.batch_id}"]
+    assert sorted(e["entity_id"] for e in events if e["type"] == "entity") == entity_ids
+    assert events[-1]["type"] == "batch" and events[-1]["status"] == "completed"
+    assert "results" not in events[-1]
+
+
+@pytest.mark.asyncio
+async def test_batch_forecast_persists_completed_entities_in_bulk(synthetic_dataset, stub_redis):
+    """Completed entities are buffered and written a flush at a time under one history row."""
+    sessions = []
+
+    class _Session:
+        def __init__(self):
+            self.added, self.executed = [], []
+            self.commit = AsyncMock()
+            sessions.append(self)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        def add(self, obj):
+            self.added.append(obj)
+
+        async def execute(self, stmt):
+            self.executed.append(stmt)
+
+    flushed = []
+
+    async def _save(db, tenant_id, items):
+        flushed.append([(history_id, result.entity_id) for history_id, result in items])
+
+    async def _fake_run_forecast(request, **kwargs):
+        return ForecastResultResponse(
+            id=f"fc-{request.entity_id}",
+            dataset_id=request.dataset_id,
+            entity_id=request.entity_id,
+            method=request.method,
+            status=ForecastStatus.FAILED if request.entity_id == "C" else ForecastStatus.COMPLETED,
+            created_at=datetime.utcnow(),
+        )
+
+    async def _get_df(_):
+        return synthetic_dataset
+
+    service = ForecastService(tenant_id="tenant-batch", session_factory=_Session)
+    batch = BatchForecastRequest(
+        dataset_id="dataset-1", entity_ids=list("ABCDEFG"), method=ForecastMethod.ETS, horizon=7,
+    )
+    with patch.object(service, "run_forecast", new=_fake_run_forecast), \
+         patch.object(service.preprocessing_service, "get_dataset_dataframe", new=_get_df), \
+         patch("app.services.prediction_store.save_predictions", new=_save), \
+         patch("app.services.prediction_store.settings.PREDICTION_WRITE_BATCH_SIZE", 4), \
+         patch("app.services.forecast_service.get_redis", return_value=stub_redis):
+        final = await service.run_batch_forecast(batch, batch_id="batch-1")
+
+    assert final.completed == 6
+    history = sessions[0].added[0]
+    assert (history.id, history.entity_count, history.status.value) == ("batch-1", 7, "running")
+    assert [len(items) for items in flushed] == [4, 2]
+    assert {entity for items in flushed for _, entity in items} == set("ABDEFG")
+    assert all(history_id == "batch-1" for items in flushed for history_id, _ in items)
+    assert len(sessions[-1].executed) == 1  # history marked finished
+
+
+def test_celery_batch_callback_persists_completed_entities(stub_redis):
+    """The chord callback writes the results the entity subtasks sent back."""
+    from contextlib import asynccontextmanager
+    from app.workers import forecast_tasks
+
+    executed, flushed = [], []
+
+    class _Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def execute(self, stmt):
+            executed.append(stmt)
+
+        async def commit(self):
+            pass
+
+    @asynccontextmanager
+    async def _task_sessions():
+        yield _Session
+
+    async def _save(db, tenant_id, items):
+        flushed.append([(history_id, result.entity_id) for history_id, result in items])
+
+    results = [
+        ForecastResultResponse(
+            id=f"fc-{entity}", dataset_id="dataset-1", entity_id=entity, method=ForecastMethod.ETS,
+            status=ForecastStatus.FAILED if entity == "B" else ForecastStatus.COMPLETED,
+            created_at=datetime.utcnow(),
+        ).model_dump(mode="json")
+        for entity in "ABC"
+    ]
+    with patch.object(forecast_tasks, "_task_sessions", _task_sessions), \
+         patch.object(forecast_tasks, "init_redis", AsyncMock()), \
+         patch.object(forecast_tasks, "close_redis", AsyncMock()), \
+         patch("app.services.prediction_store.save_predictions", new=_save), \
+         patch("app.services.forecast_service.get_redis", return_value=stub_redis):
+        status = forecast_tasks.finalize_batch_task(results, "tenant-batch", "batch-1", 3, persist=True)
+        unpersisted = forecast_tasks.finalize_batch_task(results, "tenant-batch", "batch-2", 3)
+
+    assert status["completed"] == 2 and unpersisted["completed"] == 2
+    assert flushed == [[("batch-1", "A"), ("batch-1", "C")]]
+    assert len(executed) == 1  # history marked finished
+
+
+@pytest.mark.asyncio
+async def test_batch_preparation_matches_per_entity_path(stub_redis):
+    """One load + one groupby yields the same series as per-entity loading."""
+    frames = []
+    for i, entity in enumerate(["A", "B", "C"]):
+        series = daily_weekly_seasonal(n=60, seed=i)
+        frames.append(pd.DataFrame({
+            "date": series.index.strftime("%Y-%m-%d"),
+            "value": series.values.astype(str),
+            "promo": np.arange(60) % 2,
+            "entity_id": entity,
+        }))
+    dataset = pd.concat(frames).sample(frac=1.0, random_state=0).reset_index(drop=True)
+    loads = {"n": 0}
+
+    async def _get_df(_):
+        loads["n"] += 1
+        return dataset.copy()
+
+    service = ForecastService(tenant_id="tenant-123")
+    entity_requests = [
+        ForecastRequest(
+            dataset_id="dataset-1", entity_id=e, entity_column="entity_id",
+            method=ForecastMethod.ETS, regressor_columns=["promo"],
+        )
+        for e in ["A", "B", "C", "MISSING"]
+    ]
+    with patch.object(service.preprocessing_service, "get_dataset_dataframe", new=_get_df), \
+         patch("app.services.forecast_service.get_redis", return_value=stub_redis), \
+         patch("app.services.preprocessing_service.get_redis", return_value=None):
+        prepared = await service._prepare_batch_data("dataset-1", entity_requests)
+        assert loads["n"] == 1
+
+        for r in entity_requests[:3]:
+            expected_series, _, expected_exog = await service._get_forecast_data(
+                r.dataset_id, r.entity_id, entity_column=r.entity_column,
+                regressor_columns=r.regressor_columns,
+            )
+            series, error, exog = prepared[r.entity_id]
+            assert error is None
+            pd.testing.assert_series_equal(series, expected_series)
+            pd.testing.assert_frame_equal(exog, expected_exog)
+
+    assert prepared["MISSING"][0] is None
+    assert prepared["MISSING"][1] == "Dataset is empty"
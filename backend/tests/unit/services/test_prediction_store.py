@@ -0,0 +1,159 @@
+"""Prediction store tests — point records, bulk writes and the SQL of range / aggregate reads."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.forecast import ForecastResultResponse, ForecastStatus, PredictionResponse
+from app.services import prediction_store
+from app.services.prediction_store import (
+    POINT_COLUMNS,
+    PredictionStore,
+    PredictionWriter,
+    point_records,
+    save_predictions,
+    write_points,
+)
+
+
+def _predictions(n: int = 3):
+    return [
+        PredictionResponse(date=f"2026-02-{i + 1:02d}", value=float(i), lower_bound=i - 1.0, upper_bound=i + 1.0)
+        for i in range(n)
+    ]
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _session(driver):
+    connection = SimpleNamespace(get_raw_connection=AsyncMock(return_value=SimpleNamespace(driver_connection=driver)))
+    return SimpleNamespace(connection=AsyncMock(return_value=connection), execute=AsyncMock())
+
+
+def test_point_records_follow_point_columns():
+    records = point_records("t-1", "fh-1", "fp-1", "E1", _predictions(2))
+
+    assert len(records[0]) == len(POINT_COLUMNS)
+    assert dict(zip(POINT_COLUMNS, records[1])) == {
+        "forecast_prediction_id": "fp-1",
+        "date": date(2026, 2, 2),
+        "tenant_id": "t-1",
+        "forecast_history_id": "fh-1",
+        "entity_id": "E1",
+        "value": 1.0,
+        "lower_bound": 0.0,
+        "upper_bound": 2.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_write_points_copies_on_asyncpg_and_inserts_otherwise():
+    records = point_records("t-1", "fh-1", "fp-1", "E1", _predictions())
+
+    asyncpg_like = SimpleNamespace(copy_records_to_table=AsyncMock())
+    session = _session(asyncpg_like)
+    await write_points(session, records)
+    asyncpg_like.copy_records_to_table.assert_awaited_once_with(
+        "forecast_prediction_points", records=records, columns=list(POINT_COLUMNS)
+    )
+    session.execute.assert_not_awaited()
+
+    session = _session(SimpleNamespace())
+    await write_points(session, records)
+    _, rows = session.execute.await_args.args
+    assert len(rows) == 3 and rows[0]["entity_id"] == "E1"
+
+    session = _session(asyncpg_like)
+    await write_points(session, [])
+    session.connection.assert_not_awaited()
+
+
+def _result(entity_id: str, horizon: int = 3) -> ForecastResultResponse:
+    return ForecastResultResponse(
+        id=f"fc-{entity_id}",
+        dataset_id="dataset-1",
+        entity_id=entity_id,
+        method="ets",
+        status=ForecastStatus.COMPLETED,
+        predictions=_predictions(horizon),
+        created_at=datetime(2026, 1, 1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_predictions_is_two_statements_for_any_number_of_results():
+    driver = SimpleNamespace(copy_records_to_table=AsyncMock())
+    session = _session(driver)
+
+    ids = await save_predictions(session, "t-1", [("fh-1", _result(f"E{i}")) for i in range(50)])
+
+    assert len(set(ids)) == 50
+    session.execute.assert_awaited_once()
+    _, rows = session.execute.await_args.args
+    assert len(rows) == 50 and rows[0]["predicted_values"] is None
+    records = driver.copy_records_to_table.await_args.kwargs["records"]
+    assert len(records) == 150 and {r[0] for r in records} == set(ids)
+
+
+@pytest.mark.asyncio
+async def test_writer_flushes_by_size_interval_and_on_close():
+    flushed = []
+
+    class _Session:
+        commit = AsyncMock()
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    async def _save(db, tenant_id, items):
+        flushed.append([result.entity_id for _, result in items])
+
+    with patch.object(prediction_store, "save_predictions", new=_save):
+        async with PredictionWriter("t-1", session_factory=_Session, flush_size=3, flush_interval=0.05) as writer:
+            for entity in ("A", "B", "C", "D"):
+                await writer.add("fh-1", _result(entity))
+            assert flushed == [["A", "B", "C"]]
+            await asyncio.sleep(0.12)
+            assert flushed == [["A", "B", "C"], ["D"]]
+            await writer.add("fh-1", _result("E"))
+
+    assert flushed[-1] == ["E"]
+    assert (writer.written, writer.flushes) == (5, 3)
+
+
+def test_aggregate_runs_as_one_grouped_query():
+    sql = _sql(PredictionStore("t-1").aggregate_query(
+        group_by="date", agg="sum", entity_ids=["E1", "E2"], start_date=date(2026, 2, 1), latest_only=True,
+    ))
+
+    assert "sum(forecast_prediction_points.value) AS value" in sql
+    assert "GROUP BY forecast_prediction_points.date" in sql
+    assert "forecast_prediction_points.tenant_id = 't-1'" in sql
+    assert "forecast_prediction_points.entity_id IN ('E1', 'E2')" in sql
+    assert "DISTINCT ON (forecast_predictions.entity_id)" in sql
+
+    with pytest.raises(ValueError, match="Unknown aggregate"):
+        PredictionStore("t-1").aggregate_query(agg="median")
+    with pytest.raises(ValueError, match="Cannot group"):
+        PredictionStore("t-1").aggregate_query(group_by="value")
+
+
+def test_range_query_filters_and_pages_in_sql():
+    sql = _sql(PredictionStore("t-1").range_query(
+        entity_ids=["E1"], start_date=date(2026, 2, 1), end_date=date(2026, 2, 28), offset=100, limit=50,
+    ))
+
+    assert "forecast_prediction_points.date >= '2026-02-01'" in sql
+    assert "forecast_prediction_points.date <= '2026-02-28'" in sql
+    assert "ORDER BY forecast_prediction_points.entity_id, forecast_prediction_points.date" in sql
+    assert "LIMIT 50 OFFSET 100" in sql
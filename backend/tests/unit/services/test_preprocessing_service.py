@@ -232,3 +232,112 @@ async def test_conditional_replace_less_than_specific_value(service):
     assert result.success
     # 3 negative values replaced
     assert result.rows_affected == 3
+
+
+# ------------------------------------------------------------------
+# Entity listing
+# ------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_entities_single_pass_matches_per_entity_summary(service):
+    df = _series_with_nans()
+    df.loc[3, "date"] = pd.NaT
+
+    class _FakeRedis:
+        def __init__(self):
+            self.store: dict = {}
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def set(self, key, value, ex=None):
+            self.store[key] = value
+
+    fake = _FakeRedis()
+    version = {"value": "v1"}
+
+    async def _version(dataset_id):
+        return version["value"]
+
+    loader = AsyncMock(side_effect=lambda *a, **kw: df.copy())
+    with patch("app.services.preprocessing_service.get_redis", AsyncMock(return_value=fake)), \
+         patch("app.services.preprocessing_service.get_frame_version", new=_version), \
+         patch.object(service, "get_dataset_dataframe", new=loader):
+        entities, column = await service.get_entities("ds-1")
+        cached, _ = await service.get_entities("ds-1")
+        assert loader.await_count == 1
+        assert cached == entities
+
+        version["value"] = "v2"
+        await service.get_entities("ds-1")
+        assert loader.await_count == 2
+
+    assert column == "entity_id"
+    assert [e.name for e in entities] == ["A", "B"]
+    for entity in entities:
+        part = df[df["entity_id"] == entity.name]
+        assert entity.row_count == len(part)
+        assert entity.missing_count == int(part.isnull().sum().sum())
+        assert entity.has_missing
+        dates = part["date"].dropna()
+        assert entity.date_range == {
+            "start": dates.min().strftime("%Y-%m-%d"),
+            "end": dates.max().strftime("%Y-%m-%d"),
+        }
+
+
+@pytest.mark.asyncio
+async def test_entity_listing_built_during_a_write_is_not_cached_as_current(service):
+    df = _series_with_nans()
+
+    class _FakeRedis:
+        def __init__(self):
+            self.store: dict = {}
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def set(self, key, value, ex=None):
+            self.store[key] = value
+
+    version = {"value": "v1"}
+
+    async def _version(dataset_id):
+        return version["value"]
+
+    async def _load_then_bump(*args, **kwargs):
+        # A write lands while the listing is being computed from the old data
+        version["value"] = "v2"
+        return df.copy()
+
+    loader = AsyncMock(side_effect=_load_then_bump)
+    with patch("app.services.preprocessing_service.get_redis", AsyncMock(return_value=_FakeRedis())), \
+         patch("app.services.preprocessing_service.get_frame_version", new=_version), \
+         patch.object(service, "get_dataset_dataframe", new=loader):
+        await service.get_entities("ds-1")
+        await service.get_entities("ds-1")
+
+    assert loader.await_count == 2
+
+@pytest.mark.asyncio
+async def test_invalidate_entities_drops_only_changed_series(service):
+    class _FakeRedis:
+        def __init__(self):
+            self.store = {
+                "preprocessed:ds-1": b"all",
+                "preprocessed:ds-1:A": b"a",
+                "preprocessed:ds-1:B": b"b",
+            }
+
+        async def delete(self, *keys):
+            for key in keys:
+                self.store.pop(key, None)
+
+    fake = _FakeRedis()
+    bump = AsyncMock()
+    with patch("app.services.preprocessing_service.get_redis", AsyncMock(return_value=fake)), \
+         patch("app.services.preprocessing_service.bump_frame_version", new=bump):
+        assert await service.invalidate_entities("ds-1", ["A"])
+
+    assert fake.store == {"preprocessed:ds-1:B": b"b"}
+    bump.assert_awaited_once_with("ds-1")
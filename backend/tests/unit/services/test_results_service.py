@@ -0,0 +1,142 @@
+"""Results service tests — slice reads and streamed exports of predictions."""
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.schemas.forecast import ForecastResultResponse, ForecastStatus, PredictionResponse
+from app.services import results_service
+from app.services.results_service import (
+    ResultsService,
+    store_result_rows,
+    stream_csv,
+    stream_ndjson,
+)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict = {}
+        self.lrange_calls: list = []
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def exists(self, key):
+        return int(key in self.store)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def rpush(self, key, *values):
+        self.store.setdefault(key, []).extend(values)
+
+    async def llen(self, key):
+        return len(self.store.get(key, []))
+
+    async def lrange(self, key, start, end):
+        self.lrange_calls.append((start, end))
+        return self.store.get(key, [])[start:end + 1]
+
+    async def hkeys(self, key):
+        return list(self.store.get(key, {}))
+
+    async def hget(self, key, field):
+        return self.store.get(key, {}).get(field)
+
+
+def _result(forecast_id: str = "fc-1", entity_id: str = "ENTITY_A", horizon: int = 25) -> ForecastResultResponse:
+    return ForecastResultResponse(
+        id=forecast_id,
+        dataset_id="dataset-1",
+        entity_id=entity_id,
+        method="ets",
+        status=ForecastStatus.COMPLETED,
+        progress=100,
+        predictions=[
+            PredictionResponse(
+                date=f"2026-01-{i + 1:02d}", value=float(i), lower_bound=i - 1.0, upper_bound=i + 1.5
+            )
+            for i in range(horizon)
+        ],
+        created_at=datetime(2026, 1, 1),
+    )
+
+
+async def _collect(chunks) -> str:
+    return "".join([piece async for piece in chunks])
+
+
+@pytest.fixture
+def redis():
+    fake = _FakeRedis()
+    with patch.object(results_service, "get_redis", return_value=fake):
+        yield fake
+
+
+async def test_pages_are_read_as_slices_of_the_rows_list(redis):
+    result = _result()
+    await store_result_rows(redis, result, ttl=60)
+    service = ResultsService(tenant_id="tenant-1")
+
+    reader = await service.open_predictions("fc-1")
+    items, total, total_pages, page = await reader.page(3, 10)
+
+    assert reader.result.entity_id == "ENTITY_A" and reader.result.predictions == []
+    assert (total, total_pages, page) == (25, 3, 3)
+    assert items == service.paginate_predictions(result.predictions, 3, 10)[0]
+    assert redis.lrange_calls == [(20, 24)]
+
+
+async def test_streamed_csv_matches_generate_csv_and_reads_in_chunks(redis):
+    result = _result()
+    await store_result_rows(redis, result, ttl=60)
+    service = ResultsService(tenant_id="tenant-1")
+    reader = await service.open_predictions("fc-1")
+
+    async def _rows():
+        async for chunk in reader.iter_chunks(chunk_rows=10):
+            yield [p.model_dump() for p in chunk]
+
+    csv_text = await _collect(stream_csv(_rows()))
+
+    assert csv_text == service.generate_csv(result)
+    assert redis.lrange_calls == [(0, 9), (10, 19), (20, 24)]
+
+
+async def test_legacy_cached_result_is_sliced_in_memory(redis):
+    result = _result(horizon=5)
+    redis.store["forecast:fc-1"] = json.dumps(result.model_dump(mode="json"))
+    service = ResultsService(tenant_id="tenant-1")
+
+    reader = await service.open_predictions("fc-1")
+    items, total, _, _ = await reader.page(1, 2)
+
+    assert total == 5 and [p.date for p in items] == ["2026-01-01", "2026-01-02"]
+    assert await service.open_predictions("missing") is None
+
+
+async def test_batch_rows_stream_one_entity_at_a_time(redis):
+    redis.store["forecast_batch:b-1"] = "{}"
+    redis.store["forecast_batch_results:b-1"] = {
+        str(i): json.dumps(_result(f"fc-{i}", f"E{i}", horizon=2).model_dump(mode="json"))
+        for i in (1, 0)
+    }
+    service = ResultsService(tenant_id="tenant-1")
+
+    assert await service.batch_exists("b-1") and not await service.batch_exists("b-2")
+    lines = (await _collect(stream_ndjson(service.iter_batch_rows("b-1")))).splitlines()
+
+    assert [(row["entity_id"], row["date"]) for row in map(json.loads, lines)] == [
+        ("E0", "2026-01-01"), ("E0", "2026-01-02"), ("E1", "2026-01-01"), ("E1", "2026-01-02"),
+    ]
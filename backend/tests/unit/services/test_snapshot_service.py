@@ -0,0 +1,153 @@
+"""Snapshot tests — fingerprinting (order-insensitive, chunk-invariant,
+content-sensitive) and selective parquet reads."""
+from __future__ import annotations
+
+import io
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import snapshot_service
+from app.services.snapshot_service import SnapshotService, fingerprint_frames
+from app.services.blob_reader import BlobRangeReader, S3Object
+from app.services.storage.local_backend import LocalBackend
+
+
+def _frame(rows: int = 500) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=rows, freq="D"),
+        "entity_id": rng.choice(["A", "B", "C"], rows),
+        "value": rng.normal(100, 10, rows),
+        "promo": rng.integers(0, 2, rows),
+    })
+
+
+def test_hash_ignores_row_column_order_and_index():
+    df = _frame()
+    shuffled = df.sample(frac=1.0, random_state=3)[["promo", "value", "date", "entity_id"]]
+
+    assert SnapshotService.compute_data_hash(shuffled) == SnapshotService.compute_data_hash(df)
+    assert len(SnapshotService.compute_data_hash(df)) == 64
+
+
+def test_hash_is_the_same_however_rows_are_chunked():
+    df = _frame(1000)
+    whole = SnapshotService.compute_data_hash(df)
+
+    assert fingerprint_frames([df.iloc[:10], df.iloc[10:700], df.iloc[700:]]) == whole
+    with patch.object(snapshot_service, "HASH_CHUNK_ROWS", 64):
+        assert SnapshotService.compute_data_hash(df) == whole
+
+
+def test_hash_changes_with_content_multiplicity_and_schema():
+    df = _frame()
+    base = SnapshotService.compute_data_hash(df)
+
+    changed = df.copy()
+    changed.loc[3, "value"] += 0.001
+    duplicated = pd.concat([df, df.iloc[[0]]])
+    renamed = df.rename(columns={"promo": "on_promo"})
+    retyped = df.astype({"promo": float})
+
+    hashes = {base} | {
+        SnapshotService.compute_data_hash(frame) for frame in (changed, duplicated, renamed, retyped)
+    }
+    assert len(hashes) == 5
+    assert SnapshotService.compute_data_hash(df.iloc[:0]) != SnapshotService.compute_data_hash(df.iloc[:0, :2])
+
+
+def test_legacy_hash_still_available_for_old_snapshots():
+    df = _frame(50)
+    shuffled = df.sample(frac=1.0, random_state=3)
+
+    legacy = SnapshotService.compute_legacy_data_hash(df)
+    assert legacy == SnapshotService.compute_legacy_data_hash(shuffled)
+    assert legacy != SnapshotService.compute_data_hash(df)
+
+
+# ----------------------------------------------------------------------
+# Selective reads
+# ----------------------------------------------------------------------
+
+def _panel(entities: int = 20, days: int = 200) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    dates = pd.date_range("2024-01-01", periods=days, freq="D")
+    return pd.DataFrame({
+        "entity_id": np.repeat([f"E{i:02d}" for i in range(entities)], days),
+        "date": np.tile(dates, entities),
+        "value": rng.normal(100, 10, entities * days),
+        "promo": rng.integers(0, 2, entities * days),
+    }).sample(frac=1.0, random_state=5)
+
+
+class _StubS3Client:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.ranged_bytes = 0
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = (int(v) for v in Range.removeprefix("bytes=").split("-"))
+        self.ranged_bytes += end - start + 1
+        return {"Body": io.BytesIO(self.data[start:end + 1])}
+
+
+@pytest.mark.parametrize("compression", ["zstd", "lz4", "snappy", "gzip", "none"])
+def test_parquet_round_trip_with_every_codec(compression):
+    df = _panel(3, 30)
+    raw = SnapshotService._to_parquet(df, compression, row_group_rows=25)
+
+    restored = SnapshotService._read_parquet(io.BytesIO(raw))
+    pd.testing.assert_frame_equal(restored, df)
+
+
+def test_read_prunes_row_groups_and_projects_columns():
+    df = _panel(20, 1500)
+    raw = SnapshotService._to_parquet(df, "zstd", row_group_rows=1500, sort_by=["entity_id", "date"])
+    client = _StubS3Client(raw)
+    reader = BlobRangeReader(S3Object(client, "bucket", "key"), size=len(raw))
+
+    out = SnapshotService._read_parquet(
+        reader,
+        columns=["date", "value"],
+        entity_column="entity_id",
+        entity_ids=["E03", "E07"],
+        date_column="date",
+        start_date="2024-03-01",
+        end_date=pd.Timestamp("2024-03-31"),
+    )
+
+    expected = df[
+        df["entity_id"].isin(["E03", "E07"])
+        & (df["date"] >= "2024-03-01") & (df["date"] <= "2024-03-31")
+    ].sort_values(["entity_id", "date"])[["date", "value"]]
+    pd.testing.assert_frame_equal(out, expected)
+    # 2 of 20 row groups plus the footer, not the whole object
+    assert client.ranged_bytes < len(raw) / 4
+
+
+def test_read_rejects_unknown_filter_column():
+    raw = SnapshotService._to_parquet(_panel(2, 10), "zstd", row_group_rows=100)
+    with pytest.raises(ValueError, match="no column 'store'"):
+        SnapshotService._read_parquet(io.BytesIO(raw), entity_column="store", entity_ids=["A"])
+
+
+async def test_snapshot_written_and_read_through_local_storage(tmp_path):
+    df = _panel(4, 50)
+    backend = LocalBackend(str(tmp_path))
+    key = "tenant-1/snapshots/abc.parquet"
+    await backend.upload(key, SnapshotService._to_parquet(df, "zstd", 50, ["entity_id", "date"]))
+    snapshot = SimpleNamespace(s3_key=key)
+
+    with patch.object(snapshot_service, "get_storage_backend", return_value=backend):
+        service = SnapshotService(tenant_id="tenant-1")
+        full = await service.get_snapshot_data(snapshot)
+        one = await service.get_snapshot_data(snapshot, entity_column="entity_id", entity_ids=["E02"])
+        with pytest.raises(ValueError, match="date_column is required"):
+            await service.get_snapshot_data(snapshot, start_date="2024-01-01")
+
+    pd.testing.assert_frame_equal(full.sort_index(), df.sort_index())
+    assert set(one["entity_id"]) == {"E02"} and len(one) == 50
@@ -0,0 +1,133 @@
+"""Tests for the spooled, chunked dataset upload path."""
+from __future__ import annotations
+
+from io import BytesIO
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import upload_ingest
+from app.services.dataset_service import DatasetService
+
+
+def _upload_frame(n: int = 1000) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Date": pd.date_range("2023-01-01", periods=n, freq="D").strftime("%Y-%m-%d"),
+        "Entity_ID": np.where(np.arange(n) % 2 == 0, "E1", "E2"),
+        "Entity_Name": np.where(np.arange(n) % 2 == 0, "مخزن", "Store"),
+        "Volume": np.arange(n, dtype=float),
+    })
+
+
+class _FakeUpload:
+    def __init__(self, data: bytes):
+        self._buffer = BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path):
+    with patch.object(upload_ingest.settings, "UPLOAD_DIR", str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.mark.asyncio
+async def test_spool_enforces_size_limit_and_removes_partial_file(upload_dir):
+    spooled = await upload_ingest.spool_upload(_FakeUpload(b"x" * 3000), max_bytes=5000)
+    assert spooled.size == 3000
+    spooled.cleanup()
+
+    with patch.object(upload_ingest, "SPOOL_CHUNK_BYTES", 1024):
+        with pytest.raises(upload_ingest.UploadTooLargeError):
+            await upload_ingest.spool_upload(_FakeUpload(b"x" * 6000), max_bytes=5000)
+    assert list(upload_dir.iterdir()) == []
+
+
+def test_sniff_encoding_uses_prefix_and_tolerates_split_characters(upload_dir):
+    path = upload_dir / "arabic.csv"
+    path.write_bytes(_upload_frame().to_csv(index=False).encode("windows-1256"))
+    assert upload_ingest.sniff_encoding(str(path)) == "windows-1256"
+
+    # Cut the sample in the middle of a two-byte UTF-8 character
+    path.write_bytes("مخزن".encode("utf-8"))
+    assert upload_ingest.sniff_encoding(str(path), sample_bytes=3) == "utf-8-sig"
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_matches_single_read_and_reports_progress(upload_dir):
+    expected = _upload_frame()
+    path = upload_dir / "sales.csv"
+    expected.to_csv(path, index=False)
+    updates = []
+
+    async def progress(update):
+        updates.append(update)
+
+    service = DatasetService(db=None, tenant_id="t1")
+    with patch.object(upload_ingest.settings, "UPLOAD_PARSE_CHUNK_ROWS", 300), \
+         patch.object(service, "_store_data_in_redis") as store, \
+         patch.object(service, "_store_metadata_in_redis"):
+        dataset = await service.upload_file(str(path), "sales.csv", "text/csv", progress=progress)
+
+    assert dataset.row_count == len(expected)
+    parsing = [u for u in updates if u["stage"] == "parsing"]
+    assert [u["rows_parsed"] for u in parsing] == [300, 600, 900, 1000]
+    assert updates[0]["stage"] == "validated"
+    assert updates[-1]["stage"] == "parsed" and updates[-1]["percent"] == 100.0
+
+    stored = store.call_args.args[1]
+    pd.testing.assert_frame_equal(stored, pd.read_csv(path))
+
+
+@pytest.mark.asyncio
+async def test_missing_columns_rejected_from_header_before_body_is_parsed(upload_dir):
+    path = upload_dir / "bad.csv"
+    _upload_frame().drop(columns=["Volume"]).assign(Other=1).to_csv(path, index=False)
+
+    service = DatasetService(db=None, tenant_id="t1")
+    with patch.object(upload_ingest, "iter_csv_chunks") as chunks:
+        with pytest.raises(ValueError, match="Missing required columns: Volume"):
+            await service.upload_file(str(path), "bad.csv", "text/csv")
+    chunks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_column_whose_type_changes_across_chunks_parses_like_one_read(upload_dir):
+    frame = _upload_frame(1000)
+    frame["Store_Code"] = [str(i) for i in range(900)] + [f"A{i}" for i in range(100)]
+    path = upload_dir / "codes.csv"
+    frame.to_csv(path, index=False)
+
+    service = DatasetService(db=None, tenant_id="t1")
+    with patch.object(upload_ingest.settings, "UPLOAD_PARSE_CHUNK_ROWS", 300), \
+         patch.object(service, "_store_data_in_redis") as store, \
+         patch.object(service, "_store_metadata_in_redis"):
+        await service.upload_file(str(path), "codes.csv", "text/csv")
+
+    stored = store.call_args.args[1]
+    pd.testing.assert_frame_equal(stored, pd.read_csv(path))
+    assert all(isinstance(v, str) for v in stored["Store_Code"])
+    assert stored["Volume"].dtype == float
+
+
+@pytest.mark.asyncio
+async def test_undecodable_byte_past_the_sniffed_prefix_falls_back_to_next_encoding(upload_dir):
+    frame = _upload_frame(20_000).assign(Entity_Name="Store")
+    frame.loc[len(frame) - 1, "Entity_Name"] = "مخزن"
+    path = upload_dir / "late-arabic.csv"
+    path.write_bytes(frame.to_csv(index=False).encode("windows-1256"))
+    assert path.stat().st_size > 2 * upload_ingest.SNIFF_BYTES
+    assert upload_ingest.sniff_encoding(str(path)) == "utf-8-sig"
+
+    service = DatasetService(db=None, tenant_id="t1")
+    with patch.object(service, "_store_data_in_redis") as store, \
+         patch.object(service, "_store_metadata_in_redis"):
+        await service.upload_file(str(path), "late-arabic.csv", "text/csv")
+
+    stored = store.call_args.args[1]
+    assert stored["Entity_Name"].iloc[-1] == "مخزن"
+    assert len(stored) == len(frame)
@@ -53,6 +53,6 @@ export const dataSourceApi = {
 
   importData: (
     dataSourceId: string,
-    data: { date_range_start?: string; date_range_end?: string }
+    data: { date_range_start?: string; date_range_end?: string; incremental?: boolean }
   ) => api.post<WizardImportResponse>(`/data-sources/${dataSourceId}/import`, data),
 };
@@ -40,6 +40,7 @@ export interface WizardImportResponse {
   row_count: number;
   entity_count: number;
   status: string;
+  sync_mode?: 'full' | 'incremental';
 }
 
 export interface WizardPreviewResponse {